@@ -0,0 +1,90 @@
+"""
+Strategy Evolution
+==================
+
+Evolutionary search for ``StrategyGenome`` compositions: genomes are scored
+by simulated Odd/Even matches against the primitive strategies, in parallel
+across a process pool, and the best genomes found are reported as JSON.
+
+With ``--checkpoint`` the search state is saved after every generation, and
+running again with the same file resumes where it stopped.
+
+Usage:
+    python experiments/evolve_strategies.py --population 128 --generations 50 \\
+        --checkpoint results/evolution.json --output results/evolution_report.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.strategies.genome_evolution import (  # noqa: E402
+    PRIMITIVES,
+    EvolutionConfig,
+    EvolutionEngine,
+)
+from src.common.logger import setup_logging  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Evolve strategy compositions")
+    parser.add_argument("--population", type=int, default=64)
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--elite", type=int, default=4, help="Genomes kept unchanged")
+    parser.add_argument("--tournament", type=int, default=3, help="Tournament size")
+    parser.add_argument("--crossover-rate", type=float, default=0.7)
+    parser.add_argument("--mutation-rate", type=float, default=0.1)
+    parser.add_argument("--rounds", type=int, default=20, help="Rounds per simulated match")
+    parser.add_argument(
+        "--opponents",
+        default=",".join(PRIMITIVES),
+        help="Comma-separated primitive opponents",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (0: in-process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=5, help="Genomes to report")
+    parser.add_argument("--checkpoint", type=Path, help="Save/resume the search here")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the search and print the report."""
+    args = parse_args(argv)
+    setup_logging(level="WARNING")
+
+    opponents = tuple(o.strip() for o in args.opponents.split(",") if o.strip())
+    unknown = [o for o in opponents if o not in PRIMITIVES]
+    if unknown:
+        print(f"Unknown opponents: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    config = EvolutionConfig(
+        population_size=args.population,
+        generations=args.generations,
+        elite_count=args.elite,
+        tournament_size=args.tournament,
+        crossover_rate=args.crossover_rate,
+        mutation_rate=args.mutation_rate,
+        rounds=args.rounds,
+        opponents=opponents,
+        workers=args.workers,
+        seed=args.seed,
+        top_k=args.top,
+    )
+    if args.checkpoint:
+        args.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+    report = EvolutionEngine(config, args.checkpoint).run().to_dict()
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,589 @@
+"""
+Loopback Load Test
+==================
+
+End-to-end load test of the real agents: a ``LeagueManager``, ``RefereeAgent``s
+and ``PlayerAgent``s talk to each other over HTTP on loopback while the driver
+plays complete leagues through the league manager's MCP tools
+(``start_league``, then ``start_next_round`` until the league is complete).
+
+Reports, as JSON:
+- matches/sec over the whole league
+- p50/p99 latency of game rounds (from the referees' ``get_referee_stats``)
+- CPU seconds and RSS of every agent (``--isolation process`` runs each agent
+  in its own OS process; ``inprocess`` runs all of them on one event loop and
+  reports the process as a whole)
+- dropped messages: protocol messages the referees failed to deliver, plus
+  scheduled matches that never completed
+
+With ``--baseline`` the report is compared against a stored one, metric by
+metric, and the exit status is 1 if any metric regressed beyond
+``--tolerance``.
+
+Usage:
+    python experiments/load_test.py --players 8 --referees 2 --rounds 5 \\
+        --strategies random,pattern --output results/load_test.json
+    python experiments/load_test.py --players 8 --baseline results/load_test.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import random
+import signal
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents import LeagueManager, PlayerAgent, RefereeAgent  # noqa: E402
+from src.agents.strategies import RandomStrategy, Strategy, StrategyFactory  # noqa: E402
+from src.client.mcp_client import MCPClient  # noqa: E402
+from src.common.logger import get_logger, setup_logging  # noqa: E402
+from src.server.base_server import BaseGameServer  # noqa: E402
+
+logger = get_logger(__name__)
+
+ISOLATION_MODES = ("process", "inprocess")
+
+# Compared metrics (dotted report paths) and whether higher is better
+COMPARED_METRICS: dict[str, bool] = {
+    "matches_per_second": True,
+    "round_latency_ms.p50": False,
+    "round_latency_ms.p99": False,
+    "dropped_messages": False,
+    "totals.cpu_seconds": False,
+    "totals.rss_bytes": False,
+}
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+
+@dataclass
+class LoadTestConfig:
+    """Scale and shape of the league under test."""
+
+    players: int = 4
+    referees: int = 1
+    rounds_per_match: int = 5
+    strategies: list[str] = field(default_factory=lambda: ["random"])  # Cycled over players
+    league_format: str = "round_robin"
+    pairing_rounds: int = 0  # Swiss/ladder rounds (0: recommended)
+    repeat: int = 1  # Round-robin repetitions (the league manager's TOURNAMENT_REPEAT)
+    isolation: str = "process"
+    move_timeout: float = 5.0
+    client_transport: str = "websocket"  # Referee -> player transport ("http" or "websocket")
+    seed: int = 0
+    host: str = "localhost"
+    round_timeout: float = 600.0  # Seconds allowed for one league round
+    startup_timeout: float = 60.0
+
+
+@dataclass
+class AgentSpec:
+    """One agent of the league."""
+
+    kind: str  # "league_manager", "referee" or "player"
+    name: str
+    strategy: str = "random"
+
+
+def agent_specs(config: LoadTestConfig) -> list[AgentSpec]:
+    """League manager first, then referees, then players."""
+    specs = [AgentSpec("league_manager", "league_manager")]
+    specs += [AgentSpec("referee", f"REF{i + 1:02d}") for i in range(config.referees)]
+    specs += [
+        AgentSpec("player", f"Player_{i + 1}", config.strategies[i % len(config.strategies)])
+        for i in range(config.players)
+    ]
+    return specs
+
+
+@contextlib.contextmanager
+def _tournament_repeat(repeat: int) -> Any:
+    """Set the league manager's round-robin repetitions while starting the league."""
+    previous = os.environ.get("TOURNAMENT_REPEAT")
+    os.environ["TOURNAMENT_REPEAT"] = str(repeat)
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["TOURNAMENT_REPEAT"]
+        else:
+            os.environ["TOURNAMENT_REPEAT"] = previous
+
+
+def _create_strategy(name: str) -> Strategy:
+    try:
+        return StrategyFactory.create_from_string(name)
+    except ValueError as e:
+        logger.warning(f"Unknown strategy '{name}', using RandomStrategy: {e}")
+        return RandomStrategy()
+
+
+async def _start_agent(
+    spec: AgentSpec, config: LoadTestConfig, league_manager_url: str
+) -> BaseGameServer:
+    """Start an agent on an ephemeral port and register it with the league."""
+    agent: BaseGameServer
+    if spec.kind == "league_manager":
+        agent = LeagueManager(
+            min_players=2,
+            max_players=max(config.players, 2),
+            host=config.host,
+            port=0,
+            league_format=config.league_format,
+            pairing_rounds=config.pairing_rounds,
+            rounds_per_match=config.rounds_per_match,
+        )
+        await agent.start()
+        return agent
+
+    if spec.kind == "referee":
+        agent = RefereeAgent(
+            referee_id=spec.name,
+            host=config.host,
+            port=0,
+            move_timeout=config.move_timeout,
+            league_manager_url=league_manager_url,
+            client_transport=config.client_transport,
+        )
+    else:
+        agent = PlayerAgent(
+            player_name=spec.name,
+            strategy=_create_strategy(spec.strategy),
+            host=config.host,
+            port=0,
+            league_manager_url=league_manager_url,
+        )
+    await agent.start()
+    if not await agent.register_with_league():  # type: ignore[attr-defined]
+        await agent.stop()
+        raise RuntimeError(f"{spec.name} could not register with the league")
+    return agent
+
+
+# ============================================================================
+# Agent Fleets
+# ============================================================================
+
+
+class InProcessAgents:
+    """All agents on the driver's event loop (resource usage is process-wide)."""
+
+    def __init__(self, config: LoadTestConfig):
+        self.config = config
+        self.agents: dict[str, BaseGameServer] = {}
+        self._process = psutil.Process()
+        self._cpu_start = 0.0
+
+    async def start(self, specs: list[AgentSpec]) -> dict[str, str]:
+        """Start the agents; returns their MCP URLs by name."""
+        random.seed(self.config.seed)
+        league_manager_url = ""
+        for spec in specs:
+            agent = await _start_agent(spec, self.config, league_manager_url)
+            self.agents[spec.name] = agent
+            if spec.kind == "league_manager":
+                league_manager_url = agent.url
+        return {name: agent.url for name, agent in self.agents.items()}
+
+    def mark(self) -> None:
+        """Start measuring CPU time."""
+        cpu = self._process.cpu_times()
+        self._cpu_start = cpu.user + cpu.system
+
+    def usage(self) -> dict[str, dict[str, Any]]:
+        """CPU seconds and RSS since ``mark``."""
+        cpu = self._process.cpu_times()
+        return {
+            "inprocess": {
+                "pid": self._process.pid,
+                "agents": list(self.agents),
+                "cpu_seconds": cpu.user + cpu.system - self._cpu_start,
+                "rss_bytes": self._process.memory_info().rss,
+            }
+        }
+
+    async def stop(self) -> None:
+        """Stop the agents (players first)."""
+        for agent in reversed(list(self.agents.values())):
+            await agent.stop()
+        self.agents.clear()
+
+
+async def _serve_agent(
+    spec: AgentSpec, config: LoadTestConfig, league_manager_url: str, seed: int, ready: Any
+) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    random.seed(seed)
+    os.environ["TOURNAMENT_REPEAT"] = str(config.repeat)  # Read when the league starts
+    try:
+        agent = await _start_agent(spec, config, league_manager_url)
+    except Exception as e:
+        ready.put((spec.name, None, f"{type(e).__name__}: {e}"))
+        return
+
+    ready.put((spec.name, agent.url, None))
+    try:
+        await stop_event.wait()
+    finally:
+        await agent.stop()
+
+
+def _run_agent(
+    spec: AgentSpec, config: LoadTestConfig, league_manager_url: str, seed: int, ready: Any
+) -> None:
+    """Agent process entry point."""
+    setup_logging(level="WARNING")
+    asyncio.run(_serve_agent(spec, config, league_manager_url, seed, ready))
+
+
+class ProcessAgents:
+    """One OS process per agent (resource usage per agent)."""
+
+    def __init__(self, config: LoadTestConfig, start_method: str = "spawn"):
+        self.config = config
+        self._context = multiprocessing.get_context(start_method)
+        self._ready = self._context.Queue()
+        self._processes: dict[str, Any] = {}
+        self._cpu_start: dict[str, float] = {}
+
+    async def start(self, specs: list[AgentSpec]) -> dict[str, str]:
+        """Start the agents; returns their MCP URLs by name."""
+        # The league manager must be up before anyone can register
+        urls = await self._spawn(specs[:1], "")
+        urls.update(await self._spawn(specs[1:], urls[specs[0].name]))
+        return urls
+
+    async def _spawn(self, specs: list[AgentSpec], league_manager_url: str) -> dict[str, str]:
+        for spec in specs:
+            seed = self.config.seed + len(self._processes)
+            process = self._context.Process(
+                target=_run_agent,
+                args=(spec, self.config, league_manager_url, seed, self._ready),
+                name=f"load-test-{spec.name}",
+                daemon=True,
+            )
+            process.start()
+            self._processes[spec.name] = process
+        return await asyncio.to_thread(self._wait_ready, {spec.name for spec in specs})
+
+    def _wait_ready(self, pending: set[str]) -> dict[str, str]:
+        urls = {}
+        deadline = time.monotonic() + self.config.startup_timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(f"Agents {sorted(pending)} not ready")
+            try:
+                name, url, error = self._ready.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                dead = [n for n in pending if not self._processes[n].is_alive()]
+                if dead:
+                    raise RuntimeError(f"Agents {dead} exited") from None
+                continue
+            if error is not None:
+                raise RuntimeError(f"Agent {name} failed: {error}")
+            urls[name] = url
+            pending.discard(name)
+        return urls
+
+    def _cpu_seconds(self, process: psutil.Process) -> float:
+        cpu = process.cpu_times()
+        return cpu.user + cpu.system
+
+    def mark(self) -> None:
+        """Start measuring CPU time."""
+        self._cpu_start = {
+            name: self._cpu_seconds(psutil.Process(process.pid))
+            for name, process in self._processes.items()
+        }
+
+    def usage(self) -> dict[str, dict[str, Any]]:
+        """CPU seconds (since ``mark``) and RSS of every agent."""
+        usage = {}
+        for name, process in self._processes.items():
+            try:
+                ps = psutil.Process(process.pid)
+                usage[name] = {
+                    "pid": process.pid,
+                    "cpu_seconds": self._cpu_seconds(ps) - self._cpu_start.get(name, 0.0),
+                    "rss_bytes": ps.memory_info().rss,
+                }
+            except psutil.NoSuchProcess:
+                usage[name] = {"pid": process.pid, "cpu_seconds": 0.0, "rss_bytes": 0}
+        return usage
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop every agent (SIGTERM, then SIGKILL after ``timeout``)."""
+        await asyncio.to_thread(self._terminate, timeout)
+
+    def _terminate(self, timeout: float) -> None:
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in self._processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self._processes.clear()
+
+
+# ============================================================================
+# Driver
+# ============================================================================
+
+
+async def _call(client: MCPClient, server: str, tool: str, timeout: float = 30.0) -> dict:
+    result = await client.call_tool(server, tool, {}, timeout=timeout)
+    data: dict = json.loads(result["content"][0]["text"])
+    return data
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = round(percentile / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+async def run_load_test(config: LoadTestConfig) -> dict[str, Any]:
+    """
+    Play one full league against real agents and report the measurements.
+
+    Raises:
+        RuntimeError: If the agents cannot start or the league cannot run
+    """
+    if config.isolation not in ISOLATION_MODES:
+        raise ValueError(f"isolation must be one of {ISOLATION_MODES}")
+
+    specs = agent_specs(config)
+    referees = [spec.name for spec in specs if spec.kind == "referee"]
+    fleet: InProcessAgents | ProcessAgents = (
+        ProcessAgents(config) if config.isolation == "process" else InProcessAgents(config)
+    )
+    client = MCPClient("load_test")
+    try:
+        urls = await fleet.start(specs)
+        await client.start()
+        for name in ["league_manager", *referees]:
+            await client.connect(name, urls[name])
+
+        with _tournament_repeat(config.repeat):
+            started = await _call(client, "league_manager", "start_league")
+        if not started.get("success"):
+            raise RuntimeError(f"League did not start: {started.get('error')}")
+
+        fleet.mark()
+        league_start = time.perf_counter()
+        league_rounds: list[float] = []
+        matches_scheduled = 0
+        # The league manager completes the league once the last round reports
+        for _ in range(started["rounds"]):
+            round_start = time.perf_counter()
+            result = await _call(
+                client, "league_manager", "start_next_round", timeout=config.round_timeout
+            )
+            if not result.get("success"):
+                if result.get("league_complete"):
+                    break
+                raise RuntimeError(f"Round failed: {result.get('error')}")
+            matches_scheduled += len(result.get("matches", []))
+            league_rounds.append(time.perf_counter() - round_start)
+        wall = time.perf_counter() - league_start
+
+        agents = fleet.usage()
+        referee_stats = [await _call(client, name, "get_referee_stats") for name in referees]
+    finally:
+        await client.stop()
+        await fleet.stop()
+
+    latencies = sorted(latency for stats in referee_stats for latency in stats["round_latency_ms"])
+    completed = sum(stats["matches_completed"] for stats in referee_stats)
+    return {
+        "config": asdict(config),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "timestamp": time.time(),
+        "wall_seconds": wall,
+        "league_rounds": len(league_rounds),
+        "league_round_seconds": league_rounds,
+        "matches_scheduled": matches_scheduled,
+        "matches_completed": completed,
+        "matches_per_second": completed / wall if wall > 0 else 0.0,
+        "game_rounds": len(latencies),
+        "round_latency_ms": {
+            "p50": _percentile(latencies, 50),
+            "p99": _percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        },
+        "dropped_messages": sum(stats["dropped_messages"] for stats in referee_stats)
+        + max(0, matches_scheduled - completed),
+        "agents": agents,
+        "totals": {
+            "cpu_seconds": sum(usage["cpu_seconds"] for usage in agents.values()),
+            "rss_bytes": sum(usage["rss_bytes"] for usage in agents.values()),
+        },
+    }
+
+
+# ============================================================================
+# Regression Comparison
+# ============================================================================
+
+
+@dataclass
+class MetricComparison:
+    """One metric of a report compared against the baseline."""
+
+    metric: str
+    baseline: float
+    current: float
+    change_percent: float  # current vs baseline
+    higher_is_better: bool
+    regressed: bool
+
+
+def _lookup(report: dict[str, Any], path: str) -> float:
+    value: Any = report
+    for key in path.split("."):
+        value = value[key]
+    return float(value)
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float = 0.10
+) -> list[MetricComparison]:
+    """
+    Compare a load-test report against a baseline report.
+
+    A metric regresses when it is worse than the baseline by more than
+    ``tolerance`` (a fraction; 0.10 allows 10% noise).
+    """
+    if baseline.get("config") != current.get("config"):
+        logger.warning("Baseline was recorded with a different load-test configuration")
+
+    comparisons = []
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        base = _lookup(baseline, metric)
+        value = _lookup(current, metric)
+        change = (value - base) / base * 100 if base else 0.0
+        if higher_is_better:
+            regressed = value < base * (1 - tolerance)
+        else:
+            regressed = value > base * (1 + tolerance)
+        comparisons.append(
+            MetricComparison(
+                metric=metric,
+                baseline=base,
+                current=value,
+                change_percent=change,
+                higher_is_better=higher_is_better,
+                regressed=regressed,
+            )
+        )
+    return comparisons
+
+
+def format_comparison(comparisons: list[MetricComparison]) -> str:
+    """Markdown table of a comparison."""
+    lines = [
+        "| Metric | Baseline | Current | Change | Status |",
+        "|--------|----------|---------|--------|--------|",
+    ]
+    for c in comparisons:
+        status = "REGRESSED" if c.regressed else "ok"
+        lines.append(
+            f"| {c.metric} | {c.baseline:.3f} | {c.current:.3f} | "
+            f"{c.change_percent:+.1f}% | {status} |"
+        )
+    return "\n".join(lines)
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Loopback load test of the real agents")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--referees", type=int, default=1)
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per match")
+    parser.add_argument(
+        "--strategies", default="random", help="Comma-separated strategies, cycled over players"
+    )
+    parser.add_argument(
+        "--format", default="round_robin", choices=["round_robin", "swiss", "ladder"]
+    )
+    parser.add_argument("--pairing-rounds", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Round-robin repetitions")
+    parser.add_argument("--isolation", default="process", choices=ISOLATION_MODES)
+    parser.add_argument("--move-timeout", type=float, default=5.0)
+    parser.add_argument("--client-transport", default="websocket", choices=["http", "websocket"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Compare against this stored report")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load test; returns 1 if a metric regressed against the baseline."""
+    args = parse_args(argv)
+    setup_logging(level="WARNING")
+
+    config = LoadTestConfig(
+        players=args.players,
+        referees=args.referees,
+        rounds_per_match=args.rounds,
+        strategies=[s.strip() for s in args.strategies.split(",") if s.strip()],
+        league_format=args.format,
+        pairing_rounds=args.pairing_rounds,
+        repeat=args.repeat,
+        isolation=args.isolation,
+        move_timeout=args.move_timeout,
+        client_transport=args.client_transport,
+        seed=args.seed,
+    )
+    report = asyncio.run(run_load_test(config))
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        comparisons = compare_reports(json.loads(args.baseline.read_text()), report, args.tolerance)
+        print(format_comparison(comparisons), file=sys.stderr)
+        if any(c.regressed for c in comparisons):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,13 @@ For full documentation, visit:
 https://github.com/mcp-game/mcp-multi-agent-game
 """
 
+from .common.lazy import lazy_exports
+
+# Agents are imported on first access
+__getattr__, __dir__ = lazy_exports(
+    __name__, {".agents": ("LeagueManager", "PlayerAgent", "RefereeAgent")}
+)
+
 # Version information
 __version__ = "2.0.0"
 __version_info__ = tuple(int(i) for i in __version__.split(".") if i.isdigit())
@@ -5,6 +5,7 @@ This module provides:
 - LeagueManager: Manages the league, scheduling, and standings
 - RefereeAgent: Manages individual matches between players
 - PlayerAgent: AI player with configurable strategies
+- PlayerHost / PlayerHostSupervisor: Many players behind one port
 
 Strategy Framework:
 - Classic: RandomStrategy, PatternStrategy, LLMStrategy
@@ -22,34 +23,71 @@ Usage:
     player = create_player("Bot2", 8102, strategy_type="adaptive_bayesian")
 """
 
-from .league_manager import LeagueManager
-from .player import (
-    PlayerAgent,
-    create_player,
-    get_recommended_strategy,
-    list_available_strategies,
-)
-from .referee import RefereeAgent
+from typing import TYPE_CHECKING
+
+from ..common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .league_manager import LeagueManager
+    from .player import (
+        PlayerAgent,
+        create_player,
+        get_recommended_strategy,
+        list_available_strategies,
+    )
+    from .player_host import PlayerHost, PlayerHostSupervisor
+    from .referee import RefereeAgent
+
+    # Import strategy types for convenience
+    from .strategies import (
+        # Game Theory
+        AdaptiveBayesianStrategy,
+        BestResponseStrategy,
+        FictitiousPlayStrategy,
+        # Classic
+        LLMStrategy,
+        NashEquilibriumStrategy,
+        PatternStrategy,
+        RandomStrategy,
+        RegretMatchingStrategy,
+        # Base
+        Strategy,
+        StrategyConfig,
+        StrategyFactory,
+        StrategyType,
+        ThompsonSamplingStrategy,
+        UCBStrategy,
+    )
 
-# Import strategy types for convenience
-from .strategies import (
-    # Game Theory
-    AdaptiveBayesianStrategy,
-    BestResponseStrategy,
-    FictitiousPlayStrategy,
-    # Classic
-    LLMStrategy,
-    NashEquilibriumStrategy,
-    PatternStrategy,
-    RandomStrategy,
-    RegretMatchingStrategy,
-    # Base
-    Strategy,
-    StrategyConfig,
-    StrategyFactory,
-    StrategyType,
-    ThompsonSamplingStrategy,
-    UCBStrategy,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".league_manager": ("LeagueManager",),
+        ".player": (
+            "PlayerAgent",
+            "create_player",
+            "get_recommended_strategy",
+            "list_available_strategies",
+        ),
+        ".player_host": ("PlayerHost", "PlayerHostSupervisor"),
+        ".referee": ("RefereeAgent",),
+        ".strategies": (
+            "AdaptiveBayesianStrategy",
+            "BestResponseStrategy",
+            "FictitiousPlayStrategy",
+            "LLMStrategy",
+            "NashEquilibriumStrategy",
+            "PatternStrategy",
+            "RandomStrategy",
+            "RegretMatchingStrategy",
+            "Strategy",
+            "StrategyConfig",
+            "StrategyFactory",
+            "StrategyType",
+            "ThompsonSamplingStrategy",
+            "UCBStrategy",
+        ),
+    },
 )
 
 __all__ = [
@@ -57,6 +95,8 @@ __all__ = [
     "LeagueManager",
     "RefereeAgent",
     "PlayerAgent",
+    "PlayerHost",
+    "PlayerHostSupervisor",
     # Factory functions
     "create_player",
     "list_available_strategies",
@@ -9,12 +9,15 @@ Manages the overall league:
 - Round coordination
 """
 
+import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from ..client.mcp_client import MCPClient
+from ..common.config import get_config
 from ..common.events import (
     AgentRegisteredEvent,
     StandingsUpdatedEvent,
@@ -25,6 +28,8 @@ from ..common.events import (
 from ..common.logger import get_logger
 from ..common.protocol import RegistrationStatus, generate_auth_token
 from ..game.match import Match, MatchScheduler, MatchState
+from ..game.pairing import SwissPairing, create_pairing_engine
+from ..game.standings import StandingsTable
 from ..server.base_server import BaseGameServer
 
 logger = get_logger(__name__)
@@ -103,15 +108,75 @@ class RegisteredPlayer:
         self.played += 1
         self.wins += 1
         self.points += 3
+        self._notify_stats_changed()
 
     def record_loss(self) -> None:
         self.played += 1
         self.losses += 1
+        self._notify_stats_changed()
 
     def record_draw(self) -> None:
         self.played += 1
         self.draws += 1
         self.points += 1
+        self._notify_stats_changed()
+
+    def bind_standings(self, listener: Callable[[str], None] | None) -> None:
+        """Set the callback notified with player_id whenever stats change."""
+        # Plain attribute (not a dataclass field) so asdict() never copies it
+        self._stats_listener = listener
+
+    def _notify_stats_changed(self) -> None:
+        listener = getattr(self, "_stats_listener", None)
+        if listener is not None:
+            listener(self.player_id)
+
+
+class _PlayerRegistry(dict):
+    """
+    Player dict that keeps a StandingsTable in sync.
+
+    Adding or removing a player updates the table, and each player's
+    record_* calls reposition it, so standings never need a full re-sort.
+    """
+
+    def __init__(self, standings: StandingsTable, players: dict | None = None):
+        super().__init__()
+        self._standings = standings
+        standings.rebuild([])
+        for player_id, player in (players or {}).items():
+            self[player_id] = player
+
+    def __setitem__(self, player_id: str, player: RegisteredPlayer) -> None:
+        previous = self.get(player_id)
+        if previous is not None and previous is not player:
+            previous.bind_standings(None)
+            self._standings.remove(player_id)
+        super().__setitem__(player_id, player)
+        player.bind_standings(self._standings.update)
+        self._standings.add(player)
+
+    def __delitem__(self, player_id: str) -> None:
+        self[player_id].bind_standings(None)
+        super().__delitem__(player_id)
+        self._standings.remove(player_id)
+
+    def pop(self, player_id: str, *default: Any) -> Any:
+        if player_id in self:
+            player = self[player_id]
+            del self[player_id]
+            return player
+        return super().pop(player_id, *default)
+
+    def clear(self) -> None:
+        for player in self.values():
+            player.bind_standings(None)
+        super().clear()
+        self._standings.rebuild([])
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        for player_id, player in dict(*args, **kwargs).items():
+            self[player_id] = player
 
 
 class LeagueManager(BaseGameServer):
@@ -120,7 +185,7 @@ class LeagueManager(BaseGameServer):
 
     Runs as MCP server and manages:
     - Player registration
-    - Round-robin scheduling
+    - Round-robin, Swiss or rating-ladder scheduling
     - League standings
     - Match coordination with referee
     """
@@ -132,6 +197,9 @@ class LeagueManager(BaseGameServer):
         max_players: int = 100,
         host: str = "localhost",
         port: int = 8000,
+        league_format: str = "round_robin",
+        pairing_rounds: int = 0,
+        rounds_per_match: int | None = None,
     ):
         super().__init__(
             name="league_manager",
@@ -143,6 +211,9 @@ class LeagueManager(BaseGameServer):
 
         self.min_players = min_players
         self.max_players = max_players
+        self.rounds_per_match = (
+            rounds_per_match if rounds_per_match is not None else get_config().game.rounds_per_match
+        )
 
         # League state
         self.state = LeagueState.REGISTRATION
@@ -152,11 +223,15 @@ class LeagueManager(BaseGameServer):
         self._referees: dict[str, RegisteredReferee] = {}
         self._referee_id_counter = 0
 
-        # Players
-        self._players: dict[str, RegisteredPlayer] = {}
+        # Players (standings are maintained incrementally as results arrive)
+        self._standings = StandingsTable()
+        self._players = {}
         self._player_id_counter = 0
 
-        # Schedule
+        # Schedule (Swiss/ladder rounds are paired lazily as each round starts)
+        self.league_format = league_format
+        self.pairing_rounds = pairing_rounds
+        self._pairing: SwissPairing | None = create_pairing_engine(league_format)
         self._schedule: list[list[tuple]] = []
         self._matches: dict[str, Match] = {}
         self._current_round_matches: list[Match] = []
@@ -176,6 +251,15 @@ class LeagueManager(BaseGameServer):
         # Register resources
         self._register_resources()
 
+    @property
+    def _players(self) -> dict[str, RegisteredPlayer]:
+        """Registered players, keyed by player ID."""
+        return self._player_registry
+
+    @_players.setter
+    def _players(self, players: dict[str, RegisteredPlayer]) -> None:
+        self._player_registry = _PlayerRegistry(self._standings, players)
+
     def _register_tools(self) -> None:
         """Register league manager tools."""
 
@@ -199,9 +283,35 @@ class LeagueManager(BaseGameServer):
         @self.tool(
             "get_standings",
             "Get current league standings",
+            {
+                "type": "object",
+                "properties": {
+                    "top_k": {"type": "integer", "description": "Only return the top K rows"},
+                },
+            },
         )
         async def get_standings(params: dict) -> dict:
-            return self._get_standings()
+            return self._get_standings(top_k=params.get("top_k"))
+
+        @self.tool(
+            "get_player_rank",
+            "Get a player's current rank",
+            {
+                "type": "object",
+                "properties": {
+                    "player_id": {"type": "string"},
+                },
+                "required": ["player_id"],
+            },
+        )
+        async def get_player_rank(params: dict) -> dict:
+            player_id = params.get("player_id", "")
+            return {
+                "player_id": player_id,
+                "rank": self._standings.rank_of(player_id),
+                "total_players": len(self._standings),
+                "standings_version": self._standings.version,
+            }
 
         @self.tool(
             "get_schedule",
@@ -213,9 +323,19 @@ class LeagueManager(BaseGameServer):
         @self.tool(
             "start_league",
             "Start the league competition",
+            {
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "enum": ["round_robin", "swiss", "ladder"],
+                        "description": "Scheduling format (defaults to the configured one)",
+                    },
+                },
+            },
         )
         async def start_league(params: dict) -> dict:
-            return await self._start_league()
+            return await self._start_league(league_format=params.get("format"))
 
         @self.tool(
             "reset_league",
@@ -336,6 +456,21 @@ class LeagueManager(BaseGameServer):
         async def get_referees(params: dict) -> dict:
             return {"referees": [r.to_dict() for r in self._referees.values()]}
 
+        @self.tool(
+            "verify_peer",
+            "Verify that a peer ID and auth token belong to a registered referee",
+            {
+                "type": "object",
+                "properties": {
+                    "peer_id": {"type": "string"},
+                    "auth_token": {"type": "string"},
+                },
+                "required": ["peer_id", "auth_token"],
+            },
+        )
+        async def verify_peer(params: dict) -> dict:
+            return self._verify_peer(params.get("peer_id", ""), params.get("auth_token", ""))
+
         @self.tool(
             "set_referee",
             "Set the referee endpoint (legacy)",
@@ -431,6 +566,7 @@ class LeagueManager(BaseGameServer):
         )
 
         self._referees[referee_id] = referee
+        self.register_trusted_peer(f"referee:{referee_id}", "referee", auth_token=auth_token)
 
         logger.info(
             f"Referee registered: {referee_id} ({display_name})",
@@ -449,6 +585,22 @@ class LeagueManager(BaseGameServer):
             league_id=self.league_id,
         )
 
+    def _verify_peer(self, peer_id: str, auth_token: str) -> dict[str, Any]:
+        """
+        Check a peer's credentials against the league's registrations.
+
+        Players use this to confirm that a referee inviting them is registered
+        before granting it the referee rate-limit tier.
+        """
+        peer_class, _, referee_id = peer_id.partition(":")
+        referee = self._referees.get(referee_id) if peer_class == "referee" else None
+        valid = referee is not None and bool(auth_token) and referee.auth_token == auth_token
+        return {
+            "peer_id": peer_id,
+            "valid": valid,
+            "peer_class": "referee" if valid else None,
+        }
+
     async def _handle_registration(self, params: dict) -> dict:
         """Handle player registration."""
         display_name = params.get("display_name", "")
@@ -531,7 +683,9 @@ class LeagueManager(BaseGameServer):
         except Exception as e:
             logger.error(f"Failed to emit AgentRegisteredEvent: {e}")
 
-        # Update dashboard with new registration
+        # Update dashboard and resource subscribers with new registration
+        self.notify_resource_updated("league://players")
+        self.notify_resource_updated("league://standings")
         await self._stream_tournament_update()
 
         return self.message_factory.register_response(
@@ -540,12 +694,19 @@ class LeagueManager(BaseGameServer):
             auth_token=auth_token,
         )
 
-    async def _start_league(self) -> dict[str, Any]:
+    async def _start_league(self, league_format: str | None = None) -> dict[str, Any]:
         """Start the league."""
         # Accept both REGISTRATION and READY states for starting
         if self.state not in (LeagueState.REGISTRATION, LeagueState.READY):
             return {"success": False, "error": "League already started or in invalid state"}
 
+        if league_format and league_format != self.league_format:
+            try:
+                self._pairing = create_pairing_engine(league_format)
+            except ValueError as e:
+                return {"success": False, "error": str(e)}
+            self.league_format = league_format
+
         if len(self._players) < self.min_players:
             return {
                 "success": False,
@@ -557,8 +718,16 @@ class LeagueManager(BaseGameServer):
         import os
         repeat_count = int(os.getenv("TOURNAMENT_REPEAT", "3"))
 
-        player_ids = list(self._players.keys())
-        self._schedule = MatchScheduler.create_round_robin_schedule(player_ids, repeat=repeat_count)
+        if self._pairing is None:
+            player_ids = list(self._players.keys())
+            self._schedule = MatchScheduler.create_round_robin_schedule(
+                player_ids, repeat=repeat_count
+            )
+        else:
+            # One placeholder per round; pairings are filled in as rounds start
+            self._pairing.reset()
+            rounds = self.pairing_rounds or self._pairing.recommended_rounds(len(self._players))
+            self._schedule = [[] for _ in range(rounds)]
 
         self.state = LeagueState.READY
 
@@ -568,12 +737,15 @@ class LeagueManager(BaseGameServer):
             rounds=len(self._schedule),
         )
 
-        # Stream initial tournament state to dashboard
+        # Stream initial tournament state to dashboard and resource subscribers
+        self.notify_resource_updated("league://schedule")
+        self.notify_resource_updated("league://standings")
         await self._stream_tournament_update()
 
         return {
             "success": True,
             "players": len(self._players),
+            "format": self.league_format,
             "rounds": len(self._schedule),
             "schedule": self._get_schedule(),
         }
@@ -596,12 +768,15 @@ class LeagueManager(BaseGameServer):
             player.draws = 0
             player.points = 0
             player.played = 0
+        self._standings.rebuild(self._players.values())
 
         logger.info(
             f"League reset complete. {len(self._players)} players and {len(self._referees)} referees still registered."
         )
 
-        # Stream reset state to dashboard
+        # Stream reset state to dashboard and resource subscribers
+        self.notify_resource_updated("league://schedule")
+        self.notify_resource_updated("league://standings")
         await self._stream_tournament_update()
 
         return {
@@ -648,6 +823,10 @@ class LeagueManager(BaseGameServer):
         self.state = LeagueState.IN_PROGRESS
 
         # Get round pairings
+        if self._pairing is not None:
+            self._schedule[self.current_round] = self._pairing.pair_round(
+                self._standings.ranked_ids()
+            )
         pairings = self._schedule[self.current_round]
         self.current_round += 1
 
@@ -695,6 +874,8 @@ class LeagueManager(BaseGameServer):
             matches=len(self._current_round_matches),
             referees_assigned=len([m for m in round_matches_info if m["referee_endpoint"]]),
         )
+        self.notify_resource_updated("league://schedule")
+        self.notify_resource_updated("league://standings")
 
         # Emit tournament round started event
         try:
@@ -717,14 +898,13 @@ class LeagueManager(BaseGameServer):
             matches=round_matches_info,
         )
 
-        # Execute matches through referee (Step 5: Game Management)
-        import asyncio
-
-        for match_info in round_matches_info:
-            await self._send_match_to_referee(match_info)
-
-        # Wait for matches to complete
-        await asyncio.sleep(2)
+        # Execute matches through referee (Step 5: Game Management). Referees
+        # play their matches concurrently; start_match returns once the match
+        # is over and its result reported, so the round is complete when all
+        # dispatches have returned.
+        await asyncio.gather(
+            *(self._send_match_to_referee(match_info) for match_info in round_matches_info)
+        )
 
         # Stream tournament update to dashboard
         await self._stream_tournament_update()
@@ -740,14 +920,10 @@ class LeagueManager(BaseGameServer):
         """
         Run all remaining rounds automatically.
 
-        This orchestrates the full league competition by:
-        1. Starting each round
-        2. Sending match assignments to referee
-        3. Waiting for match completion
-        4. Moving to next round
+        This orchestrates the full league competition by starting each round
+        (which dispatches its matches to the referees and returns once they
+        are complete) until the schedule is exhausted.
         """
-        import asyncio
-
         results = []
         rounds_completed = 0
 
@@ -764,14 +940,7 @@ class LeagueManager(BaseGameServer):
                     "rounds_completed": rounds_completed,
                 }
 
-            # Execute matches through referee
             matches = round_result.get("matches", [])
-            for match_info in matches:
-                await self._send_match_to_referee(match_info)
-
-            # Wait for matches to complete (simple timeout-based approach)
-            await asyncio.sleep(2)
-
             rounds_completed += 1
             results.append(
                 {
@@ -881,14 +1050,16 @@ class LeagueManager(BaseGameServer):
                 logger.error("MCP client not initialized")
                 return
 
-            # Use MCP client to call referee's start_match tool
-            await self._client.connect("referee", referee_endpoint)
+            # Use MCP client to call referee's start_match tool (one
+            # connection per referee, reused across matches)
+            server_name = f"referee@{referee_endpoint}"
+            await self._client.connect(server_name, referee_endpoint)
 
             player_a_id_str = str(player_a_id) if player_a_id is not None else ""
             player_b_id_str = str(player_b_id) if player_b_id is not None else ""
 
             await self._client.call_tool(
-                "referee",
+                server_name,
                 "start_match",
                 {
                     "match_id": match_info.get("match_id"),
@@ -896,7 +1067,7 @@ class LeagueManager(BaseGameServer):
                     "player1_endpoint": self._players[player_a_id_str].endpoint,
                     "player2_id": player_b_id_str,
                     "player2_endpoint": self._players[player_b_id_str].endpoint,
-                    "rounds": 5,
+                    "rounds": self.rounds_per_match,
                 },
             )
 
@@ -962,6 +1133,8 @@ class LeagueManager(BaseGameServer):
         match.winner_id = winner_id
         player1_id = match.player1.player_id if match.player1 else ""
         player2_id = match.player2.player_id if match.player2 else ""
+        if self._pairing is not None and player1_id and player2_id:
+            self._pairing.record_result(player1_id, player2_id, winner_id)
         match.final_score = {
             player1_id: player1_score,
             player2_id: player2_score,
@@ -1040,8 +1213,12 @@ class LeagueManager(BaseGameServer):
         except Exception as e:
             logger.error(f"Failed to emit StandingsUpdatedEvent: {e}")
 
-        # Stream tournament update to dashboard
-        await self._stream_tournament_update()
+        # Stream tournament update to dashboard (built once per frame) and
+        # standings subscribers (read once per notify interval)
+        self.notify_resource_updated("league://standings")
+        if round_complete:
+            self.notify_resource_updated("league://schedule")
+        await self._stream_tournament_update(lazy=True)
 
         # Check if tournament is complete (last round finished)
         tournament_complete = round_complete and self.current_round >= len(self._schedule)
@@ -1049,9 +1226,8 @@ class LeagueManager(BaseGameServer):
             # Tournament is complete! Emit completion event with winner
             self.state = LeagueState.COMPLETED
 
-            # Get final standings
-            final_standings_data = self._get_standings()
-            standings_list = final_standings_data.get("standings", [])
+            # Final standings (unchanged since the snapshot above)
+            standings_list = standings.get("standings", [])
 
             # Determine champion (rank 1)
             champion = None
@@ -1194,33 +1370,24 @@ class LeagueManager(BaseGameServer):
             "round_completed": round_completed_message,
         }
 
-    def _get_standings(self) -> dict[str, Any]:
-        """Get current standings."""
-        # Sort by points, then wins, then goal difference
-        sorted_players = sorted(
-            self._players.values(), key=lambda p: (p.points, p.wins, -p.losses), reverse=True
-        )
+    def _get_standings(self, top_k: int | None = None) -> dict[str, Any]:
+        """
+        Get current standings.
 
-        # Build standings
-        standings = []
-        for i, p in enumerate(sorted_players):
-            standings.append(
-                {
-                    "rank": i + 1,
-                    "player_id": p.player_id,
-                    "display_name": p.display_name,
-                    "played": p.played,
-                    "wins": p.wins,
-                    "draws": p.draws,
-                    "losses": p.losses,
-                    "points": p.points,
-                }
-            )
+        Served from the incrementally maintained table: the full row list is
+        rebuilt only when a result changed it, and ``top_k`` avoids building
+        rows for the rest of the league.
+        """
+        if top_k is not None:
+            standings = self._standings.top(top_k)
+        else:
+            standings = self._standings.snapshot()
 
         return {
             "round_id": self.current_round,
             "total_rounds": len(self._schedule),
             "standings": standings,
+            "standings_version": self._standings.version,
         }
 
     def _get_schedule(self) -> dict[str, Any]:
@@ -1290,11 +1457,30 @@ class LeagueManager(BaseGameServer):
         self._dashboard = dashboard
         logger.info("Dashboard connected to league manager")
 
-    async def _stream_tournament_update(self) -> None:
-        """Stream tournament state update to dashboard."""
+    async def _stream_tournament_update(self, lazy: bool = False) -> None:
+        """
+        Stream tournament state update to dashboard.
+
+        Updates are coalesced by the dashboard's frame scheduler. With
+        ``lazy``, the update is built when the frame is sent, so a burst of
+        match results builds it once per frame.
+        """
         if not self._dashboard:
             return
 
+        if lazy:
+            self._dashboard.publish("tournament_update", self._build_tournament_update)
+            return
+
+        message = self._build_tournament_update()
+        if message is not None:
+            self._dashboard.publish("tournament_update", message)
+
+    def _build_tournament_update(self) -> dict[str, Any] | None:
+        """Build the tournament update message and store the dashboard state."""
+        if not self._dashboard:
+            return None
+
         try:
             # During registration phase, show registered players with 0 stats
             if self.state == LeagueState.REGISTRATION:
@@ -1378,7 +1564,7 @@ class LeagueManager(BaseGameServer):
                     logger.error(
                         f"Standings: {tournament_state.get('standings', [])[:1]}"
                     )  # First player only
-                    return
+                    return None
 
                 # Create the broadcast message
                 broadcast_message = {"type": "tournament_update", "data": serializable_state}
@@ -1389,14 +1575,12 @@ class LeagueManager(BaseGameServer):
                     logger.debug("Full broadcast message is JSON serializable")
                 except TypeError as e:
                     logger.error(f"Broadcast message not serializable: {e}")
-                    return
-
-                await self._dashboard.connection_manager.broadcast(broadcast_message)
+                    return None
 
                 logger.debug(
-                    f"Streamed registration update: {len(self._players)} players registered"
+                    f"Built registration update: {len(self._players)} players registered"
                 )
-                return
+                return broadcast_message
 
             # Get current standings (for active league)
             standings_data = self._get_standings()
@@ -1637,15 +1821,13 @@ class LeagueManager(BaseGameServer):
                 json.dumps(serializable_state)  # Test if it's serializable
             except TypeError as e:
                 logger.error(f"State still not serializable: {e}")
-                return
-
-            await self._dashboard.connection_manager.broadcast(
-                {"type": "tournament_update", "data": serializable_state}
-            )
+                return None
 
             logger.debug(
-                f"Streamed tournament update: Round {self.current_round}/{len(self._schedule)}"
+                f"Built tournament update: Round {self.current_round}/{len(self._schedule)}"
             )
+            return {"type": "tournament_update", "data": serializable_state}
 
         except Exception as e:
-            logger.error(f"Failed to stream tournament update: {e}")
+            logger.error(f"Failed to build tournament update: {e}")
+            return None
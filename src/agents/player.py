@@ -14,8 +14,12 @@ Strategies:
                Fictitious Play, Regret Matching, UCB, Thompson Sampling
 """
 
+import asyncio
+import json
+import time
 from dataclasses import dataclass, field
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, TypedDict
 
 from ..client.mcp_client import MCPClient
 from ..common.config import LLMConfig
@@ -36,6 +40,7 @@ from ..server.base_server import BaseGameServer
 
 # Import strategy framework
 from .strategies import (
+    MoveDecision,
     # Classic strategies (backwards compatibility)
     RandomStrategy,
     Strategy,
@@ -45,12 +50,28 @@ from .strategies import (
 
 logger = get_logger(__name__)
 
+# Seconds before retrying a referee verification that could not complete,
+# doubling with each failure up to the maximum
+PEER_VERIFY_BACKOFF = 5.0
+PEER_VERIFY_MAX_BACKOFF = 300.0
+
 
 # ============================================================================
 # Player Agent
 # ============================================================================
 
 
+class _MoveState(TypedDict):
+    """Game state passed to a strategy's move decision."""
+
+    game_id: str
+    round_number: int
+    my_role: GameRole
+    my_score: int
+    opponent_score: int
+    history: list[dict]
+
+
 @dataclass
 class GameSession:
     """Player's view of an active game."""
@@ -76,6 +97,16 @@ class PlayerAgent(BaseGameServer):
     - Accepts game invitations
     - Makes moves using strategy
     - Tracks game state
+
+    Args:
+        path: HTTP path of the MCP endpoint (``PlayerHost`` serves players
+            under ``/players/{name}/mcp``)
+        client: Shared MCP client; when given, the player neither creates
+            nor stops a client of its own
+        move_time_limit: Cap in seconds on a move's decision time, on top of
+            the deadline the referee sends (None: deadline only)
+        move_margin: Seconds kept back from the referee's deadline for the
+            response to travel back
     """
 
     def __init__(
@@ -86,6 +117,10 @@ class PlayerAgent(BaseGameServer):
         host: str = "localhost",
         port: int = 8101,
         league_manager_url: str = "http://localhost:8000/mcp",
+        path: str = "/mcp",
+        client: MCPClient | None = None,
+        move_time_limit: float | None = None,
+        move_margin: float = 0.25,
     ):
         super().__init__(
             name=player_name,
@@ -93,6 +128,7 @@ class PlayerAgent(BaseGameServer):
             league_id=league_id,
             host=host,
             port=port,
+            path=path,
         )
 
         self.player_name = player_name
@@ -116,8 +152,23 @@ class PlayerAgent(BaseGameServer):
         self._rounds_played: list[int] = []
         self._win_rates: list[float] = []
 
+        # Anytime move decisions
+        self.move_time_limit = move_time_limit
+        self.move_margin = move_margin
+        self._moves_decided = 0
+        self._moves_cut_off = 0
+
         # MCP client
-        self._client: MCPClient | None = None
+        self._client: MCPClient | None = client
+        self._owns_client = client is None
+        self._event_handler_ids: list[str] = []
+
+        # (sender, auth_token) pairs the league manager refused to verify
+        self._rejected_peers: set[tuple[str, str]] = set()
+        # Referee verifications running in the background, and the backoff
+        # (failures, monotonic retry time) after ones that could not complete
+        self._peer_checks: dict[tuple[str, str], asyncio.Task] = {}
+        self._peer_backoff: dict[tuple[str, str], tuple[int, float]] = {}
 
         # Update message factory sender
         self.message_factory = MessageFactory(
@@ -142,6 +193,8 @@ class PlayerAgent(BaseGameServer):
                 "registered": self.registered,
                 "has_auth_token": self.auth_token is not None,
                 "active_games": len(self._games),
+                "moves_decided": self._moves_decided,
+                "moves_cut_off": self._moves_cut_off,
             }
 
         @self.tool(
@@ -247,8 +300,9 @@ class PlayerAgent(BaseGameServer):
 
     async def on_start(self) -> None:
         """Initialize player."""
-        self._client = MCPClient(name=f"{self.player_name}_client")
-        await self._client.start()
+        if self._owns_client:
+            self._client = MCPClient(name=f"{self.player_name}_client")
+            await self._client.start()
 
         # Set player context on strategy for event emission
         if hasattr(self.strategy, 'set_player_context'):
@@ -259,15 +313,26 @@ class PlayerAgent(BaseGameServer):
 
         # Subscribe to strategy learning events and relay them to league manager
         event_bus = get_event_bus()
-        event_bus.on("opponent.model.update", self._relay_strategy_event)
-        event_bus.on("counterfactual.analysis", self._relay_strategy_event)
+        self._event_handler_ids = [
+            event_bus.on("opponent.model.update", self._relay_strategy_event),
+            event_bus.on("counterfactual.analysis", self._relay_strategy_event),
+        ]
         logger.info(f"✓ {self.player_name}: Subscribed to strategy learning events for relay to league manager")
 
         logger.info(f"Player agent {self.player_name} started")
 
     async def on_stop(self) -> None:
         """Cleanup player."""
-        if self._client:
+        event_bus = get_event_bus()
+        for handler_id in self._event_handler_ids:
+            event_bus.off(handler_id)
+        self._event_handler_ids = []
+
+        for task in self._peer_checks.values():
+            task.cancel()
+        self._peer_checks.clear()
+
+        if self._client and self._owns_client:
             await self._client.stop()
         logger.info(f"Player agent {self.player_name} stopped")
 
@@ -277,6 +342,10 @@ class PlayerAgent(BaseGameServer):
 
         This enables cross-process communication for dashboard visualization.
         """
+        # Players sharing a process (and event bus) relay only their own events
+        if getattr(event, "player_id", self.player_name) != self.player_name:
+            return
+
         try:
             event_type = event.event_type
             logger.info(f"[{self.player_name}] 🔍 DEBUG: _relay_strategy_event called for event type: {event_type}")
@@ -340,8 +409,6 @@ class PlayerAgent(BaseGameServer):
             result = response.get("content", [{}])[0]
             if isinstance(result, dict):
                 text = result.get("text", "{}")
-                import json
-
                 data = json.loads(text)
             else:
                 data = response
@@ -355,6 +422,10 @@ class PlayerAgent(BaseGameServer):
                 if self.auth_token:
                     self.message_factory.set_auth_token(self.auth_token)
 
+                # Exempt the league manager we registered with from rate limiting
+                # (it sends no token, so it is trusted by sender ID)
+                self.register_trusted_peer("league_manager", "league_manager")
+
                 logger.info(f"Registered as {self.player_id} with auth token")
                 return True
             else:
@@ -415,8 +486,14 @@ class PlayerAgent(BaseGameServer):
 
         return {"success": True, "accepted": accept}
 
-    async def make_move(self, game_id: str) -> int:
-        """Make a move in a game."""
+    async def make_move(self, game_id: str, budget: float | None = None) -> int:
+        """
+        Make a move in a game.
+
+        The strategy's initial move is refined for at most ``budget`` seconds
+        (capped by ``move_time_limit``); a refinement still running then is
+        cancelled and the best move found so far is played.
+        """
         session = self._games.get(game_id)
         if not session:
             raise ValueError(f"Unknown game: {game_id}")
@@ -444,14 +521,10 @@ class PlayerAgent(BaseGameServer):
 
         start_time = time.time()
 
-        move = await self.strategy.decide_move(
-            game_id=game_id,
-            round_number=session.current_round,
-            my_role=session.my_role,
-            my_score=session.my_score,
-            opponent_score=session.opponent_score,
-            history=session.history,
-        )
+        if self.move_time_limit is not None:
+            budget = self.move_time_limit if budget is None else min(budget, self.move_time_limit)
+        decision = await self._decide_anytime(session, budget)
+        move = decision.move
 
         decision_time_ms = (time.time() - start_time) * 1000
 
@@ -476,6 +549,62 @@ class PlayerAgent(BaseGameServer):
 
         return move
 
+    async def _decide_anytime(self, session: GameSession, budget: float | None) -> MoveDecision:
+        """Run the strategy's anytime protocol within ``budget`` seconds."""
+        state: _MoveState = {
+            "game_id": session.game_id,
+            "round_number": session.current_round,
+            "my_role": session.my_role,
+            "my_score": session.my_score,
+            "opponent_score": session.opponent_score,
+            "history": session.history,
+        }
+        decision = MoveDecision(self.strategy.initial_move(**state))
+
+        outcome = "complete"
+        refining = self.strategy.refine_move(decision, budget, **state)
+        try:
+            if budget is None:
+                await refining
+            else:
+                # Shielded so the task can be cancelled here, not by wait_for
+                task = asyncio.create_task(refining)
+                try:
+                    await asyncio.wait_for(asyncio.shield(task), budget)
+                except TimeoutError:
+                    outcome = "cut_off"
+                finally:
+                    task.cancel()
+        except Exception as e:
+            outcome = "failed"
+            logger.warning(f"Strategy refinement failed, playing best move so far: {e}")
+
+        decision.complete = outcome == "complete"
+        self._moves_decided += 1
+        if outcome == "cut_off":
+            self._moves_cut_off += 1
+        if self.enable_observability:
+            self.metrics.increment(
+                "strategy_decisions_total",
+                labels={"strategy": self.strategy.name, "outcome": outcome},
+            )
+        return decision
+
+    def _move_budget(self, deadline: str | None) -> float | None:
+        """Seconds left to decide before a referee's ISO ``deadline``."""
+        if not deadline:
+            return None
+        try:
+            expires = datetime.fromisoformat(deadline)
+        except ValueError:
+            logger.warning(f"Ignoring malformed move deadline: {deadline}")
+            return None
+        # mypy.ini checks against 3.10, which has no datetime.UTC
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)  # noqa: UP017
+        remaining = (expires - datetime.now(timezone.utc)).total_seconds()  # noqa: UP017
+        return max(0.0, remaining - self.move_margin)
+
     # ========================================================================
     # Protocol Message Handlers
     # ========================================================================
@@ -542,7 +671,72 @@ class PlayerAgent(BaseGameServer):
 
         # Auto-accept within 5 second timeout
         game_id_str = str(game_id) if game_id is not None else ""
-        return await self._respond_to_invitation(game_id_str, True)
+        response = await self._respond_to_invitation(game_id_str, True)
+
+        # Grant the referee tier once its registration is confirmed
+        self._trust_inviting_referee(message)
+        return response
+
+    def _trust_inviting_referee(self, message: dict) -> None:
+        """
+        Verify the inviting referee in the background.
+
+        The invitation is answered first; verification against the league
+        manager runs as a task so a slow league manager cannot make the
+        player miss the acceptance window.
+        """
+        sender = message.get("sender", "")
+        auth_token = message.get("auth_token")
+        if not sender.startswith("referee:") or not auth_token or self._client is None:
+            return
+        key = (sender, auth_token)
+        if self.is_trusted_peer(sender, auth_token) or key in self._rejected_peers:
+            return
+        if key in self._peer_checks:
+            return
+        backoff = self._peer_backoff.get(key)
+        if backoff is not None and time.monotonic() < backoff[1]:
+            return
+
+        task = asyncio.create_task(self._verify_referee(sender, auth_token))
+        self._peer_checks[key] = task
+        task.add_done_callback(lambda _: self._peer_checks.pop(key, None))
+
+    async def _verify_referee(self, sender: str, auth_token: str) -> None:
+        """
+        Register a referee with the rate limiter once the league manager
+        vouches for it.
+
+        Rejections are remembered for good; verifications that could not
+        complete are retried no sooner than an exponential backoff allows.
+        """
+        key = (sender, auth_token)
+        try:
+            if self._client is None:
+                return
+            await self._client.connect("league_manager", self.league_manager_url)
+            response = await self._client.call_tool(
+                "league_manager",
+                "verify_peer",
+                {"peer_id": sender, "auth_token": auth_token},
+                timeout=5.0,
+            )
+            result = response.get("content", [{}])[0] if isinstance(response, dict) else {}
+            data = json.loads(result.get("text", "{}")) if isinstance(result, dict) else {}
+        except Exception as e:
+            failures = self._peer_backoff.get(key, (0, 0.0))[0] + 1
+            delay = min(PEER_VERIFY_BACKOFF * 2 ** (failures - 1), PEER_VERIFY_MAX_BACKOFF)
+            self._peer_backoff[key] = (failures, time.monotonic() + delay)
+            logger.warning(f"Could not verify referee {sender} (retry in {delay:.0f}s): {e}")
+            return
+
+        self._peer_backoff.pop(key, None)
+        if data.get("valid"):
+            self.register_trusted_peer(sender, "referee", auth_token=auth_token)
+            logger.info(f"Verified referee {sender} for rate limiting")
+        else:
+            self._rejected_peers.add(key)
+            logger.warning(f"Referee {sender} failed verification with league manager")
 
     async def _handle_move_request(self, message: dict) -> dict:
         """Handle MOVE_REQUEST message."""
@@ -609,8 +803,8 @@ class PlayerAgent(BaseGameServer):
         session.current_round = round_id
         session.state = "making_move"
 
-        # Decide move (number 1-10)
-        move = await self.make_move(session.game_id)
+        # Decide move (number 1-10) before the referee's deadline
+        move = await self.make_move(session.game_id, self._move_budget(message.get("deadline")))
 
         # Get player's assigned role
         parity_choice = session.my_role.value  # "odd" or "even"
@@ -0,0 +1,519 @@
+"""
+Player Host
+===========
+
+Serves many players from one process and one port.
+
+A ``PlayerAgent`` normally runs its own aiohttp server, so a league of N
+players needs N listening ports. A ``PlayerHost`` routes
+``/players/{name}/mcp`` to agents attached without a listener of their own
+that share one MCP client, so each extra player costs its game state and
+tool table (tens of kilobytes) rather than a server.
+
+``PlayerHostSupervisor`` shards players across worker processes, one
+``PlayerHost`` each. Every worker binds the public port with
+``SO_REUSEPORT`` (the kernel spreads connections across them) plus a shard
+port of its own. Players keep game state, so each lives on exactly one
+shard (``shard_for``) and registers its shard URL with the league; a
+request for another shard's player that reaches the public port is
+redirected (307) to the owning shard.
+
+Usage::
+
+    host = PlayerHost(port=8101)
+    await host.start()
+    await host.add_player("Player_1", RandomStrategy())
+
+    supervisor = PlayerHostSupervisor([f"Player_{i}" for i in range(1000)], register=True)
+    supervisor.serve_forever()
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import threading
+import time
+import zlib
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from aiohttp import web
+
+from ..client.mcp_client import MCPClient
+from ..common.logger import get_logger
+from ..transport.json_rpc import JsonRpcError, create_error_response
+from .player import PlayerAgent
+from .strategies import RandomStrategy, Strategy, StrategyFactory
+
+logger = get_logger(__name__)
+
+PLAYER_PATH = "/players/{name}/mcp"
+
+HAS_REUSE_PORT = hasattr(socket, "SO_REUSEPORT")
+
+
+def shard_for(player_name: str, shards: int) -> int:
+    """Stable shard index of a player (the same in every process)."""
+    return zlib.crc32(player_name.encode("utf-8")) % max(1, shards)
+
+
+class PlayerHost:
+    """
+    One aiohttp server hosting many players.
+
+    Args:
+        host: Bind address, also used in player endpoint URLs
+        port: Public port (0 picks a free port)
+        reuse_port: Bind the public port with ``SO_REUSEPORT`` so several
+            processes can share it
+        shard_port: Extra port only this host listens on; when set, player
+            endpoints use it
+        shard_index: This host's shard, used with ``shard_urls``
+        shard_urls: Base URL of every shard, indexed by shard; requests for
+            players of another shard are redirected there
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8101,
+        league_id: str = "league_2024_01",
+        league_manager_url: str = "http://localhost:8000/mcp",
+        reuse_port: bool = False,
+        shard_port: int | None = None,
+        shard_index: int = 0,
+        shard_urls: Sequence[str] = (),
+    ):
+        self.host = host
+        self.port = port
+        self.league_id = league_id
+        self.league_manager_url = league_manager_url
+        self.reuse_port = reuse_port
+        self.shard_port = shard_port
+        self.shard_index = shard_index
+        self.shard_urls = list(shard_urls)
+
+        self._players: dict[str, PlayerAgent] = {}
+        self._client = MCPClient(name="player_host_client")
+        self._runner: web.AppRunner | None = None
+        self._running = False
+        self._start_time: datetime | None = None
+        self.redirects = 0
+
+    # ========================================================================
+    # Players
+    # ========================================================================
+
+    @property
+    def endpoint_port(self) -> int:
+        """Port players advertise (the shard port when there is one)."""
+        return self.shard_port or self.port
+
+    def player_url(self, name: str) -> str:
+        """MCP endpoint URL of a hosted player."""
+        return f"http://{self.host}:{self.endpoint_port}{PLAYER_PATH.format(name=name)}"
+
+    async def add_player(self, name: str, strategy: Strategy | None = None) -> PlayerAgent:
+        """Host a new player (started immediately if the host is running)."""
+        if name in self._players:
+            raise ValueError(f"Player already hosted: {name}")
+
+        player = PlayerAgent(
+            player_name=name,
+            strategy=strategy,
+            league_id=self.league_id,
+            host=self.host,
+            port=self.endpoint_port,
+            league_manager_url=self.league_manager_url,
+            path=PLAYER_PATH.format(name=name),
+            client=self._client,
+        )
+        self._players[name] = player
+        if self._running:
+            await player.attach()
+        return player
+
+    async def remove_player(self, name: str) -> bool:
+        """Stop hosting a player."""
+        player = self._players.pop(name, None)
+        if player is None:
+            return False
+        await player.detach()
+        return True
+
+    def get_player(self, name: str) -> PlayerAgent | None:
+        """Get a hosted player by name."""
+        return self._players.get(name)
+
+    @property
+    def players(self) -> list[PlayerAgent]:
+        """All hosted players."""
+        return list(self._players.values())
+
+    async def register_all(self, concurrency: int = 16) -> int:
+        """
+        Register every unregistered player with the league.
+
+        Returns:
+            Number of players registered
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def register(player: PlayerAgent) -> bool:
+            async with semaphore:
+                return await player.register_with_league()
+
+        pending = [p for p in self._players.values() if not p.registered]
+        results = await asyncio.gather(*(register(p) for p in pending))
+        return sum(results)
+
+    # ========================================================================
+    # HTTP
+    # ========================================================================
+
+    async def _handle_player_request(self, request: web.Request) -> web.StreamResponse:
+        name = request.match_info["name"]
+        player = self._players.get(name)
+        if player is not None:
+            if request.method == "GET":
+                return await player._handle_websocket(request)
+            return await player._handle_http_request(request)
+
+        if self.shard_urls:
+            owner = shard_for(name, len(self.shard_urls))
+            if owner != self.shard_index:
+                self.redirects += 1
+                raise web.HTTPTemporaryRedirect(f"{self.shard_urls[owner]}{request.path_qs}")
+
+        error = JsonRpcError.invalid_request(f"Unknown player: {name}")
+        return web.json_response(create_error_response(None, error).to_dict(), status=404)
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        uptime = 0.0
+        if self._start_time:
+            uptime = (datetime.now() - self._start_time).total_seconds()
+
+        return web.json_response(
+            {
+                "status": "healthy",
+                "players": len(self._players),
+                "shard": self.shard_index,
+                "shards": len(self.shard_urls) or 1,
+                "pid": os.getpid(),
+                "uptime_seconds": uptime,
+            }
+        )
+
+    async def _handle_list_players(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "players": [
+                    {
+                        "name": name,
+                        "player_id": player.player_id,
+                        "registered": player.registered,
+                        "endpoint": player.url,
+                    }
+                    for name, player in self._players.items()
+                ]
+            }
+        )
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    async def start(self) -> None:
+        """Start listening and attach all hosted players."""
+        if self._running:
+            return
+
+        app = web.Application()
+        app.router.add_post(PLAYER_PATH, self._handle_player_request)
+        app.router.add_get(PLAYER_PATH, self._handle_player_request)
+        app.router.add_get("/players", self._handle_list_players)
+        app.router.add_get("/health", self._handle_health)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self.host, self.port, reuse_port=self.reuse_port or None)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+        if self.shard_port is not None:
+            await web.TCPSite(self._runner, self.host, self.shard_port).start()
+
+        await self._client.start()
+        self._running = True
+        self._start_time = datetime.now()
+
+        for player in self._players.values():
+            player.port = self.endpoint_port
+            await player.attach()
+
+        logger.info(
+            f"Player host started at http://{self.host}:{self.port} "
+            f"(shard {self.shard_index}, {len(self._players)} players)"
+        )
+
+    async def stop(self) -> None:
+        """Detach all players and stop listening."""
+        if not self._running:
+            return
+
+        for player in self._players.values():
+            await player.detach()
+        await self._client.stop()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+        self._running = False
+        logger.info(f"Player host stopped (shard {self.shard_index})")
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the host is running."""
+        return self._running
+
+
+# ============================================================================
+# Multi-process supervisor
+# ============================================================================
+
+
+@dataclass
+class HostedPlayerSpec:
+    """A player to create inside a host worker process."""
+
+    name: str
+    strategy: str = "random"
+    strategy_kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _ShardConfig:
+    index: int
+    players: list[HostedPlayerSpec]
+    host: str
+    port: int
+    shard_port: int | None
+    shard_urls: list[str]
+    reuse_port: bool
+    league_id: str
+    league_manager_url: str
+    register: bool
+
+
+def _create_strategy(spec: HostedPlayerSpec) -> Strategy:
+    try:
+        return StrategyFactory.create_from_string(spec.strategy, **spec.strategy_kwargs)
+    except ValueError as e:
+        logger.warning(f"Unknown strategy '{spec.strategy}', using RandomStrategy: {e}")
+        return RandomStrategy()
+
+
+async def _serve_shard(config: _ShardConfig, ready: Any) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    host = PlayerHost(
+        host=config.host,
+        port=config.port,
+        league_id=config.league_id,
+        league_manager_url=config.league_manager_url,
+        reuse_port=config.reuse_port,
+        shard_port=config.shard_port,
+        shard_index=config.index,
+        shard_urls=config.shard_urls,
+    )
+    try:
+        for spec in config.players:
+            await host.add_player(spec.name, _create_strategy(spec))
+        await host.start()
+        if config.register:
+            await host.register_all()
+    except Exception as e:
+        ready.put((config.index, f"{type(e).__name__}: {e}"))
+        await host.stop()
+        return
+
+    ready.put((config.index, None))
+    try:
+        await stop_event.wait()
+    finally:
+        await host.stop()
+
+
+def _run_shard(config: _ShardConfig, ready: Any) -> None:
+    """Worker process entry point."""
+    asyncio.run(_serve_shard(config, ready))
+
+
+class PlayerHostSupervisor:
+    """
+    Shards players across worker processes, one ``PlayerHost`` each.
+
+    Args:
+        players: Player names or specs
+        workers: Worker processes (default: one per core, at most one per player)
+        port: Public port shared by all workers
+        shard_port_base: Worker ``i`` also listens on ``shard_port_base + i``
+            (default: the ports right after ``port``)
+        register: Register every player with the league once its worker is up
+        start_method: ``multiprocessing`` start method for the workers
+    """
+
+    def __init__(
+        self,
+        players: Sequence[HostedPlayerSpec | str],
+        workers: int | None = None,
+        host: str = "localhost",
+        port: int = 8101,
+        shard_port_base: int | None = None,
+        league_id: str = "league_2024_01",
+        league_manager_url: str = "http://localhost:8000/mcp",
+        register: bool = False,
+        start_method: str = "spawn",
+    ):
+        self.players = [
+            p if isinstance(p, HostedPlayerSpec) else HostedPlayerSpec(p) for p in players
+        ]
+        self.workers = max(1, min(workers or os.cpu_count() or 1, len(self.players) or 1))
+        self.host = host
+        self.port = port
+        self.shard_port_base = shard_port_base if shard_port_base is not None else port + 1
+        self.league_id = league_id
+        self.league_manager_url = league_manager_url
+        self.register = register
+
+        self._context: Any = multiprocessing.get_context(start_method)
+        self._processes: list[Any] = []
+        self._stop_requested = threading.Event()
+
+    def shard_url(self, index: int) -> str:
+        """Base URL of a worker's own port."""
+        return f"http://{self.host}:{self.shard_port_base + index}"
+
+    def shards(self) -> list[list[HostedPlayerSpec]]:
+        """Players of each worker."""
+        shards: list[list[HostedPlayerSpec]] = [[] for _ in range(self.workers)]
+        for spec in self.players:
+            shards[shard_for(spec.name, self.workers)].append(spec)
+        return shards
+
+    def endpoints(self) -> dict[str, str]:
+        """MCP endpoint URL of every player (on its worker's shard port)."""
+        return {
+            spec.name: self.shard_url(shard_for(spec.name, self.workers))
+            + PLAYER_PATH.format(name=spec.name)
+            for spec in self.players
+        }
+
+    def start(self, timeout: float = 60.0) -> None:
+        """
+        Start the workers and wait until every one is serving.
+
+        Raises:
+            RuntimeError: If a worker fails or is not ready within ``timeout``
+        """
+        if self._processes:
+            return
+
+        ready = self._context.Queue()
+        shard_urls = [self.shard_url(i) for i in range(self.workers)]
+        for index, specs in enumerate(self.shards()):
+            config = _ShardConfig(
+                index=index,
+                players=specs,
+                host=self.host,
+                port=self.port,
+                shard_port=self.shard_port_base + index,
+                shard_urls=shard_urls,
+                # Without SO_REUSEPORT only the first worker takes the public port
+                reuse_port=HAS_REUSE_PORT,
+                league_id=self.league_id,
+                league_manager_url=self.league_manager_url,
+                register=self.register,
+            )
+            if not HAS_REUSE_PORT and index > 0:
+                config.port, config.shard_port = config.shard_port, None
+            process = self._context.Process(
+                target=_run_shard, args=(config, ready), name=f"player-host-{index}", daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+        deadline = time.monotonic() + timeout
+        pending = set(range(self.workers))
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(f"Player host workers {sorted(pending)} not ready")
+                try:
+                    index, error = ready.get(timeout=min(remaining, 0.5))
+                except queue.Empty:
+                    dead = [i for i in pending if not self._processes[i].is_alive()]
+                    if dead:
+                        raise RuntimeError(f"Player host workers {dead} exited") from None
+                    continue
+                if error is not None:
+                    raise RuntimeError(f"Player host worker {index} failed: {error}")
+                pending.discard(index)
+        except BaseException:
+            self.stop()
+            raise
+
+        logger.info(
+            f"Player host supervisor started {self.workers} workers for "
+            f"{len(self.players)} players on port {self.port}"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop all workers (SIGTERM, then SIGKILL after ``timeout``)."""
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self._processes = []
+
+    def serve_forever(self) -> None:
+        """Start the workers and supervise them until SIGINT/SIGTERM."""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: self._stop_requested.set())
+
+        self.start()
+        try:
+            while not self._stop_requested.wait(1.0):
+                dead = [p.name for p in self._processes if not p.is_alive()]
+                if dead:
+                    logger.error(f"Player host workers exited: {dead}")
+                    break
+        finally:
+            self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if every worker is alive."""
+        return bool(self._processes) and all(p.is_alive() for p in self._processes)
+
+    def __enter__(self) -> "PlayerHostSupervisor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -9,6 +9,9 @@ Manages individual games:
 - Declare results
 """
 
+import asyncio
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -29,6 +32,9 @@ from ..server.base_server import BaseGameServer
 
 logger = get_logger(__name__)
 
+# Recent round latencies kept for get_referee_stats
+ROUND_LATENCY_WINDOW = 10000
+
 
 class RefereeState(Enum):
     """Referee state matching game states."""
@@ -61,6 +67,9 @@ class RefereeAgent(BaseGameServer):
     - Manages game rounds
     - Validates moves
     - Reports results to league manager
+
+    Player traffic goes over one multiplexed WebSocket per player by default
+    (``client_transport="websocket"``); pass "http" for a request per message.
     """
 
     def __init__(
@@ -71,6 +80,7 @@ class RefereeAgent(BaseGameServer):
         port: int = 8001,
         move_timeout: float = 30.0,
         league_manager_url: str | None = None,
+        client_transport: str = "websocket",
     ):
         self.referee_id = referee_id
         super().__init__(
@@ -83,6 +93,7 @@ class RefereeAgent(BaseGameServer):
 
         self.move_timeout = move_timeout
         self.league_manager_url = league_manager_url or "http://localhost:8000/mcp"
+        self.client_transport = client_transport
 
         # Registration state
         self.auth_token: str | None = None
@@ -95,6 +106,11 @@ class RefereeAgent(BaseGameServer):
         self._sessions: dict[str, GameSession] = {}
         self._player_connections: dict[str, str] = {}  # player_id -> endpoint
 
+        # Load statistics (get_referee_stats)
+        self.matches_completed = 0
+        self.dropped_messages = 0  # Protocol messages that failed to send
+        self._round_latencies: deque[float] = deque(maxlen=ROUND_LATENCY_WINDOW)
+
         # MCP client for communicating with players
         self._client: MCPClient | None = None
 
@@ -224,6 +240,19 @@ class RefereeAgent(BaseGameServer):
                 "active_matches": list(self._sessions.keys()),
             }
 
+        @self.tool(
+            "get_referee_stats",
+            "Get completed matches, dropped messages and round latencies",
+        )
+        async def get_referee_stats(params: dict) -> dict:
+            return {
+                "referee_id": self.referee_id,
+                "active_games": sum(1 for s in self._sessions.values() if s.state != "complete"),
+                "matches_completed": self.matches_completed,
+                "dropped_messages": self.dropped_messages,
+                "round_latency_ms": [round(latency * 1000, 3) for latency in self._round_latencies],
+            }
+
     def _register_resources(self) -> None:
         """Register referee resources."""
 
@@ -239,7 +268,7 @@ class RefereeAgent(BaseGameServer):
 
     async def on_start(self) -> None:
         """Initialize referee."""
-        self._client = MCPClient(name=f"{self.referee_id}_client")
+        self._client = MCPClient(name=f"{self.referee_id}_client", transport=self.client_transport)
         await self._client.start()
         logger.info(f"Referee agent {self.referee_id} started")
 
@@ -290,6 +319,10 @@ class RefereeAgent(BaseGameServer):
                 if self.auth_token:
                     self.message_factory.set_auth_token(self.auth_token)
 
+                # Exempt the league manager we registered with from rate limiting
+                # (it sends no token, so it is trusted by sender ID)
+                self.register_trusted_peer("league_manager", "league_manager")
+
                 logger.info(f"Referee {self.referee_id} registered with league")
                 return True
             else:
@@ -347,6 +380,7 @@ class RefereeAgent(BaseGameServer):
             move_timeout=self.move_timeout,
         )
         self._sessions[game.game_id] = session
+        self._game_state_changed(session)
 
         # Store player connections
         self._player_connections[player1_id_str] = player1_endpoint_str
@@ -379,11 +413,13 @@ class RefereeAgent(BaseGameServer):
         if not both_accepted:
             logger.error(f"Not all players accepted game {session.game.game_id}")
             session.state = "cancelled"
+            self._game_state_changed(session)
             return
 
         # Step 2: Start the game (match.start() internally calls game.start())
         session.match.start()
         session.state = "running"
+        self._game_state_changed(session)
         logger.info(f"Game started: {session.game.game_id}")
 
         # Emit match started event
@@ -450,6 +486,7 @@ class RefereeAgent(BaseGameServer):
                     accepted_count += 1
 
             except Exception as e:
+                self.dropped_messages += 1
                 logger.error(f"Failed to send invitation to {player_id}: {e}")
 
         session.state = "both_accepted" if accepted_count == 2 else "waiting_for_acceptance"
@@ -464,6 +501,7 @@ class RefereeAgent(BaseGameServer):
         game = session.game
         match = session.match
         moves = {}
+        started = time.perf_counter()
 
         # Emit round started event
         try:
@@ -485,8 +523,7 @@ class RefereeAgent(BaseGameServer):
 
         deadline = (datetime.utcnow() + timedelta(seconds=self.move_timeout)).isoformat() + "Z"
 
-        # Request parity choices from both players
-        for player_id in [game.player1_id, game.player2_id]:
+        async def request_move(player_id: str) -> None:
             opponent_id = game.get_opponent_id(player_id)
 
             # Build CHOOSE_PARITY_CALL message
@@ -506,7 +543,9 @@ class RefereeAgent(BaseGameServer):
 
             try:
                 if self._client is not None and player_id in self._client.connected_servers:
-                    response = await self._client.send_protocol_message(player_id, parity_call)
+                    response = await self._client.send_protocol_message(
+                        player_id, parity_call, timeout=self.move_timeout
+                    )
                     # CHOOSE_PARITY_RESPONSE contains:
                     # - parity_choice: "odd" or "even" (player's role)
                     # - move: the actual number choice (1-10)
@@ -515,10 +554,14 @@ class RefereeAgent(BaseGameServer):
                         moves[player_id] = int(move)
                         logger.debug(f"Received move from {player_id}: {move}")
             except Exception as e:
+                self.dropped_messages += 1
                 logger.error(f"Failed to get parity choice from {player_id}: {e}")
                 # Default move on error
                 moves[player_id] = 3
 
+        # Request parity choices from both players at once; they share the deadline
+        await asyncio.gather(request_move(game.player1_id), request_move(game.player2_id))
+
         # Play the round
         if game.player1_id in moves and game.player2_id in moves:
             # Submit both moves
@@ -536,6 +579,7 @@ class RefereeAgent(BaseGameServer):
 
             # Send round results to players
             await self._send_round_results(session, round_result)
+            self._round_latencies.append(time.perf_counter() - started)
 
     async def handle_game_acceptance(
         self,
@@ -705,6 +749,7 @@ class RefereeAgent(BaseGameServer):
     async def _send_round_results(self, session: GameSession, result) -> None:
         """Send round results to both players."""
         game = session.game
+        self._game_state_changed(session)
 
         for player_id in [game.player1_id, game.player2_id]:
             game.get_opponent_id(player_id)
@@ -734,6 +779,7 @@ class RefereeAgent(BaseGameServer):
                 if self._client is not None and player_id in self._client.connected_servers:
                     await self._client.send_protocol_message(player_id, result_msg)
             except Exception as e:
+                self.dropped_messages += 1
                 logger.error(f"Failed to send result to {player_id}: {e}")
 
     async def _complete_game(self, session: GameSession) -> None:
@@ -754,6 +800,8 @@ class RefereeAgent(BaseGameServer):
 
         session.state = "complete"
         match.complete(game_result)
+        self.matches_completed += 1
+        self._game_state_changed(session)
 
         # Calculate final drawn_number (sum of last round's moves or total score)
         last_round = game_result.rounds[-1] if game_result.rounds else None
@@ -829,6 +877,7 @@ class RefereeAgent(BaseGameServer):
                 if self._client is not None and player_id in self._client.connected_servers:
                     await self._client.send_protocol_message(player_id, game_over_msg)
             except Exception as e:
+                self.dropped_messages += 1
                 logger.error(f"Failed to send GAME_OVER to {player_id}: {e}")
 
         # Step 5.6: Report to league manager
@@ -890,8 +939,13 @@ class RefereeAgent(BaseGameServer):
             )
 
         except Exception as e:
+            self.dropped_messages += 1
             logger.error(f"Failed to report to league manager: {e}")
 
+    def _game_state_changed(self, session: GameSession) -> None:
+        """Push the game's state resource to its subscribers."""
+        self.notify_resource_updated(f"game://state/{session.game.game_id}")
+
     def _get_game_state(self, game_id: str) -> dict[str, Any]:
         """Get game state."""
         session = self._sessions.get(game_id)
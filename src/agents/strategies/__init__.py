@@ -24,42 +24,92 @@ Usage:
             pass
 """
 
-from .base import (
-    GameTheoryStrategy,
-    OpponentModel,
-    ParityChoice,
-    Strategy,
-    StrategyConfig,
-)
-from .classic import (
-    LLMStrategy,
-    PatternStrategy,
-    RandomStrategy,
-)
-from .factory import (
-    StrategyFactory,
-    StrategyType,
-    create_strategy,
-    get_recommended,
-    list_strategies,
-)
-from .game_theory import (
-    AdaptiveBayesianStrategy,
-    BestResponseStrategy,
-    FictitiousPlayStrategy,
-    NashEquilibriumStrategy,
-    RegretMatchingStrategy,
-    ThompsonSamplingStrategy,
-    UCBStrategy,
-)
-from .plugin_registry import (
-    StrategyPluginRegistry,
-    create_strategy_plugin,
-    get_strategy_plugin,
-    get_strategy_plugin_registry,
-    list_strategy_plugins,
-    register_strategy_plugin,
-    strategy_plugin,
+from typing import TYPE_CHECKING
+
+from ...common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import (
+        GameTheoryStrategy,
+        MoveDecision,
+        OpponentModel,
+        ParityChoice,
+        Strategy,
+        StrategyConfig,
+    )
+    from .classic import (
+        LLMStrategy,
+        PatternStrategy,
+        RandomStrategy,
+    )
+    from .factory import (
+        StrategyFactory,
+        StrategyType,
+        create_strategy,
+        get_recommended,
+        list_strategies,
+    )
+    from .game_theory import (
+        AdaptiveBayesianStrategy,
+        BestResponseStrategy,
+        FictitiousPlayStrategy,
+        NashEquilibriumStrategy,
+        RegretMatchingStrategy,
+        ThompsonSamplingStrategy,
+        UCBStrategy,
+    )
+    from .plugin_registry import (
+        StrategyPluginRegistry,
+        create_strategy_plugin,
+        get_strategy_plugin,
+        get_strategy_plugin_registry,
+        list_strategy_plugins,
+        register_strategy_plugin,
+        strategy_plugin,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".base": (
+            "GameTheoryStrategy",
+            "MoveDecision",
+            "OpponentModel",
+            "ParityChoice",
+            "Strategy",
+            "StrategyConfig",
+        ),
+        ".classic": (
+            "LLMStrategy",
+            "PatternStrategy",
+            "RandomStrategy",
+        ),
+        ".factory": (
+            "StrategyFactory",
+            "StrategyType",
+            "create_strategy",
+            "get_recommended",
+            "list_strategies",
+        ),
+        ".game_theory": (
+            "AdaptiveBayesianStrategy",
+            "BestResponseStrategy",
+            "FictitiousPlayStrategy",
+            "NashEquilibriumStrategy",
+            "RegretMatchingStrategy",
+            "ThompsonSamplingStrategy",
+            "UCBStrategy",
+        ),
+        ".plugin_registry": (
+            "StrategyPluginRegistry",
+            "create_strategy_plugin",
+            "get_strategy_plugin",
+            "get_strategy_plugin_registry",
+            "list_strategy_plugins",
+            "register_strategy_plugin",
+            "strategy_plugin",
+        ),
+    },
 )
 
 __all__ = [
@@ -69,6 +119,7 @@ __all__ = [
     "StrategyConfig",
     "OpponentModel",
     "ParityChoice",
+    "MoveDecision",
     # Classic strategies
     "RandomStrategy",
     "PatternStrategy",
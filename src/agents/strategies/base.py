@@ -9,6 +9,7 @@ Key Concepts:
 - GameTheoryStrategy: Base class with opponent modeling for game theory strategies
 - ParityChoice: Enum for ODD/EVEN parity decisions
 - OpponentModel: Tracks opponent's behavior for exploitation
+- MoveDecision: Best-so-far move of an anytime decision
 """
 
 import random
@@ -18,7 +19,7 @@ from enum import Enum
 from typing import Any
 
 from ...common.logger import get_logger
-from ..player import GameRole
+from ...game.odd_even import GameRole
 
 logger = get_logger(__name__)
 
@@ -239,6 +240,26 @@ class StrategyConfig:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
+@dataclass
+class MoveDecision:
+    """
+    Best-so-far move of an anytime decision.
+
+    The player creates it from ``Strategy.initial_move`` and strategies
+    improve it in place from ``Strategy.refine_move``; whatever it holds
+    when the time budget runs out is played.
+    """
+
+    move: int
+    refinements: int = 0
+    complete: bool = False  # refine_move returned before the budget ran out
+
+    def improve(self, move: int) -> None:
+        """Replace the best-so-far move."""
+        self.move = move
+        self.refinements += 1
+
+
 class Strategy(ABC):
     """
     Abstract base class for all player strategies.
@@ -299,6 +320,53 @@ class Strategy(ABC):
         """
         pass
 
+    def initial_move(
+        self,
+        game_id: str,
+        round_number: int,
+        my_role: GameRole,
+        my_score: int,
+        opponent_score: int,
+        history: list[dict],
+    ) -> int:
+        """
+        Move to play if refinement gets no time at all.
+
+        Must return immediately. The default is a uniformly random number,
+        the Nash equilibrium of the game.
+        """
+        return random.randint(self.config.min_value, self.config.max_value)
+
+    async def refine_move(
+        self,
+        decision: MoveDecision,
+        budget: float | None,
+        game_id: str,
+        round_number: int,
+        my_role: GameRole,
+        my_score: int,
+        opponent_score: int,
+        history: list[dict],
+    ) -> None:
+        """
+        Improve ``decision`` within ``budget`` seconds (None: no limit).
+
+        Cancelled once the budget is spent, so strategies that search
+        iteratively should call ``decision.improve`` after every step and
+        yield to the event loop between steps. The default runs
+        ``decide_move`` once.
+        """
+        decision.improve(
+            await self.decide_move(
+                game_id=game_id,
+                round_number=round_number,
+                my_role=my_role,
+                my_score=my_score,
+                opponent_score=opponent_score,
+                history=history,
+            )
+        )
+
     @abstractmethod
     def reset(self) -> None:
         """Reset strategy state for a new game."""
@@ -24,7 +24,10 @@ Based on "Regret Minimization in Games with Incomplete Information" (Zinkevich e
 Proven to converge to Nash equilibrium at rate O(1/√T).
 """
 
+import heapq
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -59,6 +62,71 @@ class CounterfactualOutcome:
     round: int
 
 
+class CounterfactualHistory:
+    """
+    Counterfactual outcomes bucketed by round.
+
+    Behaves like the list of outcomes in insertion order, and adds O(1)
+    lookups of one round (``for_round``, ``latest``), range queries over
+    rounds (``between``) and a running ``total_regret``.
+    """
+
+    def __init__(self) -> None:
+        self._outcomes: list[CounterfactualOutcome] = []
+        self._by_round: dict[int, list[CounterfactualOutcome]] = {}
+        # Sorted round numbers (rounds normally arrive in order: O(1) append)
+        self._rounds: list[int] = []
+        self.total_regret = 0.0
+
+    def append(self, outcome: CounterfactualOutcome) -> None:
+        """Record an outcome under its round."""
+        self._outcomes.append(outcome)
+        self.total_regret += outcome.regret
+
+        bucket = self._by_round.get(outcome.round)
+        if bucket is None:
+            bucket = self._by_round[outcome.round] = []
+            if not self._rounds or outcome.round > self._rounds[-1]:
+                self._rounds.append(outcome.round)
+            else:
+                insort(self._rounds, outcome.round)
+        bucket.append(outcome)
+
+    def for_round(self, round_num: int) -> list[CounterfactualOutcome]:
+        """Get the outcomes of one round."""
+        return list(self._by_round.get(round_num, ()))
+
+    def latest_round(self) -> int | None:
+        """Get the highest round with outcomes."""
+        return self._rounds[-1] if self._rounds else None
+
+    def latest(self) -> list[CounterfactualOutcome]:
+        """Get the outcomes of the highest round."""
+        return self.for_round(self._rounds[-1]) if self._rounds else []
+
+    def between(self, start_round: int, end_round: int) -> Iterator[CounterfactualOutcome]:
+        """Iterate outcomes of rounds ``start_round..end_round`` (inclusive), by round."""
+        lo = bisect_left(self._rounds, start_round)
+        hi = bisect_right(self._rounds, end_round)
+        for round_num in self._rounds[lo:hi]:
+            yield from self._by_round[round_num]
+
+    def clear(self) -> None:
+        self._outcomes.clear()
+        self._by_round.clear()
+        self._rounds.clear()
+        self.total_regret = 0.0
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    def __iter__(self) -> Iterator[CounterfactualOutcome]:
+        return iter(self._outcomes)
+
+    def __getitem__(self, index):
+        return self._outcomes[index]
+
+
 @dataclass
 class RegretTable:
     """
@@ -111,7 +179,7 @@ class CounterfactualReasoningEngine:
         self.regret_table = RegretTable()
 
         # History of counterfactual analyses
-        self.counterfactual_history: list[CounterfactualOutcome] = []
+        self.counterfactual_history = CounterfactualHistory()
 
         # Opponent model for counterfactual estimation
         from .opponent_modeling import OpponentModelingEngine
@@ -309,11 +377,11 @@ class CounterfactualReasoningEngine:
         if not self.counterfactual_history:
             return {"total_regret": 0, "average_regret": 0, "analysis": []}
 
-        total_regret = sum(cf.regret for cf in self.counterfactual_history)
+        total_regret = self.counterfactual_history.total_regret
         avg_regret = total_regret / len(self.counterfactual_history)
 
         # Find most regretful decisions
-        sorted_cfs = sorted(self.counterfactual_history, key=lambda cf: cf.regret, reverse=True)
+        sorted_cfs = heapq.nlargest(5, self.counterfactual_history, key=lambda cf: cf.regret)
 
         analysis = {
             "total_regret": total_regret,
@@ -328,7 +396,7 @@ class CounterfactualReasoningEngine:
                     "actual_reward": cf.actual_reward,
                     "potential_reward": cf.counterfactual_reward,
                 }
-                for cf in sorted_cfs[:5]
+                for cf in sorted_cfs
             ],
         }
 
@@ -0,0 +1,437 @@
+"""
+Genome Evolution
+================
+
+Evolutionary search over ``StrategyGenome`` compositions.
+
+Genomes are scored by simulating Odd/Even matches in-process against a
+panel of primitive opponents, once in each role. The primitives are
+cooperate/defect strategies; in the simulation "cooperate" plays an odd
+number and "defect" an even one, so a composite's choices decide the
+parity of the sum. The unseen genomes of a
+generation are scored in parallel on a process pool; fitness is cached by
+genome, so elites and duplicate offspring are never simulated twice.
+Each generation can be checkpointed to disk and the search resumed.
+
+Usage:
+    engine = EvolutionEngine(EvolutionConfig(generations=30), "evolution.json")
+    result = engine.run()
+    for genes, fitness in result.best:
+        print(fitness, genes)
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import time
+import zlib
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+from ...common.logger import get_logger
+from ...game.odd_even import GameRole, OddEvenRules
+from .hierarchical_composition import (
+    AlwaysCooperatePrimitive,
+    AlwaysDefectPrimitive,
+    GrudgerPrimitive,
+    PavlovPrimitive,
+    PrimitiveStrategy,
+    RandomPrimitive,
+    StrategyGenome,
+    TitForTatPrimitive,
+)
+
+logger = get_logger(__name__)
+
+# A genome's genes as an immutable (hashable) value: ((primitive, weight), ...)
+Genes = tuple[tuple[str, float], ...]
+
+PRIMITIVES: dict[str, type[PrimitiveStrategy]] = {
+    "tit_for_tat": TitForTatPrimitive,
+    "pavlov": PavlovPrimitive,
+    "grudger": GrudgerPrimitive,
+    "always_cooperate": AlwaysCooperatePrimitive,
+    "always_defect": AlwaysDefectPrimitive,
+    "random": RandomPrimitive,
+}
+
+_RULES = OddEvenRules()
+# Number played for each primitive action: cooperating plays odd, defecting even
+ACTION_MOVES = {"cooperate": _RULES.min_value, "defect": _RULES.min_value + 1}
+
+
+# ============================================================================
+# Configuration and Results
+# ============================================================================
+
+
+@dataclass
+class EvolutionConfig:
+    """Parameters of the evolutionary search."""
+
+    population_size: int = 64
+    generations: int = 20
+    elite_count: int = 4  # Best genomes carried over unchanged
+    tournament_size: int = 3
+    crossover_rate: float = 0.7
+    mutation_rate: float = 0.1
+
+    # Fitness simulation
+    rounds: int = 20  # Rounds per simulated match
+    opponents: tuple[str, ...] = tuple(PRIMITIVES)
+    seed: int = 0
+
+    # Parallelism (workers=0 simulates in the calling process)
+    workers: int | None = None  # None: one per CPU
+    start_method: str = "spawn"
+
+    top_k: int = 5  # Genomes reported in the result
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data["opponents"] = list(self.opponents)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EvolutionConfig":
+        """Create from dictionary."""
+        values = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        if "opponents" in values:
+            values["opponents"] = tuple(values["opponents"])
+        return cls(**values)
+
+    def simulation_key(self) -> tuple[Any, ...]:
+        """Fields that determine a genome's fitness (cached fitness is only valid for these)."""
+        return (self.rounds, tuple(self.opponents), self.seed)
+
+
+@dataclass
+class EvolutionResult:
+    """Outcome of an evolutionary search."""
+
+    best: list[tuple[Genes, float]]
+    generations: int
+    evaluated: int  # Genomes simulated
+    cache_hits: int  # Genomes scored from the fitness cache
+    elapsed_seconds: float
+    history: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def genomes_per_minute(self) -> float:
+        """Simulated genomes per minute of this run."""
+        return self.evaluated / self.elapsed_seconds * 60 if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "best": [
+                {"genes": [list(gene) for gene in genes], "fitness": fitness}
+                for genes, fitness in self.best
+            ],
+            "generations": self.generations,
+            "evaluated": self.evaluated,
+            "cache_hits": self.cache_hits,
+            "elapsed_seconds": self.elapsed_seconds,
+            "genomes_per_minute": self.genomes_per_minute,
+            "history": self.history,
+        }
+
+
+# ============================================================================
+# Fitness Simulation (runs in worker processes)
+# ============================================================================
+
+
+def evaluate_genomes(
+    population: list[Genes], rounds: int, opponents: tuple[str, ...], seed: int
+) -> list[float]:
+    """
+    Fitness of each genome: fraction of rounds won against ``opponents``.
+
+    Each genome plays every opponent once as ODD and once as EVEN. The
+    random streams are seeded from the genome and ``seed``, so a genome's
+    fitness is reproducible and can be cached; the caller's random and
+    numpy.random states are restored afterwards.
+    """
+    random_state, numpy_state = random.getstate(), np.random.get_state()
+    try:
+        return asyncio.run(_evaluate_all(population, rounds, opponents, seed))
+    finally:
+        random.setstate(random_state)
+        np.random.set_state(numpy_state)
+
+
+async def _evaluate_all(
+    population: list[Genes], rounds: int, opponents: tuple[str, ...], seed: int
+) -> list[float]:
+    scores = []
+    for genes in population:
+        if not any(weight > 0 for _, weight in genes):
+            # Every weight mutated to zero: the composite cannot choose
+            scores.append(0.0)
+            continue
+
+        genome_seed = zlib.crc32(repr((genes, seed)).encode())
+        random.seed(genome_seed)
+        np.random.seed(genome_seed)
+        try:
+            scores.append(await _simulate(genes, rounds, opponents))
+        except Exception as e:
+            logger.warning(f"Genome {genes} failed to play: {e}")
+            scores.append(0.0)
+    return scores
+
+
+async def _simulate(genes: Genes, rounds: int, opponents: tuple[str, ...]) -> float:
+    won = 0
+    for opponent in opponents:
+        for role in GameRole:
+            player = StrategyGenome(list(genes)).to_strategy()
+            won += await _play_match(player, PRIMITIVES[opponent](), role, rounds)
+    return won / (rounds * len(opponents) * len(GameRole))
+
+
+async def _play_match(player: Any, opponent: Any, role: GameRole, rounds: int) -> int:
+    """Play ``rounds`` rounds with ``player`` in ``role``; returns rounds won."""
+    state = SimpleNamespace(valid_moves=list(ACTION_MOVES), round=0)
+    wins = 0
+    for round_number in range(rounds):
+        state.round = round_number
+        move = await player.decide_move(state)
+        opponent_move = await opponent.decide_move(state)
+
+        # Same rule as OddEvenRules.calculate_result
+        sum_is_odd = (ACTION_MOVES[move] + ACTION_MOVES[opponent_move]) % 2 == 1
+        won = sum_is_odd if role == GameRole.ODD else not sum_is_odd
+        wins += won
+
+        player._observe_outcome(move, {"opponent_move": opponent_move, "reward": int(won)}, state)
+        opponent._observe_outcome(
+            opponent_move, {"opponent_move": move, "reward": int(not won)}, state
+        )
+    return wins
+
+
+# ============================================================================
+# Evolution Engine
+# ============================================================================
+
+
+class EvolutionEngine:
+    """
+    Evolves a population of ``StrategyGenome``s.
+
+    Each generation: score the population (simulating only genomes not in
+    the fitness cache), carry the ``elite_count`` best over unchanged, and
+    fill the rest with offspring of tournament-selected parents
+    (crossover, then mutation).
+
+    Args:
+        config: Search parameters
+        checkpoint_path: JSON file written after every generation; ``run``
+            resumes from it when it exists
+    """
+
+    def __init__(
+        self,
+        config: EvolutionConfig | None = None,
+        checkpoint_path: str | Path | None = None,
+    ):
+        self.config = config or EvolutionConfig()
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+
+        self.generation = 0
+        self.population: list[Genes] = []
+        self.fitness_cache: dict[Genes, float] = {}
+        self.history: list[dict[str, Any]] = []
+        self.evaluated = 0
+        self.cache_hits = 0
+
+        self._rng = random.Random(self.config.seed)
+
+    # ------------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------------
+
+    def run(self, generations: int | None = None) -> EvolutionResult:
+        """
+        Evolve until ``generations`` (default ``config.generations``) are done.
+
+        Returns:
+            Best genomes found and search statistics
+        """
+        target = generations if generations is not None else self.config.generations
+        if self.checkpoint_path and self.checkpoint_path.exists():
+            self.load_checkpoint()
+        if not self.population:
+            self.population = [
+                _freeze(StrategyGenome(rng=self._rng).genes)
+                for _ in range(self.config.population_size)
+            ]
+
+        evaluated, cache_hits = self.evaluated, self.cache_hits
+        started = time.perf_counter()
+        pool = self._create_pool() if self.generation < target else None
+        try:
+            while self.generation < target:
+                scored = self._score(pool, self.population)
+                self._record(scored)
+                self.generation += 1
+                self.population = self._breed(scored)
+                if self.checkpoint_path:
+                    self.save_checkpoint()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        elapsed = time.perf_counter() - started
+        return EvolutionResult(
+            best=self.best(),
+            generations=self.generation,
+            evaluated=self.evaluated - evaluated,
+            cache_hits=self.cache_hits - cache_hits,
+            elapsed_seconds=elapsed,
+            history=list(self.history),
+        )
+
+    def best(self, k: int | None = None) -> list[tuple[Genes, float]]:
+        """The ``k`` (default ``config.top_k``) fittest genomes seen so far."""
+        ranked = sorted(self.fitness_cache.items(), key=lambda item: item[1], reverse=True)
+        return ranked[: k if k is not None else self.config.top_k]
+
+    def _create_pool(self) -> Executor | None:
+        workers = self.config.workers if self.config.workers is not None else os.cpu_count()
+        if not workers:
+            return None
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(self.config.start_method),
+        )
+
+    def _score(self, pool: Executor | None, population: list[Genes]) -> list[tuple[Genes, float]]:
+        """Fitness of every genome, simulating only uncached ones."""
+        unseen = list(dict.fromkeys(g for g in population if g not in self.fitness_cache))
+        self.cache_hits += len(population) - len(unseen)
+        self.evaluated += len(unseen)
+
+        args = (self.config.rounds, self.config.opponents, self.config.seed)
+        if pool is None or len(unseen) < 2:
+            scores = evaluate_genomes(unseen, *args) if unseen else []
+        else:
+            # A few chunks per worker keeps every worker busy to the end
+            chunk_size = max(1, len(unseen) // (4 * (self.config.workers or os.cpu_count() or 1)))
+            chunks = [unseen[i : i + chunk_size] for i in range(0, len(unseen), chunk_size)]
+            futures = [pool.submit(evaluate_genomes, chunk, *args) for chunk in chunks]
+            scores = [score for future in futures for score in future.result()]
+
+        self.fitness_cache.update(zip(unseen, scores, strict=True))
+        return [(genes, self.fitness_cache[genes]) for genes in population]
+
+    def _record(self, scored: list[tuple[Genes, float]]) -> None:
+        fitness = [f for _, f in scored]
+        entry = {
+            "generation": self.generation,
+            "best_fitness": max(fitness),
+            "mean_fitness": sum(fitness) / len(fitness),
+            "evaluated": self.evaluated,
+            "cache_hits": self.cache_hits,
+        }
+        self.history.append(entry)
+        logger.info(
+            f"Generation {self.generation}: best {entry['best_fitness']:.3f}, "
+            f"mean {entry['mean_fitness']:.3f}"
+        )
+
+    def _breed(self, scored: list[tuple[Genes, float]]) -> list[Genes]:
+        """Next generation: elites plus offspring of tournament winners."""
+        ranked = sorted(scored, key=lambda item: item[1], reverse=True)
+        elite_count = min(self.config.elite_count, self.config.population_size)
+        offspring = [genes for genes, _ in ranked[:elite_count]]
+
+        while len(offspring) < self.config.population_size:
+            parent = StrategyGenome(list(self._tournament(scored)))
+            if self._rng.random() < self.config.crossover_rate:
+                other = StrategyGenome(list(self._tournament(scored)))
+                parent = parent.crossover(other, rng=self._rng)
+            parent.mutate(self.config.mutation_rate, rng=self._rng)
+            offspring.append(_freeze(parent.genes))
+        return offspring
+
+    def _tournament(self, scored: list[tuple[Genes, float]]) -> Genes:
+        """Fittest of ``tournament_size`` genomes drawn at random."""
+        size = min(self.config.tournament_size, len(scored))
+        return max(self._rng.sample(scored, size), key=lambda item: item[1])[0]
+
+    # ------------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------------
+
+    def save_checkpoint(self, path: str | Path | None = None) -> Path:
+        """Write the search state to ``path`` (default ``checkpoint_path``)."""
+        target = Path(path) if path else self.checkpoint_path
+        if target is None:
+            raise ValueError("No checkpoint path configured")
+
+        version, internal, gauss = self._rng.getstate()
+        data = {
+            "config": self.config.to_dict(),
+            "generation": self.generation,
+            "population": [[list(gene) for gene in genes] for genes in self.population],
+            "fitness_cache": [
+                {"genes": [list(gene) for gene in genes], "fitness": fitness}
+                for genes, fitness in self.fitness_cache.items()
+            ],
+            "history": self.history,
+            "evaluated": self.evaluated,
+            "cache_hits": self.cache_hits,
+            "rng_state": [version, list(internal), gauss],
+        }
+
+        # Write to temp file first, then rename (atomic)
+        temp_path = target.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(data), encoding="utf-8")
+        temp_path.replace(target)
+        return target
+
+    def load_checkpoint(self, path: str | Path | None = None) -> None:
+        """
+        Restore the search state from ``path`` (default ``checkpoint_path``).
+
+        Cached fitness is dropped if the checkpoint simulated matches
+        differently (rounds, opponents or seed) from this engine's config.
+        """
+        source = Path(path) if path else self.checkpoint_path
+        if source is None:
+            raise ValueError("No checkpoint path configured")
+        data = json.loads(source.read_text(encoding="utf-8"))
+
+        self.generation = data["generation"]
+        self.population = [_freeze(genes) for genes in data["population"]]
+        self.history = data["history"]
+        self.evaluated = data["evaluated"]
+        self.cache_hits = data["cache_hits"]
+        version, internal, gauss = data["rng_state"]
+        self._rng.setstate((version, tuple(internal), gauss))
+
+        saved = EvolutionConfig.from_dict(data["config"])
+        if saved.simulation_key() == self.config.simulation_key():
+            self.fitness_cache = {
+                _freeze(entry["genes"]): entry["fitness"] for entry in data["fitness_cache"]
+            }
+        else:
+            logger.warning("Checkpoint simulated matches differently; discarding cached fitness")
+            self.fitness_cache = {}
+
+        logger.info(f"Resumed evolution at generation {self.generation} from {source}")
+
+
+def _freeze(genes: list[Any]) -> Genes:
+    return tuple((str(name), float(weight)) for name, weight in genes)
@@ -24,18 +24,23 @@ Like how complex molecules are built from atoms, complex strategies are
 built from primitive components, creating emergent intelligent behavior.
 """
 
+import asyncio
 import random
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Union
+from typing import Union
 
 import numpy as np
 
+from ...common.logger import get_logger
 from ...common.protocol import GameState
 from .base import Strategy, StrategyConfig
 
+logger = get_logger(__name__)
+
 # Type alias for moves (integers 1-10 in odd/even game)
 Move = int
 
@@ -58,12 +63,20 @@ class CompositionOperator(Enum):
 
 @dataclass
 class StrategyNode:
-    """Node in strategy composition tree."""
+    """
+    Node in strategy composition tree.
+
+    ``offload`` runs a CPU-bound strategy on the composite's worker pool
+    instead of the event loop; ``budget`` overrides the composite's
+    per-component time budget in seconds.
+    """
 
     name: str
     strategy: Union[Strategy, "CompositeStrategy"]
     weight: float = 1.0
     condition: Callable[[GameState], bool] | None = None
+    offload: bool = False
+    budget: float | None = None
 
 
 # ============================================================================
@@ -79,6 +92,12 @@ class PrimitiveStrategy(Strategy):
         """Primitive decision logic."""
         pass
 
+    def _observe_outcome(self, move: Move, outcome: dict, game_state: GameState):
+        """Stateless by default."""
+
+    def reset(self) -> None:
+        """Stateless by default."""
+
 
 class AlwaysCooperatePrimitive(PrimitiveStrategy):
     """Always cooperate."""
@@ -116,6 +135,9 @@ class TitForTatPrimitive(PrimitiveStrategy):
     def _observe_outcome(self, move: Move, outcome: dict, game_state: GameState):
         self.opponent_last_move = outcome.get("opponent_move")
 
+    def reset(self) -> None:
+        self.opponent_last_move = None
+
 
 class GrudgerPrimitive(PrimitiveStrategy):
     """Cooperate until opponent defects, then always defect."""
@@ -133,6 +155,9 @@ class GrudgerPrimitive(PrimitiveStrategy):
         if outcome.get("opponent_move") == "defect":
             self.grudge = True
 
+    def reset(self) -> None:
+        self.grudge = False
+
 
 class PavlovPrimitive(PrimitiveStrategy):
     """Win-stay, lose-shift."""
@@ -155,6 +180,10 @@ class PavlovPrimitive(PrimitiveStrategy):
         self.last_move = move  # type: ignore[assignment]
         self.last_outcome_good = outcome.get("reward", 0) > 0
 
+    def reset(self) -> None:
+        self.last_move = None
+        self.last_outcome_good = True
+
 
 # ============================================================================
 # Composite Strategy System
@@ -168,6 +197,15 @@ class CompositeStrategy(Strategy):
     **Key Innovation:**
     Enables building complex strategies from simple primitives using various
     composition operators (sequence, parallel, conditional, etc.)
+
+    Components that vote (sequence, parallel) are evaluated concurrently;
+    one that misses its time budget or fails drops out of the vote, so a
+    decision takes at most as long as the slowest component or the budget.
+
+    Args:
+        component_budget: Seconds each component may take (None: no limit)
+        executor: Worker pool for offloaded components (None: the event
+            loop's default executor)
     """
 
     def __init__(
@@ -175,13 +213,21 @@ class CompositeStrategy(Strategy):
         components: list[StrategyNode],
         operator: CompositionOperator,
         config: StrategyConfig | None = None,
+        component_budget: float | None = None,
+        executor: Executor | None = None,
     ):
         super().__init__(config)
         self.components = components
         self.operator = operator
+        self.component_budget = component_budget
+        self.executor = executor
+
+        # Track component performance as running means (for best_of)
+        self.component_scores = {node.name: 0.0 for node in components}
+        self._score_counts = dict.fromkeys(self.component_scores, 0)
 
-        # Track component performance
-        self.component_scores = {node.name: [] for node in components}  # type: ignore[var-annotated]
+        # Component decisions dropped for being late or failing
+        self.dropped = dict.fromkeys(self.component_scores, 0)
 
     async def decide_move(self, game_state: GameState) -> Move:  # type: ignore[override]
         """
@@ -207,41 +253,96 @@ class CompositeStrategy(Strategy):
 
         else:
             # Fallback
-            return await self.components[0].strategy.decide_move(game_state)
+            return await self._component_move(self.components[0], game_state)
+
+    # ------------------------------------------------------------------------
+    # Component evaluation
+    # ------------------------------------------------------------------------
+
+    async def _evaluate(self, node: StrategyNode, game_state: GameState) -> Move:
+        """Run one component within its budget; raises TimeoutError if late."""
+        call: Awaitable[Move]
+        if node.offload:
+            loop = asyncio.get_running_loop()
+            call = loop.run_in_executor(self.executor, _decide_offloaded, node.strategy, game_state)
+        else:
+            call = node.strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
+
+        budget = node.budget if node.budget is not None else self.component_budget
+        if budget is None:
+            return await call
+        return await asyncio.wait_for(call, budget)
+
+    async def _votes(self, game_state: GameState) -> list[tuple[StrategyNode, Move]]:
+        """Evaluate all components concurrently; late or failed ones drop out."""
+        results = await asyncio.gather(
+            *(self._evaluate(node, game_state) for node in self.components),
+            return_exceptions=True,
+        )
+
+        votes = []
+        for node, result in zip(self.components, results, strict=True):
+            if isinstance(result, BaseException):
+                self._drop(node, result)
+            else:
+                votes.append((node, result))
+        return votes
+
+    async def _component_move(self, node: StrategyNode, game_state: GameState) -> Move:
+        """Move of a single component, or a fallback if it is late or fails."""
+        try:
+            return await self._evaluate(node, game_state)
+        except Exception as e:
+            self._drop(node, e)
+            return self._fallback_move(game_state)
+
+    def _drop(self, node: StrategyNode, error: BaseException) -> None:
+        self.dropped[node.name] = self.dropped.get(node.name, 0) + 1
+        if isinstance(error, TimeoutError):
+            logger.debug(f"Component {node.name} missed its budget")
+        else:
+            logger.warning(f"Component {node.name} failed: {error}")
+
+    def _fallback_move(self, game_state: GameState) -> Move:
+        """Move used when no component answered in time."""
+        valid_moves = getattr(game_state, "valid_moves", None)
+        if valid_moves:
+            return random.choice(valid_moves)  # type: ignore[no-any-return]
+        return random.randint(self.config.min_value, self.config.max_value)
+
+    # ------------------------------------------------------------------------
+    # Composition operators
+    # ------------------------------------------------------------------------
 
     async def _sequence_composition(self, game_state: GameState) -> Move:
         """Execute strategies in sequence, return last result."""
-        result = None
-        for node in self.components:
-            result = await node.strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
-        return result  # type: ignore[return-value]
+        votes = await self._votes(game_state)
+        if not votes:
+            return self._fallback_move(game_state)
+        return votes[-1][1]
 
     async def _parallel_composition(self, game_state: GameState) -> Move:
         """Execute all strategies, combine via voting."""
-        moves = []
-        weights = []
-
-        for node in self.components:
-            move = await node.strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
-            moves.append(move)
-            weights.append(node.weight)
+        votes = await self._votes(game_state)
+        if not votes:
+            return self._fallback_move(game_state)
 
         # Weighted voting
-        move_votes: dict[str, Any] = {}  # type: ignore[name-defined]
-        for move, weight in zip(moves, weights, strict=False):
-            move_votes[move] = move_votes.get(move, 0) + weight  # type: ignore[index,call-overload]
+        move_votes: dict[Move, float] = {}
+        for node, move in votes:
+            move_votes[move] = move_votes.get(move, 0) + node.weight
 
         # Return move with highest vote
-        return max(move_votes.items(), key=lambda x: x[1])[0]  # type: ignore[return-value]
+        return max(move_votes.items(), key=lambda x: x[1])[0]
 
     async def _conditional_composition(self, game_state: GameState) -> Move:
         """If-then-else logic based on conditions."""
         for node in self.components:
             if node.condition is None or node.condition(game_state):
-                return await node.strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
+                return await self._component_move(node, game_state)
 
         # No condition met - use last strategy
-        return await self.components[-1].strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
+        return await self._component_move(self.components[-1], game_state)
 
     async def _weighted_composition(self, game_state: GameState) -> Move:
         """Probabilistic selection based on weights."""
@@ -250,24 +351,19 @@ class CompositeStrategy(Strategy):
 
         # Sample strategy
         idx = np.random.choice(len(self.components), p=probs)
-        return await self.components[idx].strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
+        return await self._component_move(self.components[idx], game_state)
 
     async def _best_of_composition(self, game_state: GameState) -> Move:
         """Choose strategy with best historical performance."""
         # Find best performing component
-        best_node = max(
-            self.components,
-            key=lambda node: np.mean(self.component_scores[node.name])
-            if self.component_scores[node.name]
-            else 0,
-        )
+        best_node = max(self.components, key=lambda node: self.component_scores[node.name])
 
-        return await best_node.strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
+        return await self._component_move(best_node, game_state)
 
     async def _random_composition(self, game_state: GameState) -> Move:
         """Random selection."""
         node = random.choice(self.components)
-        return await node.strategy.decide_move(game_state)  # type: ignore[call-arg,arg-type]
+        return await self._component_move(node, game_state)
 
     def _observe_outcome(self, move: Move, outcome: dict, game_state: GameState):
         """Propagate outcome to all components and track performance."""
@@ -278,7 +374,18 @@ class CompositeStrategy(Strategy):
             node.strategy._observe_outcome(move, outcome, game_state)  # type: ignore[union-attr]
 
             # Track component performance (for best_of operator)
-            self.component_scores[node.name].append(reward)
+            count = self._score_counts[node.name] + 1
+            self._score_counts[node.name] = count
+            self.component_scores[node.name] += (reward - self.component_scores[node.name]) / count
+
+    def reset(self) -> None:
+        """Reset all components and their performance."""
+        for node in self.components:
+            node.strategy.reset()
+        for name in self.component_scores:
+            self.component_scores[name] = 0.0
+            self._score_counts[name] = 0
+            self.dropped[name] = 0
 
     def get_composition_tree(self) -> str:
         """Visualize strategy composition as tree."""
@@ -302,6 +409,11 @@ class CompositeStrategy(Strategy):
         return "\n".join(lines)
 
 
+def _decide_offloaded(strategy: Strategy, game_state: GameState) -> Move:
+    """Run a component's decision on a worker thread, in its own event loop."""
+    return asyncio.run(strategy.decide_move(game_state))  # type: ignore[call-arg,arg-type]
+
+
 # ============================================================================
 # Strategy Composition Builder (DSL)
 # ============================================================================
@@ -331,13 +443,22 @@ class StrategyComposer:
         self.current_operator = None
 
     def add(
-        self, strategy: Strategy, name: str | None = None, weight: float = 1.0
+        self,
+        strategy: Strategy,
+        name: str | None = None,
+        weight: float = 1.0,
+        offload: bool = False,
+        budget: float | None = None,
     ) -> "StrategyComposer":
         """Add a strategy component."""
         if name is None:
             name = f"component_{len(self.components)}"
 
-        self.components.append(StrategyNode(name=name, strategy=strategy, weight=weight))
+        self.components.append(
+            StrategyNode(
+                name=name, strategy=strategy, weight=weight, offload=offload, budget=budget
+            )
+        )
         return self
 
     def sequence(self, *strategies: Strategy) -> "StrategyComposer":
@@ -395,7 +516,11 @@ class StrategyComposer:
             self.add(strat, name=f"candidate_{i}")
         return self
 
-    def build(self) -> CompositeStrategy:
+    def build(
+        self,
+        component_budget: float | None = None,
+        executor: Executor | None = None,
+    ) -> CompositeStrategy:
         """Build the composite strategy."""
         if not self.components:
             raise ValueError("No components added to composer")
@@ -403,7 +528,12 @@ class StrategyComposer:
         if self.current_operator is None:
             self.current_operator = CompositionOperator.SEQUENCE
 
-        return CompositeStrategy(components=self.components, operator=self.current_operator)  # type: ignore[abstract]
+        return CompositeStrategy(
+            components=self.components,
+            operator=self.current_operator,
+            component_budget=component_budget,
+            executor=executor,
+        )
 
 
 # ============================================================================
@@ -425,10 +555,10 @@ def create_adaptive_mixed_strategy() -> CompositeStrategy:
 
     return composer.weighted(
         [
-            (TitForTatPrimitive(), 0.4),  # type: ignore[abstract]
-            (PavlovPrimitive(), 0.3),  # type: ignore[abstract]
-            (RandomPrimitive(), 0.2),  # type: ignore[abstract]
-            (GrudgerPrimitive(), 0.1),  # type: ignore[abstract]
+            (TitForTatPrimitive(), 0.4),
+            (PavlovPrimitive(), 0.3),
+            (RandomPrimitive(), 0.2),
+            (GrudgerPrimitive(), 0.1),
         ]
     ).build()
 
@@ -446,10 +576,10 @@ def create_conditional_strategy() -> CompositeStrategy:
 
     return (
         composer.if_condition(lambda s: s.round < 10)  # type: ignore[attr-defined]
-        .then(AlwaysCooperatePrimitive())  # type: ignore[abstract]
+        .then(AlwaysCooperatePrimitive())
         .if_condition(lambda s: 10 <= s.round < 50)  # type: ignore[attr-defined]
-        .then(TitForTatPrimitive())  # type: ignore[abstract]
-        .otherwise(AlwaysDefectPrimitive())  # type: ignore[abstract]
+        .then(TitForTatPrimitive())
+        .otherwise(AlwaysDefectPrimitive())
         .build()
     )
 
@@ -463,11 +593,11 @@ def create_best_of_ensemble() -> CompositeStrategy:
     composer = StrategyComposer()
 
     return composer.best_of(
-        TitForTatPrimitive(),  # type: ignore[abstract]
-        PavlovPrimitive(),  # type: ignore[abstract]
-        GrudgerPrimitive(),  # type: ignore[abstract]
-        AlwaysCooperatePrimitive(),  # type: ignore[abstract]
-        AlwaysDefectPrimitive(),  # type: ignore[abstract]
+        TitForTatPrimitive(),
+        PavlovPrimitive(),
+        GrudgerPrimitive(),
+        AlwaysCooperatePrimitive(),
+        AlwaysDefectPrimitive(),
     ).build()
 
 
@@ -482,7 +612,7 @@ def create_defensive_strategy() -> CompositeStrategy:
     composer = StrategyComposer()
 
     # This would need opponent_last_move in GameState
-    return composer.parallel(GrudgerPrimitive(), TitForTatPrimitive(), weights=[0.6, 0.4]).build()  # type: ignore[abstract,abstract]
+    return composer.parallel(GrudgerPrimitive(), TitForTatPrimitive(), weights=[0.6, 0.4]).build()
 
 
 # ============================================================================
@@ -495,10 +625,18 @@ class StrategyGenome:
     Genome encoding a composite strategy.
 
     Can be evolved via genetic algorithms to discover novel compositions.
+    Random initialization, ``mutate`` and ``crossover`` draw from the
+    ``rng`` they are given (a seeded ``random.Random`` makes a search
+    reproducible), else from the global ``random`` module.
     """
 
-    def __init__(self, genes: list[tuple[str, float]] | None = None):
+    def __init__(
+        self,
+        genes: list[tuple[str, float]] | None = None,
+        rng: random.Random | None = None,
+    ):
         if genes is None:
+            draw = rng or random
             # Random initialization
             primitives = [
                 "tit_for_tat",
@@ -509,8 +647,7 @@ class StrategyGenome:
                 "random",
             ]
             genes = [
-                (random.choice(primitives), random.uniform(0, 1))
-                for _ in range(random.randint(2, 5))
+                (draw.choice(primitives), draw.uniform(0, 1)) for _ in range(draw.randint(2, 5))
             ]
 
         self.genes = genes
@@ -532,20 +669,24 @@ class StrategyGenome:
 
         return composer.weighted(strategy_weight_pairs).build()  # type: ignore[arg-type]
 
-    def mutate(self, rate: float = 0.1):
+    def mutate(self, rate: float = 0.1, rng: random.Random | None = None):
         """Mutate genome."""
+        draw = rng or random
         for i in range(len(self.genes)):
-            if random.random() < rate:
+            if draw.random() < rate:
                 name, weight = self.genes[i]
 
                 # Mutate weight
-                weight = max(0, min(1, weight + random.gauss(0, 0.2)))
+                weight = max(0, min(1, weight + draw.gauss(0, 0.2)))
                 self.genes[i] = (name, weight)
 
-    def crossover(self, other: "StrategyGenome") -> "StrategyGenome":
+    def crossover(
+        self, other: "StrategyGenome", rng: random.Random | None = None
+    ) -> "StrategyGenome":
         """Create offspring via crossover."""
+        draw = rng or random
         # Single-point crossover
-        point = random.randint(1, min(len(self.genes), len(other.genes)) - 1)
+        point = draw.randint(1, min(len(self.genes), len(other.genes)) - 1)
 
         child_genes = self.genes[:point] + other.genes[point:]
         return StrategyGenome(child_genes)
@@ -26,7 +26,6 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
-from scipy.stats import entropy
 
 from ...common.protocol import GameState
 from .base import Strategy, StrategyConfig
@@ -35,6 +34,13 @@ from .base import Strategy, StrategyConfig
 Move = int
 
 
+def entropy(pk: Any, qk: Any = None) -> float:
+    """``scipy.stats.entropy``, importing SciPy on first use (it is slow to import)."""
+    from scipy.stats import entropy as scipy_entropy
+
+    return float(scipy_entropy(pk, qk))
+
+
 # ============================================================================
 # Data Structures for Opponent Modeling
 # ============================================================================
@@ -347,7 +353,7 @@ class OpponentModelingEngine:
             divergences.append(kl_div)
 
         # High divergence = high adaptability
-        return min(1.0, np.mean(divergences))  # type: ignore[no-any-return]
+        return min(1.0, float(np.mean(divergences)))
 
     def _detect_pattern_length(self, moves: list[Move]) -> int:
         """Detect if opponent uses a repeating pattern."""
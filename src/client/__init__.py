@@ -2,7 +2,7 @@
 
 from .connection_manager import CircuitBreaker, ConnectionManager
 from .mcp_client import MCPClient
-from .message_queue import Message, MessagePriority, MessageQueue
+from .message_queue import Message, MessageDispatcher, MessagePriority, MessageQueue
 from .resource_manager import ResourceManager
 from .session_manager import Session, SessionManager
 from .tool_registry import ToolInfo, ToolRegistry
@@ -18,5 +18,6 @@ __all__ = [
     "MessageQueue",
     "Message",
     "MessagePriority",
+    "MessageDispatcher",
     "ResourceManager",
 ]
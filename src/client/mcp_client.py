@@ -19,6 +19,8 @@ from ..common.exceptions import (
     ProtocolError,
 )
 from ..common.logger import PerformanceTracker, get_logger
+from ..observability.metrics import get_metrics_collector
+from ..transport.base import Transport, TransportError
 from ..transport.http_transport import HTTPTransport
 from ..transport.json_rpc import (
     JsonRpcResponse,
@@ -26,6 +28,7 @@ from ..transport.json_rpc import (
     create_request,
     parse_message,
 )
+from ..transport.websocket_transport import WebSocketTransport
 from .connection_manager import ConnectionManager
 from .message_queue import MessageQueue
 from .resource_manager import ResourceManager
@@ -34,6 +37,8 @@ from .tool_registry import ToolExecutor, ToolRegistry
 
 logger = get_logger(__name__)
 
+CLIENT_TRANSPORTS = ("http", "websocket")
+
 
 class MCPClient:
     """
@@ -48,25 +53,43 @@ class MCPClient:
     - Connection health monitoring
     - Request routing
     - Retry logic with circuit breaker
+
+    Args:
+        name: Client name sent during initialization
+        version: Client version sent during initialization
+        transport: "http" for one HTTP request per message, or "websocket"
+            to multiplex all messages to a server over one persistent
+            connection (falls back to HTTP for servers that do not accept it)
     """
 
     def __init__(
         self,
         name: str = "mcp_client",
         version: str = "1.0.0",
+        transport: str = "http",
     ):
+        if transport not in CLIENT_TRANSPORTS:
+            raise ValueError(f"transport must be one of {CLIENT_TRANSPORTS}, got {transport!r}")
+
         self.name = name
         self.version = version
+        self.transport = transport
 
         # Core managers
         self.sessions = SessionManager()
         self.tools = ToolRegistry()
         self.connections = ConnectionManager()
-        self.resources = ResourceManager()
+        self.resources = ResourceManager(metrics=get_metrics_collector())
         self.message_queue = MessageQueue()
 
         # Transports for each server
-        self._transports: dict[str, HTTPTransport] = {}
+        self._transports: dict[str, Transport] = {}
+
+        # Tasks delivering server notifications (WebSocket transports only)
+        self._listeners: dict[str, asyncio.Task] = {}
+
+        # Serializes connects to the same server name
+        self._connect_locks: dict[str, asyncio.Lock] = {}
 
         # Tool executor
         self._tool_executor = ToolExecutor(self.tools, self)
@@ -85,6 +108,10 @@ class MCPClient:
         """
         Connect to an MCP server.
 
+        Connecting again to a server that is already connected at the same
+        URL returns the existing session; a stale or different connection
+        under the same name is closed before the new one is opened.
+
         Args:
             server_name: Name to identify the server
             server_url: URL of the server's MCP endpoint
@@ -93,6 +120,21 @@ class MCPClient:
         Returns:
             Established Session
         """
+        lock = self._connect_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            existing = await self.sessions.get_session_by_server(server_name)
+            if (
+                existing is not None
+                and existing.is_ready
+                and existing.server_url == server_url
+                and server_name in self._transports
+            ):
+                return existing
+            if existing is not None or server_name in self._transports:
+                await self.disconnect(server_name)
+            return await self._connect(server_name, server_url)
+
+    async def _connect(self, server_name: str, server_url: str) -> Session:
         logger.info(f"Connecting to {server_name} at {server_url}")
 
         # Create session
@@ -104,9 +146,12 @@ class MCPClient:
 
         try:
             # Create transport
-            transport = HTTPTransport()
-            await transport.connect(server_url)
+            transport = await self._open_transport(server_name, server_url)
             self._transports[server_name] = transport
+            if isinstance(transport, WebSocketTransport):
+                self._listeners[server_name] = asyncio.create_task(
+                    self._listen(server_name, transport)
+                )
 
             session._transport = transport
             await self.sessions.update_session_state(session.id, SessionState.CONNECTED)
@@ -126,6 +171,20 @@ class MCPClient:
             await self.connections.record_failure(server_name, str(e))
             raise ConnectionError(f"Failed to connect to {server_name}: {e}") from e
 
+    async def _open_transport(self, server_name: str, server_url: str) -> Transport:
+        """Open the configured transport, falling back to HTTP."""
+        if self.transport == "websocket":
+            ws_transport = WebSocketTransport()
+            try:
+                await ws_transport.connect(server_url)
+                return ws_transport
+            except TransportError as e:
+                logger.warning(f"WebSocket unavailable for {server_name}, using HTTP: {e}")
+
+        transport = HTTPTransport()
+        await transport.connect(server_url)
+        return transport
+
     async def connect_to_server(
         self,
         config: ServerConfig,
@@ -245,6 +304,9 @@ class MCPClient:
         logger.info(f"Disconnecting from {server_name}")
 
         # Close transport
+        listener = self._listeners.pop(server_name, None)
+        if listener is not None:
+            listener.cancel()
         if server_name in self._transports:
             await self._transports[server_name].disconnect()
             del self._transports[server_name]
@@ -349,34 +411,34 @@ class MCPClient:
         Args:
             server_name: Name of the server
             uri: Resource URI
-            use_cache: Whether to use cached data
+            use_cache: Whether to use cached data (concurrent misses share one read)
 
         Returns:
             Resource data
         """
-        # Check cache first
-        if use_cache:
-            cached = await self.resources.get_cached(uri)
-            if cached is not None:
-                return cached
 
-        transport = self._transports.get(server_name)
-        if not transport:
-            raise ConnectionError(f"Not connected to {server_name}")
+        async def load() -> Any:
+            transport = self._transports.get(server_name)
+            if not transport:
+                raise ConnectionError(f"Not connected to {server_name}")
 
-        request = create_request(MCPMethods.RESOURCES_READ, {"uri": uri})
+            request = create_request(MCPMethods.RESOURCES_READ, {"uri": uri})
 
-        response = await transport.request(request.to_dict())
-        result = self._parse_response(response)
+            response = await transport.request(request.to_dict())
+            result = self._parse_response(response)
 
-        # Cache result
-        contents = result.get("contents", [])
-        if contents:
-            data = contents[0].get("text", contents[0])
-            await self.resources.set_cached(uri, data)
-            return data
+            contents = result.get("contents", [])
+            if contents:
+                return contents[0].get("text", contents[0])
+            return result
 
-        return result
+        # Cached, or one read shared by concurrent callers
+        if use_cache:
+            return await self.resources.get_or_load(uri, load)
+
+        data = await load()
+        await self.resources.set_cached(uri, data)
+        return data
 
     async def subscribe_resource(
         self,
@@ -384,7 +446,13 @@ class MCPClient:
         uri: str,
         callback,
     ) -> bool:
-        """Subscribe to resource updates."""
+        """
+        Subscribe to resource updates pushed by the server.
+
+        Needs a WebSocket connection (``transport="websocket"``). The
+        callback receives the current contents first, then each newer
+        version the server pushes; updates arriving out of order are dropped.
+        """
         transport = self._transports.get(server_name)
         if not transport:
             raise ConnectionError(f"Not connected to {server_name}")
@@ -392,10 +460,47 @@ class MCPClient:
         # Send subscribe request
         request = create_request(MCPMethods.RESOURCES_SUBSCRIBE, {"uri": uri})
 
-        await transport.request(request.to_dict())
+        response = await transport.request(request.to_dict())
+        result = self._parse_response(response)
+
+        # Register local callback, then deliver the snapshot
+        subscribed = await self.resources.subscribe(uri, callback)
+        if subscribed:
+            await self._deliver_update(uri, result.get("contents", []), result.get("version"))
+        return subscribed
+
+    async def unsubscribe_resource(self, server_name: str, uri: str) -> bool:
+        """Stop updates for a resource."""
+        transport = self._transports.get(server_name)
+        if not transport:
+            raise ConnectionError(f"Not connected to {server_name}")
+
+        request = create_request(MCPMethods.RESOURCES_UNSUBSCRIBE, {"uri": uri})
+        self._parse_response(await transport.request(request.to_dict()))
+        return await self.resources.unsubscribe(uri)
+
+    async def _listen(self, server_name: str, transport: WebSocketTransport) -> None:
+        """Deliver notifications pushed by a server."""
+        while True:
+            message = await transport.receive()
+            if message.get("method") != MCPMethods.RESOURCES_UPDATED:
+                logger.debug(f"Ignoring notification from {server_name}: {message.get('method')}")
+                continue
+
+            params = message.get("params") or {}
+            try:
+                await self._deliver_update(
+                    params.get("uri", ""), params.get("contents", []), params.get("version")
+                )
+            except Exception as e:
+                logger.error(f"Failed to deliver update from {server_name}: {e}")
 
-        # Register local callback
-        return await self.resources.subscribe(uri, callback)
+    async def _deliver_update(
+        self, uri: str, contents: list[dict[str, Any]], version: int | None
+    ) -> None:
+        if contents:
+            data = contents[0].get("text", contents[0])
+            await self.resources.notify_update(uri, data, version=version)
 
     # ========================================================================
     # Protocol Message Handling
@@ -429,6 +534,29 @@ class MCPClient:
         result: dict[str, Any] = self._parse_response(response)
         return result
 
+    async def send_request(
+        self,
+        server_name: str,
+        data: dict[str, Any],
+        timeout: float = 30.0,
+    ) -> Any:
+        """
+        Send a prepared JSON-RPC request (used by MessageDispatcher).
+
+        Args:
+            server_name: Target server
+            data: JSON-RPC request dict
+            timeout: Request timeout
+
+        Returns:
+            Response result
+        """
+        transport = self._transports.get(server_name)
+        if not transport:
+            raise ConnectionError(f"Not connected to {server_name}")
+
+        return self._parse_response(await transport.request(data, timeout=timeout))
+
     # ========================================================================
     # Lifecycle
     # ========================================================================
@@ -3,11 +3,19 @@ Message Queue
 =============
 
 Priority-based message queue for MCP communication.
+
+Within a priority, messages for different target servers are served
+round-robin (FIFO per server), so one busy server cannot starve the
+others. Waiting consumers and producers park on futures instead of
+holding a lock, and rate limiting reserves monotonic-clock slots before
+sleeping, so a throttled consumer never blocks the rest of the queue.
 """
 
 import asyncio
-import heapq
+import time
 import uuid
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
@@ -32,12 +40,12 @@ class Message:
     """
     Message in the queue.
 
-    Comparable by (priority, timestamp) for heap ordering.
+    Comparable by (priority, timestamp).
     """
 
-    # Comparison fields (used by heapq)
+    # Comparison fields
     priority: MessagePriority = field(compare=True)
-    timestamp: float = field(compare=True, default_factory=lambda: datetime.utcnow().timestamp())
+    timestamp: float = field(compare=True, default_factory=time.time)
 
     # Message content (not used in comparison)
     id: str = field(compare=False, default_factory=lambda: str(uuid.uuid4()))
@@ -50,12 +58,16 @@ class Message:
     retries: int = field(compare=False, default=0)
     max_retries: int = field(compare=False, default=3)
     timeout: float = field(compare=False, default=30.0)
+    deadline: float = field(compare=False, default=0.0)  # time.monotonic() expiry
+
+    def __post_init__(self) -> None:
+        if not self.deadline:
+            self.deadline = time.monotonic() + self.timeout
 
     @property
     def is_expired(self) -> bool:
         """Check if message has expired."""
-        elapsed = (datetime.utcnow() - self.created_at).total_seconds()
-        return elapsed > self.timeout
+        return time.monotonic() > self.deadline
 
     @property
     def can_retry(self) -> bool:
@@ -63,15 +75,24 @@ class Message:
         return self.retries < self.max_retries
 
 
+# Messages of one priority: target server -> FIFO, in round-robin order
+_Lane = OrderedDict[str | None, deque[Message]]
+
+
 class MessageQueue:
     """
-    Thread-safe priority message queue.
+    Bounded priority message queue.
 
     Features:
     - Priority-based ordering
-    - FIFO within same priority
+    - Round-robin across target servers within a priority, FIFO per server
+    - Batched dequeue
     - Rate limiting
     - Overflow protection
+
+    Args:
+        max_size: Messages held before enqueue blocks (or raises QueueFull)
+        rate_limit: Messages per second handed out, across all consumers
     """
 
     def __init__(
@@ -82,23 +103,26 @@ class MessageQueue:
         self.max_size = max_size
         self.rate_limit = rate_limit
 
-        # Priority queue (min-heap)
-        self._queue: list[Message] = []
+        self._lanes: list[_Lane] = [OrderedDict() for _ in MessagePriority]
+        self._size = 0
 
-        # Synchronization
-        self._lock = asyncio.Lock()
-        self._not_empty = asyncio.Condition(self._lock)
-        self._not_full = asyncio.Condition(self._lock)
+        # Parked consumers and producers
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
 
-        # Rate limiting
-        self._last_dequeue_time: datetime | None = None
+        # Rate limiting (monotonic time of the next free dequeue slot)
         self._rate_limit_delay = 1.0 / rate_limit if rate_limit else 0
+        self._next_slot = 0.0
 
         # Statistics
         self._total_enqueued = 0
         self._total_dequeued = 0
         self._total_dropped = 0
 
+    # ========================================================================
+    # Enqueue
+    # ========================================================================
+
     async def enqueue(
         self,
         data: dict[str, Any],
@@ -129,22 +153,36 @@ class MessageQueue:
             target_server=target_server,
             timeout=timeout,
         )
+        await self.requeue(message, block)
+        return message
+
+    async def requeue(self, message: Message, block: bool = True) -> None:
+        """
+        Put an existing message (e.g. a retry) back in the queue.
 
-        async with self._not_full:
-            if block:
-                while len(self._queue) >= self.max_size:
-                    await self._not_full.wait()
-            elif len(self._queue) >= self.max_size:
+        It keeps its id, callback, retry count and deadline.
+
+        Raises:
+            asyncio.QueueFull: If queue is full and not blocking
+        """
+        while self._size >= self.max_size:
+            if not block:
                 self._total_dropped += 1
                 raise asyncio.QueueFull()
+            await self._park(self._putters, None)
 
-            heapq.heappush(self._queue, message)
-            self._total_enqueued += 1
-
-            self._not_empty.notify()
+        lane = self._lanes[message.priority]
+        messages = lane.get(message.target_server)
+        if messages is None:
+            messages = lane[message.target_server] = deque()
+        messages.append(message)
+        self._size += 1
+        self._total_enqueued += 1
+        self._wake(self._getters)
 
-        logger.debug(f"Enqueued message: {message.id} (priority: {priority.name})")
-        return message
+    # ========================================================================
+    # Dequeue
+    # ========================================================================
 
     async def dequeue(
         self,
@@ -161,99 +199,208 @@ class MessageQueue:
         Returns:
             Message or None if timeout/empty
         """
-        async with self._not_empty:
-            if block:
-                while not self._queue:
-                    try:
-                        await asyncio.wait_for(self._not_empty.wait(), timeout=timeout)
-                    except TimeoutError:
-                        return None
-            elif not self._queue:
-                return None
-
-            # Rate limiting
-            if self._rate_limit_delay and self._last_dequeue_time:
-                elapsed = (datetime.utcnow() - self._last_dequeue_time).total_seconds()
-                if elapsed < self._rate_limit_delay:
-                    await asyncio.sleep(self._rate_limit_delay - elapsed)
-
-            message = heapq.heappop(self._queue)
-            self._total_dequeued += 1
-            self._last_dequeue_time = datetime.utcnow()
-
-            self._not_full.notify()
-
-        # Skip expired messages
-        if message.is_expired:
-            logger.warning(f"Dropping expired message: {message.id}")
-            self._total_dropped += 1
-            return await self.dequeue(block, timeout)
-
-        logger.debug(f"Dequeued message: {message.id}")
-        return message
+        batch = await self.dequeue_batch(1, block, timeout)
+        return batch[0] if batch else None
+
+    async def dequeue_batch(
+        self,
+        max_n: int,
+        block: bool = True,
+        timeout: float | None = None,
+    ) -> list[Message]:
+        """
+        Get up to ``max_n`` messages, waiting only for the first.
+
+        Args:
+            max_n: Maximum messages to return
+            block: Whether to block if queue is empty
+            timeout: Maximum time to wait
+
+        Returns:
+            Messages in priority order (empty on timeout/empty)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._size:
+                if self._rate_limit_delay:
+                    await self._throttle(min(max_n, self._size))
+                batch = self._pop(max_n)
+                if batch:
+                    return batch
+                # Everything left had expired, or other consumers took it
+
+            if not block:
+                return []
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return []
+            if not await self._park(self._getters, remaining):
+                return []
+
+    async def _throttle(self, n: int) -> None:
+        """Reserve ``n`` rate-limited slots, then sleep until the last one."""
+        now = time.monotonic()
+        last_slot = max(now, self._next_slot) + (n - 1) * self._rate_limit_delay
+        self._next_slot = last_slot + self._rate_limit_delay
+        if last_slot > now:
+            await asyncio.sleep(last_slot - now)
+
+    def _pop(self, max_n: int) -> list[Message]:
+        """Take up to ``max_n`` live messages, dropping expired ones on the way."""
+        batch: list[Message] = []
+        freed = 0
+        for lane in self._lanes:
+            while lane and len(batch) < max_n:
+                server, messages = next(iter(lane.items()))
+                message = messages.popleft()
+                if messages:
+                    lane.move_to_end(server)  # Next server's turn
+                else:
+                    del lane[server]
+                freed += 1
+
+                if message.is_expired:
+                    logger.warning(f"Dropping expired message: {message.id}")
+                    self._total_dropped += 1
+                    continue
+                batch.append(message)
+
+            if len(batch) >= max_n:
+                break
+
+        self._size -= freed
+        self._total_dequeued += len(batch)
+        for _ in range(freed):
+            self._wake(self._putters)
+        return batch
+
+    async def purge_expired(self) -> int:
+        """Drop every expired message; returns how many were dropped."""
+        dropped = 0
+        for lane in self._lanes:
+            for server in list(lane):
+                messages = lane[server]
+                live = deque(m for m in messages if not m.is_expired)
+                dropped += len(messages) - len(live)
+                if live:
+                    lane[server] = live
+                else:
+                    del lane[server]
+
+        self._size -= dropped
+        self._total_dropped += dropped
+        for _ in range(dropped):
+            self._wake(self._putters)
+        return dropped
+
+    # ========================================================================
+    # Waiting
+    # ========================================================================
+
+    async def _park(self, waiters: deque[asyncio.Future], timeout: float | None) -> bool:
+        """Wait to be woken; returns False on timeout."""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except TimeoutError:
+            return False
+        except asyncio.CancelledError:
+            # Pass a wakeup we may have received on to the next waiter
+            if waiter.done() and not waiter.cancelled():
+                self._wake(waiters)
+            raise
+        finally:
+            if waiter in waiters:
+                waiters.remove(waiter)
+
+    @staticmethod
+    def _wake(waiters: deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    # ========================================================================
+    # Inspection and Removal
+    # ========================================================================
 
     async def peek(self) -> Message | None:
         """Peek at next message without removing."""
-        async with self._lock:
-            if self._queue:
-                return self._queue[0]
-            return None
+        for lane in self._lanes:
+            for messages in lane.values():
+                return messages[0]
+        return None
 
     async def clear(self) -> int:
         """Clear all messages from queue."""
-        async with self._lock:
-            count = len(self._queue)
-            self._queue.clear()
-            self._not_full.notify_all()
-            return count
+        count = self._size
+        for lane in self._lanes:
+            lane.clear()
+        self._size = 0
+        for _ in range(count):
+            self._wake(self._putters)
+        return count
 
     async def remove_by_server(self, server_name: str) -> int:
         """Remove all messages for a specific server."""
-        async with self._lock:
-            original_size = len(self._queue)
-            self._queue = [m for m in self._queue if m.target_server != server_name]
-            heapq.heapify(self._queue)
-            removed = original_size - len(self._queue)
-            self._not_full.notify_all()
-            return removed
+        removed = 0
+        for lane in self._lanes:
+            messages = lane.pop(server_name, None)
+            if messages:
+                removed += len(messages)
+
+        self._size -= removed
+        for _ in range(removed):
+            self._wake(self._putters)
+        return removed
 
     @property
     def size(self) -> int:
         """Get queue size."""
-        return len(self._queue)
+        return self._size
 
     @property
     def is_empty(self) -> bool:
         """Check if queue is empty."""
-        return len(self._queue) == 0
+        return self._size == 0
 
     @property
     def is_full(self) -> bool:
         """Check if queue is full."""
-        return len(self._queue) >= self.max_size
+        return self._size >= self.max_size
 
     async def get_stats(self) -> dict[str, Any]:
         """Get queue statistics."""
-        async with self._lock:
-            priority_counts = {p.name: 0 for p in MessagePriority}
-            for msg in self._queue:
-                priority_counts[msg.priority.name] += 1
-
-            return {
-                "size": len(self._queue),
-                "max_size": self.max_size,
-                "total_enqueued": self._total_enqueued,
-                "total_dequeued": self._total_dequeued,
-                "total_dropped": self._total_dropped,
-                "by_priority": priority_counts,
-            }
+        return {
+            "size": self._size,
+            "max_size": self.max_size,
+            "total_enqueued": self._total_enqueued,
+            "total_dequeued": self._total_dequeued,
+            "total_dropped": self._total_dropped,
+            "by_priority": {
+                p.name: sum(len(m) for m in self._lanes[p].values()) for p in MessagePriority
+            },
+            "servers": len({server for lane in self._lanes for server in lane}),
+        }
 
 
 class MessageDispatcher:
     """
     Dispatches messages from queue to handlers.
 
-    Runs as background task processing messages.
+    Runs as background worker tasks; each worker takes a batch of up to
+    ``batch_size`` messages and sends them concurrently. Can be stopped
+    and started again.
+
+    Args:
+        queue: Queue to drain
+        handler: Object with ``send_request(server_name, data)`` (e.g.
+            MCPClient), or an async callable taking the same arguments
+        concurrency: Number of workers (and messages sent at once)
+        batch_size: Messages a worker takes per dequeue
     """
 
     def __init__(
@@ -261,11 +408,16 @@ class MessageDispatcher:
         queue: MessageQueue,
         handler: Any,  # MCPClient or similar
         concurrency: int = 5,
+        batch_size: int = 10,
     ):
         self.queue = queue
         self.handler = handler
         self.concurrency = concurrency
+        self.batch_size = batch_size
 
+        self._send: Callable[..., Awaitable[Any]] = (
+            handler.send_request if hasattr(handler, "send_request") else handler
+        )
         self._running = False
         self._tasks: list[asyncio.Task] = []
         self._semaphore: asyncio.Semaphore | None = None
@@ -304,28 +456,27 @@ class MessageDispatcher:
         """Worker coroutine."""
         while self._running:
             try:
-                # Get message
-                message = await self.queue.dequeue(timeout=1.0)
-                if message is None:
-                    continue
-
-                # Process message
-                if self._semaphore:
-                    async with self._semaphore:
-                        await self._process_message(message)
-                else:
-                    await self._process_message(message)
+                batch = await self.queue.dequeue_batch(self.batch_size, timeout=1.0)
+                if batch:
+                    await asyncio.gather(*(self._dispatch(message) for message in batch))
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.exception(f"Worker {worker_id} error: {e}")
 
+    async def _dispatch(self, message: Message) -> None:
+        if self._semaphore:
+            async with self._semaphore:
+                await self._process_message(message)
+        else:
+            await self._process_message(message)
+
     async def _process_message(self, message: Message) -> None:
         """Process a single message."""
         try:
             # Send via handler
-            result = await self.handler.send_request(
+            result = await self._send(
                 server_name=message.target_server,
                 data=message.data,
             )
@@ -340,10 +491,6 @@ class MessageDispatcher:
             # Retry if possible
             if message.can_retry:
                 message.retries += 1
-                await self.queue.enqueue(
-                    message.data,
-                    priority=message.priority,
-                    target_server=message.target_server,
-                )
+                await self.queue.requeue(message)
             elif message.callback and not message.callback.done():
                 message.callback.set_exception(e)
@@ -5,16 +5,20 @@ Resource Manager
 Manages resources from MCP servers with:
 - Resource discovery
 - Subscription mechanism
-- Caching
+- Caching (LRU with TTL, stale-while-revalidate, single-flight loads)
 """
 
 import asyncio
-from collections.abc import Callable
+import re
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
 from ..common.logger import get_logger
+from ..observability.metrics import MetricsCollector
+from ..transport.json_rpc import uri_template_pattern
 
 logger = get_logger(__name__)
 
@@ -33,6 +37,7 @@ class CachedResource:
     # Cache metadata
     cached_at: datetime = field(default_factory=datetime.utcnow)
     expires_at: datetime | None = None
+    stale_until: datetime | None = None  # Served while revalidating until then
     version: int = 0
 
     @property
@@ -42,6 +47,11 @@ class CachedResource:
             return False
         return datetime.utcnow() > self.expires_at
 
+    @property
+    def is_servable_stale(self) -> bool:
+        """Check if an expired entry may still be served while it is refreshed."""
+        return self.stale_until is not None and datetime.utcnow() <= self.stale_until
+
     def update(self, data: Any) -> None:
         """Update cached data."""
         self.data = data
@@ -73,27 +83,59 @@ class ResourceManager:
     Features:
     - Resource discovery and listing
     - Subscription mechanism for updates
-    - Caching with TTL
+    - Caching with TTL, bounded by least-recently-used eviction
+
+    ``get_or_load`` shares one load between concurrent misses on a URI and
+    serves entries up to ``stale_ttl`` past expiry while a single
+    background load refreshes them. Pushed updates replace entries directly.
+
+    Args:
+        cache_ttl: Seconds an entry is fresh
+        max_entries: Cached URIs kept before the least recently used is evicted
+        stale_ttl: Seconds past expiry an entry is still served while refreshing
+        metrics: Collector for cache counters (None disables publishing)
     """
 
     def __init__(
         self,
         cache_ttl: float = 60.0,  # Default cache TTL in seconds
+        max_entries: int = 1024,
+        stale_ttl: float = 30.0,
+        metrics: MetricsCollector | None = None,
     ):
         self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self.metrics = metrics
 
         # Resources indexed by URI
         self._resources: dict[str, ResourceInfo] = {}
 
+        # URI templates ("game://state/{game_id}") for concrete URIs
+        self._templates: list[tuple[re.Pattern[str], ResourceInfo]] = []
+
         # Resources grouped by server
         self._by_server: dict[str, dict[str, ResourceInfo]] = {}
 
-        # Cache
-        self._cache: dict[str, CachedResource] = {}
+        # Cache, least recently used first
+        self._cache: OrderedDict[str, CachedResource] = OrderedDict()
+
+        # In-flight loads, one per URI
+        self._loads: dict[str, asyncio.Task] = {}
+
+        # Cache counters
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
 
         # Subscriptions
         self._subscriptions: dict[str, list[Callable]] = {}
 
+        # Last server version delivered per URI (pushed updates)
+        self._versions: dict[str, int] = {}
+
         self._lock = asyncio.Lock()
 
     async def register_resource(
@@ -126,6 +168,9 @@ class ResourceManager:
             )
 
             self._resources[uri] = resource_info
+            if "{" in uri:
+                self._templates = [(p, r) for p, r in self._templates if r.uri != uri]
+                self._templates.append((uri_template_pattern(uri), resource_info))
 
             if server_name not in self._by_server:
                 self._by_server[server_name] = {}
@@ -164,10 +209,18 @@ class ResourceManager:
                 count += 1
 
             del self._by_server[server_name]
+            self._templates = [(p, r) for p, r in self._templates if r.server_name != server_name]
 
             logger.info(f"Unregistered {count} resources from {server_name}")
             return count
 
+    def _lookup(self, uri: str) -> ResourceInfo | None:
+        """Resource for a URI, or the template it instantiates."""
+        resource = self._resources.get(uri)
+        if resource is None:
+            resource = next((r for p, r in self._templates if p.match(uri)), None)
+        return resource
+
     async def get_resource_info(self, uri: str) -> ResourceInfo | None:
         """Get resource info by URI."""
         async with self._lock:
@@ -218,6 +271,7 @@ class ResourceManager:
         async with self._lock:
             cached = self._cache.get(uri)
             if cached and not cached.is_expired:
+                self._cache.move_to_end(uri)
                 return cached.data
             return None
 
@@ -236,26 +290,112 @@ class ResourceManager:
             ttl: Cache TTL in seconds (uses default if not specified)
         """
         async with self._lock:
-            resource = self._resources.get(uri)
-            if not resource:
-                logger.warning(f"Caching unknown resource: {uri}")
-                server_name = "unknown"
-            else:
-                server_name = resource.server_name
+            self._store(uri, data, ttl)
+
+    def _store(self, uri: str, data: Any, ttl: float | None = None) -> None:
+        resource = self._lookup(uri)
+        if not resource:
+            logger.warning(f"Caching unknown resource: {uri}")
+            server_name = "unknown"
+        else:
+            server_name = resource.server_name
+
+        ttl = ttl or self.cache_ttl
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        stale_until = expires_at + timedelta(seconds=self.stale_ttl)
+
+        if uri in self._cache:
+            self._cache[uri].update(data)
+            self._cache[uri].expires_at = expires_at
+            self._cache[uri].stale_until = stale_until
+            self._cache.move_to_end(uri)
+        else:
+            self._cache[uri] = CachedResource(
+                uri=uri,
+                server_name=server_name,
+                data=data,
+                expires_at=expires_at,
+                stale_until=stale_until,
+            )
 
-            ttl = ttl or self.cache_ttl
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+            if self.metrics is not None:
+                self.metrics.increment("resource_cache_evictions_total")
 
-            if uri in self._cache:
-                self._cache[uri].update(data)
-                self._cache[uri].expires_at = expires_at
+    async def get_or_load(self, uri: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get cached data, calling ``load`` on a miss.
+
+        Args:
+            uri: Resource URI
+            load: Fetches the data from the server
+
+        Returns:
+            Fresh or servable stale data, or the result of ``load``
+        """
+        async with self._lock:
+            cached = self._cache.get(uri)
+            if cached is not None and not cached.is_expired:
+                self._cache.move_to_end(uri)
+                self._count("hit")
+                return cached.data
+
+            if cached is not None and cached.is_servable_stale:
+                self._cache.move_to_end(uri)
+                self._count("stale")
+                self._start_load(uri, load)
+                return cached.data
+
+            task = self._loads.get(uri)
+            if task is None:
+                self._count("miss")
+                task = self._start_load(uri, load)
             else:
-                self._cache[uri] = CachedResource(
-                    uri=uri,
-                    server_name=server_name,
-                    data=data,
-                    expires_at=expires_at,
-                )
+                self._count("coalesced")
+
+        # Shielded: a cancelled caller must not cancel the load others wait on
+        return await asyncio.shield(task)
+
+    def _count(self, result: str) -> None:
+        if result == "hit":
+            self.hits += 1
+        elif result == "stale":
+            self.stale_hits += 1
+        elif result == "miss":
+            self.misses += 1
+        else:
+            self.coalesced += 1
+        if self.metrics is not None:
+            self.metrics.increment("resource_cache_requests_total", labels={"result": result})
+
+    def _start_load(self, uri: str, load: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._loads.get(uri)
+        if task is None:
+            task = asyncio.create_task(self._load(uri, load))
+            task.add_done_callback(self._log_failed_load)
+            self._loads[uri] = task
+        return task
+
+    async def _load(self, uri: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        started = datetime.utcnow()
+        try:
+            data = await load()
+            async with self._lock:
+                # A pushed update that arrived during the load is newer
+                cached = self._cache.get(uri)
+                if cached is None or cached.cached_at <= started:
+                    self._store(uri, data)
+            return data
+        finally:
+            self._loads.pop(uri, None)
+
+    @staticmethod
+    def _log_failed_load(task: asyncio.Task) -> None:
+        # Retrieves the exception, so background refreshes nobody awaits do not warn
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Resource load failed: {task.exception()}")
 
     async def invalidate_cache(self, uri: str) -> bool:
         """Invalidate cached data for a resource."""
@@ -292,7 +432,7 @@ class ResourceManager:
             True if subscription was created
         """
         async with self._lock:
-            resource = self._resources.get(uri)
+            resource = self._lookup(uri)
             if not resource:
                 logger.warning(f"Subscribing to unknown resource: {uri}")
                 return False
@@ -339,17 +479,24 @@ class ResourceManager:
             logger.debug(f"Unsubscribed from resource: {uri}")
             return True
 
-    async def notify_update(self, uri: str, data: Any) -> int:
+    async def notify_update(self, uri: str, data: Any, version: int | None = None) -> int:
         """
         Notify subscribers of resource update.
 
         Args:
             uri: Resource URI
             data: New data
+            version: Server version of the data; updates not newer than
+                the last one delivered are dropped
 
         Returns:
             Number of callbacks notified
         """
+        if version is not None:
+            if version <= self._versions.get(uri, -1):
+                return 0
+            self._versions[uri] = version
+
         # Update cache
         await self.set_cached(uri, data)
 
@@ -371,6 +518,10 @@ class ResourceManager:
 
         return count
 
+    def get_version(self, uri: str) -> int | None:
+        """Last server version delivered for a URI (None if never pushed)."""
+        return self._versions.get(uri)
+
     # ========================================================================
     # Statistics
     # ========================================================================
@@ -398,7 +549,14 @@ class ResourceManager:
                 "by_server": {name: len(resources) for name, resources in self._by_server.items()},
                 "cache": {
                     "entries": len(self._cache),
+                    "max_entries": self.max_entries,
                     "expired": sum(1 for c in self._cache.values() if c.is_expired),
+                    "hits": self.hits,
+                    "stale_hits": self.stale_hits,
+                    "misses": self.misses,
+                    "coalesced": self.coalesced,
+                    "evictions": self.evictions,
+                    "loading": len(self._loads),
                 },
                 "subscriptions": {
                     "total": sum(len(cbs) for cbs in self._subscriptions.values()),
@@ -1,54 +1,127 @@
-"""Common utilities and shared components."""
+"""
+Common utilities and shared components.
 
-from .config import Config, ServerConfig, get_config
-from .config_loader import (
-    ConfigLoader,
-    GamesRegistryConfig,
-    LeagueConfigFile,
-    PlayerDefaults,
-    RefereeDefaults,
-    SystemConfig,
-    get_config_loader,
-)
-from .exceptions import (
-    ConnectionError,
-    GameError,
-    MCPError,
-    ProtocolError,
-    RegistrationError,
-    TimeoutError,
-    ValidationError,
-)
-from .lifecycle import (
-    AgentLifecycleManager,
-    LifecycleEvent,
-    LifecycleRegistry,
-    StateTransition,
-    get_lifecycle_registry,
-)
-from .logger import get_logger, setup_logging
-from .protocol import (
-    PROTOCOL_VERSION,
-    GameStatus,
-    MessageType,
-    PlayerStatus,
-    create_message,
-    validate_message,
-)
-from .repositories import (
-    DataManager,
-    MatchData,
-    MatchRepository,
-    PlayerHistoryData,
-    PlayerHistoryEntry,
-    PlayerHistoryRepository,
-    RoundEntry,
-    RoundsData,
-    RoundsRepository,
-    StandingsData,
-    StandingsEntry,
-    StandingsRepository,
-    get_data_manager,
+Exports are loaded on first access (see ``lazy.py``), so importing one
+submodule does not import the others.
+"""
+
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import Config, ServerConfig, get_config
+    from .config_loader import (
+        ConfigLoader,
+        GamesRegistryConfig,
+        LeagueConfigFile,
+        PlayerDefaults,
+        RefereeDefaults,
+        SystemConfig,
+        get_config_loader,
+    )
+    from .exceptions import (
+        ConnectionError,
+        GameError,
+        MCPError,
+        ProtocolError,
+        RegistrationError,
+        TimeoutError,
+        ValidationError,
+    )
+    from .lifecycle import (
+        AgentLifecycleManager,
+        LifecycleEvent,
+        LifecycleRegistry,
+        StateTransition,
+        get_lifecycle_registry,
+    )
+    from .logger import get_logger, setup_logging
+    from .protocol import (
+        PROTOCOL_VERSION,
+        GameStatus,
+        MessageType,
+        PlayerStatus,
+        create_message,
+        validate_message,
+    )
+    from .repositories import (
+        DataManager,
+        MatchData,
+        MatchRepository,
+        PlayerHistoryData,
+        PlayerHistoryEntry,
+        PlayerHistoryRepository,
+        RoundEntry,
+        RoundsData,
+        RoundsRepository,
+        StandingsData,
+        StandingsEntry,
+        StandingsRepository,
+        get_data_manager,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".config": (
+            "Config",
+            "ServerConfig",
+            "get_config",
+        ),
+        ".config_loader": (
+            "ConfigLoader",
+            "GamesRegistryConfig",
+            "LeagueConfigFile",
+            "PlayerDefaults",
+            "RefereeDefaults",
+            "SystemConfig",
+            "get_config_loader",
+        ),
+        ".exceptions": (
+            "ConnectionError",
+            "GameError",
+            "MCPError",
+            "ProtocolError",
+            "RegistrationError",
+            "TimeoutError",
+            "ValidationError",
+        ),
+        ".lifecycle": (
+            "AgentLifecycleManager",
+            "LifecycleEvent",
+            "LifecycleRegistry",
+            "StateTransition",
+            "get_lifecycle_registry",
+        ),
+        ".logger": (
+            "get_logger",
+            "setup_logging",
+        ),
+        ".protocol": (
+            "PROTOCOL_VERSION",
+            "GameStatus",
+            "MessageType",
+            "PlayerStatus",
+            "create_message",
+            "validate_message",
+        ),
+        ".repositories": (
+            "DataManager",
+            "MatchData",
+            "MatchRepository",
+            "PlayerHistoryData",
+            "PlayerHistoryEntry",
+            "PlayerHistoryRepository",
+            "RoundEntry",
+            "RoundsData",
+            "RoundsRepository",
+            "StandingsData",
+            "StandingsEntry",
+            "StandingsRepository",
+            "get_data_manager",
+        ),
+    },
 )
 
 __all__ = [
@@ -103,6 +103,8 @@ class LeagueConfig:
     max_players: int = 100
     matches_per_round: int = 2  # Parallel matches
     round_robin: bool = True
+    format: str = "round_robin"  # round_robin, swiss or ladder
+    pairing_rounds: int = 0  # Swiss/ladder rounds (0 = ceil(log2(players)))
 
 
 @dataclass
@@ -116,6 +118,50 @@ class RetryConfig:
     jitter_factor: float = 0.1
 
 
+@dataclass
+class RateLimitConfig:
+    """
+    Configuration for protocol-message rate limiting.
+
+    Peer classes are granted only to peers registered with the limiter (the
+    league manager registers referees; players register referees verified
+    against the league manager; players and referees register the league
+    manager once their registration is accepted). Exempt classes and
+    registered peers bypass the limiter; referees get a high tier so they
+    can drive many concurrent games. Unregistered senders always get the
+    default tier.
+    """
+
+    enabled: bool = True
+    requests_per_minute: int = 100  # Default tier (players, anonymous)
+    burst_size: int = 10
+    referee_requests_per_minute: int = 6000
+    referee_burst_size: int = 200
+    exempt_peer_classes: list[str] = field(default_factory=lambda: ["league_manager"])
+    exempt_registered_peers: bool = True
+    trust_sender_prefix: bool = False  # Unsafe: derive class from unauthenticated sender
+    idle_bucket_ttl: float = 300.0  # Seconds before an idle bucket is evicted
+    max_buckets: int = 10000
+
+
+@dataclass
+class ProfilingConfig:
+    """
+    Configuration for runtime profiling of game servers (opt-in).
+
+    Enables the slow-callback watchdog, per-handler CPU accounting and the
+    ``get_profile`` tool's sampling profiler. Collapsed stacks are written
+    under ``output_dir`` only when requested.
+    """
+
+    enabled: bool = False
+    slow_callback_ms: float = 100.0
+    max_slow_callbacks: int = 50
+    sample_interval_ms: float = 5.0
+    max_sample_seconds: float = 30.0
+    output_dir: str = "profiles"
+
+
 @dataclass
 class Config:
     """Main configuration container."""
@@ -138,6 +184,8 @@ class Config:
     game: GameConfig = field(default_factory=GameConfig)
     league: LeagueConfig = field(default_factory=LeagueConfig)
     retry: RetryConfig = field(default_factory=RetryConfig)
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
 
     # Logging
     log_level: str = "INFO"
@@ -202,6 +250,12 @@ class Config:
         if "retry" in data:
             filtered = cls._filter_config_data(data["retry"], RetryConfig)
             config.retry = RetryConfig(**filtered)
+        if "rate_limit" in data:
+            filtered = cls._filter_config_data(data["rate_limit"], RateLimitConfig)
+            config.rate_limit = RateLimitConfig(**filtered)
+        if "profiling" in data:
+            filtered = cls._filter_config_data(data["profiling"], ProfilingConfig)
+            config.profiling = ProfilingConfig(**filtered)
         if "log_level" in data:
             config.log_level = data["log_level"]
         if "debug" in data:
@@ -0,0 +1,50 @@
+"""
+Lazy Package Exports
+====================
+
+PEP 562 helpers for package ``__init__`` modules.
+
+A package lists its public names and the submodule defining each; the
+submodule is imported the first time one of its names is accessed, and the
+value is then stored on the package so later lookups are plain attribute
+reads. Importing a package (or one of its submodules) therefore no longer
+imports every sibling subsystem.
+
+Usage::
+
+    __getattr__, __dir__ = lazy_exports(__name__, {".player": ("PlayerAgent",)})
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Submodule (relative, e.g. ``".player"``) -> names it provides
+
+    Returns:
+        (``__getattr__``, ``__dir__``) to assign at package level
+    """
+    origins = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(origins))
+
+    return __getattr__, __dir__
@@ -2,6 +2,7 @@
 
 from .match import Match, MatchState
 from .odd_even import GameResult, GameRole, Move, OddEvenGame, OddEvenRules, RoundResult
+from .pairing import LadderPairing, SwissPairing
 from .registry import (
     GameInterface,
     GameMove,
@@ -10,6 +11,7 @@ from .registry import (
     GameTypeInfo,
     register_default_games,
 )
+from .standings import StandingsTable
 
 __all__ = [
     # Odd/Even game
@@ -22,6 +24,11 @@ __all__ = [
     # Match management
     "Match",
     "MatchState",
+    # Pairing
+    "SwissPairing",
+    "LadderPairing",
+    # Standings
+    "StandingsTable",
     # Game Registry
     "GameRegistry",
     "GameInterface",
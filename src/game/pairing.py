@@ -0,0 +1,196 @@
+"""
+Round Pairing
+=============
+
+Lazy, per-round pairing engines for large leagues.
+
+Round-robin scheduling materializes O(n²) matches up front. The engines
+here instead pair one round at a time from the current ranking, so a league
+of n players converges on a ranking in about log2(n) rounds:
+
+- ``SwissPairing``: pairs players with similar scores (from the incremental
+  standings), avoiding rematches.
+- ``LadderPairing``: pairs players with similar Elo ratings, avoiding
+  rematches.
+
+Pairing a round is O(n log n) at most (the ladder's rating sort); the Swiss
+engine reuses the already-sorted standings and pairs in O(n · window).
+"""
+
+import math
+from collections import defaultdict
+from collections.abc import Sequence
+
+LEAGUE_FORMATS = ("round_robin", "swiss", "ladder")
+
+
+class SwissPairing:
+    """
+    Swiss-system pairing by current rank.
+
+    Players are paired top-down with the nearest-ranked opponent they have
+    not met yet, searching at most ``window`` candidates before falling back
+    to a rematch with the nearest one. With an odd player count, the
+    lowest-ranked player without a previous bye sits out the round.
+    """
+
+    format_name = "swiss"
+
+    def __init__(self, window: int = 8):
+        self.window = max(1, window)
+        self._opponents: dict[str, set[str]] = defaultdict(set)
+        self._byes: set[str] = set()
+
+    @staticmethod
+    def recommended_rounds(num_players: int) -> int:
+        """Get the number of rounds needed to separate ``num_players``."""
+        if num_players < 2:
+            return 0
+        return max(1, math.ceil(math.log2(num_players)))
+
+    def has_played(self, player1_id: str, player2_id: str) -> bool:
+        """Check whether two players were already paired."""
+        return player2_id in self._opponents.get(player1_id, ())
+
+    def reset(self) -> None:
+        """Forget pairing history."""
+        self._opponents.clear()
+        self._byes.clear()
+
+    def rank_players(self, ranked_ids: Sequence[str]) -> list[str]:
+        """Order players for pairing (Swiss uses the standings order as-is)."""
+        return list(ranked_ids)
+
+    def record_result(self, player1_id: str, player2_id: str, winner_id: str | None) -> None:
+        """Record a match result (unused by Swiss; standings drive the order)."""
+
+    def pair_round(self, ranked_ids: Sequence[str]) -> list[tuple[str, str]]:
+        """
+        Pair the next round.
+
+        Args:
+            ranked_ids: Player IDs ordered best first
+
+        Returns:
+            List of (player1, player2) tuples
+        """
+        order = self.rank_players(ranked_ids)
+        if len(order) % 2 == 1:
+            order.remove(self._pick_bye(order))
+
+        n = len(order)
+        used = [False] * n
+        pairings: list[tuple[str, str]] = []
+
+        for i in range(n):
+            if used[i]:
+                continue
+            used[i] = True
+            player_id = order[i]
+            opponents = self._opponents[player_id]
+
+            partner = fallback = None
+            scanned = 0
+            j = i + 1
+            while j < n and scanned < self.window:
+                if not used[j]:
+                    if fallback is None:
+                        fallback = j
+                    if order[j] not in opponents:
+                        partner = j
+                        break
+                    scanned += 1
+                j += 1
+
+            if partner is None:
+                partner = fallback
+            if partner is None:
+                break
+
+            used[partner] = True
+            opponent_id = order[partner]
+            opponents.add(opponent_id)
+            self._opponents[opponent_id].add(player_id)
+            pairings.append((player_id, opponent_id))
+
+        return pairings
+
+    def _pick_bye(self, order: list[str]) -> str:
+        for player_id in reversed(order):
+            if player_id not in self._byes:
+                break
+        else:
+            # Everyone has had a bye; start a new cycle
+            self._byes.clear()
+            player_id = order[-1]
+        self._byes.add(player_id)
+        return player_id
+
+
+class LadderPairing(SwissPairing):
+    """
+    Rating ladder pairing.
+
+    Players are ordered by Elo rating, updated from each reported result,
+    and paired with nearby ratings while avoiding rematches.
+    """
+
+    format_name = "ladder"
+
+    def __init__(
+        self,
+        window: int = 8,
+        initial_rating: float = 1500.0,
+        k_factor: float = 32.0,
+    ):
+        super().__init__(window=window)
+        self.initial_rating = initial_rating
+        self.k_factor = k_factor
+        self._ratings: dict[str, float] = {}
+
+    def rating(self, player_id: str) -> float:
+        """Get a player's current rating."""
+        return self._ratings.get(player_id, self.initial_rating)
+
+    def reset(self) -> None:
+        super().reset()
+        self._ratings.clear()
+
+    def rank_players(self, ranked_ids: Sequence[str]) -> list[str]:
+        # Stable sort keeps the standings order among equal ratings
+        return sorted(ranked_ids, key=lambda pid: -self.rating(pid))
+
+    def record_result(self, player1_id: str, player2_id: str, winner_id: str | None) -> None:
+        """Update both players' Elo ratings from a match result."""
+        rating1 = self.rating(player1_id)
+        rating2 = self.rating(player2_id)
+        expected1 = 1.0 / (1.0 + 10 ** ((rating2 - rating1) / 400.0))
+
+        if winner_id == player1_id:
+            score1 = 1.0
+        elif winner_id == player2_id:
+            score1 = 0.0
+        else:
+            score1 = 0.5
+
+        delta = self.k_factor * (score1 - expected1)
+        self._ratings[player1_id] = rating1 + delta
+        self._ratings[player2_id] = rating2 - delta
+
+
+def create_pairing_engine(league_format: str) -> SwissPairing | None:
+    """
+    Create the pairing engine for a league format.
+
+    Returns None for round-robin, which is scheduled up front.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if league_format == "round_robin":
+        return None
+    if league_format == "swiss":
+        return SwissPairing()
+    if league_format == "ladder":
+        return LadderPairing()
+    raise ValueError(f"Unknown league format: {league_format}. Available: {LEAGUE_FORMATS}")
@@ -0,0 +1,172 @@
+"""
+League Standings
+================
+
+Incrementally maintained standings table.
+
+Players are kept in a sorted key list, so a match result only repositions
+the two affected players instead of re-sorting the whole league. Rank and
+top-K queries are answered from the key list; the full standings list is
+rebuilt lazily and cached per version.
+"""
+
+import itertools
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Row builder: (rank, player) -> standings row
+RowBuilder = Callable[[int, Any], dict[str, Any]]
+
+
+def default_standings_row(rank: int, player: Any) -> dict[str, Any]:
+    """Build a standings row from a player with league stats."""
+    return {
+        "rank": rank,
+        "player_id": player.player_id,
+        "display_name": player.display_name,
+        "played": player.played,
+        "wins": player.wins,
+        "draws": player.draws,
+        "losses": player.losses,
+        "points": player.points,
+    }
+
+
+class StandingsTable:
+    """
+    Ordered standings with O(log n) rank lookups.
+
+    Ordering: points desc, wins desc, losses asc, then registration order.
+
+    Players must expose ``player_id``, ``points``, ``wins`` and ``losses``.
+    Call ``update(player_id)`` after a player's stats change.
+    """
+
+    def __init__(self, row_builder: RowBuilder | None = None):
+        self._row_builder = row_builder or default_standings_row
+
+        # Sorted ascending: best player first
+        self._keys: list[tuple] = []
+        self._key_of: dict[str, tuple] = {}
+        self._players: dict[str, Any] = {}
+
+        # Registration order tie-breaker
+        self._seq_of: dict[str, int] = {}
+        self._seq = itertools.count()
+
+        # Versioned snapshot cache
+        self._version = 0
+        self._snapshot_version = -1
+        self._snapshot: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._key_of
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change to the standings."""
+        return self._version
+
+    def _make_key(self, player: Any) -> tuple:
+        pid = player.player_id
+        return (-player.points, -player.wins, player.losses, self._seq_of[pid], pid)
+
+    def _remove_key(self, key: tuple) -> None:
+        index = bisect_left(self._keys, key)
+        del self._keys[index]
+
+    # ========================================================================
+    # Mutation
+    # ========================================================================
+
+    def add(self, player: Any) -> None:
+        """Add a player (or reposition it if already present)."""
+        pid = player.player_id
+        if pid in self._key_of:
+            self._players[pid] = player
+            self.update(pid)
+            return
+
+        self._seq_of[pid] = next(self._seq)
+        self._players[pid] = player
+        key = self._make_key(player)
+        self._key_of[pid] = key
+        insort(self._keys, key)
+        self._version += 1
+
+    def remove(self, player_id: str) -> bool:
+        """Remove a player. Returns False if not present."""
+        key = self._key_of.pop(player_id, None)
+        if key is None:
+            return False
+        self._remove_key(key)
+        del self._players[player_id]
+        del self._seq_of[player_id]
+        self._version += 1
+        return True
+
+    def update(self, player_id: str) -> None:
+        """Reposition a player after its stats changed."""
+        old_key = self._key_of.get(player_id)
+        if old_key is None:
+            return
+
+        new_key = self._make_key(self._players[player_id])
+        if new_key != old_key:
+            self._remove_key(old_key)
+            insort(self._keys, new_key)
+            self._key_of[player_id] = new_key
+
+        # Other row fields (played, draws) may change without moving the player
+        self._version += 1
+
+    def rebuild(self, players: Iterable[Any]) -> None:
+        """Replace the table contents (iteration order sets the tie-breaker)."""
+        self._keys.clear()
+        self._key_of.clear()
+        self._players.clear()
+        self._seq_of.clear()
+        for player in players:
+            self.add(player)
+        self._version += 1
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def rank_of(self, player_id: str) -> int | None:
+        """Get a player's 1-based rank, or None if not present."""
+        key = self._key_of.get(player_id)
+        if key is None:
+            return None
+        return bisect_left(self._keys, key) + 1
+
+    def ranked_ids(self) -> list[str]:
+        """Get player IDs in rank order."""
+        return [key[-1] for key in self._keys]
+
+    def top(self, k: int) -> list[dict[str, Any]]:
+        """Get the top-K standings rows without building the full table."""
+        return [
+            self._row_builder(rank, self._players[key[-1]])
+            for rank, key in enumerate(self._keys[: max(0, k)], 1)
+        ]
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """
+        Get the full standings rows.
+
+        Rows are rebuilt only when the version changed since the last call;
+        the returned rows are shared with the cache and must not be mutated.
+        """
+        if self._snapshot_version != self._version:
+            self._snapshot = [
+                self._row_builder(rank, self._players[key[-1]])
+                for rank, key in enumerate(self._keys, 1)
+            ]
+            self._snapshot_version = self._version
+        return list(self._snapshot)
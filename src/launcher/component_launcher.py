@@ -128,6 +128,8 @@ class ComponentLauncher:
             max_players=self.config.league.max_players,
             host=self.config.league_manager.host,
             port=port,
+            league_format=self.config.league.format,
+            pairing_rounds=self.config.league.pairing_rounds,
         )
 
         await self.component.start()
@@ -307,13 +309,13 @@ class ComponentLauncher:
 
                         serializable_state = convert_datetimes(state_dict)
 
-                        await dashboard.connection_manager.broadcast({
+                        dashboard.publish(f"tournament_state:{tournament_id}", {
                             "type": "tournament_state",
                             "tournament_id": tournament_id,
                             "data": serializable_state
                         })
 
-                        logger.info(f"[Launcher] ✅ Broadcasted updated tournament state for {tournament_id}")
+                        logger.info(f"[Launcher] ✅ Published updated tournament state for {tournament_id}")
                 else:
                     logger.warning("[Launcher] ⚠️ No tournament states available to broadcast")
             else:
@@ -250,9 +250,9 @@ class StateSyncService:
         logger.info("Dashboard subscribed to all state change events")
 
     async def _forward_to_dashboard(self, dashboard: Any, event: BaseEvent) -> None:
-        """Forward event to dashboard via WebSocket."""
+        """Forward event to dashboard via WebSocket (sent with the next frame)."""
         try:
-            if hasattr(dashboard, "connection_manager"):
+            if hasattr(dashboard, "publish_event"):
                 from dataclasses import asdict as dataclass_asdict
                 from dataclasses import is_dataclass
                 from datetime import datetime
@@ -276,7 +276,7 @@ class StateSyncService:
                 # Ensure all datetime objects are converted
                 serializable_event_dict = convert_to_serializable(event_dict)
 
-                await dashboard.connection_manager.broadcast(
+                dashboard.publish_event(
                     {
                         "type": "state_update",
                         "event_type": event.event_type,
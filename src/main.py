@@ -28,6 +28,12 @@ Usage:
     # Start a player with LLM strategy
     python -m src.main --component player --name "ClaudeBot" --port 8101 --strategy llm --register
 
+    # Host 1000 players on port 8101, sharded across one worker process per core
+    python -m src.main --component player-host --players 1000 --register
+
+    # Print standings whenever they change (pushed, no polling)
+    python -m src.main --watch league://standings
+
 LLM Configuration:
     Set ANTHROPIC_API_KEY environment variable for Claude
     Set OPENAI_API_KEY environment variable for OpenAI
@@ -35,15 +41,17 @@ LLM Configuration:
 
 import argparse
 import asyncio
+import contextlib
 import os
 import signal
 from typing import Any
 
 from .agents.league_manager import LeagueManager
 from .agents.player import PlayerAgent
+from .agents.player_host import HostedPlayerSpec, PlayerHost, PlayerHostSupervisor
 from .agents.referee import RefereeAgent
-from .agents.strategies import RandomStrategy
-from .common.config import Config, get_config
+from .agents.strategies import RandomStrategy, Strategy
+from .common.config import DEFAULT_PORTS, Config, get_config
 from .common.events import get_event_bus
 from .common.logger import get_logger, setup_logging
 
@@ -65,17 +73,19 @@ class GameOrchestrator:
     Example configuration:
         - 1 League Manager on port 8000
         - 2 Referees on ports 8001, 8002
-        - 4 Players on ports 8101-8104
+        - 4 Players on ports 8101-8104 (or all on port 8101 with ``player_host``)
     """
 
-    def __init__(self, config: Config, enable_dashboard: bool = False):
+    def __init__(self, config: Config, enable_dashboard: bool = False, player_host: bool = False):
         self.config = config
         self.enable_dashboard = enable_dashboard
+        self.use_player_host = player_host
 
         # Components
         self.league_manager: LeagueManager | None = None
         self.referees: list[RefereeAgent] = []  # Support multiple referees
         self.players: list[PlayerAgent] = []
+        self.player_host: PlayerHost | None = None
 
         # Plugin Registry
         self.plugin_registry = get_plugin_registry()
@@ -145,6 +155,9 @@ class GameOrchestrator:
             max_players=self.config.league.max_players,
             host=self.config.league_manager.host,
             port=self.config.league_manager.port,
+            league_format=self.config.league.format,
+            pairing_rounds=self.config.league.pairing_rounds,
+            rounds_per_match=self.config.game.rounds_per_match,
         )
 
         await self.league_manager.start()
@@ -191,15 +204,8 @@ class GameOrchestrator:
         self._referee_index += 1
         return referee
 
-    async def start_player(
-        self,
-        name: str,
-        port: int,
-        strategy_type: str = "random",
-    ) -> PlayerAgent:
-        """Start a player agent."""
-        # Create strategy
-        from .agents.strategies import Strategy
+    def _create_strategy(self, strategy_type: str) -> Strategy:
+        """Create a player strategy by type name."""
         from .agents.strategies.base import StrategyConfig
         from .agents.strategies.classic import LLMStrategy, PatternStrategy
 
@@ -225,9 +231,18 @@ class GameOrchestrator:
                 logger.warning(f"Unknown strategy '{strategy_type}', using RandomStrategy")
                 strategy = RandomStrategy()
 
+        return strategy
+
+    async def start_player(
+        self,
+        name: str,
+        port: int,
+        strategy_type: str = "random",
+    ) -> PlayerAgent:
+        """Start a player agent."""
         player = PlayerAgent(
             player_name=name,
-            strategy=strategy,
+            strategy=self._create_strategy(strategy_type),
             league_id=self.config.league.league_id,
             host="localhost",
             port=port,
@@ -241,6 +256,24 @@ class GameOrchestrator:
 
         return player
 
+    async def start_hosted_player(self, name: str, strategy_type: str = "random") -> PlayerAgent:
+        """Start a player on the shared player host (one port for all players)."""
+        if self.player_host is None:
+            self.player_host = PlayerHost(
+                host="localhost",
+                port=DEFAULT_PORTS["player_base"] + 1,
+                league_id=self.config.league.league_id,
+                league_manager_url=self.config.league_manager.url,
+            )
+            await self.player_host.start()
+
+        player = await self.player_host.add_player(name, self._create_strategy(strategy_type))
+        self.players.append(player)
+
+        logger.info(f"Player {name} hosted at {player.url}")
+
+        return player
+
     async def start_all(
         self,
         num_players: int = 4,
@@ -336,7 +369,10 @@ class GameOrchestrator:
             port = 8101 + i
             player_strategy = strategies[i % len(strategies)]
 
-            player = await self.start_player(name, port, player_strategy)
+            if self.use_player_host:
+                player = await self.start_hosted_player(name, player_strategy)
+            else:
+                player = await self.start_player(name, port, player_strategy)
 
             # Register with league
             await asyncio.sleep(0.2)
@@ -494,8 +530,12 @@ class GameOrchestrator:
             await self.plugin_registry.shutdown()
 
         # Stop players
-        for player in self.players:
-            await player.stop()
+        if self.player_host:
+            await self.player_host.stop()
+            self.player_host = None
+        else:
+            for player in self.players:
+                await player.stop()
         self.players.clear()
 
         # Stop all referees
@@ -638,6 +678,32 @@ async def send_league_command(command: str, arguments: dict | None = None) -> No
         print(f"Error: {e}")
 
 
+async def watch_league_resource(uri: str = "league://standings") -> None:
+    """Print a league resource each time the league manager pushes a change."""
+    import json
+
+    from .client.mcp_client import MCPClient
+    from .common.exceptions import MCPError
+
+    setup_logging(level="WARNING")
+    config = get_config()
+
+    def show(updated_uri: str, data: Any) -> None:
+        print(f"--- {updated_uri} (version {client.resources.get_version(updated_uri)})")
+        print(json.dumps(json.loads(data), indent=2) if isinstance(data, str) else data)
+
+    client = MCPClient("league_watcher", transport="websocket")
+    await client.start()
+    try:
+        await client.connect("league_manager", config.league_manager.url)
+        await client.subscribe_resource("league_manager", uri, show)
+        await asyncio.Event().wait()  # Until interrupted
+    except MCPError as e:
+        print(f"Error: {e}")
+    finally:
+        await client.stop()
+
+
 async def run_full_league(args: argparse.Namespace) -> None:
     """Run the full league."""
     setup_logging(level="DEBUG" if args.debug else "INFO")
@@ -654,7 +720,11 @@ async def run_full_league(args: argparse.Namespace) -> None:
     if args.llm_model:
         config.llm.model = args.llm_model
 
-    orchestrator = GameOrchestrator(config, enable_dashboard=getattr(args, "dashboard", False))
+    orchestrator = GameOrchestrator(
+        config,
+        enable_dashboard=getattr(args, "dashboard", False),
+        player_host=getattr(args, "player_host", False),
+    )
 
     # Handle shutdown
     loop = asyncio.get_event_loop()
@@ -685,6 +755,32 @@ async def run_full_league(args: argparse.Namespace) -> None:
         await orchestrator.stop()
 
 
+def run_player_host(args: argparse.Namespace) -> None:
+    """Serve many players from one port, sharded across worker processes."""
+    setup_logging(level="DEBUG" if args.debug else "INFO")
+    config = get_config()
+
+    if args.strategy == "mixed":
+        strategies = ["random", "pattern"]
+    else:
+        strategies = [args.strategy]
+    prefix = args.name or "Player"
+    players = [
+        HostedPlayerSpec(f"{prefix}_{i + 1}", strategies[i % len(strategies)])
+        for i in range(args.players)
+    ]
+
+    supervisor = PlayerHostSupervisor(
+        players,
+        workers=args.workers,
+        port=args.port or DEFAULT_PORTS["player_base"] + 1,
+        league_id=config.league.league_id,
+        league_manager_url=config.league_manager.url,
+        register=args.register,
+    )
+    supervisor.serve_forever()
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -706,6 +802,9 @@ Examples:
   # Start a single player with LLM strategy
   python -m src.main --component player --name "ClaudeBot" --port 8101 --strategy llm --register
 
+  # Host 1000 players on one port across 8 worker processes
+  python -m src.main --component player-host --players 1000 --workers 8 --register
+
   # Start league (after components are running)
   python -m src.main --start-league
 
@@ -722,7 +821,7 @@ Examples:
 
     parser.add_argument(
         "--component",
-        choices=["league", "referee", "player", "all"],
+        choices=["league", "referee", "player", "player-host", "all"],
         default="all",
         help="Component to start (default: all)",
     )
@@ -755,6 +854,19 @@ Examples:
         help="Number of referees (default: 2, )",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --component player-host (default: one per core)",
+    )
+
+    parser.add_argument(
+        "--player-host",
+        action="store_true",
+        help="Serve all league players from one port instead of one server each",
+    )
+
     parser.add_argument(
         "--strategy",
         # choices=["mixed", "random", "pattern", "llm"], # allow custom plugin strategies
@@ -818,6 +930,14 @@ Examples:
         help="Get current league standings",
     )
 
+    parser.add_argument(
+        "--watch",
+        nargs="?",
+        const="league://standings",
+        metavar="URI",
+        help="Print a league resource on every change (default: league://standings)",
+    )
+
     parser.add_argument(
         "--run-round",
         action="store_true",
@@ -839,12 +959,17 @@ Examples:
         asyncio.run(send_league_command("reset_league"))
     elif args.get_standings:
         asyncio.run(send_league_command("get_standings"))
+    elif args.watch:
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(watch_league_resource(args.watch))
     elif args.run_round:
         asyncio.run(send_league_command("start_next_round"))
     elif args.run_all_rounds:
         asyncio.run(send_league_command("run_all_rounds"))
     elif args.component == "all":
         asyncio.run(run_full_league(args))
+    elif args.component == "player-host":
+        run_player_host(args)
     else:
         asyncio.run(run_component(args.component, args))
 
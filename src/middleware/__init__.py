@@ -46,6 +46,7 @@ from .builtin import (
     LoggingMiddleware,
     MetricsMiddleware,
     RateLimitMiddleware,
+    RateLimitPolicy,
     TracingMiddleware,
     ValidationMiddleware,
 )
@@ -68,6 +69,7 @@ __all__ = [
     "LoggingMiddleware",
     "AuthenticationMiddleware",
     "RateLimitMiddleware",
+    "RateLimitPolicy",
     "MetricsMiddleware",
     "ValidationMiddleware",
     "CachingMiddleware",
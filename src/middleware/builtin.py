@@ -7,7 +7,7 @@ Production-grade built-in middleware for common use cases.
 Provides 8 middleware:
 1. LoggingMiddleware - Request/response logging with timing
 2. AuthenticationMiddleware - Token validation
-3. RateLimitMiddleware - Token bucket rate limiting
+3. RateLimitMiddleware - Token bucket rate limiting with per-peer-class tiers
 4. MetricsMiddleware - Performance metrics collection
 5. ValidationMiddleware - JSON schema validation
 6. CachingMiddleware - LRU response caching
@@ -25,6 +25,7 @@ import hashlib
 import json
 import time
 from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from typing import Any
 
 from ..common.logger import get_logger
@@ -206,6 +207,26 @@ class AuthenticationMiddleware(Middleware):
 # ============================================================================
 
 
+@dataclass
+class RateLimitPolicy:
+    """Token bucket limits for one class of peer."""
+
+    requests_per_minute: float = 100
+    burst_size: int = 10
+    exempt: bool = False
+
+
+class _TokenBucket:
+    """Mutable token bucket state (slots keep per-client memory small)."""
+
+    __slots__ = ("tokens", "last_update", "peer_class")
+
+    def __init__(self, tokens: float, last_update: float, peer_class: str):
+        self.tokens = tokens
+        self.last_update = last_update
+        self.peer_class = peer_class
+
+
 class RateLimitMiddleware(Middleware):
     """
     Token bucket rate limiting per client.
@@ -213,41 +234,112 @@ class RateLimitMiddleware(Middleware):
     Features:
     - Per-client rate limiting
     - Token bucket algorithm
-    - Configurable limits
-    - Burst support
+    - Per-peer-class policies (e.g. referees high-tier, league manager exempt)
+    - Peer classes are granted only to registered peers, optionally bound to
+      the auth token issued at registration; unregistered senders get the
+      default tier regardless of what their ``sender`` field claims
+    - Idle bucket eviction and a hard cap on tracked clients
+    - Throttle statistics and optional MetricsCollector export
     - Rate limit headers in response
     """
 
+    # How many requests between idle-bucket sweeps
+    _SWEEP_INTERVAL = 256
+
     def __init__(
         self,
         requests_per_minute: int = 100,
         burst_size: int = 10,
+        peer_policies: dict[str, RateLimitPolicy] | None = None,
+        exempt_registered_peers: bool = True,
+        trust_sender_prefix: bool = False,
+        idle_bucket_ttl: float = 300.0,
+        max_buckets: int = 10000,
+        metrics_collector: Any | None = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.requests_per_minute = requests_per_minute
         self.burst_size = burst_size
+        self.default_policy = RateLimitPolicy(requests_per_minute, burst_size)
+        self.peer_policies: dict[str, RateLimitPolicy] = dict(peer_policies or {})
+        self.exempt_registered_peers = exempt_registered_peers
+        self.trust_sender_prefix = trust_sender_prefix
+        self.idle_bucket_ttl = idle_bucket_ttl
+        self.max_buckets = max_buckets
+        self.metrics_collector = metrics_collector
+
+        # Token buckets in least-recently-used order: client_id -> bucket
+        self._buckets: OrderedDict[str, _TokenBucket] = OrderedDict()
+
+        # Explicitly registered peers: peer_id -> (peer class, bound auth token)
+        self._registered_peers: dict[str, tuple[str, str | None]] = {}
+
+        self._requests_since_sweep = 0
+        self._stats: dict[str, Any] = {
+            "allowed": 0,
+            "throttled": 0,
+            "exempt": 0,
+            "evicted_buckets": 0,
+            "throttled_by_class": defaultdict(int),
+        }
+
+    def register_peer(
+        self,
+        peer_id: str,
+        peer_class: str,
+        auth_token: str | None = None,
+    ) -> None:
+        """
+        Register a known peer (e.g. a referee that registered with the league).
+
+        Args:
+            peer_id: Protocol sender ID (e.g. "referee:REF01")
+            peer_class: Peer class used to select the policy
+            auth_token: If given, requests only count as this peer when they
+                carry the same token (the one issued at registration)
+        """
+        self._registered_peers[peer_id] = (peer_class, auth_token)
+        self._buckets.pop(peer_id, None)
+
+    def is_registered_peer(self, peer_id: str, auth_token: str | None = None) -> bool:
+        """Check whether a peer is registered (and its token matches, if bound)."""
+        entry = self._registered_peers.get(peer_id)
+        if entry is None:
+            return False
+        bound_token = entry[1]
+        return bound_token is None or bound_token == auth_token
 
-        # Token buckets: client_id -> (tokens, last_update)
-        self._buckets: dict[str, tuple] = {}
+    def unregister_peer(self, peer_id: str) -> None:
+        """Forget a registered peer."""
+        self._registered_peers.pop(peer_id, None)
 
     async def before(self, context: RequestContext) -> RequestContext:
         """Check rate limit."""
         # Get client identifier
         client_id = self._get_client_id(context)
+        registered = self.is_registered_peer(client_id, context.request.get("auth_token"))
+        peer_class = self._get_peer_class(client_id, registered)
+
+        if self._is_exempt(peer_class, registered):
+            self._stats["exempt"] += 1
+            context.state["rate_limit_exempt"] = True
+            return context
 
         # Check rate limit
-        allowed, remaining = self._check_rate_limit(client_id)
+        allowed, remaining, retry_after = self._check_rate_limit(client_id, peer_class)
 
         # Store rate limit info in state (shared with after hook)
         context.state["rate_limit_remaining"] = remaining
+        context.state["rate_limit_class"] = peer_class
 
         if not allowed:
+            self._record_throttle(peer_class)
             context.set_response(
                 {
                     "error": "Rate limit exceeded",
                     "error_type": "RateLimitError",
-                    "retry_after": 60,  # seconds
+                    "retry_after": retry_after,  # seconds
                 }
             )
 
@@ -255,12 +347,22 @@ class RateLimitMiddleware(Middleware):
 
     async def after(self, context: ResponseContext) -> ResponseContext:
         """Add rate limit headers to response."""
+        if context.state.get("rate_limit_exempt"):
+            context.response["rate_limit"] = {"exempt": True}
+            return context
+
         remaining = context.state.get("rate_limit_remaining", 0)
+        policy = self._get_policy(context.state.get("rate_limit_class", "anonymous"))
+
+        # Seconds until the bucket is full again at this policy's refill rate
+        rate_per_second = policy.requests_per_minute / 60.0
+        missing = max(0, policy.burst_size - remaining)
+        reset = round(missing / rate_per_second, 3) if rate_per_second > 0 else 60.0
 
         context.response["rate_limit"] = {
-            "limit": self.requests_per_minute,
+            "limit": policy.requests_per_minute,
             "remaining": remaining,
-            "reset": 60,  # seconds
+            "reset": reset,  # seconds
         }
 
         return context
@@ -272,34 +374,115 @@ class RateLimitMiddleware(Middleware):
             context.client_id or context.request.get("sender") or context.client_ip or "anonymous"
         )
 
-    def _check_rate_limit(self, client_id: str) -> tuple:
+    def _get_peer_class(self, client_id: str, registered: bool = False) -> str:
+        """
+        Classify a client.
+
+        Registered peers get their registered class. Unregistered senders are
+        "anonymous" (default tier) unless ``trust_sender_prefix`` is enabled,
+        in which case the unauthenticated sender prefix is used
+        ("referee:REF01" -> "referee").
+        """
+        if registered:
+            return self._registered_peers[client_id][0]
+        if client_id in self._registered_peers or not self.trust_sender_prefix:
+            # Unknown sender, or a registered ID presented with the wrong token
+            return "anonymous"
+        return client_id.split(":", 1)[0]
+
+    def _get_policy(self, peer_class: str) -> RateLimitPolicy:
+        """Get the policy for a peer class (default tier if none configured)."""
+        return self.peer_policies.get(peer_class, self.default_policy)
+
+    def _is_exempt(self, peer_class: str, registered: bool = False) -> bool:
+        """Check whether a client bypasses the limiter."""
+        if registered and self.exempt_registered_peers:
+            return True
+        return self._get_policy(peer_class).exempt
+
+    def _check_rate_limit(self, client_id: str, peer_class: str = "anonymous") -> tuple:
         """
         Check if request is within rate limit.
 
         Returns:
-            (allowed: bool, remaining: int)
+            (allowed: bool, remaining: int, retry_after: float)
         """
-        now = time.time()
+        now = time.monotonic()
+        policy = self._get_policy(peer_class)
 
-        # Get or create bucket
-        if client_id not in self._buckets:
-            self._buckets[client_id] = (self.burst_size, now)
+        self._requests_since_sweep += 1
+        if self._requests_since_sweep >= self._SWEEP_INTERVAL:
+            self._evict_idle_buckets(now)
 
-        tokens, last_update = self._buckets[client_id]
+        # Get or create bucket
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = _TokenBucket(float(policy.burst_size), now, peer_class)
+            self._buckets[client_id] = bucket
+            if len(self._buckets) > self.max_buckets:
+                self._evict_idle_buckets(now, force=True)
+        else:
+            self._buckets.move_to_end(client_id)
 
         # Refill tokens based on time elapsed
-        elapsed = now - last_update
-        refill = (elapsed / 60.0) * self.requests_per_minute
-        tokens = min(self.burst_size, tokens + refill)
+        rate_per_second = policy.requests_per_minute / 60.0
+        elapsed = now - bucket.last_update
+        bucket.tokens = min(policy.burst_size, bucket.tokens + elapsed * rate_per_second)
+        bucket.last_update = now
+        bucket.peer_class = peer_class
 
         # Check if we have tokens
-        if tokens >= 1.0:
+        if bucket.tokens >= 1.0:
             # Allow request, consume token
-            self._buckets[client_id] = (tokens - 1.0, now)
-            return True, int(tokens - 1)
-        else:
-            # Rate limit exceeded
-            return False, 0
+            bucket.tokens -= 1.0
+            self._stats["allowed"] += 1
+            return True, int(bucket.tokens), 0.0
+
+        # Rate limit exceeded
+        retry_after = (1.0 - bucket.tokens) / rate_per_second if rate_per_second > 0 else 60.0
+        return False, 0, round(retry_after, 3)
+
+    def _evict_idle_buckets(self, now: float, force: bool = False) -> None:
+        """
+        Drop buckets that have been idle longer than ``idle_bucket_ttl``.
+
+        Buckets are kept in LRU order, so the sweep stops at the first
+        active bucket. With ``force`` the oldest buckets are dropped until
+        the table is back under ``max_buckets``.
+        """
+        self._requests_since_sweep = 0
+        cutoff = now - self.idle_bucket_ttl
+
+        while self._buckets:
+            client_id, bucket = next(iter(self._buckets.items()))
+            over_capacity = force and len(self._buckets) > self.max_buckets
+            if bucket.last_update > cutoff and not over_capacity:
+                break
+            del self._buckets[client_id]
+            self._stats["evicted_buckets"] += 1
+
+    def _record_throttle(self, peer_class: str) -> None:
+        """Count a throttled request."""
+        self._stats["throttled"] += 1
+        self._stats["throttled_by_class"][peer_class] += 1
+
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment(
+                "rate_limit_throttled_total",
+                labels={"peer_class": peer_class},
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics."""
+        return {
+            "allowed": self._stats["allowed"],
+            "throttled": self._stats["throttled"],
+            "exempt": self._stats["exempt"],
+            "evicted_buckets": self._stats["evicted_buckets"],
+            "throttled_by_class": dict(self._stats["throttled_by_class"]),
+            "active_buckets": len(self._buckets),
+            "registered_peers": len(self._registered_peers),
+        }
 
 
 # ============================================================================
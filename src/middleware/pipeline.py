@@ -11,6 +11,7 @@ Features:
 - Middleware enable/disable
 - Execution timeout
 - Performance metrics
+- Precompiled execution chain (rebuilt only when middleware changes)
 
 Usage:
     pipeline = MiddlewarePipeline()
@@ -25,6 +26,7 @@ Usage:
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -40,6 +42,13 @@ from .base import (
 logger = get_logger(__name__)
 
 
+def _overrides_hook(middleware: Middleware, hook: str) -> bool:
+    """Check whether a middleware overrides a base-class hook (or patches it per instance)."""
+    if hook in vars(middleware):
+        return True
+    return getattr(type(middleware), hook) is not getattr(Middleware, hook)
+
+
 # ============================================================================
 # Middleware Metadata
 # ============================================================================
@@ -107,6 +116,10 @@ class MiddlewarePipeline:
             "total_timeouts": 0,
         }
 
+        # Compiled request chain (rebuilt on every middleware change)
+        self._chain: Callable[..., Awaitable[dict[str, Any]]]
+        self._compile()
+
     def add_middleware(
         self,
         middleware: Middleware,
@@ -135,6 +148,7 @@ class MiddlewarePipeline:
 
         # Sort by priority (descending)
         self._middleware.sort(key=lambda m: m.priority, reverse=True)
+        self._compile()
 
         logger.debug(f"Added middleware: {middleware.name} (priority={priority})")
 
@@ -156,6 +170,7 @@ class MiddlewarePipeline:
         removed = len(self._middleware) < initial_count
 
         if removed:
+            self._compile()
             logger.debug(f"Removed middleware: {name}")
 
         return removed
@@ -174,6 +189,7 @@ class MiddlewarePipeline:
             if metadata.middleware.name == name:
                 metadata.enabled = True
                 metadata.middleware.enabled = True
+                self._compile()
                 logger.debug(f"Enabled middleware: {name}")
                 return True
         return False
@@ -192,10 +208,26 @@ class MiddlewarePipeline:
             if metadata.middleware.name == name:
                 metadata.enabled = False
                 metadata.middleware.enabled = False
+                self._compile()
                 logger.debug(f"Disabled middleware: {name}")
                 return True
         return False
 
+    def get_middleware(self, name: str) -> Middleware | None:
+        """
+        Get a registered middleware instance by name.
+
+        Args:
+            name: Middleware name
+
+        Returns:
+            Middleware instance, or None if not found
+        """
+        for metadata in self._middleware:
+            if metadata.middleware.name == name:
+                return metadata.middleware
+        return None
+
     async def execute(
         self,
         request: dict[str, Any],
@@ -225,7 +257,6 @@ class MiddlewarePipeline:
             MiddlewareError: If error_handling is "raise"
         """
         self._stats["total_requests"] += 1
-        start_time = time.time()
 
         # Create request context
         context = RequestContext(
@@ -235,13 +266,12 @@ class MiddlewarePipeline:
         )
 
         try:
-            # Execute with timeout
-            response = await asyncio.wait_for(
-                self._execute_pipeline(context, handler, handler_kwargs),
-                timeout=self._timeout_seconds,
-            )
-
-            return response
+            # asyncio.timeout arms a single timer handle on the current task,
+            # unlike wait_for which wraps the pipeline in a new task.
+            if self._timeout_seconds and self._timeout_seconds > 0:
+                async with asyncio.timeout(self._timeout_seconds):
+                    return await self._chain(context, handler, handler_kwargs)
+            return await self._chain(context, handler, handler_kwargs)
 
         except TimeoutError:
             self._stats["total_timeouts"] += 1
@@ -264,109 +294,131 @@ class MiddlewarePipeline:
                 "middleware_error": True,
             }
 
-        finally:
-            duration = (time.time() - start_time) * 1000
-            logger.debug(f"Pipeline execution completed in {duration:.2f}ms")
-
-    async def _execute_pipeline(
-        self,
-        context: RequestContext,
-        handler: AsyncRequestHandler,
-        handler_kwargs: dict[str, Any],
-    ) -> dict[str, Any]:
+    def _compile(self) -> None:
         """
-        Execute the full middleware pipeline.
+        Compile the enabled middleware into a single closure chain.
 
-        Args:
-            context: Request context
-            handler: Request handler
-            handler_kwargs: Handler kwargs
-
-        Returns:
-            Response data
+        Called whenever middleware is added, removed, enabled or disabled, so
+        the per-request path never re-filters the middleware list. Hooks a
+        middleware does not override are left out of the chain entirely.
         """
-        # Get enabled middleware
-        enabled_middleware = [m for m in self._middleware if m.enabled]
-
-        # Phase 1: Before hooks (high to low priority)
-        for metadata in enabled_middleware:
-            if context.has_response():
-                # Short-circuit: skip remaining before hooks
-                break
+        enabled = [m for m in self._middleware if m.enabled]
 
-            try:
-                start = time.time()
-                context = await metadata.middleware.before(context)
-                duration = (time.time() - start) * 1000
-
-                metadata.total_requests += 1
-                metadata.total_time_ms += duration
-
-            except Exception as e:
-                logger.error(f"Error in {metadata.middleware.name}.before: {e}")
-
-                # Try error handler
-                error_response = await self._handle_error(context, e, enabled_middleware)
-
-                if error_response:
-                    return error_response
-
-                if self._error_handling == "raise":
-                    raise
-                elif self._error_handling == "stop":
-                    return self._create_error_response(e, metadata.middleware.name)
-
-        # Phase 2: Execute handler (if not short-circuited)
-        if context.has_response():
-            response_data = context.response
-        else:
-            try:
-                response_data = await handler(context.request, **handler_kwargs)
-            except Exception as e:
-                logger.error(f"Error in handler: {e}")
-
-                # Try error handlers
-                error_response = await self._handle_error(context, e, enabled_middleware)
-
-                if error_response:
-                    return error_response
+        before_stages = tuple(
+            (m, m.middleware.before) for m in enabled if _overrides_hook(m.middleware, "before")
+        )
+        after_stages = tuple(
+            (m, m.middleware.after)
+            for m in reversed(enabled)
+            if _overrides_hook(m.middleware, "after")
+        )
+        error_stages = [m for m in enabled if _overrides_hook(m.middleware, "on_error")]
 
-                if self._error_handling == "raise":
-                    raise
+        self._chain = self._build_chain(before_stages, after_stages, error_stages)
 
-                return self._create_error_response(e, "handler")
+    def _build_chain(
+        self,
+        before_stages: tuple,
+        after_stages: tuple,
+        error_stages: list[MiddlewareMetadata],
+    ) -> Callable[..., Awaitable[dict[str, Any]]]:
+        """
+        Build the closure that runs one request through the compiled stages.
 
-        # Ensure we have a valid response
-        if response_data is None:
-            response_data = {}
+        Args:
+            before_stages: (metadata, bound before hook) in priority order
+            after_stages: (metadata, bound after hook) in reverse priority order
+            error_stages: Middleware with an on_error hook, in priority order
 
-        # Create response context
-        response_context = ResponseContext(
-            response=response_data,
-            metadata={},
-            state=context.state,
-            request=context,
-        )
+        Returns:
+            Async callable ``chain(context, handler, handler_kwargs)``
+        """
+        perf_counter = time.perf_counter
+        error_handling = self._error_handling
+        handle_error = self._handle_error
+        create_error_response = self._create_error_response
+
+        async def chain(
+            context: RequestContext,
+            handler: AsyncRequestHandler,
+            handler_kwargs: dict[str, Any],
+        ) -> dict[str, Any]:
+            # Phase 1: Before hooks (high to low priority)
+            for metadata, before in before_stages:
+                if context.response is not None:
+                    # Short-circuit: skip remaining before hooks
+                    break
+
+                try:
+                    start = perf_counter()
+                    context = await before(context)
+                    metadata.total_requests += 1
+                    metadata.total_time_ms += (perf_counter() - start) * 1000
+
+                except Exception as e:
+                    logger.error(f"Error in {metadata.middleware.name}.before: {e}")
+
+                    # Try error handler
+                    error_response = await handle_error(context, e, error_stages)
+
+                    if error_response:
+                        return error_response
+
+                    if error_handling == "raise":
+                        raise
+                    elif error_handling == "stop":
+                        return create_error_response(e, metadata.middleware.name)
+
+            # Phase 2: Execute handler (if not short-circuited)
+            if context.response is not None:
+                response_data = context.response
+            else:
+                try:
+                    response_data = await handler(context.request, **handler_kwargs)
+                except Exception as e:
+                    logger.error(f"Error in handler: {e}")
+
+                    # Try error handlers
+                    error_response = await handle_error(context, e, error_stages)
+
+                    if error_response:
+                        return error_response
+
+                    if error_handling == "raise":
+                        raise
+
+                    return create_error_response(e, "handler")
+
+            if not after_stages:
+                return response_data if response_data is not None else {}
+
+            # Create response context
+            response_context = ResponseContext(
+                response=response_data if response_data is not None else {},
+                metadata={},
+                state=context.state,
+                request=context,
+            )
 
-        # Phase 3: After hooks (low to high priority - reverse order)
-        for metadata in reversed(enabled_middleware):
-            try:
-                start = time.time()
-                response_context = await metadata.middleware.after(response_context)
-                duration = (time.time() - start) * 1000
+            # Phase 3: After hooks (low to high priority - reverse order)
+            for metadata, after in after_stages:
+                try:
+                    start = perf_counter()
+                    response_context = await after(response_context)
+                    metadata.total_time_ms += (perf_counter() - start) * 1000
 
-                metadata.total_time_ms += duration
+                except Exception as e:
+                    logger.error(f"Error in {metadata.middleware.name}.after: {e}")
+                    metadata.total_errors += 1
 
-            except Exception as e:
-                logger.error(f"Error in {metadata.middleware.name}.after: {e}")
-                metadata.total_errors += 1
+                    if error_handling == "raise":
+                        raise
+                    elif error_handling == "stop":
+                        return create_error_response(e, metadata.middleware.name)
 
-                if self._error_handling == "raise":
-                    raise
-                elif self._error_handling == "stop":
-                    return self._create_error_response(e, metadata.middleware.name)
+            return response_context.response
 
-        return response_context.response
+        return chain
 
     async def _handle_error(
         self,
@@ -445,4 +497,5 @@ class MiddlewarePipeline:
     def clear(self):
         """Clear all middleware (for testing)."""
         self._middleware.clear()
+        self._compile()
         logger.debug("Cleared middleware pipeline")
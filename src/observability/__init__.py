@@ -9,6 +9,10 @@ Provides three pillars of observability:
 2. **Tracing** - OpenTelemetry-compatible distributed tracing
 3. **Health** - Health check system with liveness/readiness probes
 
+Plus a background ``ResourceSampler`` (CPU, RSS, fds, event-loop lag, GC
+pauses) that health checks and metrics read without blocking, and an opt-in
+``LoopProfiler`` (slow callbacks, handler CPU time, stack sampling).
+
 Usage:
     from src.observability import (
         get_metrics_collector,
@@ -50,6 +54,8 @@ from .metrics import (
     Timer,
     get_metrics_collector,
 )
+from .profiling import LoopProfiler, get_loop_profiler
+from .resources import ResourceSampler, ResourceSnapshot, get_resource_sampler
 from .tracing import (
     Span,
     SpanContext,
@@ -85,4 +91,11 @@ __all__ = [
     "ResourceCheck",
     "HealthMonitor",
     "get_health_monitor",
+    # Resources
+    "ResourceSampler",
+    "ResourceSnapshot",
+    "get_resource_sampler",
+    # Profiling
+    "LoopProfiler",
+    "get_loop_profiler",
 ]
@@ -6,7 +6,8 @@ Production-grade health check system for monitoring service health.
 
 Provides:
 - HealthCheck base class for custom checks
-- Built-in checks: Liveness, Readiness, Dependency, Resource
+- Built-in checks: Liveness, Readiness, Dependency, Resource (read from the
+  background ``ResourceSampler``)
 - HealthMonitor for managing multiple checks
 - HTTP endpoints: /health/live, /health/ready, /health
 
@@ -33,6 +34,7 @@ from typing import Any
 import psutil
 
 from ..common.logger import get_logger
+from .resources import ResourceSampler, get_resource_sampler
 
 logger = get_logger(__name__)
 
@@ -276,7 +278,8 @@ class ResourceCheck(HealthCheck):
     """
     Resource check - are system resources within limits?
 
-    Checks CPU, memory, and disk usage.
+    Checks CPU, memory, disk usage and event-loop lag. Values come from the
+    background ``ResourceSampler``, so the check never blocks the loop.
     """
 
     def __init__(
@@ -284,6 +287,8 @@ class ResourceCheck(HealthCheck):
         max_cpu_percent: float = 90.0,
         max_memory_percent: float = 90.0,
         max_disk_percent: float = 90.0,
+        max_loop_lag_ms: float = 500.0,
+        sampler: ResourceSampler | None = None,
     ):
         super().__init__(
             name="resources",
@@ -292,34 +297,47 @@ class ResourceCheck(HealthCheck):
         self.max_cpu_percent = max_cpu_percent
         self.max_memory_percent = max_memory_percent
         self.max_disk_percent = max_disk_percent
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self.sampler = sampler
 
     async def check(self) -> HealthCheckResult:
         """Check system resources."""
         try:
-            # Get resource usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage("/")
+            sampler = self.sampler or get_resource_sampler()
+            sampler.start(loop=asyncio.get_running_loop())
+            snapshot = sampler.snapshot()
 
             details = {
-                "cpu_percent": round(cpu_percent, 2),
-                "memory_percent": round(memory.percent, 2),
-                "disk_percent": round(disk.percent, 2),
-                "memory_available_mb": round(memory.available / 1024 / 1024, 2),
-                "disk_available_gb": round(disk.free / 1024 / 1024 / 1024, 2),
+                "cpu_percent": round(snapshot.cpu_percent, 2),
+                "memory_percent": round(snapshot.memory_percent, 2),
+                "disk_percent": round(snapshot.disk_percent, 2),
+                "memory_available_mb": round(snapshot.memory_available_bytes / 1024 / 1024, 2),
+                "disk_available_gb": round(snapshot.disk_free_bytes / 1024 / 1024 / 1024, 2),
+                "process_cpu_percent": round(snapshot.process_cpu_percent, 2),
+                "rss_mb": round(snapshot.rss_bytes / 1024 / 1024, 2),
+                "open_fds": snapshot.open_fds,
+                "loop_lag_p50_ms": round(snapshot.loop_lag_p50_ms, 3),
+                "loop_lag_p99_ms": round(snapshot.loop_lag_p99_ms, 3),
+                "gc_pause_ms": round(snapshot.gc_pause_ms, 3),
+                "sampled_at": snapshot.timestamp,
             }
 
             # Check thresholds
             issues = []
 
-            if cpu_percent > self.max_cpu_percent:
-                issues.append(f"CPU usage ({cpu_percent:.1f}%) exceeds limit")
+            if snapshot.cpu_percent > self.max_cpu_percent:
+                issues.append(f"CPU usage ({snapshot.cpu_percent:.1f}%) exceeds limit")
 
-            if memory.percent > self.max_memory_percent:
-                issues.append(f"Memory usage ({memory.percent:.1f}%) exceeds limit")
+            if snapshot.memory_percent > self.max_memory_percent:
+                issues.append(f"Memory usage ({snapshot.memory_percent:.1f}%) exceeds limit")
 
-            if disk.percent > self.max_disk_percent:
-                issues.append(f"Disk usage ({disk.percent:.1f}%) exceeds limit")
+            if snapshot.disk_percent > self.max_disk_percent:
+                issues.append(f"Disk usage ({snapshot.disk_percent:.1f}%) exceeds limit")
+
+            if snapshot.loop_lag_p99_ms > self.max_loop_lag_ms:
+                issues.append(
+                    f"Event-loop lag p99 ({snapshot.loop_lag_p99_ms:.0f} ms) exceeds limit"
+                )
 
             if issues:
                 return HealthCheckResult(
@@ -287,6 +287,11 @@ class MetricsCollector:
             "Middleware execution duration in seconds",
         )
 
+        self.register_counter(
+            "rate_limit_throttled_total",
+            "Total number of requests rejected by the rate limiter",
+        )
+
     # ========================================================================
     # Counter Methods
     # ========================================================================
@@ -0,0 +1,416 @@
+"""
+Runtime Profiling
+=================
+
+Opt-in instrumentation for finding what stalls a server's event loop
+(enable with ``ProfilingConfig.enabled``):
+
+- **Slow callbacks** - a watchdog thread posts a probe to the loop; if the
+  probe has not run after ``slow_callback_ms``, whatever the loop thread is
+  executing is blocking it, and its stack is captured. Unlike asyncio debug
+  mode this adds nothing to each callback, so it can stay on.
+- **Handler CPU time** - CPU seconds spent in each tool / protocol handler,
+  counted only while the handler's own coroutine runs (not while it awaits).
+- **Sampling profiler** - on demand, samples the loop thread's stack for a
+  few seconds and returns collapsed stacks (``frame;frame;frame count``, the
+  input format of flamegraph tools).
+
+Handler CPU and slow-callback counts are published to the
+``MetricsCollector``, so they appear in ``export_prometheus``. Loop-lag
+percentiles come from the ``ResourceSampler``.
+
+Usage:
+    profiler = get_loop_profiler()
+    profiler.start(loop=asyncio.get_running_loop())
+
+    result = await profiler.measure("tool.get_status", handler(params))
+    profile = await profiler.sample_stacks(duration=2.0)
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Generator
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, TypeVar
+
+from ..common.logger import get_logger
+from .metrics import MetricsCollector, get_metrics_collector
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Frames kept per captured slow-callback stack (innermost)
+MAX_STACK_DEPTH = 40
+
+
+@dataclass
+class SlowCallback:
+    """A stretch of time the event loop was blocked."""
+
+    timestamp: float
+    duration_ms: float
+    stack: list[str]  # Outermost first, "function (file:line)"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "timestamp": self.timestamp,
+            "duration_ms": round(self.duration_ms, 3),
+            "stack": self.stack,
+        }
+
+
+@dataclass
+class HandlerStats:
+    """CPU and wall time of one handler."""
+
+    calls: int = 0
+    cpu_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    max_cpu_seconds: float = 0.0
+
+    def record(self, cpu: float, wall: float) -> None:
+        self.calls += 1
+        self.cpu_seconds += cpu
+        self.wall_seconds += wall
+        self.max_cpu_seconds = max(self.max_cpu_seconds, cpu)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (milliseconds)."""
+        return {
+            "calls": self.calls,
+            "cpu_ms_total": round(self.cpu_seconds * 1000, 3),
+            "cpu_ms_avg": round(self.cpu_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            "cpu_ms_max": round(self.max_cpu_seconds * 1000, 3),
+            "wall_ms_total": round(self.wall_seconds * 1000, 3),
+        }
+
+
+@dataclass
+class CollapsedProfile:
+    """Stack samples folded into ``frame;frame;frame count`` lines."""
+
+    duration_seconds: float
+    interval_ms: float
+    samples: int = 0
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """Collapsed-stack text, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def to_dict(self, top: int = 20) -> dict[str, Any]:
+        """Summary with the ``top`` most frequent stacks."""
+        return {
+            "duration_seconds": self.duration_seconds,
+            "interval_ms": self.interval_ms,
+            "samples": self.samples,
+            "distinct_stacks": len(self.stacks),
+            "top_stacks": [
+                {"stack": stack, "samples": count} for stack, count in self.stacks.most_common(top)
+            ],
+        }
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{Path(code.co_filename).stem}:{code.co_name}"
+
+
+def _collapse(frame: FrameType | None) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def _format_stack(frame: FrameType | None) -> list[str]:
+    lines: list[str] = []
+    while frame is not None and len(lines) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        lines.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+        frame = frame.f_back
+    return list(reversed(lines))
+
+
+class _CpuTimed:
+    """
+    Await a coroutine, counting thread CPU time only during its own steps.
+
+    Drives the coroutine like ``yield from`` would, reading
+    ``time.thread_time()`` around each ``send``/``throw``, so time spent in
+    other tasks while this one awaits is not attributed to it.
+    """
+
+    def __init__(self, awaitable: Awaitable[T]):
+        self._awaitable = awaitable
+        self.cpu_seconds = 0.0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self._awaitable.__await__()
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            start = time.thread_time()
+            try:
+                if error is not None:
+                    yielded = iterator.throw(error)
+                else:
+                    yielded = iterator.send(value)
+            except StopIteration as stop:
+                self.cpu_seconds += time.thread_time() - start
+                return stop.value
+            except BaseException:
+                self.cpu_seconds += time.thread_time() - start
+                raise
+            self.cpu_seconds += time.thread_time() - start
+
+            try:
+                value, error = (yield yielded), None
+            except BaseException as e:  # Cancellation etc. goes to the coroutine
+                value, error = None, e
+
+
+class LoopProfiler:
+    """
+    Slow-callback watchdog, handler CPU accounting and stack sampling.
+
+    Args:
+        slow_callback_ms: Loop blocked this long counts as a slow callback
+        max_slow_callbacks: Most recent slow callbacks kept
+        metrics: Collector to publish counters to (None disables publishing)
+    """
+
+    def __init__(
+        self,
+        slow_callback_ms: float = 100.0,
+        max_slow_callbacks: int = 50,
+        metrics: MetricsCollector | None = None,
+    ):
+        self.slow_callback_ms = slow_callback_ms
+        self.metrics = metrics
+
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._probe_sent_at: float | None = None
+        self._pending_slow: SlowCallback | None = None
+
+        self.slow_callbacks: deque[SlowCallback] = deque(maxlen=max_slow_callbacks)
+        self.slow_callback_count = 0
+        self.handlers: dict[str, HandlerStats] = {}
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+        Start the watchdog (idempotent).
+
+        Must be called from the loop's thread; ``loop`` defaults to the
+        running loop.
+        """
+        loop = loop or asyncio.get_running_loop()
+        with self._lock:
+            if loop is not self._loop:
+                self._loop = loop
+                self._loop_thread_id = threading.get_ident()
+                self._probe_sent_at = None
+                self._pending_slow = None
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._watch, name="loop-profiler", daemon=True)
+            self._thread.start()
+
+        logger.debug("Loop profiler started")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the watchdog."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the watchdog thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # ========================================================================
+    # Slow-callback watchdog
+    # ========================================================================
+
+    def _watch(self) -> None:
+        check_interval = max(0.005, self.slow_callback_ms / 4000)
+        while not self._stop_event.wait(check_interval):
+            self._check_loop()
+
+    def _check_loop(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        if loop.is_closed():
+            with self._lock:
+                self._loop = None
+                self._probe_sent_at = None
+            return
+
+        sent_at = self._probe_sent_at
+        if sent_at is None:
+            sent_at = time.perf_counter()
+            self._probe_sent_at = sent_at
+            try:
+                loop.call_soon_threadsafe(self._probe_done, loop, sent_at)
+            except RuntimeError:  # Closed in the meantime
+                self._probe_sent_at = None
+            return
+
+        blocked = time.perf_counter() - sent_at
+        if blocked * 1000 < self.slow_callback_ms or self._pending_slow is not None:
+            return
+        with self._lock:  # The probe must not complete while its stack is taken
+            if self._probe_sent_at != sent_at:
+                return
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            self._pending_slow = SlowCallback(
+                timestamp=time.time() - blocked,
+                duration_ms=blocked * 1000,
+                stack=_format_stack(frame),
+            )
+
+    def _probe_done(self, loop: asyncio.AbstractEventLoop, sent_at: float) -> None:
+        blocked = time.perf_counter() - sent_at
+        with self._lock:
+            if loop is not self._loop:
+                return
+            self._probe_sent_at = None
+            slow, self._pending_slow = self._pending_slow, None
+
+        if slow is None:
+            return
+        slow.duration_ms = blocked * 1000
+        self.slow_callbacks.append(slow)
+        self.slow_callback_count += 1
+        if self.metrics is not None:
+            self.metrics.increment("event_loop_slow_callbacks_total")
+        logger.warning(
+            f"Event loop blocked for {slow.duration_ms:.0f} ms in "
+            f"{slow.stack[-1] if slow.stack else 'unknown'}"
+        )
+
+    # ========================================================================
+    # Handler CPU time
+    # ========================================================================
+
+    async def measure(self, handler: str, awaitable: Awaitable[T], **labels: str) -> T:
+        """
+        Await a handler, recording its CPU and wall time under ``handler``.
+
+        Extra ``labels`` (e.g. ``server``) are added to the published metrics.
+        """
+        timed = _CpuTimed(awaitable)
+        wall_start = time.perf_counter()
+        try:
+            return await timed  # type: ignore[no-any-return]
+        finally:
+            wall = time.perf_counter() - wall_start
+            stats = self.handlers.get(handler)
+            if stats is None:
+                stats = self.handlers[handler] = HandlerStats()
+            stats.record(timed.cpu_seconds, wall)
+            if self.metrics is not None:
+                metric_labels = {"handler": handler, **labels}
+                self.metrics.increment(
+                    "handler_cpu_seconds_total", timed.cpu_seconds, labels=metric_labels
+                )
+                self.metrics.increment("handler_calls_total", labels=metric_labels)
+
+    # ========================================================================
+    # Sampling profiler
+    # ========================================================================
+
+    async def sample_stacks(
+        self, duration: float = 2.0, interval_ms: float = 5.0
+    ) -> CollapsedProfile:
+        """
+        Sample the calling loop thread's stack for ``duration`` seconds.
+
+        Sampling runs on a worker thread, so the loop keeps serving requests
+        (which is what gets sampled).
+        """
+        thread_id = threading.get_ident()
+        return await asyncio.to_thread(self._sample, thread_id, duration, interval_ms)
+
+    def _sample(self, thread_id: int, duration: float, interval_ms: float) -> CollapsedProfile:
+        profile = CollapsedProfile(duration_seconds=duration, interval_ms=interval_ms)
+        interval = interval_ms / 1000
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                profile.stacks[_collapse(frame)] += 1
+                profile.samples += 1
+            del frame
+            time.sleep(interval)
+        return profile
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    def get_profile(self) -> dict[str, Any]:
+        """Slow callbacks and handler CPU time collected so far."""
+        return {
+            "slow_callback_ms": self.slow_callback_ms,
+            "slow_callback_count": self.slow_callback_count,
+            "slow_callbacks": [slow.to_dict() for slow in self.slow_callbacks],
+            "handlers": {
+                name: stats.to_dict()
+                for name, stats in sorted(
+                    self.handlers.items(), key=lambda item: -item[1].cpu_seconds
+                )
+            },
+        }
+
+    def reset(self) -> None:
+        """Clear collected data."""
+        self.slow_callbacks.clear()
+        self.slow_callback_count = 0
+        self.handlers.clear()
+
+
+# ============================================================================
+# Singleton Access
+# ============================================================================
+
+_profiler: LoopProfiler | None = None
+_profiler_lock = threading.Lock()
+
+
+def get_loop_profiler() -> LoopProfiler:
+    """Get the process-wide loop profiler (configured from ``ProfilingConfig``)."""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                from ..common.config import get_config
+
+                config = get_config().profiling
+                _profiler = LoopProfiler(
+                    slow_callback_ms=config.slow_callback_ms,
+                    max_slow_callbacks=config.max_slow_callbacks,
+                    metrics=get_metrics_collector(),
+                )
+    return _profiler
@@ -0,0 +1,345 @@
+"""
+Resource Sampler
+================
+
+Background sampling of process and system resources.
+
+Reading CPU usage the blocking way (``psutil.cpu_percent(interval=0.1)``)
+inside a health check freezes the event loop for the whole interval. The
+``ResourceSampler`` instead runs a daemon thread that keeps a rolling window
+of:
+
+- system and process CPU, memory, RSS, open file descriptors and disk usage
+- event-loop lag: how late the watched loop runs a callback posted from the
+  sampler thread (p50/p99/max over the window)
+- garbage-collector pause time (via ``gc.callbacks``)
+
+Health checks and ``MetricsCollector`` gauges read the latest
+``ResourceSnapshot`` without blocking.
+
+Usage:
+    from src.observability.resources import get_resource_sampler
+
+    sampler = get_resource_sampler()
+    sampler.start(loop=asyncio.get_running_loop())
+
+    snapshot = sampler.snapshot()
+    print(snapshot.loop_lag_p99_ms)
+"""
+
+import asyncio
+import gc
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import psutil
+
+from ..common.logger import get_logger
+from .metrics import MetricsCollector, get_metrics_collector
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """Resource usage at one point in time, with window aggregates."""
+
+    timestamp: float
+    cpu_percent: float  # System-wide
+    memory_percent: float  # System-wide
+    memory_available_bytes: int
+    disk_percent: float
+    disk_free_bytes: int
+    process_cpu_percent: float
+    rss_bytes: int
+    open_fds: int
+    # Event-loop lag over the window (0 when no loop is watched)
+    loop_lag_ms: float
+    loop_lag_p50_ms: float
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+    # Garbage-collector pauses over the window
+    gc_collections: int
+    gc_pause_ms: float
+    gc_pause_max_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+def _quantile(sorted_values: list[float], quantile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = int(len(sorted_values) * quantile)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class ResourceSampler:
+    """
+    Samples resources on a daemon thread.
+
+    Args:
+        interval: Seconds between resource samples
+        lag_interval: Seconds between event-loop lag probes
+        window_seconds: Span of the rolling lag and GC windows
+        disk_path: Path whose filesystem usage is reported
+        metrics: Collector to publish gauges to (None disables publishing)
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        lag_interval: float = 0.1,
+        window_seconds: float = 60.0,
+        disk_path: str = "/",
+        metrics: MetricsCollector | None = None,
+    ):
+        self.interval = interval
+        self.lag_interval = lag_interval
+        self.window_seconds = window_seconds
+        self.disk_path = disk_path
+        self.metrics = metrics
+
+        self._process = psutil.Process()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._latest: ResourceSnapshot | None = None
+
+        # Event-loop lag probes: (monotonic time, lag seconds)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._probe_sent_at: float | None = None
+        self._lags: deque[tuple[float, float]] = deque()
+
+        # GC pauses: (monotonic time, pause seconds)
+        self._gc_started_at: float | None = None
+        self._gc_pauses: deque[tuple[float, float]] = deque()
+
+    # ========================================================================
+    # Lifecycle
+    # ========================================================================
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+        Start sampling (idempotent).
+
+        Args:
+            loop: Event loop whose lag to measure (replaces any loop
+                watched before)
+        """
+        if loop is not None:
+            self.watch_loop(loop)
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            if self._on_gc not in gc.callbacks:
+                gc.callbacks.append(self._on_gc)
+            self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+            self._thread.start()
+
+        logger.debug("Resource sampler started")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop sampling."""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def watch_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Measure the lag of ``loop`` from now on."""
+        with self._lock:
+            if loop is not self._loop:
+                self._loop = loop
+                self._probe_sent_at = None
+                self._lags.clear()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the sampler thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        next_sample = 0.0
+        while True:
+            self._probe_loop()
+            now = time.monotonic()
+            if now >= next_sample:
+                try:
+                    self._latest = self.sample()
+                    self._publish(self._latest)
+                except Exception as e:
+                    logger.warning(f"Resource sampling failed: {e}")
+                next_sample = now + self.interval
+            if self._stop_event.wait(self.lag_interval):
+                return
+
+    # ========================================================================
+    # Event-loop lag and GC pauses
+    # ========================================================================
+
+    def _probe_loop(self) -> None:
+        """Post a callback to the watched loop; its delay is the loop lag."""
+        loop = self._loop
+        if loop is None:
+            return
+        if loop.is_closed():
+            self._loop = None
+            self._probe_sent_at = None
+            return
+        if self._probe_sent_at is not None:
+            return  # The last probe has not run yet
+
+        sent_at = time.perf_counter()
+        self._probe_sent_at = sent_at
+        try:
+            loop.call_soon_threadsafe(self._probe_done, loop, sent_at)
+        except RuntimeError:  # Closed in the meantime
+            self._loop = None
+            self._probe_sent_at = None
+
+    def _probe_done(self, loop: asyncio.AbstractEventLoop, sent_at: float) -> None:
+        lag = time.perf_counter() - sent_at
+        with self._lock:
+            if loop is not self._loop:
+                return
+            self._probe_sent_at = None
+            self._lags.append((time.monotonic(), lag))
+
+    def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._gc_started_at = time.perf_counter()
+        elif self._gc_started_at is not None:
+            pause = time.perf_counter() - self._gc_started_at
+            self._gc_started_at = None
+            self._gc_pauses.append((time.monotonic(), pause))
+
+    def _trim(self, samples: deque[tuple[float, float]], now: float) -> list[float]:
+        cutoff = now - self.window_seconds
+        while samples and samples[0][0] < cutoff:
+            samples.popleft()
+        return [value for _, value in samples]
+
+    def loop_lag_percentiles(self) -> dict[str, float]:
+        """Event-loop lag over the window, in milliseconds."""
+        now = time.monotonic()
+        with self._lock:
+            lags = sorted(self._trim(self._lags, now))
+            latest = self._lags[-1][1] if self._lags else 0.0
+            sent_at = self._probe_sent_at
+
+        # A probe still waiting to run means the loop is lagging right now
+        if sent_at is not None:
+            latest = max(latest, time.perf_counter() - sent_at)
+
+        return {
+            "current": latest * 1000,
+            "p50": _quantile(lags, 0.5) * 1000,
+            "p99": _quantile(lags, 0.99) * 1000,
+            "max": max(lags[-1] if lags else 0.0, latest) * 1000,
+        }
+
+    # ========================================================================
+    # Sampling
+    # ========================================================================
+
+    def sample(self) -> ResourceSnapshot:
+        """Take a sample now (non-blocking; CPU is measured since the last call)."""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+        with self._process.oneshot():
+            process_cpu = self._process.cpu_percent(interval=None)
+            rss = self._process.memory_info().rss
+            try:
+                open_fds = self._process.num_fds()
+            except AttributeError:  # Windows
+                open_fds = self._process.num_handles()
+
+        lag = self.loop_lag_percentiles()
+        with self._lock:
+            pauses = self._trim(self._gc_pauses, time.monotonic())
+
+        return ResourceSnapshot(
+            timestamp=time.time(),
+            cpu_percent=float(psutil.cpu_percent(interval=None)),
+            memory_percent=float(memory.percent),
+            memory_available_bytes=memory.available,
+            disk_percent=float(disk.percent),
+            disk_free_bytes=disk.free,
+            process_cpu_percent=float(process_cpu),
+            rss_bytes=rss,
+            open_fds=open_fds,
+            loop_lag_ms=lag["current"],
+            loop_lag_p50_ms=lag["p50"],
+            loop_lag_p99_ms=lag["p99"],
+            loop_lag_max_ms=lag["max"],
+            gc_collections=len(pauses),
+            gc_pause_ms=sum(pauses) * 1000,
+            gc_pause_max_ms=max(pauses, default=0.0) * 1000,
+        )
+
+    def snapshot(self) -> ResourceSnapshot:
+        """
+        Get the latest sample.
+
+        Reads what the sampler thread last recorded; only samples inline
+        when the thread is not running and the last sample is stale.
+        """
+        latest = self._latest
+        if latest is None or (
+            not self.is_running and time.time() - latest.timestamp > self.interval
+        ):
+            latest = self._latest = self.sample()
+        return latest
+
+    def _publish(self, snapshot: ResourceSnapshot) -> None:
+        if self.metrics is None:
+            return
+        gauges = {
+            "process_cpu_percent": ("Process CPU usage percent", snapshot.process_cpu_percent),
+            "process_resident_memory_bytes": ("Process resident memory", snapshot.rss_bytes),
+            "process_open_fds": ("Open file descriptors", snapshot.open_fds),
+            "system_cpu_percent": ("System CPU usage percent", snapshot.cpu_percent),
+            "system_memory_percent": ("System memory usage percent", snapshot.memory_percent),
+            "gc_pause_seconds": ("GC pause time over the window", snapshot.gc_pause_ms / 1000),
+        }
+        for name, (description, value) in gauges.items():
+            self.metrics.register_gauge(name, description).set(value)
+
+        for quantile, value in (
+            ("0.5", snapshot.loop_lag_p50_ms),
+            ("0.99", snapshot.loop_lag_p99_ms),
+            ("1.0", snapshot.loop_lag_max_ms),
+        ):
+            self.metrics.register_gauge(
+                "event_loop_lag_seconds",
+                "Event-loop lag over the window",
+                labels={"quantile": quantile},
+            ).set(value / 1000)
+
+
+# ============================================================================
+# Singleton Access
+# ============================================================================
+
+_sampler: ResourceSampler | None = None
+_sampler_lock = threading.Lock()
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """Get the process-wide resource sampler (publishing to the metrics collector)."""
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                _sampler = ResourceSampler(metrics=get_metrics_collector())
+    return _sampler
@@ -6,9 +6,13 @@ Base class for game-specific MCP servers (League Manager, Referee, Player).
 """
 
 import asyncio
+import time
+from collections.abc import Awaitable
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, TypeVar
 
+from ..common.config import get_config
 from ..common.exceptions import ProtocolError, ValidationError
 from ..common.logger import get_logger
 from ..common.protocol import (
@@ -23,18 +27,24 @@ from ..middleware import (
     MetricsMiddleware,
     MiddlewarePipeline,
     RateLimitMiddleware,
+    RateLimitPolicy,
     TracingMiddleware,
 )
 from ..observability import (
+    LoopProfiler,
     Timer,
     get_health_monitor,
+    get_loop_profiler,
     get_metrics_collector,
+    get_resource_sampler,
     get_tracing_manager,
 )
-from .mcp_server import MCPServer
+from .mcp_server import MCPServer, Tool
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class BaseGameServer(MCPServer):
     """
@@ -53,6 +63,7 @@ class BaseGameServer(MCPServer):
         league_id: str = "league_2024_01",
         enable_middleware: bool = True,
         enable_observability: bool = True,
+        enable_profiling: bool | None = None,  # None: ProfilingConfig.enabled
         **kwargs,
     ):
         super().__init__(name, **kwargs)
@@ -61,6 +72,10 @@ class BaseGameServer(MCPServer):
         self.league_id = league_id
         self.enable_middleware = enable_middleware
         self.enable_observability = enable_observability
+        self.enable_profiling = (
+            get_config().profiling.enabled if enable_profiling is None else enable_profiling
+        )
+        self.profiler: LoopProfiler | None = None
 
         # Set sender format according to protocol spec
         # - league_manager: "league_manager" (single instance, no ID)
@@ -101,6 +116,10 @@ class BaseGameServer(MCPServer):
         1. Metrics collector - Prometheus-compatible metrics
         2. Tracing manager - OpenTelemetry distributed tracing
         3. Health monitor - Liveness/readiness health checks
+        4. Resource sampler - Background CPU/memory/loop-lag sampling
+           (started with the server)
+        5. Loop profiler - Slow callbacks and handler CPU time (only with
+           ``enable_profiling``)
 
         All systems are singletons and thread-safe.
         """
@@ -110,6 +129,9 @@ class BaseGameServer(MCPServer):
         self.metrics = get_metrics_collector()
         self.tracing = get_tracing_manager()
         self.health = get_health_monitor()
+        self.resources = get_resource_sampler()
+        if self.enable_profiling:
+            self.profiler = get_loop_profiler()
 
         # Initialize tracing with service name
         service_name = f"mcp_game_{self.server_type}"
@@ -145,7 +167,7 @@ class BaseGameServer(MCPServer):
         1. Tracing (100) - Distributed tracing
         2. Logging (90) - Request/response logging
         3. Authentication (80) - Token validation (optional for some agents)
-        4. Rate Limiting (70) - Token bucket rate limiting
+        4. Rate Limiting (70) - Token bucket rate limiting with per-peer-class tiers
         5. Metrics (50) - Performance metrics
         6. Error Handler (10) - Exception handling
 
@@ -194,23 +216,34 @@ class BaseGameServer(MCPServer):
             priority=80,
         )
 
-        # 4. Rate Limiting - prevent abuse
-        # Different limits per agent type
-        rate_limits = {
-            "league_manager": 200,  # Higher limit for league manager
-            "referee": 150,  # Medium limit for referees
-            "player": 100,  # Standard limit for players
-        }
-        requests_per_minute = rate_limits.get(self.server_type, 100)
-
-        self.middleware_pipeline.add_middleware(
-            RateLimitMiddleware(
-                name="rate_limit",
-                requests_per_minute=requests_per_minute,
-                burst_size=10,
-            ),
-            priority=70,
-        )
+        # 4. Rate Limiting - prevent abuse without capping league throughput
+        # Per-peer-class tiers: referees drive many concurrent games, the
+        # league manager and registered peers are exempt.
+        rate_config = get_config().rate_limit
+        if rate_config.enabled:
+            peer_policies = {
+                "referee": RateLimitPolicy(
+                    requests_per_minute=rate_config.referee_requests_per_minute,
+                    burst_size=rate_config.referee_burst_size,
+                ),
+            }
+            for peer_class in rate_config.exempt_peer_classes:
+                peer_policies[peer_class] = RateLimitPolicy(exempt=True)
+
+            self.middleware_pipeline.add_middleware(
+                RateLimitMiddleware(
+                    name="rate_limit",
+                    requests_per_minute=rate_config.requests_per_minute,
+                    burst_size=rate_config.burst_size,
+                    peer_policies=peer_policies,
+                    exempt_registered_peers=rate_config.exempt_registered_peers,
+                    trust_sender_prefix=rate_config.trust_sender_prefix,
+                    idle_bucket_ttl=rate_config.idle_bucket_ttl,
+                    max_buckets=rate_config.max_buckets,
+                    metrics_collector=self.metrics if self.enable_observability else None,
+                ),
+                priority=70,
+            )
 
         # 5. Metrics - collect performance data
         self.middleware_pipeline.add_middleware(
@@ -233,6 +266,40 @@ class BaseGameServer(MCPServer):
             f"{len(self.middleware_pipeline.get_middleware_list())} middleware"
         )
 
+    def register_trusted_peer(
+        self,
+        peer_id: str,
+        peer_class: str,
+        auth_token: str | None = None,
+    ) -> None:
+        """
+        Register a known peer with the rate limiter.
+
+        Registered peers (e.g. referees accepted by the league manager) are
+        exempt from rate limiting when ``exempt_registered_peers`` is set.
+
+        Args:
+            peer_id: Protocol sender ID (e.g. "referee:REF01")
+            peer_class: Peer class ("referee", "player", "league_manager")
+            auth_token: Token issued at registration; when given, only
+                requests carrying it are treated as this peer
+        """
+        rate_limiter = self._get_rate_limiter()
+        if rate_limiter is not None:
+            rate_limiter.register_peer(peer_id, peer_class, auth_token=auth_token)
+
+    def is_trusted_peer(self, peer_id: str, auth_token: str | None = None) -> bool:
+        """Check whether a peer is registered with the rate limiter."""
+        rate_limiter = self._get_rate_limiter()
+        return rate_limiter is not None and rate_limiter.is_registered_peer(peer_id, auth_token)
+
+    def _get_rate_limiter(self) -> RateLimitMiddleware | None:
+        """Get the rate limit middleware, if installed."""
+        if self.middleware_pipeline is None:
+            return None
+        rate_limiter = self.middleware_pipeline.get_middleware("rate_limit")
+        return rate_limiter if isinstance(rate_limiter, RateLimitMiddleware) else None
+
     def _register_common_tools(self) -> None:
         """Register tools common to all game servers."""
 
@@ -323,6 +390,75 @@ class BaseGameServer(MCPServer):
                     **readiness,
                 }
 
+            # Runtime profile
+            @self.tool(
+                "get_profile",
+                "Get event-loop lag, slow callbacks and handler CPU time",
+                {
+                    "type": "object",
+                    "properties": {
+                        "sample_seconds": {"type": "number", "default": 0},
+                        "interval_ms": {"type": "number"},
+                        "write": {"type": "boolean", "default": False},
+                        "reset": {"type": "boolean", "default": False},
+                    },
+                },
+            )
+            async def get_profile(params: dict) -> dict:
+                """
+                Get the runtime profile (requires ``enable_profiling``).
+
+                With ``sample_seconds`` > 0, also samples the event loop's
+                stack for that long and returns the hottest collapsed stacks
+                (``write`` saves the full collapsed file under
+                ``ProfilingConfig.output_dir``).
+
+                Returns:
+                    Loop lag, slow callbacks, handler CPU and optional samples
+                """
+                if self.profiler is None:
+                    return {"success": False, "error": "Profiling is not enabled"}
+
+                config = get_config().profiling
+                result = {
+                    "success": True,
+                    "server": self.name,
+                    "loop_lag_ms": self.resources.loop_lag_percentiles(),
+                    **self.profiler.get_profile(),
+                }
+
+                sample_seconds = min(
+                    float(params.get("sample_seconds", 0)), config.max_sample_seconds
+                )
+                if sample_seconds > 0:
+                    profile = await self.profiler.sample_stacks(
+                        sample_seconds,
+                        float(params.get("interval_ms", config.sample_interval_ms)),
+                    )
+                    result["samples"] = profile.to_dict()
+                    if params.get("write"):
+                        output_dir = Path(config.output_dir)
+                        output_dir.mkdir(parents=True, exist_ok=True)
+                        path = (
+                            output_dir
+                            / f"{self.name.replace('/', '_')}-{int(time.time())}.collapsed"
+                        )
+                        path.write_text(profile.collapsed())
+                        result["samples"]["path"] = str(path)
+
+                if params.get("reset"):
+                    self.profiler.reset()
+                return result
+
+    async def _profiled(self, handler: str, awaitable: Awaitable[T]) -> T:
+        """Await a handler, recording its CPU time when profiling."""
+        if self.profiler is None:
+            return await awaitable
+        return await self.profiler.measure(handler, awaitable, server=self.name)
+
+    async def _run_tool(self, tool: Tool, arguments: dict[str, Any]) -> Any:
+        return await self._profiled(f"tool.{tool.name}", tool.handler(arguments))
+
     async def _handle_protocol_message(self, params: dict | None) -> dict[str, Any]:
         """
         Handle a league protocol message through middleware pipeline.
@@ -363,7 +499,9 @@ class BaseGameServer(MCPServer):
         try:
             if tracing_context:
                 async with tracing_context as span:  # type: ignore[attr-defined]
-                    return await self._execute_protocol_message(message, span)
+                    return await self._profiled(
+                        f"protocol.{msg_type}", self._execute_protocol_message(message, span)
+                    )
             else:
                 return await self._execute_protocol_message(message, None)
 
@@ -539,9 +677,17 @@ class BaseGameServer(MCPServer):
         """Called when server stops. Override in subclasses."""
         pass
 
+    def _start_sampling(self) -> None:
+        loop = asyncio.get_running_loop()
+        self.resources.start(loop=loop)
+        if self.profiler is not None:
+            self.profiler.start(loop=loop)
+
     async def start(self) -> None:
         """Start the server."""
         await super().start()
+        if self.enable_observability:
+            self._start_sampling()
         await self.on_start()
 
     async def stop(self) -> None:
@@ -549,6 +695,29 @@ class BaseGameServer(MCPServer):
         await self.on_stop()
         await super().stop()
 
+    async def attach(self) -> None:
+        """
+        Start without a listener of its own.
+
+        Used when a shared host (e.g. ``PlayerHost``) routes HTTP requests
+        to this server's ``_handle_http_request``.
+        """
+        if self._running:
+            return
+        self._running = True
+        self._start_time = datetime.now()
+        if self.enable_observability:
+            self._start_sampling()
+        await self.on_start()
+
+    async def detach(self) -> None:
+        """Stop a server started with ``attach``."""
+        if not self._running:
+            return
+        await self.on_stop()
+        await self._close_websockets()
+        self._running = False
+
 
 class GameServerRegistry:
     """
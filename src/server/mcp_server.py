@@ -6,11 +6,19 @@ Full Model Context Protocol server with support for:
 - Tools (active operations)
 - Resources (read-only data)
 - Prompts (templates)
+
+Clients connected over WebSocket can subscribe to resources. After
+``notify_resource_updated(uri)`` every subscriber receives a
+``notifications/resources/updated`` message with the resource's new
+version and contents; updates made within ``notify_interval`` of each
+other are coalesced into one notification carrying the latest version.
 """
 
 import asyncio
 import json
+import re
 from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -30,10 +38,14 @@ from ..transport.json_rpc import (
     create_error_response,
     create_response,
     parse_message,
+    uri_template_pattern,
 )
 
 logger = get_logger(__name__)
 
+# WebSocket the request being handled arrived on (None for HTTP)
+_connection: ContextVar[web.WebSocketResponse | None] = ContextVar("mcp_connection", default=None)
+
 
 # ============================================================================
 # MCP Primitives
@@ -138,25 +150,36 @@ class MCPServer:
         version: str = "1.0.0",
         host: str = "localhost",
         port: int = 8000,
+        path: str = "/mcp",
+        notify_interval: float = 0.05,
     ):
         self.name = name
         self.version = version
         self.host = host
         self.port = port
+        self.path = path
+        self.notify_interval = notify_interval
 
         # MCP primitives
         self._tools: dict[str, Tool] = {}
         self._resources: dict[str, Resource] = {}
         self._prompts: dict[str, Prompt] = {}
 
-        # Subscriptions for resources
-        self._subscriptions: dict[str, set] = {}  # uri -> set of client IDs
+        # Resource URI templates ("game://state/{game_id}") matched against concrete URIs
+        self._resource_patterns: list[tuple[re.Pattern[str], Resource]] = []
+
+        # Subscriptions for resources (uri -> subscribed WebSockets)
+        self._subscriptions: dict[str, set[web.WebSocketResponse]] = {}
+        self._resource_versions: dict[str, int] = {}
+        self._dirty_resources: set[str] = set()
+        self._notify_task: asyncio.Task | None = None
 
         # Server state
         self._running = False
         self._start_time: datetime | None = None
         self._app: web.Application | None = None
         self._runner: web.AppRunner | None = None
+        self._websockets: set[web.WebSocketResponse] = set()
 
         # Request handlers
         self._handlers: dict[str, Callable] = {
@@ -212,6 +235,8 @@ class MCPServer:
     def register_resource(self, resource: Resource) -> None:
         """Register a resource with the server."""
         self._resources[resource.uri] = resource
+        if "{" in resource.uri:
+            self._resource_patterns.append((uri_template_pattern(resource.uri), resource))
         logger.debug(f"Registered resource: {resource.uri}")
 
     def resource(
@@ -293,7 +318,7 @@ class MCPServer:
         # Execute tool
         with PerformanceTracker(f"tool.{tool_name}", logger):
             try:
-                result = await tool.handler(arguments)
+                result = await self._run_tool(tool, arguments)
                 return {
                     "content": [
                         {
@@ -314,6 +339,10 @@ class MCPServer:
                     "isError": True,
                 }
 
+    async def _run_tool(self, tool: Tool, arguments: dict[str, Any]) -> Any:
+        """Invoke a tool handler (hook for subclasses that instrument tools)."""
+        return await tool.handler(arguments)
+
     async def _handle_resources_list(self, params: dict | None) -> dict[str, Any]:
         """Handle resources/list request."""
         return {"resources": [res.to_dict() for res in self._resources.values()]}
@@ -327,28 +356,45 @@ class MCPServer:
         if not uri:
             raise ValidationError("Missing resource URI")
 
+        resource, uri_params = self._find_resource(uri)
+        return {"contents": [await self._read_resource(uri, resource, {**params, **uri_params})]}
+
+    def _find_resource(self, uri: str) -> tuple[Resource, dict[str, str]]:
+        """Resolve a URI to its resource and the parameters taken from a template."""
         resource = self._resources.get(uri)
-        if not resource:
-            raise ValidationError(f"Unknown resource: {uri}")
+        if resource:
+            return resource, {}
+
+        for pattern, template in self._resource_patterns:
+            match = pattern.match(uri)
+            if match:
+                return template, match.groupdict()
 
-        # Read resource
+        raise ValidationError(f"Unknown resource: {uri}")
+
+    async def _read_resource(
+        self, uri: str, resource: Resource, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Read a resource into an MCP contents entry."""
         if resource.handler:
             content = await resource.handler(params)
         else:
             content = {}
 
         return {
-            "contents": [
-                {
-                    "uri": uri,
-                    "mimeType": resource.mime_type,
-                    "text": json.dumps(content) if isinstance(content, dict) else str(content),
-                }
-            ]
+            "uri": uri,
+            "mimeType": resource.mime_type,
+            "text": json.dumps(content) if isinstance(content, dict) else str(content),
         }
 
     async def _handle_resources_subscribe(self, params: dict | None) -> dict[str, Any]:
-        """Handle resources/subscribe request."""
+        """
+        Handle resources/subscribe request.
+
+        Subscriptions live as long as the WebSocket they were made on. The
+        response carries the current version and contents, so the client
+        starts from a consistent snapshot.
+        """
         if not params:
             raise ValidationError("Missing params")
 
@@ -356,16 +402,19 @@ class MCPServer:
         if not uri:
             raise ValidationError("Missing resource URI")
 
-        if uri not in self._resources:
-            raise ValidationError(f"Unknown resource: {uri}")
+        resource, uri_params = self._find_resource(uri)
 
-        # Add subscription
-        if uri not in self._subscriptions:
-            self._subscriptions[uri] = set()
+        ws = _connection.get()
+        if ws is None:
+            raise ValidationError("Subscriptions need a WebSocket connection")
 
-        # In a real implementation, we'd track the client
-        # For now, just acknowledge
-        return {"success": True}
+        self._subscriptions.setdefault(uri, set()).add(ws)
+        return {
+            "success": True,
+            "uri": uri,
+            "version": self._resource_versions.get(uri, 0),
+            "contents": [await self._read_resource(uri, resource, uri_params)],
+        }
 
     async def _handle_resources_unsubscribe(self, params: dict | None) -> dict[str, Any]:
         """Handle resources/unsubscribe request."""
@@ -376,8 +425,72 @@ class MCPServer:
         if not uri:
             raise ValidationError("Missing resource URI")
 
+        ws = _connection.get()
+        if ws is not None:
+            self._unsubscribe(uri, ws)
         return {"success": True}
 
+    def _unsubscribe(self, uri: str, ws: web.WebSocketResponse) -> None:
+        subscribers = self._subscriptions.get(uri)
+        if subscribers is not None:
+            subscribers.discard(ws)
+            if not subscribers:
+                del self._subscriptions[uri]
+
+    def notify_resource_updated(self, uri: str) -> None:
+        """
+        Record a change to a resource and schedule a notification.
+
+        Bumps the resource version. Subscribers receive the contents once
+        per ``notify_interval``, however many changes happened in it.
+        """
+        self._resource_versions[uri] = self._resource_versions.get(uri, 0) + 1
+        if uri not in self._subscriptions:
+            return
+
+        self._dirty_resources.add(uri)
+        if self._notify_task is None or self._notify_task.done():
+            self._notify_task = asyncio.create_task(self._send_notifications())
+
+    def resource_version(self, uri: str) -> int:
+        """Current version of a resource (0 until its first change)."""
+        return self._resource_versions.get(uri, 0)
+
+    async def _send_notifications(self) -> None:
+        while self._dirty_resources:
+            await asyncio.sleep(self.notify_interval)
+            dirty, self._dirty_resources = self._dirty_resources, set()
+            await asyncio.gather(*(self._push_resource(uri) for uri in dirty))
+
+    async def _push_resource(self, uri: str) -> None:
+        subscribers = list(self._subscriptions.get(uri, ()))
+        if not subscribers:
+            return
+
+        try:
+            resource, uri_params = self._find_resource(uri)
+            contents = await self._read_resource(uri, resource, uri_params)
+        except Exception as e:
+            logger.error(f"Failed to read {uri} for subscribers: {e}")
+            return
+
+        # Encoded once for all subscribers
+        notification = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": MCPMethods.RESOURCES_UPDATED,
+                "params": {
+                    "uri": uri,
+                    "version": self._resource_versions[uri],
+                    "contents": [contents],
+                },
+            }
+        )
+        await asyncio.gather(
+            *(ws.send_str(notification) for ws in subscribers if not ws.closed),
+            return_exceptions=True,
+        )
+
     async def _handle_prompts_list(self, params: dict | None) -> dict[str, Any]:
         """Handle prompts/list request."""
         return {"prompts": [prompt.to_dict() for prompt in self._prompts.values()]}
@@ -420,38 +533,86 @@ class MCPServer:
     # HTTP Server
     # ========================================================================
 
-    async def _handle_http_request(self, request: web.Request) -> web.Response:
-        """Handle incoming HTTP request."""
-        try:
-            # Read body
-            body = await request.read()
+    async def _handle_message(self, body: str | bytes) -> tuple[dict[str, Any] | None, int]:
+        """
+        Process one raw JSON-RPC message.
 
+        Returns:
+            The response (None for notifications) and the HTTP status to send it with
+        """
+        try:
             # Parse JSON-RPC message
             message = parse_message(body)
 
             if isinstance(message, JsonRpcError):
-                response = create_error_response(None, message)
-                return web.json_response(response.to_dict())
+                return create_error_response(None, message).to_dict(), 200
 
             if isinstance(message, JsonRpcRequest):
                 response = await self._process_request(message)
 
                 # Don't respond to notifications
                 if message.is_notification:
-                    return web.Response(status=204)
+                    return None, 204
 
-                return web.json_response(response.to_dict())
+                return response.to_dict(), 200
 
             # Invalid message
             error = JsonRpcError.invalid_request("Expected request")
-            response = create_error_response(None, error)
-            return web.json_response(response.to_dict())
+            return create_error_response(None, error).to_dict(), 200
 
         except Exception as e:
             logger.exception(f"Request handling error: {e}")
             error = JsonRpcError.internal_error(str(e))
-            response = create_error_response(None, error)
-            return web.json_response(response.to_dict(), status=500)
+            return create_error_response(None, error).to_dict(), 500
+
+    async def _handle_http_request(self, request: web.Request) -> web.Response:
+        """Handle incoming HTTP request."""
+        response, status = await self._handle_message(await request.read())
+        if response is None:
+            return web.Response(status=status)
+        return web.json_response(response, status=status)
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """
+        Serve JSON-RPC over a WebSocket on the same path as HTTP POST.
+
+        Each frame is processed in its own task, so a slow request does not
+        hold up the ones behind it; responses go back as they complete and
+        the client matches them by id.
+        """
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        self._websockets.add(ws)
+        tasks: set[asyncio.Task] = set()
+
+        async def respond(data: str) -> None:
+            _connection.set(ws)
+            response, _ = await self._handle_message(data)
+            if response is not None and not ws.closed:
+                await ws.send_str(json.dumps(response))
+
+        try:
+            async for frame in ws:
+                if frame.type != web.WSMsgType.TEXT:
+                    continue
+                task = asyncio.create_task(respond(frame.data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            self._websockets.discard(ws)
+            for uri in list(self._subscriptions):
+                self._unsubscribe(uri, ws)
+            for task in tasks:
+                task.cancel()
+
+        return ws
+
+    async def _close_websockets(self) -> None:
+        """Close open WebSockets so shutdown does not wait for clients to hang up."""
+        sockets = list(self._websockets)
+        self._websockets.clear()
+        await asyncio.gather(*(ws.close() for ws in sockets), return_exceptions=True)
 
     async def _process_request(self, request: JsonRpcRequest) -> JsonRpcResponse:
         """Process a single JSON-RPC request."""
@@ -513,7 +674,8 @@ class MCPServer:
 
         # Create aiohttp app
         self._app = web.Application()
-        self._app.router.add_post("/mcp", self._handle_http_request)
+        self._app.router.add_post(self.path, self._handle_http_request)
+        self._app.router.add_get(self.path, self._handle_websocket)
         self._app.router.add_get("/health", self._handle_health)
 
         # Create runner
@@ -523,6 +685,8 @@ class MCPServer:
         # Create site
         site = web.TCPSite(self._runner, self.host, self.port)
         await site.start()
+        if self.port == 0:  # Ephemeral port: report the one the OS picked
+            self.port = self._runner.addresses[0][1]
 
         self._running = True
         self._start_time = datetime.now()
@@ -531,7 +695,7 @@ class MCPServer:
             "MCP Server started",
             host=self.host,
             port=self.port,
-            url=f"http://{self.host}:{self.port}/mcp",
+            url=self.url,
         )
 
     async def stop(self) -> None:
@@ -539,6 +703,9 @@ class MCPServer:
         if not self._running:
             return
 
+        if self._notify_task is not None:
+            self._notify_task.cancel()
+        await self._close_websockets()
         if self._runner:
             await self._runner.cleanup()
 
@@ -561,7 +728,7 @@ class MCPServer:
     @property
     def url(self) -> str:
         """Get server URL."""
-        return f"http://{self.host}:{self.port}/mcp"
+        return f"http://{self.host}:{self.port}{self.path}"
 
     @property
     def is_running(self) -> bool:
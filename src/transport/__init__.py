@@ -17,6 +17,7 @@ from .json_rpc import (
     create_response,
     parse_message,
 )
+from .websocket_transport import WebSocketTransport
 
 __all__ = [
     # JSON-RPC
@@ -38,4 +39,5 @@ __all__ = [
     "HTTPTransport",
     "Transport",
     "TransportError",
+    "WebSocketTransport",
 ]
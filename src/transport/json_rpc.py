@@ -7,6 +7,7 @@ https://www.jsonrpc.org/specification
 """
 
 import json
+import re
 import uuid
 from dataclasses import dataclass, field
 from typing import Any
@@ -338,6 +339,7 @@ class MCPMethods:
     RESOURCES_READ = "resources/read"
     RESOURCES_SUBSCRIBE = "resources/subscribe"
     RESOURCES_UNSUBSCRIBE = "resources/unsubscribe"
+    RESOURCES_UPDATED = "notifications/resources/updated"
 
     # Prompts
     PROMPTS_LIST = "prompts/list"
@@ -350,6 +352,17 @@ class MCPMethods:
     CANCELLED = "notifications/cancelled"
 
 
+def uri_template_pattern(template: str) -> re.Pattern[str]:
+    """
+    Compile a resource URI template into a pattern for concrete URIs.
+
+    ``game://state/{game_id}`` matches ``game://state/G1`` with the group
+    ``game_id="G1"``; a placeholder never spans a ``/``.
+    """
+    pattern = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(template))
+    return re.compile(pattern + "$")
+
+
 def create_mcp_request(
     method: str,
     params: dict[str, Any] | None = None,
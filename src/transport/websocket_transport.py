@@ -0,0 +1,202 @@
+"""
+WebSocket Transport
+===================
+
+JSON-RPC over one persistent WebSocket per server.
+
+Every request is a text frame and every response carries its request id,
+so many requests can be in flight on the same connection at once; a
+request costs one frame write instead of an HTTP request/response cycle.
+Each request has its own deadline. Server-initiated frames (notifications)
+are queued for ``receive``.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+from .base import Transport, TransportConfig, TransportError
+from .http_transport import HAS_AIOHTTP
+
+if HAS_AIOHTTP:
+    import aiohttp
+
+
+class WebSocketTransport(Transport):
+    """
+    Multiplexed JSON-RPC transport using aiohttp WebSockets.
+
+    Reconnects once, on the next request, if the connection dropped.
+    """
+
+    def __init__(self, config: TransportConfig | None = None):
+        super().__init__(config)
+        self._url: str | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._ws: aiohttp.ClientWebSocketResponse[bool] | None = None
+        self._reader: asyncio.Task | None = None
+        self._connect_lock = asyncio.Lock()
+
+        # Request id -> future of the response
+        self._pending: dict[str | int, asyncio.Future[dict[str, Any]]] = {}
+        self._notifications: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+        # Responses that arrived after their request's deadline
+        self.late_responses = 0
+
+    async def connect(self, url: str) -> None:
+        """
+        Open the WebSocket (``http://`` URLs are upgraded in place).
+
+        Args:
+            url: The server's MCP endpoint (e.g., http://localhost:8000/mcp)
+
+        Raises:
+            TransportError: If the server does not accept the upgrade
+        """
+        if not HAS_AIOHTTP:
+            raise TransportError(
+                "aiohttp is required for WebSocket transport. Install with: pip install aiohttp"
+            )
+
+        self._url = url
+        async with self._connect_lock:
+            await self._open()
+
+    async def _open(self) -> None:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=None, connect=10.0)
+            )
+        try:
+            self._ws = await self._session.ws_connect(
+                self._url or "", heartbeat=self.config.timeout if self.config.keepalive else None
+            )
+        except (TimeoutError, aiohttp.ClientError) as e:
+            await self._session.close()
+            self._session = None
+            raise TransportError(f"WebSocket connect failed: {e}", cause=e) from e
+
+        # Each connection owns its pending requests, so a reconnect cannot
+        # strand or fail requests of the other connection
+        self._pending = {}
+        self._reader = asyncio.create_task(self._read(self._ws, self._pending))
+        self._connected = True
+
+    async def _ensure_open(self) -> "aiohttp.ClientWebSocketResponse[bool]":
+        if self._url is None:
+            raise TransportError("Not connected")
+        if self._ws is None or self._ws.closed:
+            async with self._connect_lock:
+                if self._ws is None or self._ws.closed:
+                    await self._open()
+        assert self._ws is not None
+        return self._ws
+
+    async def disconnect(self) -> None:
+        """Close the WebSocket; in-flight requests fail."""
+        self._url = None
+        self._connected = False
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _read(
+        self,
+        ws: "aiohttp.ClientWebSocketResponse[bool]",
+        pending: dict[str | int, asyncio.Future[dict[str, Any]]],
+    ) -> None:
+        error: Exception | None = None
+        try:
+            async for frame in ws:
+                if frame.type == aiohttp.WSMsgType.TEXT:
+                    self._dispatch(json.loads(frame.data), pending)
+                elif frame.type == aiohttp.WSMsgType.ERROR:
+                    cause = ws.exception()
+                    error = cause if isinstance(cause, Exception) else None
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            if ws is self._ws:
+                self._connected = False
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(TransportError("WebSocket closed", cause=error))
+            pending.clear()
+
+    def _dispatch(
+        self,
+        message: Any,
+        pending: dict[str | int, asyncio.Future[dict[str, Any]]],
+    ) -> None:
+        for item in message if isinstance(message, list) else [message]:
+            if not isinstance(item, dict):
+                continue
+            if "method" in item:  # Server notification
+                self._notifications.put_nowait(item)
+                continue
+            future = pending.pop(item.get("id"), None)  # type: ignore[arg-type]
+            if future is None:
+                self.late_responses += 1
+            elif not future.done():
+                future.set_result(item)
+
+    async def send(self, data: dict[str, Any]) -> None:
+        """Send a frame without waiting for a response (notifications)."""
+        ws = await self._ensure_open()
+        try:
+            await ws.send_str(json.dumps(data))
+        except (aiohttp.ClientError, ConnectionError) as e:
+            raise TransportError(f"Send failed: {e}", cause=e) from e
+
+    async def receive(self) -> dict[str, Any]:
+        """Wait for the next server notification."""
+        if self._url is None:
+            raise TransportError("Not connected")
+        return await self._notifications.get()
+
+    async def request(
+        self,
+        data: dict[str, Any],
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Send a request and wait for the response with the same id.
+
+        Args:
+            data: The JSON-RPC request data
+            timeout: Deadline for this request (default: config timeout)
+
+        Returns:
+            The JSON-RPC response data
+        """
+        request_id = data.get("id")
+        if request_id is None:
+            await self.send(data)
+            return {}
+
+        ws = await self._ensure_open()
+        pending = self._pending
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        pending[request_id] = future
+        try:
+            await ws.send_str(json.dumps(data))
+            return await asyncio.wait_for(future, timeout or self.config.timeout)
+        except TimeoutError as e:
+            raise TransportError(f"Request timed out: {request_id}", cause=e) from e
+        except (aiohttp.ClientError, ConnectionError) as e:
+            raise TransportError(f"Request error: {e}", cause=e) from e
+        finally:
+            pending.pop(request_id, None)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests waiting for a response."""
+        return len(self._pending)
@@ -41,43 +41,103 @@ integration.register_player(
 Open http://localhost:8050 in browser to view live dashboard.
 """
 
-from .analytics import (
-    AnalyticsEngine,
-    CounterfactualAnalytics,
-    MatchupMatrixData,
-    OpponentModelAnalytics,
-    StrategyPerformanceAnalytics,
-    TournamentReplayState,
-    get_analytics_engine,
-    reset_analytics_engine,
-)
-from .dashboard import (
-    CounterfactualVisualization,
-    DashboardAPI,
-    GameEvent,
-    OpponentModelVisualization,
-    StrategyPerformance,
-    get_dashboard,
-    reset_dashboard,
-)
-from .integration import (
-    DashboardIntegration,
-    PlayerDashboardState,
-    TournamentDashboardState,
-    get_dashboard_integration,
-    reset_dashboard_integration,
+from typing import TYPE_CHECKING
+
+from ..common.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .analytics import (
+        AnalyticsEngine,
+        CounterfactualAnalytics,
+        MatchupMatrixData,
+        OpponentModelAnalytics,
+        ReplayLog,
+        StrategyPerformanceAnalytics,
+        TournamentReplayState,
+        get_analytics_engine,
+        reset_analytics_engine,
+    )
+    from .dashboard import (
+        CounterfactualVisualization,
+        DashboardAPI,
+        GameEvent,
+        OpponentModelVisualization,
+        StrategyPerformance,
+        get_dashboard,
+        reset_dashboard,
+    )
+    from .delta_protocol import apply_patch, json_diff
+    from .frame_scheduler import FrameScheduler
+    from .integration import (
+        DashboardIntegration,
+        PlayerDashboardState,
+        TournamentDashboardState,
+        get_dashboard_integration,
+        reset_dashboard_integration,
+    )
+    from .matchup import MatchupMatrix
+    from .timeseries import RingSeries, downsample, downsample_columns
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".analytics": (
+            "AnalyticsEngine",
+            "CounterfactualAnalytics",
+            "MatchupMatrixData",
+            "OpponentModelAnalytics",
+            "ReplayLog",
+            "StrategyPerformanceAnalytics",
+            "TournamentReplayState",
+            "get_analytics_engine",
+            "reset_analytics_engine",
+        ),
+        ".dashboard": (
+            "CounterfactualVisualization",
+            "DashboardAPI",
+            "GameEvent",
+            "OpponentModelVisualization",
+            "StrategyPerformance",
+            "get_dashboard",
+            "reset_dashboard",
+        ),
+        ".delta_protocol": (
+            "apply_patch",
+            "json_diff",
+        ),
+        ".frame_scheduler": ("FrameScheduler",),
+        ".integration": (
+            "DashboardIntegration",
+            "PlayerDashboardState",
+            "TournamentDashboardState",
+            "get_dashboard_integration",
+            "reset_dashboard_integration",
+        ),
+        ".matchup": ("MatchupMatrix",),
+        ".timeseries": (
+            "RingSeries",
+            "downsample",
+            "downsample_columns",
+        ),
+    },
 )
 
 __all__ = [
     # Analytics
     "AnalyticsEngine",
     "CounterfactualAnalytics",
+    "MatchupMatrix",
     "MatchupMatrixData",
     "OpponentModelAnalytics",
+    "ReplayLog",
     "StrategyPerformanceAnalytics",
     "TournamentReplayState",
     "get_analytics_engine",
     "reset_analytics_engine",
+    # Time series
+    "RingSeries",
+    "downsample",
+    "downsample_columns",
     # Dashboard API
     "DashboardAPI",
     "GameEvent",
@@ -86,6 +146,9 @@ __all__ = [
     "CounterfactualVisualization",
     "get_dashboard",
     "reset_dashboard",
+    "FrameScheduler",
+    "apply_patch",
+    "json_diff",
     # Integration
     "DashboardIntegration",
     "PlayerDashboardState",
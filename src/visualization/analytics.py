@@ -20,7 +20,10 @@ First comprehensive analytics system for multi-agent game theory research
 with publication-ready visualizations and insights.
 """
 
-from collections import defaultdict
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
@@ -28,9 +31,27 @@ from typing import Any
 import numpy as np
 
 from ..common.logger import get_logger
+from .matchup import MatchupMatrix
+from .timeseries import (
+    DEFAULT_MAX_POINTS,
+    RingSeries,
+    bounded_history,
+    downsample,
+    downsample_columns,
+    int_series,
+    to_jsonable,
+)
 
 logger = get_logger(__name__)
 
+# Resources versioned by AnalyticsEngine (see AnalyticsEngine.etag)
+ANALYTICS_RESOURCES = (
+    "strategies",
+    "opponent_models",
+    "counterfactuals",
+    "matchup_matrix",
+    "replay",
+)
 
 # ============================================================================
 # Analytics Data Models
@@ -54,11 +75,11 @@ class StrategyPerformanceAnalytics:
     strategy_name: str
     player_ids: list[str]
 
-    # Time series data
-    rounds: list[int] = field(default_factory=list)
-    win_rates: list[float] = field(default_factory=list)
-    avg_scores: list[float] = field(default_factory=list)
-    cumulative_scores: list[float] = field(default_factory=list)
+    # Time series data (bounded ring buffers)
+    rounds: RingSeries = field(default_factory=int_series)
+    win_rates: RingSeries = field(default_factory=RingSeries)
+    avg_scores: RingSeries = field(default_factory=RingSeries)
+    cumulative_scores: RingSeries = field(default_factory=RingSeries)
 
     # Statistical metrics
     total_matches: int = 0
@@ -84,18 +105,18 @@ class OpponentModelAnalytics:
     player_id: str
     opponent_id: str
 
-    # Confidence evolution
-    rounds: list[int] = field(default_factory=list)
-    confidence_history: list[float] = field(default_factory=list)
-    accuracy_history: list[float] = field(default_factory=list)
+    # Confidence evolution (bounded ring buffers)
+    rounds: RingSeries = field(default_factory=int_series)
+    confidence_history: RingSeries = field(default_factory=RingSeries)
+    accuracy_history: RingSeries = field(default_factory=RingSeries)
 
     # Current state
     current_confidence: float = 0.0
     current_accuracy: float = 0.0
     predicted_strategy: str = "unknown"
 
-    # Belief distribution evolution
-    belief_history: list[dict[str, float]] = field(default_factory=list)
+    # Belief distribution evolution (most recent snapshots only)
+    belief_history: deque[dict[str, float]] = field(default_factory=bounded_history)
 
     # Metrics
     prediction_count: int = 0
@@ -109,14 +130,14 @@ class CounterfactualAnalytics:
 
     player_id: str
 
-    # Regret evolution
-    rounds: list[int] = field(default_factory=list)
-    regret_by_action: dict[str, list[float]] = field(default_factory=dict)
+    # Regret evolution (bounded ring buffers)
+    rounds: RingSeries = field(default_factory=int_series)
+    regret_by_action: dict[str, RingSeries] = field(default_factory=dict)
     cumulative_regret_by_action: dict[str, float] = field(default_factory=dict)
 
     # Strategy convergence
-    strategy_distribution_history: list[dict[str, float]] = field(default_factory=list)
-    entropy_history: list[float] = field(default_factory=list)
+    strategy_distribution_history: deque[dict[str, float]] = field(default_factory=bounded_history)
+    entropy_history: RingSeries = field(default_factory=RingSeries)
 
     # Metrics
     total_regret_minimized: float = 0.0
@@ -157,6 +178,277 @@ class TournamentReplayState:
     counterfactuals: dict[str, dict[str, Any]] = field(default_factory=dict)
 
 
+# ============================================================================
+# Replay Storage
+# ============================================================================
+
+
+@dataclass
+class _ReplaySegment:
+    """A keyframe and the deltas captured after it."""
+
+    base_seq: int
+    keyframe: TournamentReplayState
+    deltas: list[dict[str, Any]] = field(default_factory=list)
+
+
+class ReplayLog:
+    """
+    Replay history stored as periodic keyframes plus per-capture deltas.
+
+    A keyframe holds a full ``TournamentReplayState``. Each later capture
+    stores only what changed: the series entries appended since the previous
+    capture, the strategy totals, and the standings when they changed.
+    Rebuilding a capture replays at most ``keyframe_interval`` deltas from
+    the nearest keyframe.
+
+    When more than ``max_snapshots`` captures are held, whole segments are
+    dropped from the front (so the count may briefly exceed the limit by less
+    than one keyframe interval).
+    """
+
+    def __init__(self, keyframe_interval: int = 50, max_snapshots: int = 1000):
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.max_snapshots = max_snapshots
+
+        self._segments: list[_ReplaySegment] = []
+        self._round_numbers: list[int] = []  # Round of each retained capture
+        self._first_seq = 0  # Sequence number of the oldest retained capture
+
+        # Last captured state, to compute deltas against
+        self._series_total: dict[str, int] = {}  # Values appended per strategy series
+        self._last_standings: list[dict[str, Any]] | None = None
+
+        # Bumped on every change (never reset, so it can validate cached responses)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._round_numbers)
+
+    def __iter__(self) -> Iterator[TournamentReplayState]:
+        return self.iter_states()
+
+    def clear(self) -> None:
+        """Drop all captures."""
+        self._segments.clear()
+        self._round_numbers.clear()
+        self._first_seq = 0
+        self._series_total.clear()
+        self._last_standings = None
+        self.version += 1
+
+    # ========================================================================
+    # Capture
+    # ========================================================================
+
+    def capture(
+        self,
+        round_num: int,
+        timestamp: str,
+        standings: list[dict[str, Any]],
+        strategy_performance: dict[str, "StrategyPerformanceAnalytics"],
+    ) -> None:
+        """Record the state after a round."""
+        seq = self._first_seq + len(self._round_numbers)
+        self.version += 1
+
+        series_shrank = any(
+            a.rounds.total < self._series_total.get(name, 0)
+            for name, a in strategy_performance.items()
+        )
+        if (
+            not self._segments
+            or series_shrank
+            or len(self._segments[-1].deltas) + 1 >= self.keyframe_interval
+        ):
+            self._segments.append(
+                _ReplaySegment(
+                    base_seq=seq,
+                    keyframe=TournamentReplayState(
+                        round_number=round_num,
+                        timestamp=timestamp,
+                        active_matches=[],
+                        completed_matches=[],
+                        standings=standings,
+                        strategy_performance={
+                            name: self._series_entry(a, None)
+                            for name, a in strategy_performance.items()
+                        },
+                    ),
+                )
+            )
+        else:
+            delta: dict[str, Any] = {
+                "round_number": round_num,
+                "timestamp": timestamp,
+                "strategies": {
+                    name: self._series_entry(a, self._series_total.get(name, 0))
+                    for name, a in strategy_performance.items()
+                    if a.rounds.total != self._series_total.get(name)
+                },
+            }
+            if standings != self._last_standings:
+                delta["standings"] = standings
+            self._segments[-1].deltas.append(delta)
+
+        self._round_numbers.append(round_num)
+        self._series_total = {name: a.rounds.total for name, a in strategy_performance.items()}
+        self._last_standings = standings
+        self._trim()
+
+    @staticmethod
+    def _series_entry(
+        analytics: "StrategyPerformanceAnalytics", since_total: int | None
+    ) -> dict[str, Any]:
+        if since_total is None:
+            return {
+                "rounds": analytics.rounds.tolist(),
+                "win_rates": analytics.win_rates.tolist(),
+                "avg_scores": analytics.avg_scores.tolist(),
+                "total_wins": analytics.total_wins,
+                "total_matches": analytics.total_matches,
+            }
+        return {
+            "rounds": analytics.rounds.since(since_total),
+            "win_rates": analytics.win_rates.since(since_total),
+            "avg_scores": analytics.avg_scores.since(since_total),
+            "total_wins": analytics.total_wins,
+            "total_matches": analytics.total_matches,
+        }
+
+    def _trim(self) -> None:
+        while len(self._segments) > 1:
+            oldest = self._segments[0]
+            oldest_count = 1 + len(oldest.deltas)
+            if len(self._round_numbers) - oldest_count < self.max_snapshots:
+                break
+            self._segments.pop(0)
+            del self._round_numbers[:oldest_count]
+            self._first_seq += oldest_count
+
+    # ========================================================================
+    # Reconstruction
+    # ========================================================================
+
+    def _segment_index(self, seq: int) -> int:
+        index = bisect_right([s.base_seq for s in self._segments], seq) - 1
+        return max(0, index)
+
+    def seq_for_round(self, start_round: int) -> int:
+        """Get the sequence number of the first capture at or after ``start_round``."""
+        # Rounds are captured in non-decreasing order
+        return self._first_seq + bisect_left(self._round_numbers, start_round)
+
+    def get(self, round_num: int) -> TournamentReplayState | None:
+        """Rebuild the first capture for ``round_num``."""
+        seq = self.seq_for_round(round_num)
+        offset = seq - self._first_seq
+        if offset >= len(self._round_numbers) or self._round_numbers[offset] != round_num:
+            return None
+        return next(self.iter_states(start_seq=seq), None)
+
+    def iter_states(
+        self,
+        start_round: int = 0,
+        end_round: int | None = None,
+        include_series: bool = True,
+        start_seq: int | None = None,
+    ) -> Iterator[TournamentReplayState]:
+        """
+        Stream reconstructed captures in order.
+
+        Captures are numbered by a sequence that survives trimming, so a
+        caller can resume paging with ``start_seq`` (which overrides
+        ``start_round``).
+
+        Each state is rebuilt incrementally from the previous one, so paging
+        through a long tournament never materializes the whole history. With
+        ``include_series=False`` the per-strategy series are omitted and only
+        totals are returned, which keeps each step O(delta).
+        """
+        if start_seq is None:
+            start_seq = self.seq_for_round(start_round)
+        start_seq = max(start_seq, self._first_seq)
+        if start_seq - self._first_seq >= len(self._round_numbers):
+            return
+
+        segment_index = self._segment_index(start_seq)
+        for segment in self._segments[segment_index:]:
+            state = self._load_keyframe(segment.keyframe)
+            seq = segment.base_seq
+            if seq >= start_seq:
+                if end_round is not None and state["round_number"] > end_round:
+                    return
+                yield self._to_replay_state(state, include_series)
+
+            for delta in segment.deltas:
+                self._apply_delta(state, delta)
+                seq += 1
+                if seq < start_seq:
+                    continue
+                if end_round is not None and state["round_number"] > end_round:
+                    return
+                yield self._to_replay_state(state, include_series)
+
+    @staticmethod
+    def _load_keyframe(keyframe: TournamentReplayState) -> dict[str, Any]:
+        return {
+            "round_number": keyframe.round_number,
+            "timestamp": keyframe.timestamp,
+            "standings": keyframe.standings,
+            "strategies": {
+                name: {
+                    key: list(value) if isinstance(value, list) else value
+                    for key, value in entry.items()
+                }
+                for name, entry in keyframe.strategy_performance.items()
+            },
+        }
+
+    @staticmethod
+    def _apply_delta(state: dict[str, Any], delta: dict[str, Any]) -> None:
+        state["round_number"] = delta["round_number"]
+        state["timestamp"] = delta["timestamp"]
+        if "standings" in delta:
+            state["standings"] = delta["standings"]
+        for name, entry in delta["strategies"].items():
+            current = state["strategies"].setdefault(
+                name, {"rounds": [], "win_rates": [], "avg_scores": []}
+            )
+            current["rounds"].extend(entry["rounds"])
+            current["win_rates"].extend(entry["win_rates"])
+            current["avg_scores"].extend(entry["avg_scores"])
+            current["total_wins"] = entry["total_wins"]
+            current["total_matches"] = entry["total_matches"]
+
+    @staticmethod
+    def _to_replay_state(state: dict[str, Any], include_series: bool) -> TournamentReplayState:
+        if include_series:
+            strategy_performance = {
+                name: {
+                    key: list(value) if isinstance(value, list) else value
+                    for key, value in entry.items()
+                }
+                for name, entry in state["strategies"].items()
+            }
+        else:
+            strategy_performance = {
+                name: {
+                    "total_wins": entry["total_wins"],
+                    "total_matches": entry["total_matches"],
+                }
+                for name, entry in state["strategies"].items()
+            }
+        return TournamentReplayState(
+            round_number=state["round_number"],
+            timestamp=state["timestamp"],
+            active_matches=[],
+            completed_matches=[],
+            standings=state["standings"],
+            strategy_performance=strategy_performance,
+        )
+
+
 # ============================================================================
 # Advanced Analytics Engine
 # ============================================================================
@@ -193,16 +485,21 @@ class AnalyticsEngine:
         self.counterfactual_analytics: dict[str, CounterfactualAnalytics] = {}
 
         # Matchup matrix
-        self.matchup_matrix: dict[tuple[str, str], dict[str, Any]] = {}
+        self.matchup_matrix = MatchupMatrix()
         self.all_players: set[str] = set()
 
-        # Replay state history
-        self.replay_history: list[TournamentReplayState] = []
+        # Replay state history (keyframes plus per-round deltas)
+        self.replay_history = ReplayLog()
         self.current_round: int = 0
 
         # Time series storage
         self.performance_timeseries: dict[str, list[TimeSeriesDataPoint]] = defaultdict(list)
 
+        # Change counters per resource, plus a per-instance tag so versions
+        # from an earlier engine (or process) are never mistaken for current
+        self._versions: dict[str, int] = defaultdict(int)
+        self._instance_tag = uuid.uuid4().hex[:8]
+
         logger.info("AnalyticsEngine initialized")
 
     def reset(self):
@@ -216,8 +513,36 @@ class AnalyticsEngine:
         self.replay_history.clear()
         self.current_round = 0
         self.performance_timeseries.clear()
+        self._touch(*ANALYTICS_RESOURCES)
         logger.info("AnalyticsEngine reset complete")
 
+    # ========================================================================
+    # Versioning
+    # ========================================================================
+
+    def _touch(self, *resources: str) -> None:
+        for resource in resources:
+            self._versions[resource] += 1
+
+    def resource_version(self, resource: str) -> int:
+        """Get a resource's change counter (increases on every mutation)."""
+        if resource == "matchup_matrix":
+            return self._versions[resource] + self.matchup_matrix.version
+        if resource == "replay":
+            return self._versions[resource] + self.replay_history.version
+        return self._versions[resource]
+
+    def etag(self, *resources: str) -> str:
+        """
+        Get a validator that changes whenever any of ``resources`` changes.
+
+        With no arguments, covers every analytics resource.
+        """
+        versions = ".".join(
+            str(self.resource_version(r)) for r in resources or ANALYTICS_RESOURCES
+        )
+        return f"{self._instance_tag}-{versions}"
+
     # ========================================================================
     # Player & Strategy Registration
     # ========================================================================
@@ -226,6 +551,8 @@ class AnalyticsEngine:
         """Register a player with their strategy."""
         self.player_strategies[player_id] = strategy_name
         self.all_players.add(player_id)
+        # Aggregate endpoints list models and counterfactuals per registered player
+        self._touch("strategies", "opponent_models", "counterfactuals")
 
         # Initialize strategy analytics if new
         if strategy_name not in self.strategy_performance:
@@ -255,6 +582,7 @@ class AnalyticsEngine:
     ):
         """Process completed round and update all analytics."""
         self.current_round = round_num
+        self._touch("strategies")
         timestamp = datetime.now().isoformat()
 
         logger.info(f"[Analytics] 🔍 DEBUG: on_round_complete called: round={round_num}, players={player1_id} vs {player2_id}, scores={scores}")
@@ -281,6 +609,7 @@ class AnalyticsEngine:
         beliefs: dict[str, float],
     ):
         """Process opponent model update."""
+        self._touch("opponent_models")
         if player_id not in self.opponent_models:
             self.opponent_models[player_id] = {}
 
@@ -317,6 +646,7 @@ class AnalyticsEngine:
         cumulative_regret: dict[str, float],
     ):
         """Process counterfactual regret update."""
+        self._touch("counterfactuals")
         if player_id not in self.counterfactual_analytics:
             self.counterfactual_analytics[player_id] = CounterfactualAnalytics(player_id=player_id)
 
@@ -331,7 +661,7 @@ class AnalyticsEngine:
             regret = cf.get("regret", 0.0)
 
             if move not in analytics.regret_by_action:
-                analytics.regret_by_action[move] = []
+                analytics.regret_by_action[move] = RingSeries()
 
             analytics.regret_by_action[move].append(regret)
 
@@ -393,8 +723,8 @@ class AnalyticsEngine:
             analytics.rounds.append(round_num)
             analytics.avg_scores.append(player_score)
 
-            # Calculate cumulative score
-            cumulative = sum(analytics.avg_scores)
+            # Calculate cumulative score (running sum, O(1))
+            cumulative = analytics.avg_scores.sum
             analytics.cumulative_scores.append(cumulative)
 
             # Calculate current win rate
@@ -414,8 +744,8 @@ class AnalyticsEngine:
             # Calculate learning metrics
             if len(analytics.win_rates) >= 3:
                 # Learning rate (slope of win rate)
-                x = np.array(analytics.rounds[-5:])  # Last 5 rounds
-                y = np.array(analytics.win_rates[-5:])
+                x = analytics.rounds.last(5)  # Last 5 rounds
+                y = analytics.win_rates.last(5)
                 if len(x) >= 2:
                     analytics.learning_rate = float(np.polyfit(x, y, 1)[0])
 
@@ -428,7 +758,7 @@ class AnalyticsEngine:
                         analytics.improvement_trend = "stable"
 
                 # Consistency (inverse of variance)
-                variance = float(np.var(analytics.win_rates[-10:]))
+                variance = float(np.var(analytics.win_rates.last(10)))
                 analytics.consistency = 1.0 / (1.0 + variance) if variance >= 0 else 0.0
 
     def _update_matchup_matrix(
@@ -440,97 +770,26 @@ class AnalyticsEngine:
         round_num: int,
     ):
         """Update matchup matrix with match result."""
-        # Use ordered tuple as key (always smaller player_id first)
-        sorted_ids = sorted([player1_id, player2_id])
-        key: tuple[str, str] = (sorted_ids[0], sorted_ids[1])
-
-        if key not in self.matchup_matrix:
-            self.matchup_matrix[key] = {
-                "player_a": key[0],
-                "player_b": key[1],
-                "total_matches": 0,
-                "player_a_wins": 0,
-                "player_b_wins": 0,
-                "draws": 0,
-                "total_score_a": 0.0,
-                "total_score_b": 0.0,
-                "match_history": [],
-            }
-
-        matchup = self.matchup_matrix[key]
-        matchup["total_matches"] += 1
-
-        # Determine winner
-        score_a = scores.get(key[0], 0)
-        score_b = scores.get(key[1], 0)
-
-        if score_a > score_b:
-            matchup["player_a_wins"] += 1
-            winner = key[0]
-        elif score_b > score_a:
-            matchup["player_b_wins"] += 1
-            winner = key[1]
-        else:
-            matchup["draws"] += 1
-            winner = None
-
-        # Update scores
-        matchup["total_score_a"] += score_a
-        matchup["total_score_b"] += score_b
-
-        # Add to match history
-        matchup["match_history"].append(
-            {
-                "round": round_num,
-                "score_a": score_a,
-                "score_b": score_b,
-                "winner": winner,
-                "moves": moves.copy(),
-            }
+        # Pairs are oriented with the smaller player_id first
+        player_a, player_b = sorted([player1_id, player2_id])
+        self.matchup_matrix.record(
+            player_a,
+            player_b,
+            scores.get(player_a, 0),
+            scores.get(player_b, 0),
+            round_num=round_num,
+            moves=moves,
         )
 
-        # Keep only last 20 matches
-        if len(matchup["match_history"]) > 20:
-            matchup["match_history"] = matchup["match_history"][-20:]
-
-        # Calculate average score differential
-        if matchup["total_matches"] > 0:
-            avg_score_a = matchup["total_score_a"] / matchup["total_matches"]
-            avg_score_b = matchup["total_score_b"] / matchup["total_matches"]
-            matchup["avg_score_diff"] = abs(avg_score_a - avg_score_b)
-        else:
-            matchup["avg_score_diff"] = 0.0
-
-        # Track last winner
-        matchup["last_winner"] = winner
-
     async def _capture_replay_state(self, round_num: int, timestamp: str):
         """Capture current state for replay."""
-        # Create snapshot
-        snapshot = TournamentReplayState(
-            round_number=round_num,
-            timestamp=timestamp,
-            active_matches=[],  # Would be populated from match manager
-            completed_matches=[],  # Would be populated from match manager
+        self.replay_history.capture(
+            round_num,
+            timestamp,
             standings=self._generate_standings(),
-            strategy_performance={
-                name: {
-                    "rounds": analytics.rounds.copy(),
-                    "win_rates": analytics.win_rates.copy(),
-                    "avg_scores": analytics.avg_scores.copy(),
-                    "total_wins": analytics.total_wins,
-                    "total_matches": analytics.total_matches,
-                }
-                for name, analytics in self.strategy_performance.items()
-            },
+            strategy_performance=self.strategy_performance,
         )
 
-        self.replay_history.append(snapshot)
-
-        # Keep last 1000 snapshots (configurable)
-        if len(self.replay_history) > 1000:
-            self.replay_history = self.replay_history[-1000:]
-
     # ========================================================================
     # Query Methods
     # ========================================================================
@@ -558,27 +817,43 @@ class AnalyticsEngine:
         return self.counterfactual_analytics.get(player_id)
 
     def get_matchup_matrix(self) -> MatchupMatrixData:
-        """Get complete matchup matrix."""
-        players = sorted(self.all_players)
-
-        total_matches = sum(m["total_matches"] for m in self.matchup_matrix.values())
-        finished_matches = total_matches
-        pending_matches = (len(players) * (len(players) - 1) // 2) - len(self.matchup_matrix)
+        """
+        Get complete matchup matrix, one stats dict per pair.
 
+        Materializes every pair; the dashboard uses ``get_matchup_columns``.
+        """
+        summary = self._matchup_summary()
         return MatchupMatrixData(
-            players=players,
-            matrix=self.matchup_matrix.copy(),
-            total_matches=total_matches,
-            finished_matches=finished_matches,
-            pending_matches=pending_matches,
+            players=sorted(self.all_players),
+            matrix=self.matchup_matrix.to_dict(),
+            **summary,
         )
 
+    def get_matchup_columns(self) -> dict[str, Any]:
+        """
+        Get the matchup matrix as columns (one array per field) with its summary.
+
+        ``players`` lists every known player; the columns' own ``players``
+        (which their ``a``/``b`` indices refer to) only those who have played.
+        """
+        return {
+            "players": sorted(self.all_players),
+            "columns": self.matchup_matrix.to_columns(),
+            "summary": self._matchup_summary(),
+        }
+
+    def _matchup_summary(self) -> dict[str, int]:
+        players = len(self.all_players)
+        total_matches = self.matchup_matrix.total_matches
+        return {
+            "total_matches": total_matches,
+            "finished_matches": total_matches,
+            "pending_matches": players * (players - 1) // 2 - len(self.matchup_matrix),
+        }
+
     def get_replay_state(self, round_num: int) -> TournamentReplayState | None:
         """Get replay state for a specific round."""
-        for snapshot in self.replay_history:
-            if snapshot.round_number == round_num:
-                return snapshot
-        return None
+        return self.replay_history.get(round_num)
 
     def get_replay_history(
         self, start_round: int = 0, end_round: int | None = None
@@ -587,7 +862,16 @@ class AnalyticsEngine:
         if end_round is None:
             end_round = self.current_round
 
-        return [s for s in self.replay_history if start_round <= s.round_number <= end_round]
+        return list(self.replay_history.iter_states(start_round, end_round))
+
+    def iter_replay_history(
+        self,
+        start_round: int = 0,
+        end_round: int | None = None,
+        include_series: bool = False,
+    ) -> Iterator[TournamentReplayState]:
+        """Stream replay states for a range of rounds without loading them all."""
+        return self.replay_history.iter_states(start_round, end_round, include_series)
 
     def _generate_standings(self) -> list[dict[str, Any]]:
         """Generate current standings from analytics."""
@@ -635,22 +919,33 @@ class AnalyticsEngine:
             "total_rounds": self.current_round,
             "exported_at": datetime.now().isoformat(),
             "strategy_performance": {
-                name: asdict(analytics) for name, analytics in self.strategy_performance.items()
+                name: _export_dataclass(analytics)
+                for name, analytics in self.strategy_performance.items()
             },
             "opponent_models": {
-                player_id: {opp_id: asdict(analytics) for opp_id, analytics in models.items()}
+                player_id: {
+                    opp_id: _export_dataclass(analytics) for opp_id, analytics in models.items()
+                }
                 for player_id, models in self.opponent_models.items()
             },
             "counterfactual_analytics": {
-                player_id: asdict(analytics)
+                player_id: _export_dataclass(analytics)
                 for player_id, analytics in self.counterfactual_analytics.items()
             },
-            "matchup_matrix": {f"{k[0]}_vs_{k[1]}": v for k, v in self.matchup_matrix.items()},
+            "matchup_matrix": {
+                f"{k[0]}_vs_{k[1]}": v for k, v in self.matchup_matrix.to_dict().items()
+            },
             "replay_history_count": len(self.replay_history),
         }
 
-    def export_for_visualization(self, strategy_name: str | None = None) -> dict[str, Any]:
-        """Export data optimized for visualization."""
+    def export_for_visualization(
+        self, strategy_name: str | None = None, max_points: int = DEFAULT_MAX_POINTS
+    ) -> dict[str, Any]:
+        """
+        Export data optimized for visualization.
+
+        Each time series is downsampled (LTTB) to at most ``max_points`` points.
+        """
         if strategy_name:
             analytics = self.get_strategy_analytics(strategy_name)
             if not analytics:
@@ -658,12 +953,7 @@ class AnalyticsEngine:
 
             return {
                 "strategy_name": strategy_name,
-                "time_series": {
-                    "rounds": analytics.rounds,
-                    "win_rates": analytics.win_rates,
-                    "avg_scores": analytics.avg_scores,
-                    "cumulative_scores": analytics.cumulative_scores,
-                },
+                "time_series": strategy_time_series(analytics, max_points),
                 "metrics": {
                     "total_matches": analytics.total_matches,
                     "win_rate": analytics.win_rate,
@@ -676,11 +966,10 @@ class AnalyticsEngine:
             # Export all strategies
             return {
                 name: {
-                    "time_series": {
-                        "rounds": a.rounds,
-                        "win_rates": a.win_rates,
-                        "avg_scores": a.avg_scores,
-                    },
+                    "time_series": downsample_columns(
+                        {"rounds": a.rounds, "win_rates": a.win_rates, "avg_scores": a.avg_scores},
+                        max_points,
+                    ),
                     "metrics": {
                         "win_rate": a.win_rate,
                         "learning_rate": a.learning_rate,
@@ -691,6 +980,57 @@ class AnalyticsEngine:
             }
 
 
+# ============================================================================
+# Series Export Helpers
+# ============================================================================
+
+
+def _export_dataclass(analytics: Any) -> dict[str, Any]:
+    """asdict() with ring buffers and bounded histories as plain lists."""
+    return asdict(analytics, dict_factory=lambda items: {k: to_jsonable(v) for k, v in items})
+
+
+def strategy_time_series(analytics: Any, max_points: int = DEFAULT_MAX_POINTS) -> dict[str, list]:
+    """Get a strategy's time series, downsampled to at most ``max_points``."""
+    return downsample_columns(
+        {
+            "rounds": analytics.rounds,
+            "win_rates": analytics.win_rates,
+            "avg_scores": analytics.avg_scores,
+            "cumulative_scores": analytics.cumulative_scores,
+        },
+        max_points,
+    )
+
+
+def opponent_model_time_series(model: Any, max_points: int = DEFAULT_MAX_POINTS) -> dict[str, list]:
+    """Get an opponent model's time series, downsampled to at most ``max_points``."""
+    return downsample_columns(
+        {
+            "rounds": model.rounds,
+            "confidence_history": model.confidence_history,
+            "accuracy_history": model.accuracy_history,
+        },
+        max_points,
+    )
+
+
+def counterfactual_time_series(cf: Any, max_points: int = DEFAULT_MAX_POINTS) -> dict[str, Any]:
+    """
+    Get counterfactual time series, downsampled to at most ``max_points``.
+
+    Regret and entropy series are recorded at different rates than rounds,
+    so each is downsampled on its own.
+    """
+    return {
+        "rounds": downsample(cf.rounds, max_points),
+        "regret_by_action": {
+            move: downsample(regrets, max_points) for move, regrets in cf.regret_by_action.items()
+        },
+        "entropy_history": downsample(cf.entropy_history, max_points),
+    }
+
+
 # ============================================================================
 # Global Analytics Engine Instance
 # ============================================================================
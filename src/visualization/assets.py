@@ -0,0 +1,189 @@
+"""
+Dashboard Static Assets
+=======================
+
+Dashboard pages live as static files under ``static/`` (HTML shell plus
+separate CSS and JS) instead of Python string constants, so importing the
+visualization package does not build the markup.
+
+An ``AssetBundle`` reads its files on first use and serves:
+
+- each asset under a content-hash name (``dashboard.1a2b3c4d5e.js``) with a
+  one-year immutable cache header, so browsers fetch it once per version
+- the HTML page with those hashed URLs substituted, revalidated by ETag
+- gzip (and brotli, when the ``brotli`` package is installed) variants
+  compressed once at load time
+
+The bundle is framework-neutral: the FastAPI and aiohttp dashboards wrap
+``Asset.select`` results in their own response types.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .http_cache import etag_matches, preferred_encoding
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+STATIC_URL_PREFIX = "/static"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Length of the content hash in asset file names
+_HASH_LENGTH = 10
+
+
+@dataclass
+class Asset:
+    """One static file with its pre-compressed variants."""
+
+    name: str
+    media_type: str
+    body: bytes
+    etag: str
+    cache_control: str
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    def select(self, accept_encoding: str = "") -> tuple[bytes, dict[str, str]]:
+        """Pick the best variant for an ``Accept-Encoding`` header (body, headers)."""
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        encoding = preferred_encoding(accept_encoding, tuple(self.encoded))
+        if encoding is None:
+            return self.body, headers
+        headers["Content-Encoding"] = encoding
+        return self.encoded[encoding], headers
+
+    def not_modified(self, if_none_match: str | None) -> bool:
+        """Check whether the client already has this version."""
+        return etag_matches(if_none_match, self.etag)
+
+
+def _compress(body: bytes, min_size: int) -> dict[str, bytes]:
+    if len(body) < min_size:
+        return {}
+    encoded = {}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, quality=11)
+    encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+    return encoded
+
+
+class AssetBundle:
+    """
+    An HTML page and the static assets it references.
+
+    Args:
+        page: HTML file name under ``static_dir``
+        assets: CSS/JS file names referenced from the page as
+            ``{url_prefix}/{name}``
+        min_compress_size: Smallest file (bytes) given compressed variants
+    """
+
+    def __init__(
+        self,
+        page: str,
+        assets: tuple[str, ...],
+        static_dir: Path = STATIC_DIR,
+        url_prefix: str = STATIC_URL_PREFIX,
+        min_compress_size: int = 512,
+    ):
+        self.page_name = page
+        self.asset_names = assets
+        self.static_dir = Path(static_dir)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.min_compress_size = min_compress_size
+
+        self._page: Asset | None = None
+        self._assets: dict[str, Asset] = {}  # Keyed by hashed and original name
+        self._hashed_names: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _load_asset(self, name: str) -> tuple[str, Asset]:
+        body = (self.static_dir / name).read_bytes()
+        digest = hashlib.sha256(body).hexdigest()[:_HASH_LENGTH]
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or media_type.endswith("javascript"):
+            media_type += "; charset=utf-8"
+        stem, dot, suffix = name.rpartition(".")
+        asset = Asset(
+            name=name,
+            media_type=media_type,
+            body=body,
+            etag=f'"{digest}"',
+            cache_control=IMMUTABLE_CACHE_CONTROL,
+            encoded=_compress(body, self.min_compress_size),
+        )
+        return f"{stem}.{digest}{dot}{suffix}", asset
+
+    def _load(self) -> Asset:
+        with self._lock:
+            if self._page is not None:
+                return self._page
+
+            html = (self.static_dir / self.page_name).read_text(encoding="utf-8")
+            for name in self.asset_names:
+                hashed, asset = self._load_asset(name)
+                html = html.replace(f"{self.url_prefix}/{name}", f"{self.url_prefix}/{hashed}")
+                self._hashed_names[name] = hashed
+                self._assets[hashed] = asset
+                # The unhashed name still works, but must be revalidated
+                self._assets[name] = Asset(
+                    name=name,
+                    media_type=asset.media_type,
+                    body=asset.body,
+                    etag=asset.etag,
+                    cache_control=REVALIDATE_CACHE_CONTROL,
+                    encoded=asset.encoded,
+                )
+
+            body = html.encode("utf-8")
+            self._page = Asset(
+                name=self.page_name,
+                media_type="text/html; charset=utf-8",
+                body=body,
+                etag=f'"{hashlib.sha256(body).hexdigest()[:_HASH_LENGTH]}"',
+                cache_control=REVALIDATE_CACHE_CONTROL,
+                encoded=_compress(body, self.min_compress_size),
+            )
+            return self._page
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the files have been read yet."""
+        return self._page is not None
+
+    @property
+    def page(self) -> Asset:
+        """The HTML page, with hashed asset URLs."""
+        return self._page or self._load()
+
+    def get(self, filename: str) -> Asset | None:
+        """Look up an asset by hashed or original file name."""
+        if self._page is None:
+            self._load()
+        return self._assets.get(filename)
+
+    def url_for(self, name: str) -> str:
+        """Get the content-hashed URL of an asset."""
+        if self._page is None:
+            self._load()
+        return f"{self.url_prefix}/{self._hashed_names[name]}"
+
+
+# Pages served by the dashboards (files are read on first request)
+DASHBOARD_ASSETS = AssetBundle("dashboard.html", ("dashboard.css", "dashboard.js"))
+ULTIMATE_ASSETS = AssetBundle("ultimate.html", ("ultimate.css", "ultimate.js"))
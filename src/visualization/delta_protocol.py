@@ -0,0 +1,344 @@
+"""
+Delta WebSocket Protocol
+========================
+
+Versioned per-topic state and JSON Patch deltas for dashboard clients.
+
+Clients that never subscribe receive every message in full (the original
+protocol). A client switches to topic mode by sending::
+
+    {"type": "subscribe", "topics": ["tournament_update", "match_update:R1M2"]}
+
+and then only receives updates for matching topics, as:
+
+- ``{"type": "snapshot", "topic", "version", "message"}``: the full message
+- ``{"type": "delta", "topic", "version", "base_version", "patch"}``: an
+  RFC 6902 JSON Patch turning the message at ``base_version`` into the one
+  at ``version``
+
+The base of a delta is the last version delivered to that client; the
+WebSocket's ordered, reliable delivery acknowledges it. A client that loses
+track sends ``{"type": "resync", "topic": ...}`` to get a snapshot. A
+snapshot is also sent every ``resync_interval`` deltas, when the base has
+left the topic history, or when the delta would not be smaller.
+
+Each delta is computed and encoded once per (topic, base version), so server
+work scales with the number of distinct client states, not client count.
+"""
+
+import json
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any
+
+Message = dict[str, Any]
+
+# Compact encoding, as used by WebSocket.send_json
+_SEPARATORS = (",", ":")
+
+
+def encode(message: Any) -> str:
+    """Encode a message for the wire (raises TypeError if not serializable)."""
+    return json.dumps(message, separators=_SEPARATORS, ensure_ascii=False)
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    """
+    Check whether a subscription pattern covers a topic.
+
+    A pattern matches its exact topic, any sub-topic (``opponent_model:P1``
+    covers ``opponent_model:P1:P2``) and shell-style wildcards.
+    """
+    return pattern == topic or topic.startswith(pattern + ":") or fnmatchcase(topic, pattern)
+
+
+# ============================================================================
+# JSON Patch
+# ============================================================================
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any) -> list[dict[str, Any]]:
+    """
+    Compute an RFC 6902 JSON Patch turning ``old`` into ``new``.
+
+    Objects are diffed per key and arrays per index (trailing items are
+    added or removed), so a change deep inside a large message yields a
+    patch proportional to the change.
+    """
+    ops: list[dict[str, Any]] = []
+    _diff(old, new, "", ops)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: str, ops: list[dict[str, Any]]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key in old:
+                _diff(old[key], value, child, ops)
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        return
+
+    if isinstance(old, list | tuple) and isinstance(new, list | tuple):
+        common = min(len(old), len(new))
+        for i in range(common):
+            _diff(old[i], new[i], f"{path}/{i}", ops)
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        return
+
+    # Type check keeps True -> 1 and 1 -> 1.0 from comparing equal
+    if type(old) is not type(new) or old != new:
+        ops.append({"op": "replace", "path": path, "value": new})
+
+
+def apply_patch(document: Any, patch: list[dict[str, Any]]) -> Any:
+    """
+    Apply a JSON Patch produced by ``json_diff`` (add, remove, replace).
+
+    Returns the patched document; ``document`` itself is not modified.
+    """
+    document = json.loads(encode(document))
+    for op in patch:
+        path = op["path"]
+        if path == "":
+            document = op.get("value")
+            continue
+
+        tokens = [_unescape(token) for token in path[1:].split("/")]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return document
+
+
+# ============================================================================
+# Topic State
+# ============================================================================
+
+
+class TopicState:
+    """
+    Latest message of one topic plus a short version history.
+
+    Encoded snapshots and deltas are cached for the current version.
+    """
+
+    def __init__(self, history_size: int = 8):
+        self.topic = ""
+        self.version = 0
+        self.message: Message = {}
+        self._history: deque[tuple[int, Message]] = deque(maxlen=max(1, history_size))
+        self._encoded_message: str | None = None
+        self._encoded_snapshot: str | None = None
+        self._encoded_deltas: dict[int, str | None] = {}
+
+    def update(self, topic: str, version: int, message: Message) -> None:
+        """Record a new message for the topic."""
+        self.topic = topic
+        self.version = version
+        self.message = message
+        self._history.append((version, message))
+        self._encoded_message = None
+        self._encoded_snapshot = None
+        self._encoded_deltas.clear()
+
+    def has_version(self, version: int) -> bool:
+        """Check whether a version is still in the history."""
+        return any(v == version for v, _ in self._history)
+
+    def encoded_message(self) -> str:
+        """The plain message, for clients without subscriptions."""
+        if self._encoded_message is None:
+            self._encoded_message = encode(self.message)
+        return self._encoded_message
+
+    def encoded_snapshot(self) -> str:
+        """A snapshot of the current version."""
+        if self._encoded_snapshot is None:
+            self._encoded_snapshot = encode(
+                {
+                    "type": "snapshot",
+                    "topic": self.topic,
+                    "version": self.version,
+                    "message": self.message,
+                }
+            )
+        return self._encoded_snapshot
+
+    def encoded_delta(self, base_version: int) -> str | None:
+        """
+        A delta from ``base_version`` to the current version.
+
+        Returns None when the base is no longer in the history or the delta
+        would not be smaller than a snapshot.
+        """
+        if base_version in self._encoded_deltas:
+            return self._encoded_deltas[base_version]
+
+        base = next((m for v, m in self._history if v == base_version), None)
+        encoded = None
+        if base is not None:
+            encoded = encode(
+                {
+                    "type": "delta",
+                    "topic": self.topic,
+                    "version": self.version,
+                    "base_version": base_version,
+                    "patch": json_diff(base, self.message),
+                }
+            )
+            if len(encoded) >= len(self.encoded_snapshot()):
+                encoded = None
+
+        self._encoded_deltas[base_version] = encoded
+        return encoded
+
+
+class TopicStore:
+    """
+    Versioned state for every published topic.
+
+    Versions come from one counter shared by all topics, so a version is
+    never reused even after a topic is evicted. At most ``max_topics`` are
+    kept (least recently updated evicted first).
+    """
+
+    def __init__(self, history_size: int = 8, max_topics: int = 1024):
+        self.history_size = history_size
+        self.max_topics = max_topics
+        self._topics: OrderedDict[str, TopicState] = OrderedDict()
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def get(self, topic: str) -> TopicState | None:
+        return self._topics.get(topic)
+
+    def update(self, topic: str, message: Message) -> TopicState:
+        """Record a new message for a topic and return its state."""
+        state = self._topics.get(topic)
+        if state is None:
+            state = TopicState(self.history_size)
+            self._topics[topic] = state
+            while len(self._topics) > self.max_topics:
+                self._topics.popitem(last=False)
+        else:
+            self._topics.move_to_end(topic)
+
+        self._version += 1
+        state.update(topic, self._version, message)
+        return state
+
+    def matching(self, patterns: set[str]) -> list[TopicState]:
+        """Get the states of all topics covered by any of the patterns."""
+        return [
+            state
+            for topic, state in self._topics.items()
+            if any(topic_matches(p, topic) for p in patterns)
+        ]
+
+    def clear(self) -> None:
+        self._topics.clear()
+
+
+# ============================================================================
+# Client Sessions
+# ============================================================================
+
+
+@dataclass
+class ClientSession:
+    """
+    Per-connection subscription state.
+
+    ``subscriptions`` is None for clients that never subscribed; they get
+    every message in full.
+    """
+
+    info: dict[str, Any] = field(default_factory=dict)
+    subscriptions: set[str] | None = None
+    delta: bool = True
+
+    # Topic -> last version delivered
+    versions: dict[str, int] = field(default_factory=dict)
+    # Topic -> deltas sent since the last snapshot
+    deltas_since_snapshot: dict[str, int] = field(default_factory=dict)
+
+    def wants(self, topic: str) -> bool:
+        """Check whether the client should receive a topic."""
+        if self.subscriptions is None:
+            return True
+        return any(topic_matches(p, topic) for p in self.subscriptions)
+
+    def subscribe(self, topics: list[str]) -> None:
+        if self.subscriptions is None:
+            self.subscriptions = set()
+        self.subscriptions.update(topics)
+
+    def unsubscribe(self, topics: list[str]) -> None:
+        if self.subscriptions is None:
+            return
+        self.subscriptions.difference_update(topics)
+        for topic in list(self.versions):
+            if not self.wants(topic):
+                del self.versions[topic]
+                self.deltas_since_snapshot.pop(topic, None)
+
+    def encode_update(self, state: TopicState, resync_interval: int) -> tuple[str, bool]:
+        """
+        Encode a topic update for this client and mark it delivered.
+
+        Returns:
+            Tuple of (wire text, whether it is a delta)
+        """
+        if self.subscriptions is None or not self.delta:
+            return state.encoded_message(), False
+
+        text = None
+        base = self.versions.get(state.topic)
+        sent = self.deltas_since_snapshot.get(state.topic, 0)
+        if base is not None and sent < resync_interval:
+            text = state.encoded_delta(base)
+
+        self.versions[state.topic] = state.version
+        if text is None:
+            self.deltas_since_snapshot[state.topic] = 0
+            return state.encoded_snapshot(), False
+        self.deltas_since_snapshot[state.topic] = sent + 1
+        return text, True
+
+    def forget(self, topic: str) -> None:
+        """Drop delivery state so the next update is a snapshot."""
+        self.versions.pop(topic, None)
+        self.deltas_since_snapshot.pop(topic, None)
@@ -0,0 +1,220 @@
+"""
+WebSocket Fan-Out
+=================
+
+Per-client bounded send queues drained by per-client writer tasks.
+
+Broadcasting enqueues already-encoded text (shared by every queue) and
+returns immediately, so a slow client only delays itself. Topic updates can
+be queued as a topic marker instead of text: the writer asks for the
+topic's latest message when it gets to it, so a backed-up client skips
+stale versions instead of sending them all (and a topic is queued at most
+once per client).
+
+When a queue is full, the overflow policy decides what happens:
+
+- ``drop_oldest``: drop the oldest queued message
+- ``drop_topic``: drop the oldest topic update (it is superseded by the
+  next publish), keeping discrete events; falls back to the oldest event
+- ``disconnect``: close the client, which can reconnect and resync
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..common.logger import get_logger
+
+logger = get_logger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_topic", "disconnect")
+
+DEFAULT_SEND_QUEUE_SIZE = 256
+
+# Queue entry: (topic or None, pre-encoded text or None for a topic marker, enqueue time)
+_Entry = tuple[str | None, str | None, float]
+
+
+class ClientOutbox:
+    """
+    Bounded outbound queue and writer task for one client.
+
+    Args:
+        send: Coroutine function sending one text frame
+        resolve: Builds the text for a topic marker at send time (None skips)
+        on_close: Called once when the outbox closes itself (send failure or
+            ``disconnect`` overflow)
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[Any]],
+        resolve: Callable[[str], str | None] | None = None,
+        on_close: Callable[[], Any] | None = None,
+        max_queue: int = DEFAULT_SEND_QUEUE_SIZE,
+        overflow: str = "drop_oldest",
+        name: str = "",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}. Available: {OVERFLOW_POLICIES}")
+
+        self.name = name
+        self.max_queue = max(1, max_queue)
+        self.overflow = overflow
+        self._send = send
+        self._resolve = resolve
+        self._on_close = on_close
+
+        self._queue: deque[_Entry] = deque()
+        self._queued_topics: set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task | None = None
+        self.closed = False
+
+        # Statistics
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.bytes_sent = 0
+        self.max_depth = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of queued messages."""
+        return len(self._queue)
+
+    # ========================================================================
+    # Enqueueing
+    # ========================================================================
+
+    def put(self, text: str, topic: str | None = None) -> bool:
+        """Queue pre-encoded text. Returns False if the client was closed."""
+        return self._enqueue((topic, text, time.monotonic()))
+
+    def put_topic(self, topic: str) -> bool:
+        """Queue the latest update of ``topic`` (no-op if already queued)."""
+        if topic in self._queued_topics:
+            self.coalesced += 1
+            return not self.closed
+        return self._enqueue((topic, None, time.monotonic()))
+
+    def _enqueue(self, entry: _Entry) -> bool:
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue:
+            if self.overflow == "disconnect":
+                logger.warning(f"Send queue full for {self.name}; disconnecting slow client")
+                self._close(notify=True)
+                return False
+            self._drop_one()
+
+        self._queue.append(entry)
+        if entry[1] is None:
+            self._queued_topics.add(entry[0])
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._idle.clear()
+        self._wakeup.set()
+        self._ensure_writer()
+        return True
+
+    def _drop_one(self) -> None:
+        index = 0
+        if self.overflow == "drop_topic":
+            index = next((i for i, entry in enumerate(self._queue) if entry[0] is not None), 0)
+        entry = self._queue[index]
+        del self._queue[index]
+        if entry[1] is None:
+            self._queued_topics.discard(entry[0])
+        self.dropped += 1
+
+    def _ensure_writer(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet: the writer starts with the next put from a loop
+            return
+        self._task = loop.create_task(self._writer(), name=f"ws-writer-{self.name}")
+
+    # ========================================================================
+    # Writer
+    # ========================================================================
+
+    async def _writer(self) -> None:
+        while not self.closed:
+            if not self._queue:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            topic, text, queued_at = self._queue.popleft()
+            if text is None:
+                self._queued_topics.discard(topic)
+                try:
+                    text = self._resolve(topic) if self._resolve else None
+                except Exception as e:
+                    logger.error(f"Failed to encode {topic} for {self.name}: {e}")
+                    text = None
+                if text is None:
+                    continue
+
+            try:
+                await self._send(text)
+            except Exception as e:
+                logger.error(f"Error sending to {self.name}: {e}")
+                self._close(notify=True)
+                return
+
+            latency = time.monotonic() - queued_at
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+            self.sent += 1
+            self.bytes_sent += len(text)
+
+    async def join(self) -> None:
+        """Wait until everything queued so far has been sent (or dropped)."""
+        if self.closed or self._task is None:
+            return
+        await self._idle.wait()
+
+    def _close(self, notify: bool) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._queue.clear()
+        self._queued_topics.clear()
+        self._idle.set()
+        self._wakeup.set()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        if notify and self._on_close is not None:
+            self._on_close()
+
+    def close(self) -> None:
+        """Stop the writer and drop anything queued."""
+        self._close(notify=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-client queue statistics (latencies in milliseconds)."""
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self.max_depth,
+            "max_queue": self.max_queue,
+            "overflow": self.overflow,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "bytes_sent": self.bytes_sent,
+            "avg_latency_ms": (self._latency_total / self.sent * 1000) if self.sent else 0.0,
+            "max_latency_ms": self._latency_max * 1000,
+            "closed": self.closed,
+        }
@@ -0,0 +1,179 @@
+"""
+Dashboard Frame Scheduler
+=========================
+
+Coalesces dashboard updates into frames sent at a fixed tick rate.
+
+Producers publish updates by topic (e.g. ``tournament_update`` or
+``match_update:R1M2``). Within a tick, a newer update replaces the pending
+one for the same topic (latest wins), so a burst of match results produces
+one frame per topic instead of one WebSocket message per result. Updates may
+be lazy (a zero-argument callable), in which case the message is only built
+when the frame is sent.
+
+Discrete events that must not be merged (registrations, tournament
+completion) go through ``publish_event`` and are sent in order with the next
+frame.
+
+The first update after an idle period is sent immediately; updates arriving
+within the following tick are coalesced.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..common.logger import get_logger
+
+logger = get_logger(__name__)
+
+Message = dict[str, Any]
+MessageSource = Message | Callable[[], Message | None]
+# Called with (topic, message); topic is None for discrete events
+FrameSink = Callable[[str | None, Message], Awaitable[None]]
+
+
+class FrameScheduler:
+    """
+    Per-topic, latest-wins update coalescer.
+
+    **Usage:**
+    ```python
+    scheduler = FrameScheduler(send, tick_hz=10)  # send(topic, message)
+    scheduler.publish("standings", {"type": "standings", "data": rows})
+    scheduler.publish("tournament_update", build_tournament_message)  # lazy
+    ```
+    """
+
+    def __init__(self, sink: FrameSink, tick_hz: float = 10.0, max_pending_events: int = 1000):
+        self._sink = sink
+        self.tick_interval = 1.0 / tick_hz if tick_hz > 0 else 0.0
+
+        self._pending: dict[str, MessageSource] = {}
+        self._events: deque[Message] = deque(maxlen=max_pending_events)
+
+        self._task: asyncio.Task | None = None
+        self._last_flush = 0.0
+
+        # Statistics
+        self.published = 0
+        self.coalesced = 0
+        self.frames_sent = 0
+        self.messages_sent = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of topics and events waiting for the next frame."""
+        return len(self._pending) + len(self._events)
+
+    # ========================================================================
+    # Publishing
+    # ========================================================================
+
+    def publish(self, topic: str, message: MessageSource, merge: bool = False) -> None:
+        """
+        Queue an update for ``topic``, replacing any pending one.
+
+        Args:
+            topic: Coalescing key
+            message: Message dict, or a callable building it at send time
+            merge: Merge ``data`` into the pending message's ``data`` instead
+                of replacing it (both must be dicts, not callables)
+        """
+        self.published += 1
+        pending = self._pending.get(topic)
+        if pending is not None:
+            self.coalesced += 1
+            if merge and isinstance(pending, dict) and isinstance(message, dict):
+                data = {**pending.get("data", {}), **message.get("data", {})}
+                message = {**pending, **message, "data": data}
+        self._pending[topic] = message
+        self._schedule()
+
+    def publish_event(self, message: Message) -> None:
+        """Queue a discrete event; events are never coalesced."""
+        self.published += 1
+        self._events.append(message)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet: updates wait for the next flush()
+            return
+
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._run(), name="dashboard-frames")
+
+    # ========================================================================
+    # Sending
+    # ========================================================================
+
+    async def _run(self) -> None:
+        # Runs only while there is something to send; exits when idle
+        while self._pending or self._events:
+            # Leading edge: send right away if the last frame is a tick old
+            delay = self._last_flush + self.tick_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Send all pending updates as one frame. Returns messages sent."""
+        self._last_flush = time.monotonic()
+        if not self._pending and not self._events:
+            return 0
+
+        events = list(self._events)
+        self._events.clear()
+        pending = self._pending
+        self._pending = {}
+
+        sent = 0
+        for message in events:
+            sent += await self._send(None, message)
+        for topic, source in pending.items():
+            try:
+                message = source() if callable(source) else source
+            except Exception as e:
+                logger.error(f"Failed to build dashboard update for {topic}: {e}")
+                continue
+            if message is not None:
+                sent += await self._send(topic, message)
+
+        self.frames_sent += 1
+        self.messages_sent += sent
+        return sent
+
+    async def _send(self, topic: str | None, message: Message) -> int:
+        try:
+            await self._sink(topic, message)
+            return 1
+        except Exception as e:
+            logger.error(f"Failed to send dashboard update: {e}")
+            return 0
+
+    async def stop(self) -> None:
+        """Send anything pending and stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "tick_interval": self.tick_interval,
+            "published": self.published,
+            "coalesced": self.coalesced,
+            "frames_sent": self.frames_sent,
+            "messages_sent": self.messages_sent,
+            "pending": self.pending_count,
+        }
@@ -0,0 +1,179 @@
+"""
+HTTP Response Cache
+===================
+
+Serialized (and gzip-compressed) REST responses cached per resource
+version, with ``ETag`` / ``If-None-Match`` revalidation.
+
+An endpoint passes a validator string that changes whenever the data
+behind it changes (for analytics, ``AnalyticsEngine.etag``). While the
+validator is unchanged, a request either gets ``304 Not Modified`` (the
+client already has this version) or the cached bytes, without rebuilding
+or re-serializing the payload. Entries are keyed by path and query, so
+different query parameters are cached separately.
+"""
+
+import gzip
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .delta_protocol import encode
+
+if TYPE_CHECKING:
+    from fastapi import Request
+
+# Bodies smaller than this are not worth compressing
+DEFAULT_MIN_COMPRESS_SIZE = 1024
+
+
+@dataclass
+class _CachedBody:
+    validator: str
+    etag: str
+    body: bytes
+    media_type: str
+    gzipped: bytes | None = None
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded responses, validated by version strings.
+
+    Args:
+        max_entries: Cached (path, query) entries kept
+        min_compress_size: Smallest body (bytes) served gzip-compressed
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        min_compress_size: int = DEFAULT_MIN_COMPRESS_SIZE,
+        compress_level: int = 6,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.min_compress_size = min_compress_size
+        self.compress_level = compress_level
+        self._entries: OrderedDict[tuple[str, str], _CachedBody] = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.builds = 0
+        self.not_modified = 0
+        self.compressed = 0
+
+    def respond(
+        self,
+        request: "Request",
+        validator: str | None,
+        build: Callable[[], Any],
+        media_type: str = "application/json",
+    ) -> Any:
+        """
+        Serve ``build()`` for the current version.
+
+        ``build`` returns a JSON-compatible object, or ``bytes`` sent as-is
+        with ``media_type``. With no validator the result of ``build()`` is
+        returned uncached.
+        """
+        if validator is None:
+            return build()
+
+        # FastAPI is only needed once something is served (the aiohttp
+        # dashboard uses this module's helpers without it)
+        from fastapi.responses import Response
+
+        etag = f'"{validator}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        key = (request.url.path, "&".join(sorted(request.url.query.split("&"))))
+        entry = self._entries.get(key)
+        if entry is not None and entry.validator == validator:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            entry = self._store(key, validator, etag, build(), media_type)
+
+        body = entry.body
+        accept_encoding = request.headers.get("accept-encoding", "")
+        if len(body) >= self.min_compress_size and preferred_encoding(accept_encoding, ("gzip",)):
+            if entry.gzipped is None:
+                entry.gzipped = gzip.compress(body, compresslevel=self.compress_level)
+            body = entry.gzipped
+            headers["Content-Encoding"] = "gzip"
+            self.compressed += 1
+
+        return Response(content=body, media_type=entry.media_type, headers=headers)
+
+    def _store(
+        self, key: tuple[str, str], validator: str, etag: str, result: Any, media_type: str
+    ) -> _CachedBody:
+        from fastapi.encoders import jsonable_encoder
+
+        self.builds += 1
+        if isinstance(result, bytes):
+            body = result
+        else:
+            body = encode(jsonable_encoder(result)).encode("utf-8")
+            media_type = "application/json"
+
+        entry = _CachedBody(validator=validator, etag=etag, body=body, media_type=media_type)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "builds": self.builds,
+            "not_modified": self.not_modified,
+            "compressed": self.compressed,
+            "cached_bytes": sum(len(e.body) for e in self._entries.values()),
+        }
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag (weak comparison)."""
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def preferred_encoding(accept_encoding: str, available: Sequence[str]) -> str | None:
+    """
+    Pick the first of ``available`` content codings the client accepts.
+
+    ``available`` is in server preference order; codings refused with
+    ``q=0`` are skipped and ``*`` accepts anything not listed.
+    """
+    accepted: dict[str, bool] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        quality = params.replace(" ", "").removeprefix("q=")
+        try:
+            refused = bool(params) and float(quality) == 0
+        except ValueError:
+            refused = False
+        accepted[name.strip().lower()] = not refused
+
+    for encoding in available:
+        if accepted.get(encoding, accepted.get("*", False)):
+            return encoding
+    return None
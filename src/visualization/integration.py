@@ -23,6 +23,7 @@ First real-time visualization of internal agent reasoning:
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
 from ..agents.strategies.counterfactual_reasoning import (
     CounterfactualReasoningEngine,
@@ -30,7 +31,7 @@ from ..agents.strategies.counterfactual_reasoning import (
 from ..agents.strategies.hierarchical_composition import CompositeStrategy
 from ..agents.strategies.opponent_modeling import OpponentModel, OpponentModelingEngine
 from ..common.logger import get_logger
-from .analytics import AnalyticsEngine, get_analytics_engine
+from .analytics import AnalyticsEngine, get_analytics_engine, strategy_time_series
 from .dashboard import (
     CounterfactualVisualization,
     DashboardAPI,
@@ -426,37 +427,8 @@ class DashboardIntegration:
 
                 logger.info(f"[Integration] ✅ Successfully updated analytics for match {match_id}")
 
-                # Broadcast matchup matrix update
-                from dataclasses import asdict, is_dataclass
-                matchup_data = self.analytics_engine.get_matchup_matrix()
-
-                logger.info(f"[Integration] 🔍 DEBUG: Broadcasting matchup matrix, players={matchup_data.players}, matrix_size={len(matchup_data.matrix)}")
-
-                # Convert dataclass or Pydantic model to dict
-                if is_dataclass(matchup_data):
-                    matchup_dict = asdict(matchup_data)
-                elif hasattr(matchup_data, 'model_dump'):
-                    matchup_dict = matchup_data.model_dump()
-                elif hasattr(matchup_data, 'dict'):
-                    matchup_dict = matchup_data.dict()
-                else:
-                    matchup_dict = matchup_data
-
-                # Convert tuple keys to string keys for JSON serialization
-                if 'matrix' in matchup_dict and isinstance(matchup_dict['matrix'], dict):
-                    matchup_dict['matrix'] = {
-                        f"{k[0]}_vs_{k[1]}" if isinstance(k, tuple) else k: v
-                        for k, v in matchup_dict['matrix'].items()
-                    }
-
-                logger.info(f"[Integration] 🔍 DEBUG: About to broadcast matchup_matrix_update with {len(matchup_dict.get('matrix', {}))} matchups")
-
-                await self.dashboard.connection_manager.broadcast({
-                    "type": "matchup_matrix_update",
-                    "data": matchup_dict
-                })
-
-                logger.info("[Integration] ✅ Successfully broadcasted matchup matrix update")
+                # Broadcast matchup matrix update (built once per dashboard frame)
+                self.dashboard.publish("matchup_matrix", self._build_matchup_matrix_update)
 
                 logger.info(f"Updated matchup matrix for match {match_id}: {player1_id} vs {player2_id}, winner: {winner}")
 
@@ -498,7 +470,8 @@ class DashboardIntegration:
             logger.info(f"[Integration] 🔍 DEBUG: After update, engine has opponent models: {list(self.analytics_engine.opponent_models.keys())}")
 
             # Broadcast to dashboard
-            await self.dashboard.connection_manager.broadcast(
+            self.dashboard.publish(
+                f"opponent_model:{player_id}:{opponent_id}",
                 {
                     "type": "opponent_model_update",
                     "player_id": player_id,
@@ -561,7 +534,8 @@ class DashboardIntegration:
             )
 
             # Broadcast to dashboard
-            await self.dashboard.connection_manager.broadcast(
+            self.dashboard.publish(
+                f"counterfactual:{player_id}",
                 {
                     "type": "counterfactual_update",
                     "player_id": player_id,
@@ -648,7 +622,8 @@ class DashboardIntegration:
             state.recent_predictions = state.recent_predictions[-20:]
 
         # Stream to dashboard (custom message)
-        await self.dashboard.connection_manager.broadcast(
+        self.dashboard.publish(
+            f"opponent_model:{player_id}:{opponent_id}",
             {
                 "type": "opponent_model_update",
                 "player_id": player_id,
@@ -674,8 +649,12 @@ class DashboardIntegration:
         if not engine:
             return
 
-        # Get recent counterfactual analysis
-        recent_cfs = [cf for cf in engine.counterfactual_history if cf.round == round_num]
+        # Get recent counterfactual analysis (round-indexed lookup when available)
+        history = engine.counterfactual_history
+        if hasattr(history, "for_round"):
+            recent_cfs = history.for_round(round_num)
+        else:
+            recent_cfs = [cf for cf in history if cf.round == round_num]
 
         if not recent_cfs:
             return
@@ -703,7 +682,7 @@ class DashboardIntegration:
             ):
                 # Get first infoset's regret as a representative
                 if engine.regret_table.cumulative_regret:
-                    first_infoset = list(engine.regret_table.cumulative_regret.keys())[0]
+                    first_infoset = next(iter(engine.regret_table.cumulative_regret))
                     cumulative_regret = {
                         str(k): float(v)
                         for k, v in engine.regret_table.cumulative_regret[first_infoset].items()
@@ -721,7 +700,8 @@ class DashboardIntegration:
         )
 
         # Create visualization data
-        viz = CounterfactualVisualization(  # type: ignore[call-arg]
+        viz = CounterfactualVisualization(
+            round=round_num,
             actual_move=str(actual.actual_move),  # Convert int to str
             actual_reward=actual.actual_reward,
             counterfactuals=counterfactuals_list,
@@ -754,7 +734,8 @@ class DashboardIntegration:
         state.cumulative_regret = viz.cumulative_regret
 
         # Stream to dashboard
-        await self.dashboard.connection_manager.broadcast(
+        self.dashboard.publish(
+            f"counterfactual:{player_id}",
             {
                 "type": "counterfactual_update",
                 "player_id": player_id,
@@ -784,15 +765,13 @@ class DashboardIntegration:
 
         for analytics in all_analytics:
             # Stream enriched data to dashboard
-            await self.dashboard.connection_manager.broadcast(
+            self.dashboard.publish(
+                f"strategy_performance:{analytics.strategy_name}",
                 {
                     "type": "strategy_performance_update",
                     "strategy_name": analytics.strategy_name,
                     "data": {
-                        "rounds": analytics.rounds,
-                        "win_rates": analytics.win_rates,
-                        "avg_scores": analytics.avg_scores,
-                        "cumulative_scores": analytics.cumulative_scores,
+                        **strategy_time_series(analytics),
                         "learning_rate": analytics.learning_rate,
                         "consistency": analytics.consistency,
                         "improvement_trend": analytics.improvement_trend,
@@ -803,22 +782,17 @@ class DashboardIntegration:
             )
 
         # Also broadcast matchup matrix
-        matchup_matrix = self.analytics_engine.get_matchup_matrix()
-        await self.dashboard.connection_manager.broadcast(
-            {
-                "type": "matchup_matrix_update",
-                "data": {
-                    "players": matchup_matrix.players,
-                    "matrix": {f"{k[0]}_vs_{k[1]}": v for k, v in matchup_matrix.matrix.items()},
-                    "total_matches": matchup_matrix.total_matches,
-                    "finished_matches": matchup_matrix.finished_matches,
-                    "pending_matches": matchup_matrix.pending_matches,
-                },
-            }
-        )
+        self.dashboard.publish("matchup_matrix", self._build_matchup_matrix_update)
 
         logger.debug("Updated strategy performance metrics with analytics")
 
+    def _build_matchup_matrix_update(self) -> dict[str, Any]:
+        """Build the matchup matrix message (called when the frame is sent)."""
+        return {
+            "type": "matchup_matrix_update",
+            "data": self.analytics_engine.get_matchup_columns(),
+        }
+
     # ========================================================================
     # API Endpoints Data Providers
     # ========================================================================
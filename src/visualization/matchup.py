@@ -0,0 +1,425 @@
+"""
+Matchup Matrix
+==============
+
+Dense NumPy storage for head-to-head results.
+
+Players are interned to array indices, and wins, draws, score totals and
+last winners are kept in ``n x n`` arrays (row player's view of the
+column player), so recording a match is a few scalar writes and derived
+metrics (win rates, score differentials, dominance) are whole-array
+operations.
+
+``MatchupMatrix`` still reads and writes like the original
+``{(player_a, player_b): stats_dict}`` mapping; each value is a live view
+over the arrays.
+"""
+
+import io
+from collections import deque
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+import numpy as np
+
+# Matches kept per pair for the "recent matches" view
+MATCH_HISTORY_LENGTH = 20
+
+_INITIAL_CAPACITY = 16
+
+# Stats fields backed by the arrays (everything else is stored per pair)
+_ARRAY_FIELDS = (
+    "total_matches",
+    "player_a_wins",
+    "player_b_wins",
+    "draws",
+    "total_score_a",
+    "total_score_b",
+)
+_DERIVED_FIELDS = ("player_a", "player_b", "avg_score_diff", "last_winner", "match_history")
+
+
+class _PairStats(MutableMapping):
+    """Live dict-like view of one pair, oriented as (player_a, player_b)."""
+
+    __slots__ = ("_matrix", "_a", "_b")
+
+    def __init__(self, matrix: "MatchupMatrix", a: int, b: int):
+        self._matrix = matrix
+        self._a = a
+        self._b = b
+
+    def __getitem__(self, name: str) -> Any:
+        m, a, b = self._matrix, self._a, self._b
+        if name == "total_matches":
+            return int(m._matches[a, b])
+        if name == "player_a_wins":
+            return int(m._wins[a, b])
+        if name == "player_b_wins":
+            return int(m._wins[b, a])
+        if name == "draws":
+            return int(m._draws[a, b])
+        if name == "total_score_a":
+            return float(m._scores[a, b])
+        if name == "total_score_b":
+            return float(m._scores[b, a])
+        if name == "player_a":
+            return m._ids[a]
+        if name == "player_b":
+            return m._ids[b]
+        if name == "avg_score_diff":
+            matches = m._matches[a, b]
+            return float(abs(m._scores[a, b] - m._scores[b, a]) / matches) if matches else 0.0
+        if name == "last_winner":
+            winner = m._last_winner[a, b]
+            return m._ids[winner] if winner >= 0 else None
+        if name == "match_history":
+            history = m._history.get(m._pair_key(a, b), ())
+            if a > b:
+                return [_flip(entry) for entry in history]
+            return list(history)
+        return m._extra[m._pair_key(a, b)][name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        m, a, b = self._matrix, self._a, self._b
+        m.version += 1
+        if name == "total_matches":
+            m._matches[a, b] = m._matches[b, a] = value
+        elif name == "player_a_wins":
+            m._wins[a, b] = value
+        elif name == "player_b_wins":
+            m._wins[b, a] = value
+        elif name == "draws":
+            m._draws[a, b] = m._draws[b, a] = value
+        elif name == "total_score_a":
+            m._scores[a, b] = value
+        elif name == "total_score_b":
+            m._scores[b, a] = value
+        elif name == "last_winner":
+            index = m._index.get(value, -1) if value is not None else -1
+            m._last_winner[a, b] = m._last_winner[b, a] = index
+        elif name in ("player_a", "player_b", "avg_score_diff"):
+            pass  # Derived from the key and the arrays
+        elif name == "match_history":
+            history = m._history_for(a, b)
+            history.clear()
+            history.extend(_flip(e) if a > b else e for e in value)
+        else:
+            m._extra.setdefault(m._pair_key(a, b), {})[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        if name in _ARRAY_FIELDS or name in _DERIVED_FIELDS:
+            raise KeyError(f"{name} is a fixed matchup field")
+        self._matrix.version += 1
+        del self._matrix._extra[self._matrix._pair_key(self._a, self._b)][name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from ("player_a", "player_b", *_ARRAY_FIELDS, "match_history")
+        yield from ("avg_score_diff", "last_winner")
+        yield from self._matrix._extra.get(self._matrix._pair_key(self._a, self._b), ())
+
+    def __len__(self) -> int:
+        extra = self._matrix._extra.get(self._matrix._pair_key(self._a, self._b), ())
+        return len(_ARRAY_FIELDS) + len(_DERIVED_FIELDS) + len(extra)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _flip(entry: dict[str, Any]) -> dict[str, Any]:
+    return {**entry, "score_a": entry.get("score_b"), "score_b": entry.get("score_a")}
+
+
+class MatchupMatrix(MutableMapping):
+    """
+    Head-to-head results for every pair of players.
+
+    Mapping keys are ``(player_a, player_b)`` tuples (either order works for
+    lookups; iteration yields each pair once, sorted), values are live
+    stats views. Setting a key to a dict replaces that pair's stats.
+    """
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._index: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._allocate(max(1, capacity))
+        self._pair_count = 0
+        self._history: dict[tuple[int, int], deque[dict[str, Any]]] = {}
+        self._extra: dict[tuple[int, int], dict[str, Any]] = {}
+
+        # Bumped on every change (never reset, so it can validate cached responses)
+        self.version = 0
+
+    def _allocate(self, capacity: int) -> None:
+        def grow(old: np.ndarray | None, dtype: Any, fill: Any = 0) -> np.ndarray:
+            new = np.full((capacity, capacity), fill, dtype=dtype)
+            if old is not None:
+                n = old.shape[0]
+                new[:n, :n] = old
+            return new
+
+        self._present = grow(getattr(self, "_present", None), np.bool_)
+        self._matches = grow(getattr(self, "_matches", None), np.int32)
+        self._wins = grow(getattr(self, "_wins", None), np.int32)
+        self._draws = grow(getattr(self, "_draws", None), np.int32)
+        self._scores = grow(getattr(self, "_scores", None), np.float64)
+        self._last_winner = grow(getattr(self, "_last_winner", None), np.int32, -1)
+
+    @property
+    def players(self) -> list[str]:
+        """Interned player IDs in index order."""
+        return list(self._ids)
+
+    def intern(self, player_id: str) -> int:
+        """Get a player's array index, adding the player if needed."""
+        index = self._index.get(player_id)
+        if index is None:
+            index = len(self._ids)
+            if index >= self._present.shape[0]:
+                self._allocate(self._present.shape[0] * 2)
+            self._index[player_id] = index
+            self._ids.append(player_id)
+        return index
+
+    @staticmethod
+    def _pair_key(a: int, b: int) -> tuple[int, int]:
+        return (a, b) if a < b else (b, a)
+
+    def _history_for(self, a: int, b: int) -> deque[dict[str, Any]]:
+        key = self._pair_key(a, b)
+        history = self._history.get(key)
+        if history is None:
+            history = self._history[key] = deque(maxlen=MATCH_HISTORY_LENGTH)
+        return history
+
+    def _mark_present(self, a: int, b: int) -> None:
+        if not self._present[a, b]:
+            self._present[a, b] = self._present[b, a] = True
+            self._pair_count += 1
+
+    # ========================================================================
+    # Recording
+    # ========================================================================
+
+    def record(
+        self,
+        player1_id: str,
+        player2_id: str,
+        score1: float,
+        score2: float,
+        round_num: int | None = None,
+        moves: Mapping[str, Any] | None = None,
+    ) -> str | None:
+        """
+        Record a match result.
+
+        Returns:
+            Winner ID, or None for a draw
+        """
+        a, b = self.intern(player1_id), self.intern(player2_id)
+        self._mark_present(a, b)
+        self.version += 1
+
+        self._matches[a, b] += 1
+        self._matches[b, a] += 1
+        self._scores[a, b] += score1
+        self._scores[b, a] += score2
+
+        if score1 > score2:
+            self._wins[a, b] += 1
+            winner, winner_index = player1_id, a
+        elif score2 > score1:
+            self._wins[b, a] += 1
+            winner, winner_index = player2_id, b
+        else:
+            self._draws[a, b] += 1
+            self._draws[b, a] += 1
+            winner, winner_index = None, -1
+        self._last_winner[a, b] = self._last_winner[b, a] = winner_index
+
+        # History is stored oriented to the lower index
+        low_score, high_score = (score1, score2) if a < b else (score2, score1)
+        self._history_for(a, b).append(
+            {
+                "round": round_num,
+                "score_a": low_score,
+                "score_b": high_score,
+                "winner": winner,
+                "moves": dict(moves or {}),
+            }
+        )
+        return winner
+
+    # ========================================================================
+    # Mapping interface
+    # ========================================================================
+
+    def _indices(self, key: tuple[str, str]) -> tuple[int, int] | None:
+        a = self._index.get(key[0])
+        b = self._index.get(key[1])
+        if a is None or b is None or not self._present[a, b]:
+            return None
+        return a, b
+
+    def __getitem__(self, key: tuple[str, str]) -> _PairStats:
+        indices = self._indices(key)
+        if indices is None:
+            raise KeyError(key)
+        return _PairStats(self, *indices)
+
+    def __setitem__(self, key: tuple[str, str], stats: Mapping[str, Any]) -> None:
+        a, b = self.intern(key[0]), self.intern(key[1])
+        self.version += 1
+        self._clear_pair(a, b)
+        self._mark_present(a, b)
+        view = _PairStats(self, a, b)
+        for name, value in stats.items():
+            view[name] = value
+
+    def __delitem__(self, key: tuple[str, str]) -> None:
+        indices = self._indices(key)
+        if indices is None:
+            raise KeyError(key)
+        a, b = indices
+        self.version += 1
+        self._clear_pair(a, b)
+        self._present[a, b] = self._present[b, a] = False
+        self._pair_count -= 1
+
+    def _clear_pair(self, a: int, b: int) -> None:
+        for array in (self._matches, self._wins, self._draws, self._scores):
+            array[a, b] = array[b, a] = 0
+        self._last_winner[a, b] = self._last_winner[b, a] = -1
+        self._history.pop(self._pair_key(a, b), None)
+        self._extra.pop(self._pair_key(a, b), None)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, tuple) and len(key) == 2 and self._indices(key) is not None
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        rows, cols = self._pair_indices()
+        for a, b in zip(rows.tolist(), cols.tolist(), strict=True):
+            id_a, id_b = self._ids[a], self._ids[b]
+            yield (id_a, id_b) if id_a <= id_b else (id_b, id_a)
+
+    def __len__(self) -> int:
+        return self._pair_count
+
+    def clear(self) -> None:
+        """Drop all players and results."""
+        self.version += 1
+        self._index.clear()
+        self._ids.clear()
+        for name in ("_present", "_matches", "_wins", "_draws", "_scores", "_last_winner"):
+            delattr(self, name)
+        self._allocate(_INITIAL_CAPACITY)
+        self._pair_count = 0
+        self._history.clear()
+        self._extra.clear()
+
+    def to_dict(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """Materialize every pair as a plain stats dict."""
+        return {key: dict(self[key]) for key in self}
+
+    # ========================================================================
+    # Vectorized metrics
+    # ========================================================================
+
+    def _pair_indices(self) -> tuple[np.ndarray, ...]:
+        n = len(self._ids)
+        return np.nonzero(np.triu(self._present[:n, :n], 1))
+
+    @property
+    def total_matches(self) -> int:
+        """Number of matches recorded across all pairs."""
+        n = len(self._ids)
+        return int(np.triu(self._matches[:n, :n], 1).sum())
+
+    def win_rate_matrix(self) -> np.ndarray:
+        """Row player's win rate against each column player (NaN if unplayed)."""
+        n = len(self._ids)
+        matches = self._matches[:n, :n]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(matches > 0, self._wins[:n, :n] / matches, np.nan)
+
+    def score_differential_matrix(self) -> np.ndarray:
+        """Row player's average score margin against each column player (NaN if unplayed)."""
+        n = len(self._ids)
+        matches = self._matches[:n, :n]
+        scores = self._scores[:n, :n]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(matches > 0, (scores - scores.T) / matches, np.nan)
+
+    def dominance_ranking(self) -> list[dict[str, Any]]:
+        """
+        Rank players by head-to-head dominance.
+
+        Ordered by opponents beaten (more wins than losses against them),
+        then by net win rate ((wins - losses) / matches over all opponents).
+        """
+        n = len(self._ids)
+        if n == 0:
+            return []
+        wins = self._wins[:n, :n].astype(np.int64)
+        matches = self._matches[:n, :n].astype(np.int64)
+
+        beaten = (wins > wins.T).sum(axis=1)
+        played = matches.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            net = np.where(played > 0, (wins.sum(axis=1) - wins.sum(axis=0)) / played, 0.0)
+
+        order = np.lexsort((-net, -beaten))
+        return [
+            {
+                "rank": rank,
+                "player_id": self._ids[i],
+                "opponents_beaten": int(beaten[i]),
+                "net_win_rate": float(net[i]),
+                "matches": int(played[i]),
+            }
+            for rank, i in enumerate(order.tolist(), 1)
+        ]
+
+    # ========================================================================
+    # Export
+    # ========================================================================
+
+    def to_columns(self) -> dict[str, Any]:
+        """
+        Export played pairs as columns (one entry per pair).
+
+        ``a`` and ``b`` index into ``players``; ``last_winner`` is a player
+        index or -1 for a draw.
+        """
+        rows, cols = self._pair_indices()
+        matches = self._matches[rows, cols]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            win_rate_a = np.where(matches > 0, self._wins[rows, cols] / matches, 0.0)
+        return {
+            "players": list(self._ids),
+            "a": rows.tolist(),
+            "b": cols.tolist(),
+            "total_matches": matches.tolist(),
+            "a_wins": self._wins[rows, cols].tolist(),
+            "b_wins": self._wins[cols, rows].tolist(),
+            "draws": self._draws[rows, cols].tolist(),
+            "score_a": self._scores[rows, cols].tolist(),
+            "score_b": self._scores[cols, rows].tolist(),
+            "last_winner": self._last_winner[rows, cols].tolist(),
+            "win_rate_a": win_rate_a.tolist(),
+        }
+
+    def to_npz(self) -> bytes:
+        """Export the dense arrays as a compressed ``.npz`` archive."""
+        n = len(self._ids)
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            players=np.array(self._ids, dtype=np.str_),
+            matches=self._matches[:n, :n],
+            wins=self._wins[:n, :n],
+            draws=self._draws[:n, :n],
+            scores=self._scores[:n, :n],
+            last_winner=self._last_winner[:n, :n],
+        )
+        return buffer.getvalue()
@@ -0,0 +1,2273 @@
+        let ws = null;
+        let performanceData = {};
+        let opponentModelData = {};
+        let regretData = {};
+        let events = [];
+        let currentMatches = {}; // Store current match states by match_id
+        let playerLastMoves = {}; // Store last move for each player
+
+        function connectWebSocket() {
+            const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+            const host = window.location.host;
+            ws = new WebSocket(`${protocol}//${host}/ws`);
+
+            ws.onopen = () => {
+                document.getElementById('status').textContent = 'Connected';
+                document.getElementById('status').className = 'connection-status connected';
+                addLog('Connected to dashboard');
+            };
+
+            ws.onclose = () => {
+                document.getElementById('status').textContent = 'Disconnected';
+                document.getElementById('status').className = 'connection-status disconnected';
+                addLog('Disconnected from dashboard');
+            };
+
+            ws.onmessage = (event) => {
+                const message = JSON.parse(event.data);
+                handleMessage(message);
+            };
+
+            ws.onerror = (error) => {
+                console.error('WebSocket error:', error);
+                addLog('WebSocket error occurred', 'error');
+            };
+
+            // Send ping every 30 seconds
+            setInterval(() => {
+                if (ws && ws.readyState === WebSocket.OPEN) {
+                    ws.send('ping');
+                }
+            }, 30000);
+        }
+
+        function handleMessage(message) {
+            switch (message.type) {
+                case 'tournament_state':
+                    // Handle initial state on reconnect
+                    handleTournamentUpdate(message.data);
+                    addLog('Tournament state restored');
+                    break;
+                case 'state_update':
+                    // Handle events forwarded from state sync service
+                    const eventType = message.event_type;
+                    const eventData = message.data;
+
+                    if (eventType === 'strategy.performance') {
+                        handleStrategyPerformance(eventData);
+                    } else if (eventType === 'opponent.model.update') {
+                        handleOpponentModelUpdate(eventData);
+                    } else if (eventType === 'counterfactual.analysis') {
+                        handleCounterfactualUpdate(eventData);
+                    } else if (eventType === 'tournament.completed') {
+                        handleTournamentComplete(eventData);
+                    }
+                    break;
+                case 'game_event':
+                    handleGameEvent(message.data);
+                    break;
+                case 'tournament_update':
+                    handleTournamentUpdate(message.data);
+                    break;
+                case 'strategy_performance':
+                    handleStrategyPerformance(message.data);
+                    break;
+                case 'opponent_model_update':
+                    handleOpponentModelUpdate(message.data);
+                    break;
+                case 'counterfactual_update':
+                    handleCounterfactualUpdate(message.data);
+                    break;
+                case 'match_update':
+                    handleMatchUpdate(message.data);
+                    break;
+                case 'matchup_matrix_update':
+                    handleMatchupMatrixUpdate(message.data);
+                    break;
+                case 'tournament_complete':
+                    handleTournamentComplete(message.data);
+                    break;
+            }
+        }
+
+        function handleGameEvent(data) {
+            events.push(data);
+            console.log('Game event received:', data); // Debug logging
+            addLog(`Round ${data.round}: ${data.event_type}`);
+
+            // Update game arena when moves are made
+            if (data.event_type === 'move' || data.event_type === 'round_end') {
+                // Create match display from game event data
+                if (data.players && data.players.length >= 2) {
+                    const matchId = `Round_${data.round}_${data.players[0]}_vs_${data.players[1]}`;
+
+                    // Get or create match state
+                    if (!currentMatches[matchId]) {
+                        currentMatches[matchId] = {
+                            match_id: matchId,
+                            round: data.round,
+                            total_rounds: data.round,
+                            state: 'IN_PROGRESS',
+                            player_a: {
+                                id: data.players[0],
+                                name: getPlayerDisplayName(data.players[0]),
+                                strategy: getPlayerStrategy(data.players[0]),
+                                role: 'ODD',
+                                move: '',
+                                score: 0
+                            },
+                            player_b: {
+                                id: data.players[1],
+                                name: getPlayerDisplayName(data.players[1]),
+                                strategy: getPlayerStrategy(data.players[1]),
+                                role: 'EVEN',
+                                move: '',
+                                score: 0
+                            }
+                        };
+                    }
+
+                    const match = currentMatches[matchId];
+
+                    // Update moves and track last moves
+                    if (data.moves) {
+                        if (data.moves[data.players[0]]) {
+                            match.player_a.move = data.moves[data.players[0]];
+                            // Store last move for this player
+                            playerLastMoves[data.players[0]] = data.moves[data.players[0]];
+                            playerLastMoves[match.player_a.name] = data.moves[data.players[0]];
+                        }
+                        if (data.moves[data.players[1]]) {
+                            match.player_b.move = data.moves[data.players[1]];
+                            // Store last move for this player
+                            playerLastMoves[data.players[1]] = data.moves[data.players[1]];
+                            playerLastMoves[match.player_b.name] = data.moves[data.players[1]];
+                        }
+                    }
+
+                    // Update scores - for round_end events, scores field contains cumulative scores
+                    console.log('[DEBUG] Game event:', {
+                        type: data.event_type,
+                        scores: data.scores,
+                        metadata: data.metadata,
+                        players: data.players
+                    });
+
+                    // Only update scores on round_end events (scores are cumulative)
+                    if (data.event_type === 'round_end' && data.scores && Object.keys(data.scores).length > 0) {
+                        match.player_a.score = data.scores[data.players[0]] || 0;
+                        match.player_b.score = data.scores[data.players[1]] || 0;
+                        console.log('[DEBUG] Score updated:', match.player_a.score, '-', match.player_b.score);
+                    }
+
+                    // Update state
+                    match.state = data.event_type === 'round_end' ? 'FINISHED' : 'IN_PROGRESS';
+
+                    // Update game arena with all current matches
+                    updateGameArena(Object.values(currentMatches));
+
+                    // Refresh standings table to show updated last moves
+                    const tbody = document.getElementById('standings-tbody');
+                    if (tbody && tbody.innerHTML !== '<tr><td colspan="9" style="text-align: center; color: #a0aec0; padding: 40px;">No data yet</td></tr>') {
+                        // Trigger standings refresh by calling handleTournamentUpdate with current data
+                        // This will re-render the standings table with new last moves
+                        const currentRound = document.getElementById('current-round').textContent;
+                        const gameType = document.getElementById('game-type').textContent;
+                        const activePlayers = document.getElementById('active-players').textContent;
+
+                        // Extract current standings from table and re-render
+                        const rows = tbody.querySelectorAll('tr');
+                        if (rows.length > 0 && rows[0].querySelector('.player-name')) {
+                            const standings = Array.from(rows).map(row => {
+                                const playerName = row.querySelector('.player-name')?.textContent;
+                                const strategy = row.querySelector('.strategy-badge')?.textContent;
+                                const points = parseInt(row.querySelector('.score-cell')?.textContent || '0');
+                                const wins = parseInt(row.querySelector('.wins-cell')?.textContent || '0');
+                                const draws = parseInt(row.querySelector('.draws-cell')?.textContent || '0');
+                                const losses = parseInt(row.querySelector('.losses-cell')?.textContent || '0');
+                                const matches = parseInt(row.cells[7]?.textContent || '0');
+
+                                return {
+                                    player_id: playerName,
+                                    display_name: playerName,
+                                    strategy: strategy,
+                                    points: points,
+                                    wins: wins,
+                                    draws: draws,
+                                    losses: losses,
+                                    total_matches: matches
+                                };
+                            });
+
+                            updateStandingsTable(standings);
+                        }
+                    }
+
+                    // Add to event log with move details
+                    if (data.moves && Object.keys(data.moves).length > 0) {
+                        const movesText = Object.entries(data.moves)
+                            .filter(([_, move]) => move !== null && move !== undefined && move !== '')
+                            .map(([player, move]) => `${getPlayerDisplayName(player)}: ${move}`)
+                            .join(', ');
+                        if (movesText) {
+                            addLog(`🎲 Moves: ${movesText}`);
+                        }
+                    } else {
+                        console.log('No moves in event data:', data);
+                    }
+
+                    // Clean up finished matches after a delay
+                    if (data.event_type === 'round_end') {
+                        setTimeout(() => {
+                            delete currentMatches[matchId];
+                            updateGameArena(Object.values(currentMatches));
+                        }, 5000); // Keep for 5 seconds after round ends
+                    }
+                }
+            }
+        }
+
+        // Helper function to get player display name from standings
+        function getPlayerDisplayName(playerId) {
+            const tbody = document.getElementById('standings-tbody');
+            if (tbody) {
+                const rows = tbody.querySelectorAll('tr');
+                for (const row of rows) {
+                    const nameDiv = row.querySelector('.player-name');
+                    if (nameDiv && row.textContent.includes(playerId)) {
+                        return nameDiv.textContent.trim();
+                    }
+                }
+            }
+            return playerId;
+        }
+
+        // Helper function to get player strategy from standings
+        function getPlayerStrategy(playerId) {
+            const tbody = document.getElementById('standings-tbody');
+            if (tbody) {
+                const rows = tbody.querySelectorAll('tr');
+                for (const row of rows) {
+                    if (row.textContent.includes(playerId)) {
+                        const badge = row.querySelector('.strategy-badge');
+                        if (badge) {
+                            return badge.textContent.trim();
+                        }
+                    }
+                }
+            }
+            return 'unknown';
+        }
+
+        function handleTournamentUpdate(data) {
+            // Store tournament state globally for other functions to access
+            window.tournamentState = data;
+
+            document.getElementById('game-type').textContent = data.game_type || 'even_odd';
+            document.getElementById('current-round').textContent =
+                `${data.current_round || 0} / ${data.total_rounds || 0}`;
+
+            // Calculate active players from standings (more reliable than players array)
+            const activePlayers = data.standings ? data.standings.length : (data.players ? data.players.length : 0);
+            document.getElementById('active-players').textContent = activePlayers;
+
+            // Update enhanced standings table
+            updateStandingsTable(data.standings || []);
+
+            // Update active matches if present
+            if (data.active_matches && data.active_matches.length > 0) {
+                updateGameArena(data.active_matches);
+            }
+
+            // Update Standings Race chart if it's visible
+            const standingsView = document.getElementById('tournament-standings');
+            if (standingsView && !standingsView.classList.contains('hidden')) {
+                createStandingsRace();
+            }
+
+            // Initialize learning evolution charts if we have player data
+            if (data.standings && data.standings.length > 0) {
+                // Trigger initial chart updates after a short delay to allow data to load
+                setTimeout(() => {
+                    updateBeliefsChart();
+                    updateConfidenceEvolutionChart();
+                    updateRegretEvolutionChart();
+                    updateLearningCurve();
+                }, 500);
+            }
+        }
+
+        function updateStandingsTable(standings) {
+            const tbody = document.getElementById('standings-tbody');
+
+            if (!standings || standings.length === 0) {
+                tbody.innerHTML = '<tr><td colspan="9" style="text-align: center; color: #a0aec0; padding: 40px;">No data yet</td></tr>';
+                return;
+            }
+
+            tbody.innerHTML = standings.map((player, index) => {
+                const rank = index + 1;
+                let rankClass = 'rank-other';
+                if (rank === 1) rankClass = 'rank-1';
+                else if (rank === 2) rankClass = 'rank-2';
+                else if (rank === 3) rankClass = 'rank-3';
+
+                const playerId = player.player_id || player.player || `Player ${rank}`;
+                const playerName = player.display_name || player.player_name || playerId;
+                const strategy = player.strategy || 'Unknown';
+                const points = player.points || 0;
+                const wins = player.wins || player.total_wins || 0;
+                const draws = player.draws || 0;
+                const losses = player.losses || 0;
+                const matches = player.total_matches || player.matches_played || player.played || 0;
+                const winRate = matches > 0
+                    ? ((wins / matches) * 100).toFixed(1)
+                    : '0.0';
+
+                // Get last move for this player - prioritize standings data, then fall back to tracked moves
+                const lastMove = player.last_move || playerLastMoves[playerId] || playerLastMoves[playerName] || null;
+                const lastMoveDisplay = lastMove !== null && lastMove !== undefined && lastMove !== '-'
+                    ? `<span class="last-move-badge">${lastMove}</span>`
+                    : '<span style="color: #a0aec0;">-</span>';
+
+                // Update playerLastMoves cache with standings data
+                if (player.last_move) {
+                    playerLastMoves[playerId] = player.last_move;
+                    playerLastMoves[playerName] = player.last_move;
+                }
+
+                return `
+                    <tr>
+                        <td>
+                            <div class="rank-badge ${rankClass}">${rank}</div>
+                        </td>
+                        <td>
+                            <div class="player-cell">
+                                <div class="player-avatar">${playerName.substring(0, 2).toUpperCase()}</div>
+                                <div class="player-details">
+                                    <div class="player-name">${playerName}</div>
+                                    <span class="strategy-badge">${strategy}</span>
+                                </div>
+                            </div>
+                        </td>
+                        <td style="text-align: center; font-size: 20px; font-weight: bold;">${lastMoveDisplay}</td>
+                        <td class="score-cell">${points}</td>
+                        <td class="wins-cell">${wins}</td>
+                        <td class="draws-cell">${draws}</td>
+                        <td class="losses-cell">${losses}</td>
+                        <td>${matches}</td>
+                        <td class="winrate-cell">${winRate}%</td>
+                    </tr>
+                `;
+            }).join('');
+        }
+
+        function handleStrategyPerformance(data) {
+            performanceData[data.strategy_name] = data;
+            updatePerformanceChart();
+            // Also update learning evolution charts
+            updateBeliefsChart();
+            updateLearningCurve();
+        }
+
+        function handleOpponentModelUpdate(data) {
+            // Handle both old format and new format
+            if (data.model) {
+                opponentModelData[data.player_id] = data.model;
+            } else if (data.data) {
+                // New format from analytics
+                opponentModelData[data.player_id] = data.data;
+            }
+            updateOpponentModelChart();
+            updateConfidenceEvolutionChart();
+        }
+
+        function handleCounterfactualUpdate(data) {
+            // Handle both old format and new format
+            if (data.counterfactual) {
+                regretData[data.player_id] = data.counterfactual;
+            } else if (data.data) {
+                // New format from analytics
+                regretData[data.player_id] = data.data;
+            }
+            updateRegretChart();
+            updateRegretEvolutionChart();
+        }
+
+        function normalizeMatchupMatrix(data) {
+            // Expand the columnar export (one array per field) into the
+            // per-pair objects the views render; legacy payloads pass through
+            if (!data || !data.columns) {
+                return data;
+            }
+            const c = data.columns;
+            const matrix = {};
+            c.a.forEach((a, i) => {
+                const playerA = c.players[a];
+                const playerB = c.players[c.b[i]];
+                const total = c.total_matches[i];
+                const lastWinner = c.last_winner[i];
+                matrix[`${playerA}_vs_${playerB}`] = {
+                    player_a: playerA,
+                    player_b: playerB,
+                    total_matches: total,
+                    player_a_wins: c.a_wins[i],
+                    player_b_wins: c.b_wins[i],
+                    draws: c.draws[i],
+                    avg_score_diff: total > 0 ? (c.score_a[i] - c.score_b[i]) / total : 0,
+                    last_winner: lastWinner >= 0 ? c.players[lastWinner] : null
+                };
+            });
+            return { ...data.summary, players: data.players || [...c.players].sort(), matrix: matrix };
+        }
+
+        function handleMatchupMatrixUpdate(data) {
+            // Store matchup matrix data
+            window.matchupMatrixData = normalizeMatchupMatrix(data);
+            // Always update matrix view to keep data fresh
+            // (Even if not currently visible, it will be ready when user clicks the tab)
+            createMatchupMatrix();
+
+            // Also update head-to-head stats if it's visible or needs updating
+            const statsView = document.getElementById('tournament-stats');
+            if (statsView && !statsView.classList.contains('hidden')) {
+                createHeadToHeadStats();
+            }
+        }
+
+        function handleMatchUpdate(data) {
+            // Update game arena with match data
+            updateGameArena(data);
+        }
+
+        function updateGameArena(matchesData) {
+            const container = document.getElementById('active-matches');
+
+            // Handle both single match and array of matches
+            const matches = Array.isArray(matchesData) ? matchesData : [matchesData];
+
+            if (matches.length === 0 || (matches.length === 1 && !matches[0].match_id)) {
+                container.innerHTML = '<p style="color: #a0aec0; text-align: center; padding: 40px;">No active matches</p>';
+                return;
+            }
+
+            // Debug: Log match data to see round_history
+            console.log('[DEBUG] Match data:', matches.map(m => ({
+                match_id: m.match_id,
+                round_history_count: m.round_history ? m.round_history.length : 0,
+                round_history: m.round_history
+            })));
+
+            container.innerHTML = matches.map(match => {
+                const player_a = match.player_a || {};
+                const player_b = match.player_b || {};
+                const totalScore = (player_a.score || 0) + (player_b.score || 0);
+                const scorePercentage = totalScore > 0 ? ((player_a.score || 0) / totalScore * 100) : 50;
+
+                // Generate round history HTML
+                let roundHistoryHtml = '';
+                if (match.round_history && match.round_history.length > 0) {
+                    roundHistoryHtml = `
+                        <div class="round-history">
+                            <div class="round-history-title">Round Details:</div>
+                            <div class="round-history-items">
+                                ${match.round_history.map(round => {
+                                    const sumParity = round.sum_is_odd ? 'ODD' : 'EVEN';
+                                    const sumParityClass = round.sum_is_odd ? 'odd' : 'even';
+                                    const isPlayer1Winner = round.winner_id === player_a.id;
+                                    const isPlayer2Winner = round.winner_id === player_b.id;
+
+                                    return `
+                                        <div class="round-item">
+                                            <span class="round-label">R${round.round_number}</span>
+                                            <span class="round-moves ${isPlayer1Winner ? 'winner' : ''}">${player_a.name}: ${round.player1_move}</span>
+                                            <span class="round-plus">+</span>
+                                            <span class="round-moves ${isPlayer2Winner ? 'winner' : ''}">${player_b.name}: ${round.player2_move}</span>
+                                            <span class="round-equals">=</span>
+                                            <span class="round-sum ${sumParityClass}">${round.sum} (${sumParity})</span>
+                                            <span class="round-winner">→ ${round.winner_name || 'Unknown'} ✓</span>
+                                        </div>
+                                    `;
+                                }).join('')}
+                            </div>
+                        </div>
+                    `;
+                }
+
+                return `
+                    <div class="match-card ${match.state === 'IN_PROGRESS' ? 'active' : ''}">
+                        <div class="match-header">
+                            <span class="match-id">${match.match_id || 'Match'}</span>
+                            <span class="round-badge">Tournament Round ${match.round || 0}/${match.total_rounds || 0}</span>
+                            ${match.game_rounds ? `<span class="round-badge" style="background: #667eea;">Game Round ${match.game_round_current || 0}/${match.game_rounds}</span>` : ''}
+                        </div>
+
+                        <div class="player-slot">
+                            <div class="player-avatar">${(player_a.id || 'P1').substring(0,2)}</div>
+                            <div class="player-info">
+                                <div class="player-name">${player_a.name || player_a.id || 'Player A'}</div>
+                                <div>
+                                    <span class="strategy-badge">${player_a.strategy || 'unknown'}</span>
+                                    <span class="role-badge ${player_a.role || 'ODD'}">${player_a.role || 'ODD'}</span>
+                                </div>
+                            </div>
+                            ${player_a.move ? `<div class="move-display" title="Current move">${player_a.move}</div>` :
+                              (playerLastMoves[player_a.id] || playerLastMoves[player_a.name]) ?
+                              `<div class="move-display" style="opacity: 0.6; font-size: 28px;" title="Last move">${playerLastMoves[player_a.id] || playerLastMoves[player_a.name]}</div>` :
+                              ''}
+                        </div>
+
+                        <div class="vs-divider">VS</div>
+
+                        <div class="player-slot">
+                            <div class="player-avatar">${(player_b.id || 'P2').substring(0,2)}</div>
+                            <div class="player-info">
+                                <div class="player-name">${player_b.name || player_b.id || 'Player B'}</div>
+                                <div>
+                                    <span class="strategy-badge">${player_b.strategy || 'unknown'}</span>
+                                    <span class="role-badge ${player_b.role || 'EVEN'}">${player_b.role || 'EVEN'}</span>
+                                </div>
+                            </div>
+                            ${player_b.move ? `<div class="move-display" title="Current move">${player_b.move}</div>` :
+                              (playerLastMoves[player_b.id] || playerLastMoves[player_b.name]) ?
+                              `<div class="move-display" style="opacity: 0.6; font-size: 28px;" title="Last move">${playerLastMoves[player_b.id] || playerLastMoves[player_b.name]}</div>` :
+                              ''}
+                        </div>
+
+                        <div class="score-section">
+                            <div class="score-display">
+                                <span class="score-label">Score:</span>
+                                <span class="score-value">${player_a.score || 0} - ${player_b.score || 0}</span>
+                            </div>
+                            <div class="score-bar">
+                                <div class="score-fill" style="width: ${scorePercentage}%"></div>
+                            </div>
+                        </div>
+
+                        ${roundHistoryHtml}
+                    </div>
+                `;
+            }).join('');
+        }
+
+        function updatePerformanceChart() {
+            const traces = Object.values(performanceData).map(perf => ({
+                x: perf.time_series?.rounds || perf.rounds || [],
+                y: perf.time_series?.win_rates || perf.win_rates || [],
+                type: 'scatter',
+                mode: 'lines+markers',
+                name: perf.strategy_name,
+                line: { width: 2 }
+            }));
+
+            if (traces.length === 0 || traces.every(t => t.x.length === 0)) {
+                console.log('[PerformanceChart] No data to display');
+                return;
+            }
+
+            const layout = {
+                title: 'Win Rate Over Time',
+                xaxis: { title: 'Round', color: '#a0aec0', gridcolor: '#2a2f4a' },
+                yaxis: { title: 'Win Rate', color: '#a0aec0', gridcolor: '#2a2f4a' },
+                plot_bgcolor: '#0f1321',
+                paper_bgcolor: '#0f1321',
+                font: { color: '#e0e0e0' },
+                showlegend: true,
+                legend: { bgcolor: '#1a1f3a', bordercolor: '#2a2f4a', borderwidth: 1 }
+            };
+
+            Plotly.newPlot('performance-chart', traces, layout, {responsive: true});
+            console.log('[PerformanceChart] Chart updated with', traces.length, 'strategies');
+        }
+
+        function updateOpponentModelChart() {
+            const data = Object.values(opponentModelData);
+            const trace = {
+                x: data.map(m => m.opponent_id),
+                y: data.map(m => m.confidence),
+                type: 'bar',
+                marker: { color: '#667eea' }
+            };
+
+            const layout = {
+                title: 'Opponent Classification Confidence',
+                xaxis: { title: 'Opponent', color: '#a0aec0' },
+                yaxis: { title: 'Confidence', color: '#a0aec0', range: [0, 1] },
+                plot_bgcolor: '#0f1321',
+                paper_bgcolor: '#0f1321',
+                font: { color: '#e0e0e0' }
+            };
+
+            Plotly.newPlot('opponent-model-chart', [trace], layout, {responsive: true});
+        }
+
+        function updateRegretChart() {
+            const data = Object.values(regretData);
+            if (data.length === 0) {
+                console.log('[RegretChart] No data to display');
+                return;
+            }
+
+            // Aggregate cumulative regret across all players
+            const allRegrets = {};
+            data.forEach(playerData => {
+                const cumulative = playerData.cumulative_regret || {};
+                Object.entries(cumulative).forEach(([action, regret]) => {
+                    allRegrets[action] = (allRegrets[action] || 0) + regret;
+                });
+            });
+
+            if (Object.keys(allRegrets).length === 0) {
+                console.log('[RegretChart] No regret data available');
+                return;
+            }
+
+            const actions = Object.keys(allRegrets);
+            const regrets = Object.values(allRegrets);
+
+            const trace = {
+                x: actions,
+                y: regrets,
+                type: 'bar',
+                marker: {
+                    color: regrets.map(r => r > 0 ? '#ef4444' : '#10b981')
+                }
+            };
+
+            const layout = {
+                title: 'Cumulative Regret by Action',
+                xaxis: { title: 'Action', color: '#a0aec0' },
+                yaxis: { title: 'Cumulative Regret', color: '#a0aec0' },
+                plot_bgcolor: '#0f1321',
+                paper_bgcolor: '#0f1321',
+                font: { color: '#e0e0e0' }
+            };
+
+            Plotly.newPlot('regret-chart', [trace], layout, {responsive: true});
+            console.log('[RegretChart] Chart updated with', actions.length, 'actions');
+        }
+
+        function addLog(message, level = 'info') {
+            const logDiv = document.getElementById('event-log');
+            const timestamp = new Date().toLocaleTimeString();
+            const eventDiv = document.createElement('div');
+            eventDiv.className = 'event';
+            eventDiv.innerHTML = `<span class="timestamp">[${timestamp}]</span>${message}`;
+            logDiv.appendChild(eventDiv);
+            logDiv.scrollTop = logDiv.scrollHeight;
+        }
+
+        // Strategy Evolution Visualization Functions
+        function showEvolutionTab(tabName) {
+            // Hide all tab contents
+            document.querySelectorAll('.tab-content').forEach(el => el.classList.add('hidden'));
+            // Remove active class from all tabs
+            document.querySelectorAll('.tab-btn').forEach(el => el.classList.remove('active'));
+
+            // Show selected tab content
+            document.getElementById(`evolution-${tabName}`).classList.remove('hidden');
+            // Activate clicked tab button
+            event.target.classList.add('active');
+
+            // Trigger chart update for the selected tab
+            switch(tabName) {
+                case 'beliefs':
+                    updateBeliefsChart();
+                    break;
+                case 'confidence':
+                    updateConfidenceEvolutionChart();
+                    break;
+                case 'regret':
+                    updateRegretEvolutionChart();
+                    break;
+                case 'learning':
+                    updateLearningCurve();
+                    break;
+            }
+        }
+
+        function updateBeliefsChart() {
+            // Get player list and create ID-to-name mapping
+            let players = [];
+            const idToNameMap = {};
+            if (window.tournamentState && window.tournamentState.standings) {
+                window.tournamentState.standings.forEach(s => {
+                    const name = s.display_name || s.player_name || s.player_id || s.player || s.name;
+                    const id = s.player_id || s.player || name;
+                    idToNameMap[id] = name;
+                    players.push(name);
+                });
+                console.log('[Beliefs] Using player names from standings:', players);
+            }
+
+            if (players.length === 0) {
+                // Show placeholder
+                Plotly.newPlot('beliefs-chart', [], {
+                    title: 'Bayesian Belief Evolution - Waiting for data...',
+                    xaxis: { title: 'Round' },
+                    yaxis: { title: 'Belief Probability', range: [0, 1] },
+                    template: 'plotly_dark',
+                    paper_bgcolor: '#1a1f3a',
+                    plot_bgcolor: '#1a1f3a'
+                });
+                return;
+            }
+
+            // Fetch detailed opponent model data from API
+            Promise.all(players.map(pid =>
+                fetch(`/api/analytics/opponent_models/${pid}`)
+                    .then(r => r.json())
+                    .catch(() => null)
+            )).then(results => {
+                const traces = [];
+
+                results.forEach((data, idx) => {
+                    if (!data || !data.opponent_models) return;
+
+                    const playerName = players[idx];
+                    Object.entries(data.opponent_models).forEach(([oppId, model]) => {
+                        if (model.time_series && model.time_series.rounds.length > 0) {
+                            // Map opponent ID to display name, fallback to first 8 chars of ID
+                            const oppName = idToNameMap[oppId] || oppId.substring(0, 8);
+                            traces.push({
+                                x: model.time_series.rounds,
+                                y: model.time_series.confidence_history,
+                                name: `${playerName} → ${oppName} (${model.predicted_strategy})`,
+                                mode: 'lines+markers',
+                                line: { width: 2 },
+                                marker: { size: 6 }
+                            });
+                        }
+                    });
+                });
+
+                if (traces.length === 0) {
+                    traces.push({
+                        x: [1],
+                        y: [0.5],
+                        mode: 'markers',
+                        name: 'No data yet',
+                        marker: { size: 1, opacity: 0 }
+                    });
+                }
+
+                Plotly.newPlot('beliefs-chart', traces, {
+                    title: 'Opponent Model Confidence Evolution',
+                    xaxis: { title: 'Round' },
+                    yaxis: { title: 'Model Confidence', range: [0, 1] },
+                    template: 'plotly_dark',
+                    paper_bgcolor: '#1a1f3a',
+                    plot_bgcolor: '#1a1f3a'
+                });
+            });
+        }
+
+        function updateConfidenceEvolutionChart() {
+            // Get player list and create ID-to-name mapping
+            let players = [];
+            const idToNameMap = {};
+            if (window.tournamentState && window.tournamentState.standings) {
+                window.tournamentState.standings.forEach(s => {
+                    const name = s.display_name || s.player_name || s.player_id || s.player || s.name;
+                    const id = s.player_id || s.player || name;
+                    idToNameMap[id] = name;
+                    players.push(name);
+                });
+                console.log('[Confidence] Using player names from standings:', players);
+            }
+
+            if (players.length === 0) {
+                Plotly.newPlot('confidence-chart', [], {
+                    title: 'Opponent Model Confidence Evolution - Waiting for data...',
+                    xaxis: { title: 'Round' },
+                    yaxis: { title: 'Confidence', range: [0, 1] },
+                    template: 'plotly_dark',
+                    paper_bgcolor: '#1a1f3a',
+                    plot_bgcolor: '#1a1f3a'
+                });
+                return;
+            }
+
+            // Fetch detailed opponent model analytics from API (same as Bayesian Beliefs)
+            Promise.all(players.map(pid =>
+                fetch(`/api/analytics/opponent_models/${pid}`)
+                    .then(r => r.json())
+                    .catch(() => null)
+            )).then(results => {
+                const traces = [];
+
+                results.forEach((data, idx) => {
+                    if (!data || !data.opponent_models) return;
+
+                    const playerName = players[idx];
+                    Object.entries(data.opponent_models).forEach(([oppId, model]) => {
+                        if (model.time_series && model.time_series.rounds.length > 0) {
+                            // Map opponent ID to display name, fallback to first 8 chars of ID
+                            const oppName = idToNameMap[oppId] || oppId.substring(0, 8);
+                            traces.push({
+                                x: model.time_series.rounds,
+                                y: model.time_series.confidence_history,
+                                name: `${playerName} → ${oppName}`,
+                                mode: 'lines+markers',
+                                line: { width: 2 },
+                                marker: { size: 6 }
+                            });
+                        }
+                    });
+                });
+
+                if (traces.length === 0) {
+                    traces.push({
+                        x: [0],
+                        y: [0.5],
+                        mode: 'markers',
+                        name: 'No data yet',
+                        marker: { size: 1, opacity: 0 }
+                    });
+                }
+
+                Plotly.newPlot('confidence-chart', traces, {
+                    title: 'Opponent Model Confidence Evolution',
+                    xaxis: { title: 'Round' },
+                    yaxis: { title: 'Model Confidence', range: [0, 1] },
+                    template: 'plotly_dark',
+                    paper_bgcolor: '#1a1f3a',
+                    plot_bgcolor: '#1a1f3a'
+                });
+            }).catch(error => {
+                console.error('Failed to fetch confidence data:', error);
+            });
+        }
+
+        function updateRegretEvolutionChart() {
+            // Get player list and create ID-to-name mapping
+            let players = [];
+            const idToNameMap = {};
+            if (window.tournamentState && window.tournamentState.standings) {
+                window.tournamentState.standings.forEach(s => {
+                    const name = s.display_name || s.player_name || s.player_id || s.player || s.name;
+                    const id = s.player_id || s.player || name;
+                    idToNameMap[id] = name;
+                    players.push(name);
+                });
+                console.log('[Regret] Using player names from standings:', players);
+            }
+
+            if (players.length === 0) {
+                Plotly.newPlot('regret-chart-evolution', [], {
+                    title: 'Cumulative Regret Analysis (CFR) - Waiting for data...',
+                    xaxis: { title: 'Round' },
+                    yaxis: { title: 'Cumulative Regret' },
+                    template: 'plotly_dark',
+                    paper_bgcolor: '#1a1f3a',
+                    plot_bgcolor: '#1a1f3a'
+                });
+                return;
+            }
+
+            // Fetch detailed counterfactual analytics from API
+            Promise.all(players.map(pid =>
+                fetch(`/api/analytics/counterfactual/${pid}`)
+                    .then(r => r.json())
+                    .catch(() => null)
+            )).then(results => {
+                const traces = [];
+                let maxRound = 0;
+
+                results.forEach((data, idx) => {
+                    if (!data || !data.time_series) return;
+
+                    const playerName = players[idx];
+                    const regretByAction = data.time_series.regret_by_action || {};
+                    const rounds = data.time_series.rounds || [];
+
+                    if (rounds.length > 0) {
+                        maxRound = Math.max(maxRound, ...rounds);
+                    }
+
+                    // Create trace for each action
+                    Object.entries(regretByAction).forEach(([action, regrets]) => {
+                        if (regrets.length > 0) {
+                            traces.push({
+                                x: rounds.slice(0, regrets.length),
+                                y: regrets,
+                                name: `${playerName} - ${action}`,
+                                mode: 'lines',
+                                line: { width: 2 }
+                            });
+                        }
+                    });
+                });
+
+                if (traces.length === 0) {
+                    traces.push({
+                        x: [1],
+                        y: [0],
+                        mode: 'markers',
+                        name: 'No data yet',
+                        marker: { size: 1, opacity: 0 }
+                    });
+                    maxRound = 1;
+                }
+
+                Plotly.newPlot('regret-chart-evolution', traces, {
+                    title: 'Counterfactual Regret Minimization',
+                    xaxis: { title: 'Round' },
+                    yaxis: { title: 'Regret Value' },
+                    shapes: [{
+                        type: 'line',
+                        x0: 0, x1: maxRound,
+                        y0: 0, y1: 0,
+                        line: { color: 'red', width: 1, dash: 'dot' }
+                    }],
+                    template: 'plotly_dark',
+                    paper_bgcolor: '#1a1f3a',
+                    plot_bgcolor: '#1a1f3a'
+                });
+            });
+        }
+
+        function updateLearningCurve() {
+            // Fetch from analytics API
+            console.log('[LearningCurve] Fetching strategies data...');
+            fetch('/api/analytics/strategies')
+                .then(r => r.json())
+                .then(data => {
+                    const strategies = data.strategies || [];
+                    console.log('[LearningCurve] Strategies data:', strategies);
+
+                    if (strategies.length === 0) {
+                        Plotly.newPlot('learning-chart', [], {
+                            title: 'Learning Curve (Win Rate Over Time) - Waiting for data...',
+                            xaxis: { title: 'Round' },
+                            yaxis: { title: 'Win Rate', range: [0, 1] },
+                            template: 'plotly_dark',
+                            paper_bgcolor: '#1a1f3a',
+                            plot_bgcolor: '#1a1f3a'
+                        });
+                        return;
+                    }
+
+                    const traces = [];
+                    let maxRound = 0;
+
+                    strategies.forEach(strategy => {
+                        const rounds = strategy.time_series.rounds || [];
+                        const winRates = strategy.time_series.win_rates || [];
+                        console.log(`[LearningCurve] Strategy ${strategy.strategy_name}: rounds=${rounds.length}, winRates=${winRates.length}`);
+
+                        if (rounds.length > 0 && winRates.length > 0) {
+                            maxRound = Math.max(maxRound, ...rounds);
+
+                            // Main line
+                            traces.push({
+                                x: rounds,
+                                y: winRates,
+                                name: `${strategy.strategy_name} (${strategy.metrics.improvement_trend})`,
+                                mode: 'lines+markers',
+                                line: { width: 3, shape: 'spline' },
+                                marker: { size: 6 }
+                            });
+
+                            // Trendline
+                            if (rounds.length >= 2) {
+                                const trendline = calculateTrendline(rounds, winRates);
+                                traces.push({
+                                    x: rounds,
+                                    y: trendline,
+                                    name: `${strategy.strategy_name} trend`,
+                                    mode: 'lines',
+                                    line: { dash: 'dash', width: 1 },
+                                    showlegend: false,
+                                    hoverinfo: 'skip',
+                                    opacity: 0.5
+                                });
+                            }
+                        }
+                    });
+
+                    console.log(`[LearningCurve] Total traces: ${traces.length}`);
+
+                    if (traces.length === 0) {
+                        traces.push({
+                            x: [1],
+                            y: [0.5],
+                            mode: 'markers',
+                            name: 'No data yet',
+                            marker: { size: 1, opacity: 0 }
+                        });
+                        maxRound = 1;
+                    }
+
+                    Plotly.newPlot('learning-chart', traces, {
+                        title: 'Strategy Learning Curves (Win Rate Evolution)',
+                        xaxis: { title: 'Round' },
+                        yaxis: { title: 'Win Rate', range: [0, 1] },
+                        shapes: [{
+                            type: 'line',
+                            x0: 0, x1: maxRound,
+                            y0: 0.5, y1: 0.5,
+                            line: { color: 'yellow', width: 1, dash: 'dot' }
+                        }],
+                        template: 'plotly_dark',
+                        paper_bgcolor: '#1a1f3a',
+                        plot_bgcolor: '#1a1f3a',
+                        annotations: [{
+                            x: maxRound * 0.9,
+                            y: 0.5,
+                            text: 'Random baseline',
+                            showarrow: false,
+                            font: { color: 'yellow', size: 10 }
+                        }]
+                    });
+                })
+                .catch(error => {
+                    console.error('[LearningCurve] Failed to fetch learning curve data:', error);
+                });
+        }
+
+        function calculateTrendline(x, y) {
+            // Simple linear regression
+            const n = x.length;
+            const sumX = x.reduce((a, b) => a + b, 0);
+            const sumY = y.reduce((a, b) => a + b, 0);
+            const sumXY = x.reduce((sum, xi, i) => sum + xi * y[i], 0);
+            const sumX2 = x.reduce((sum, xi) => sum + xi * xi, 0);
+
+            const slope = (n * sumXY - sumX * sumY) / (n * sumX2 - sumX * sumX);
+            const intercept = (sumY - slope * sumX) / n;
+
+            return x.map(xi => slope * xi + intercept);
+        }
+
+        // Tournament Bracket/Flow Visualization Functions
+        function showTournamentView(viewName) {
+            // Hide all tournament views
+            document.querySelectorAll('.tournament-view').forEach(el => el.classList.add('hidden'));
+            // Remove active class from all view buttons
+            document.querySelectorAll('.view-btn').forEach(el => el.classList.remove('active'));
+
+            // Show selected view
+            document.getElementById(`tournament-${viewName}`).classList.remove('hidden');
+            // Activate clicked button
+            event.target.classList.add('active');
+
+            // Trigger update for the selected view
+            switch(viewName) {
+                case 'matrix':
+                    createMatchupMatrix();
+                    break;
+                case 'standings':
+                    createStandingsRace();
+                    break;
+                case 'stats':
+                    createHeadToHeadStats();
+                    break;
+            }
+        }
+
+        function createMatchupMatrix() {
+            // Show loading message
+            document.getElementById('matchup-matrix').innerHTML =
+                '<p style="text-align: center; color: #a0aec0; padding: 40px;">Loading matchup matrix...</p>';
+
+            // Use real data from analytics engine via WebSocket or fetch from API
+            if (!window.matchupMatrixData || !window.matchupMatrixData.players) {
+                // Fetch from API if not available
+                console.log('[MatchupMatrix] Fetching from API...');
+                fetch('/api/analytics/matchup_matrix')
+                    .then(response => {
+                        if (!response.ok) throw new Error('Failed to fetch');
+                        return response.json();
+                    })
+                    .then(data => {
+                        console.log('[MatchupMatrix] Fetched data:', data);
+                        window.matchupMatrixData = normalizeMatchupMatrix(data);
+                        renderMatchupMatrix(window.matchupMatrixData);
+                    })
+                    .catch(error => {
+                        console.error('[MatchupMatrix] Failed to fetch:', error);
+                        // Fallback to sample data
+                        renderMatchupMatrixFallback();
+                    });
+            } else {
+                console.log('[MatchupMatrix] Using cached data:', window.matchupMatrixData);
+                renderMatchupMatrix(window.matchupMatrixData);
+            }
+        }
+
+        function renderMatchupMatrix(data) {
+            const players = data.players || [];
+            // Check both 'matchups' and 'matrix' fields for compatibility
+            const matchups = data.matchups || data.matrix || {};
+
+            console.log('[MatchupMatrix] Rendering with players:', players, 'matchups:', matchups);
+
+            if (players.length === 0) {
+                document.getElementById('matchup-matrix').innerHTML =
+                    '<p style="text-align: center; color: #a0aec0; padding: 40px;">No matchup data available yet</p>';
+                return;
+            }
+
+            // Create player ID to display name mapping from tournament state
+            const playerNames = {};
+            if (window.tournamentState && window.tournamentState.standings) {
+                window.tournamentState.standings.forEach(s => {
+                    const playerId = s.player_id || s.player;
+                    const displayName = s.display_name || s.player_name || playerId;
+                    playerNames[playerId] = displayName;
+                });
+            }
+
+            // Function to get display name (fallback to ID if not found)
+            const getDisplayName = (playerId) => {
+                return playerNames[playerId] || playerId;
+            };
+
+            // Build matrix
+            const matrix = [];
+            players.forEach(p1 => {
+                const row = [];
+                players.forEach(p2 => {
+                    if (p1 === p2) {
+                        row.push({ value: null, text: '-', cssClass: '', title: 'Same player' });
+                    } else {
+                        // Find matchup (keys are ordered, so try both combinations)
+                        const key1 = `${p1}_vs_${p2}`;
+                        const key2 = `${p2}_vs_${p1}`;
+                        const matchup = matchups[key1] || matchups[key2];
+
+                        if (matchup && matchup.total_matches > 0) {
+                            // Determine result from p1's perspective
+                            let wins, losses, draws;
+                            if (matchup.player_a === p1) {
+                                wins = matchup.player_a_wins;
+                                losses = matchup.player_b_wins;
+                            } else {
+                                wins = matchup.player_b_wins;
+                                losses = matchup.player_a_wins;
+                            }
+                            draws = matchup.draws;
+
+                            // Determine cell style and text
+                            let cssClass, text, title;
+                            if (wins > losses) {
+                                cssClass = 'matrix-cell win';
+                                text = `W ${wins}-${losses}`;
+                            } else if (losses > wins) {
+                                cssClass = 'matrix-cell loss';
+                                text = `L ${losses}-${wins}`;
+                            } else {
+                                cssClass = 'matrix-cell draw';
+                                text = `D ${wins}-${losses}`;
+                            }
+
+                            if (draws > 0) {
+                                text += ` (${draws}D)`;
+                            }
+
+                            title = `${p1} vs ${p2}: ${wins}W-${losses}L-${draws}D (${matchup.total_matches} matches)`;
+
+                            row.push({
+                                value: matchup,
+                                text: text,
+                                cssClass: cssClass,
+                                title: title,
+                                p1: p1,
+                                p2: p2
+                            });
+                        } else {
+                            row.push({
+                                value: null,
+                                text: '...',
+                                cssClass: 'matrix-cell pending',
+                                title: 'No matches played yet'
+                            });
+                        }
+                    }
+                });
+                matrix.push(row);
+            });
+
+            // Render as interactive table
+            const html = `
+                <div class="matchup-matrix">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th></th>
+                                ${players.map(p => `<th>${getDisplayName(p)}</th>`).join('')}
+                            </tr>
+                        </thead>
+                        <tbody>
+                            ${players.map((p1, i) => `
+                                <tr>
+                                    <td>${getDisplayName(p1)}</td>
+                                    ${matrix[i].map((cell, j) => `
+                                        <td class="${cell.cssClass}"
+                                            ${cell.value ? `onclick="showMatchDetails('${cell.p1}', '${cell.p2}')"` : ''}
+                                            title="${cell.title}">
+                                            ${cell.text}
+                                        </td>
+                                    `).join('')}
+                                </tr>
+                            `).join('')}
+                        </tbody>
+                    </table>
+                </div>
+            `;
+
+            document.getElementById('matchup-matrix').innerHTML = html;
+        }
+
+        function renderMatchupMatrixFallback() {
+            // Fallback sample data
+            const html = `
+                <div class="matchup-matrix">
+                    <p style="text-align: center; color: #a0aec0; padding: 40px;">
+                        Loading matchup matrix...
+                    </p>
+                </div>
+            `;
+            document.getElementById('matchup-matrix').innerHTML = html;
+        }
+
+        function createStandingsRace() {
+            // Use real tournament data if available
+            if (!window.tournamentState || !window.tournamentState.standings) {
+                // Fallback message
+                document.getElementById('standings-race-chart').innerHTML =
+                    '<p style="text-align: center; color: #a0aec0; padding: 40px;">No tournament data available yet</p>';
+                return;
+            }
+
+            // Create player ID to display name mapping
+            const playerNames = {};
+            window.tournamentState.standings.forEach(s => {
+                const playerId = s.player_id || s.player;
+                const displayName = s.display_name || s.player_name || playerId;
+                playerNames[playerId] = displayName;
+            });
+
+            // Get current standings snapshot
+            const currentStandings = window.tournamentState.standings.map(s => ({
+                player_id: s.player_id || s.player,
+                display_name: playerNames[s.player_id || s.player],
+                points: s.points || 0
+            }));
+
+            // For now, show current standings as a bar chart
+            // TODO: Store standings history for animated progression
+            const sorted = [...currentStandings].sort((a, b) => b.points - a.points);
+
+            const data = [{
+                x: sorted.map(p => p.points),
+                y: sorted.map(p => p.display_name),
+                type: 'bar',
+                orientation: 'h',
+                marker: {
+                    color: sorted.map((_, i) => {
+                        const colors = ['#667eea', '#48c9b0', '#f39c12', '#e74c3c'];
+                        return colors[i % colors.length];
+                    })
+                },
+                text: sorted.map(p => p.points.toString()),
+                textposition: 'outside'
+            }];
+
+            const layout = {
+                title: `Tournament Standings - Round ${window.tournamentState.current_round || 0}`,
+                xaxis: {
+                    title: 'Points',
+                    range: [0, Math.max(...sorted.map(p => p.points), 10) + 2],
+                    color: '#a0aec0',
+                    gridcolor: '#2a2f4a'
+                },
+                yaxis: {
+                    title: '',
+                    color: '#a0aec0',
+                    gridcolor: '#2a2f4a'
+                },
+                paper_bgcolor: '#0f1321',
+                plot_bgcolor: '#0f1321',
+                font: { color: '#e0e0e0' },
+                height: 400,
+                margin: { l: 100, r: 50, t: 60, b: 60 }
+            };
+
+            Plotly.newPlot('standings-race-chart', data, layout, {responsive: true});
+        }
+
+        function createHeadToHeadStats() {
+            // Show loading message
+            document.getElementById('head-to-head-stats').innerHTML = `
+                <div style="text-align: center; color: #a0aec0; padding: 40px;">
+                    Loading head-to-head statistics...
+                </div>
+            `;
+
+            // Get actual matchup data from matchup matrix
+            const matchupData = window.matchupMatrixData;
+
+            if (!matchupData || !matchupData.matrix || Object.keys(matchupData.matrix).length === 0) {
+                // Try to fetch from API if not in memory
+                console.log('[H2H] Fetching matchup matrix from API...');
+                fetch('/api/analytics/matchup_matrix')
+                    .then(response => {
+                        if (!response.ok) throw new Error('Failed to fetch');
+                        return response.json();
+                    })
+                    .then(data => {
+                        console.log('[H2H] Fetched matchup matrix:', data);
+                        window.matchupMatrixData = normalizeMatchupMatrix(data);
+                        // Retry rendering with fetched data
+                        renderHeadToHeadStats(window.matchupMatrixData);
+                    })
+                    .catch(error => {
+                        console.error('[H2H] Failed to fetch matchup matrix:', error);
+                        document.getElementById('head-to-head-stats').innerHTML = `
+                            <div style="text-align: center; color: #a0aec0; padding: 40px;">
+                                No head-to-head statistics available yet.<br>
+                                Complete some matches to see statistics.
+                            </div>
+                        `;
+                    });
+                return;
+            }
+
+            console.log('[H2H] Using cached matchup matrix:', matchupData);
+            renderHeadToHeadStats(matchupData);
+        }
+
+        function renderHeadToHeadStats(matchupData) {
+            console.log('[H2H] Rendering with matchupData:', matchupData);
+
+            // Validate input
+            if (!matchupData || !matchupData.matrix) {
+                console.log('[H2H] No valid matchup data available');
+                document.getElementById('head-to-head-stats').innerHTML = `
+                    <div style="text-align: center; color: #a0aec0; padding: 40px;">
+                        No head-to-head statistics available yet.<br>
+                        Complete some matches to see statistics.
+                    </div>
+                `;
+                return;
+            }
+
+            // Create player ID to display name mapping
+            const playerNames = {};
+            if (window.tournamentState && window.tournamentState.standings) {
+                window.tournamentState.standings.forEach(s => {
+                    const playerId = s.player_id || s.player;
+                    const displayName = s.display_name || s.player_name || playerId;
+                    playerNames[playerId] = displayName;
+                });
+            }
+
+            // Function to get display name (fallback to ID if not found)
+            const getDisplayName = (playerId) => {
+                return playerNames[playerId] || playerId;
+            };
+
+            // Convert matchup matrix to h2h data
+            const h2hData = [];
+            const matrix = matchupData.matrix || {};
+            for (const [key, matchup] of Object.entries(matrix)) {
+                if (matchup.total_matches > 0) {
+                    const player1 = matchup.player_a;
+                    const player2 = matchup.player_b;
+                    const p1Name = getDisplayName(player1);
+                    const p2Name = getDisplayName(player2);
+
+                    h2hData.push({
+                        matchup: `${p1Name} vs ${p2Name}`,
+                        stats: {
+                            'Total Matches': matchup.total_matches,
+                            [`${p1Name} Wins`]: matchup.player_a_wins,
+                            [`${p2Name} Wins`]: matchup.player_b_wins,
+                            'Draws': matchup.draws || 0,
+                            'Avg Score Diff': matchup.avg_score_diff ? matchup.avg_score_diff.toFixed(1) : '0.0',
+                            'Last Winner': matchup.last_winner ? getDisplayName(matchup.last_winner) : 'N/A'
+                        }
+                    });
+                }
+            }
+
+            if (h2hData.length === 0) {
+                document.getElementById('head-to-head-stats').innerHTML = `
+                    <div style="text-align: center; color: #a0aec0; padding: 40px;">
+                        No head-to-head statistics available yet.<br>
+                        Complete some matches to see statistics.
+                    </div>
+                `;
+                return;
+            }
+
+            const html = `
+                <div class="h2h-stats-grid">
+                    ${h2hData.map(h2h => `
+                        <div class="h2h-card">
+                            <h4>${h2h.matchup}</h4>
+                            ${Object.entries(h2h.stats).map(([label, value]) => `
+                                <div class="h2h-stat">
+                                    <span class="h2h-label">${label}:</span>
+                                    <span class="h2h-value">${value}</span>
+                                </div>
+                            `).join('')}
+                        </div>
+                    `).join('')}
+                </div>
+            `;
+
+            document.getElementById('head-to-head-stats').innerHTML = html;
+        }
+
+        function showMatchDetails(player1, player2) {
+            // Placeholder for showing detailed match information
+            alert(`Match Details: ${player1} vs ${player2}
+
+This would show:
+- Round by round scores
+- Move history
+- Strategy used
+- Key moments`);
+        }
+
+        // Replay Manager Class
+        class ReplayManager {
+            constructor() {
+                this.history = [];
+                this.currentIndex = 0;
+                this.isPlaying = false;
+                this.playbackSpeed = 1;
+                this.playbackInterval = null;
+                this.snapshots = [];
+                this.initialized = false;
+            }
+
+            initialize() {
+                // Generate sample replay data
+                this.history = this.generateSampleHistory();
+                this.initialized = true;
+                this.updateUI();
+                this.updateSliderMax();
+                addLog(`Replay initialized with ${this.history.length} rounds`);
+            }
+
+            generateSampleHistory() {
+                // Sample tournament history data
+                const rounds = [];
+                for (let i = 0; i < 10; i++) {
+                    rounds.push({
+                        round: i,
+                        matches: [
+                            {
+                                match_id: `R${i}M1`,
+                                player_a: { id: 'Player_1', name: 'Player_1', strategy: 'adaptive', role: 'ODD', move: Math.floor(Math.random() * 10) + 1, score: i },
+                                player_b: { id: 'Player_2', name: 'Player_2', strategy: 'random', role: 'EVEN', move: Math.floor(Math.random() * 10) + 1, score: 10 - i },
+                                state: 'FINISHED',
+                                round: i + 1,
+                                total_rounds: 5
+                            }
+                        ],
+                        standings: [
+                            { player_id: 'Player_1', score: i * 3, wins: i, losses: 0 },
+                            { player_id: 'Player_2', score: (10 - i) * 3, wins: 10 - i, losses: i },
+                            { player_id: 'Player_3', score: i * 2, wins: i, losses: 1 },
+                            { player_id: 'Player_4', score: i, wins: 0, losses: i }
+                        ],
+                        timestamp: new Date(Date.now() - (10 - i) * 60000).toISOString()
+                    });
+                }
+                return rounds;
+            }
+
+            loadHistory(data) {
+                this.history = data.rounds || [];
+                this.initialized = true;
+                this.currentIndex = 0;
+                this.updateSliderMax();
+                this.updateUI();
+            }
+
+            updateSliderMax() {
+                const slider = document.getElementById('timeline-slider');
+                slider.max = Math.max(0, this.history.length - 1);
+                document.getElementById('total-rounds-display').textContent = `/ ${this.history.length}`;
+            }
+
+            jumpTo(index) {
+                if (!this.initialized) this.initialize();
+                this.currentIndex = Math.max(0, Math.min(index, this.history.length - 1));
+                this.updateDisplay();
+            }
+
+            stepForward() {
+                if (!this.initialized) this.initialize();
+                if (this.currentIndex < this.history.length - 1) {
+                    this.currentIndex++;
+                    this.updateDisplay();
+                }
+            }
+
+            stepBack() {
+                if (!this.initialized) this.initialize();
+                if (this.currentIndex > 0) {
+                    this.currentIndex--;
+                    this.updateDisplay();
+                }
+            }
+
+            togglePlay() {
+                if (!this.initialized) this.initialize();
+
+                this.isPlaying = !this.isPlaying;
+                const btn = document.getElementById('play-pause-btn');
+                const statusText = document.getElementById('replay-status-text');
+
+                if (this.isPlaying) {
+                    btn.textContent = '⏸️';
+                    btn.classList.add('playing');
+                    statusText.textContent = 'Playing...';
+                    statusText.classList.add('playing');
+                    this.startPlayback();
+                } else {
+                    btn.textContent = '▶️';
+                    btn.classList.remove('playing');
+                    statusText.textContent = 'Paused';
+                    statusText.classList.remove('playing');
+                    this.stopPlayback();
+                }
+            }
+
+            startPlayback() {
+                const intervalMs = 1000 / this.playbackSpeed;
+                this.playbackInterval = setInterval(() => {
+                    if (this.currentIndex < this.history.length - 1) {
+                        this.stepForward();
+                    } else {
+                        this.togglePlay();  // Auto-pause at end
+                        addLog('Replay finished');
+                    }
+                }, intervalMs);
+            }
+
+            stopPlayback() {
+                if (this.playbackInterval) {
+                    clearInterval(this.playbackInterval);
+                    this.playbackInterval = null;
+                }
+            }
+
+            updateDisplay() {
+                const roundData = this.history[this.currentIndex];
+
+                // Update all visualizations with historical data
+                if (roundData.matches && roundData.matches.length > 0) {
+                    updateGameArena(roundData.matches);
+                }
+
+                // Update UI elements
+                this.updateUI();
+            }
+
+            updateUI() {
+                document.getElementById('timeline-slider').value = this.currentIndex;
+                document.getElementById('current-round-display').textContent = `Round ${this.currentIndex}`;
+
+                // Update timeline gradient based on progress
+                const progress = this.history.length > 0 ? (this.currentIndex / (this.history.length - 1)) * 100 : 0;
+                const slider = document.getElementById('timeline-slider');
+                slider.style.background = `linear-gradient(to right, #667eea ${progress}%, rgba(102, 126, 234, 0.3) ${progress}%)`;
+            }
+
+            captureSnapshot() {
+                if (!this.initialized) {
+                    alert('Please initialize replay first');
+                    return;
+                }
+
+                const snapshot = {
+                    round: this.currentIndex,
+                    timestamp: new Date().toISOString(),
+                    data: this.history[this.currentIndex]
+                };
+                this.snapshots.push(snapshot);
+
+                document.getElementById('snapshots-count').textContent = `Snapshots: ${this.snapshots.length}`;
+                addLog(`Snapshot captured at Round ${this.currentIndex}`);
+            }
+
+            compareSnapshots() {
+                if (this.snapshots.length < 2) {
+                    alert('Capture at least 2 snapshots to compare');
+                    return;
+                }
+
+                const snap1 = this.snapshots[this.snapshots.length - 2];
+                const snap2 = this.snapshots[this.snapshots.length - 1];
+
+                const comparison = `
+Snapshot Comparison:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Snapshot 1: Round ${snap1.round}
+Timestamp: ${new Date(snap1.timestamp).toLocaleString()}
+Matches: ${snap1.data.matches?.length || 0}
+
+Snapshot 2: Round ${snap2.round}
+Timestamp: ${new Date(snap2.timestamp).toLocaleString()}
+Matches: ${snap2.data.matches?.length || 0}
+
+Round Difference: ${snap2.round - snap1.round}
+                `;
+
+                alert(comparison);
+                addLog('Compared last 2 snapshots');
+            }
+
+            exportReplay() {
+                if (!this.initialized) {
+                    alert('No replay data to export');
+                    return;
+                }
+
+                const exportData = {
+                    tournament_id: 'replay_export',
+                    total_rounds: this.history.length,
+                    history: this.history,
+                    snapshots: this.snapshots,
+                    exported_at: new Date().toISOString()
+                };
+
+                const blob = new Blob([JSON.stringify(exportData, null, 2)], {
+                    type: 'application/json'
+                });
+                const url = URL.createObjectURL(blob);
+                const a = document.createElement('a');
+                a.href = url;
+                a.download = `tournament_replay_${Date.now()}.json`;
+                a.click();
+                URL.revokeObjectURL(url);
+
+                addLog('Replay data exported');
+            }
+        }
+
+        // Global replay manager instance
+        const replayManager = new ReplayManager();
+
+        // Control functions (called from HTML)
+        function replayJumpStart() {
+            replayManager.jumpTo(0);
+        }
+
+        function replayJumpEnd() {
+            replayManager.jumpTo(replayManager.history.length - 1);
+        }
+
+        function replayStepForward() {
+            replayManager.stepForward();
+        }
+
+        function replayStepBack() {
+            replayManager.stepBack();
+        }
+
+        function replayTogglePlay() {
+            replayManager.togglePlay();
+        }
+
+        function replayScrub(value) {
+            replayManager.jumpTo(parseInt(value));
+        }
+
+        function setPlaybackSpeed(speed) {
+            replayManager.playbackSpeed = parseFloat(speed);
+            if (replayManager.isPlaying) {
+                replayManager.stopPlayback();
+                replayManager.startPlayback();
+            }
+            addLog(`Playback speed set to ${speed}x`);
+        }
+
+        function captureSnapshot() {
+            replayManager.captureSnapshot();
+        }
+
+        function compareSnapshots() {
+            replayManager.compareSnapshots();
+        }
+
+        function exportReplay() {
+            replayManager.exportReplay();
+        }
+
+        // Winner Celebration Functions
+        function showWinnerCelebration(winner) {
+            const modal = document.getElementById('winner-modal');
+
+            // Populate winner data with priority on display names
+            const winnerName = winner.display_name || winner.player_name || winner.player_id || 'Champion';
+            document.getElementById('winner-avatar').textContent = winnerName.substring(0, 2).toUpperCase();
+            document.getElementById('winner-name').textContent = winnerName;
+            document.getElementById('winner-strategy').textContent = `Strategy: ${winner.strategy || 'Unknown'}`;
+            document.getElementById('winner-wins').textContent = winner.wins || 0;
+            document.getElementById('winner-points').textContent = winner.points || 0;
+            document.getElementById('winner-winrate').textContent = `${(winner.win_rate || 0).toFixed(1)}%`;
+
+            // Show modal
+            modal.classList.remove('hidden');
+
+            // Create confetti
+            createConfetti();
+
+            // Log event
+            addLog(`🏆 Tournament Winner: ${winnerName}`);
+        }
+
+        function createConfetti() {
+            const container = document.getElementById('confetti-container');
+            container.innerHTML = ''; // Clear existing confetti
+
+            const colors = ['#ffd700', '#ff6b6b', '#4ecdc4', '#45b7d1', '#f7b731', '#5f27cd'];
+            const confettiCount = 100;
+
+            for (let i = 0; i < confettiCount; i++) {
+                const confetti = document.createElement('div');
+                confetti.className = 'confetti-piece';
+                confetti.style.left = Math.random() * 100 + '%';
+                confetti.style.animationDelay = Math.random() * 3 + 's';
+                confetti.style.animationDuration = (Math.random() * 2 + 2) + 's';
+                confetti.style.backgroundColor = colors[Math.floor(Math.random() * colors.length)];
+                confetti.style.width = (Math.random() * 10 + 5) + 'px';
+                confetti.style.height = (Math.random() * 10 + 5) + 'px';
+                container.appendChild(confetti);
+            }
+        }
+
+        function closeWinnerModal() {
+            const modal = document.getElementById('winner-modal');
+            modal.classList.add('hidden');
+        }
+
+        // Handle tournament completion with winner celebration
+        function handleTournamentComplete(data) {
+            // Support both direct data and event-wrapped data
+            const winnerDetails = data.winner_details || data.metadata?.winner_details;
+            const winnerId = data.winner || winnerDetails?.player_id;
+
+            addLog(`🏆 Tournament Complete! Winner: ${winnerDetails?.display_name || winnerId || 'Unknown'}`);
+
+            // Show winner celebration if we have winner details
+            if (winnerId && winnerDetails) {
+                setTimeout(() => {
+                    showWinnerCelebration(winnerDetails);
+                }, 500);
+            } else if (winnerId) {
+                // Fallback: construct basic winner data from standings
+                const standings = document.getElementById('standings-tbody');
+                if (standings && standings.firstElementChild) {
+                    // Get top player from standings
+                    const topPlayerRow = standings.firstElementChild;
+                    const playerName = topPlayerRow.querySelector('.player-name')?.textContent || winnerId;
+                    const wins = parseInt(topPlayerRow.querySelector('.wins-cell')?.textContent || '0');
+                    const points = parseFloat(topPlayerRow.querySelector('.score-cell')?.textContent || '0');
+                    const winRate = parseFloat(topPlayerRow.querySelector('.winrate-cell')?.textContent || '0');
+
+                    setTimeout(() => {
+                        showWinnerCelebration({
+                            player_id: winnerId,
+                            display_name: playerName,
+                            wins: wins,
+                            points: points,
+                            win_rate: winRate,
+                            strategy: topPlayerRow.querySelector('.strategy-badge')?.textContent || 'Unknown'
+                        });
+                    }, 500);
+                }
+            }
+        }
+
+        function startTournament() {
+            // Show loading indicator
+            const statusEl = document.getElementById('status');
+            const originalText = statusEl.textContent;
+            statusEl.textContent = 'Starting...';
+            statusEl.className = 'connection-status';
+            statusEl.style.background = '#27ae60';
+
+            addLog('🚀 Starting tournament...', 'info');
+
+            // Call dashboard's start API (which proxies to league manager)
+            fetch('/api/league/start', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' }
+            })
+            .then(r => r.json())
+            .then(response => {
+                console.log('Start response:', response);
+                if (response.success) {
+                    // Restore status
+                    statusEl.textContent = 'Connected';
+                    statusEl.className = 'connection-status connected';
+                    statusEl.style.background = '';
+
+                    const data = response.data || {};
+                    const players = data.players || 0;
+                    const rounds = data.rounds || 0;
+
+                    addLog('✅ Tournament started successfully!', 'success');
+                    addLog(`👥 Players: ${players} | 🎯 Rounds: ${rounds}`, 'info');
+                    addLog('💡 Run rounds: uv run python -m src.main --run-round', 'info');
+
+                    // Show success message
+                    alert(`Tournament started successfully!\n\nPlayers: ${players}\nRounds: ${rounds}\n\nYou can now run rounds with:\nuv run python -m src.main --run-round`);
+                } else {
+                    statusEl.textContent = originalText;
+                    statusEl.className = 'connection-status connected';
+                    statusEl.style.background = '';
+                    const errorMsg = response.error || 'Unknown error';
+                    addLog('❌ Failed to start: ' + errorMsg, 'error');
+                    alert('Failed to start tournament:\n' + errorMsg);
+                }
+            })
+            .catch(error => {
+                console.error('Start error:', error);
+                statusEl.textContent = originalText;
+                statusEl.className = 'connection-status connected';
+                statusEl.style.background = '';
+                addLog('❌ Error starting tournament: ' + error.message, 'error');
+                alert('Error starting tournament:\n' + error.message);
+            });
+        }
+
+        function runRound() {
+            // Show loading indicator
+            const statusEl = document.getElementById('status');
+            const originalText = statusEl.textContent;
+            statusEl.textContent = 'Running Round...';
+            statusEl.className = 'connection-status';
+            statusEl.style.background = '#3498db';
+
+            addLog('▶️ Running next round...', 'info');
+
+            // Call dashboard's run_round API (which proxies to league manager)
+            fetch('/api/league/run_round', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' }
+            })
+            .then(r => r.json())
+            .then(response => {
+                console.log('Run round response:', response);
+                if (response.success) {
+                    // Restore status
+                    statusEl.textContent = 'Connected';
+                    statusEl.className = 'connection-status connected';
+                    statusEl.style.background = '';
+
+                    const data = response.data || {};
+                    const roundNum = data.round || '?';
+                    const matches = data.matches || [];
+
+                    addLog(`✅ Round ${roundNum} started with ${matches.length} matches!`, 'success');
+                    addLog('🎮 Matches are now playing...', 'info');
+                } else {
+                    statusEl.textContent = originalText;
+                    statusEl.className = 'connection-status connected';
+                    statusEl.style.background = '';
+                    const errorMsg = response.error || 'Unknown error';
+                    addLog('❌ Failed to run round: ' + errorMsg, 'error');
+
+                    // Check if it's "all rounds completed" message
+                    if (errorMsg.includes('All rounds completed') || errorMsg.includes('already completed') || errorMsg.includes('Tournament is completed')) {
+                        alert('🏆 Tournament Completed!\n\n' + errorMsg + '\n\nClick "Reset Tournament" to start a new one.');
+                    } else {
+                        alert('Failed to run round:\n' + errorMsg);
+                    }
+                }
+            })
+            .catch(error => {
+                console.error('Run round error:', error);
+                statusEl.textContent = originalText;
+                statusEl.className = 'connection-status connected';
+                statusEl.style.background = '';
+                addLog('❌ Error running round: ' + error.message, 'error');
+                alert('Error running round:\n' + error.message);
+            });
+        }
+
+        function clearData() {
+            if (!confirm('Are you sure you want to reset the tournament? This will clear all match history and scores, but keep players registered.')) {
+                return;
+            }
+
+            // Show loading indicator
+            const statusEl = document.getElementById('status');
+            const originalText = statusEl.textContent;
+            statusEl.textContent = 'Resetting...';
+            statusEl.className = 'connection-status';
+            statusEl.style.background = '#f39c12';
+
+            addLog('🔄 Resetting tournament...', 'info');
+
+            // Call dashboard's reset API (which proxies to league manager)
+            fetch('/api/league/reset', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' }
+            })
+            .then(r => r.json())
+            .then(response => {
+                console.log('Reset response:', response);
+                if (response.success) {
+                    // Clear frontend data
+                    performanceData = {};
+                    opponentModelData = {};
+                    regretData = {};
+                    events = [];
+                    currentMatches = {};
+                    playerLastMoves = {};
+                    window.matchupMatrixData = null;
+                    window.tournamentState = null;
+
+                    // Clear displays
+                    document.getElementById('event-log').innerHTML = '';
+                    document.getElementById('standings-tbody').innerHTML = '<tr><td colspan="9" style="text-align: center; color: #a0aec0; padding: 40px;">Tournament reset. Waiting for new league...</td></tr>';
+                    document.getElementById('active-matches').innerHTML = '<p style="text-align: center; color: #a0aec0;">No active matches</p>';
+                    document.getElementById('game-type').textContent = '-';
+                    document.getElementById('current-round').textContent = '-';
+                    document.getElementById('active-players').textContent = '-';
+
+                    // Clear tournament flow sections
+                    document.getElementById('matchup-matrix').innerHTML = '<p style="text-align: center; color: #a0aec0; padding: 40px;">No matches yet</p>';
+                    document.getElementById('head-to-head-stats').innerHTML = '<p style="text-align: center; color: #a0aec0; padding: 40px;">No statistics yet</p>';
+                    document.getElementById('standings-race-chart').innerHTML = '<p style="text-align: center; color: #a0aec0; padding: 40px;">No standings yet</p>';
+
+                    // Purge all Plotly charts in Strategy Learning Evolution
+                    try {
+                        Plotly.purge('beliefs-chart');
+                        Plotly.purge('confidence-chart');
+                        Plotly.purge('regret-chart-evolution');
+                        Plotly.purge('learning-chart');
+                        Plotly.purge('performance-chart');
+                        console.log('[Reset] All Plotly charts purged');
+                    } catch (e) {
+                        console.error('[Reset] Error purging charts:', e);
+                    }
+
+                    // Clear chart containers
+                    document.getElementById('beliefs-chart').innerHTML = '<p style="text-align: center; color: #a0aec0; padding: 40px;">Waiting for data...</p>';
+                    document.getElementById('confidence-chart').innerHTML = '<p style="text-align: center; color: #a0aec0; padding: 40px;">Waiting for data...</p>';
+                    document.getElementById('regret-chart-evolution').innerHTML = '<p style="text-align: center; color: #a0aec0; padding: 40px;">Waiting for data...</p>';
+                    document.getElementById('learning-chart').innerHTML = '<p style="text-align: center; color: #a0aec0; padding: 40px;">Waiting for data...</p>';
+
+                    // Restore status
+                    statusEl.textContent = 'Connected';
+                    statusEl.className = 'connection-status connected';
+                    statusEl.style.background = '';
+
+                    addLog('✅ Tournament reset successfully!', 'success');
+                    addLog('💡 Run: uv run python -m src.main --start-league', 'info');
+
+                    // Show success message
+                    alert('Tournament reset successfully!\n\nYou can now start a new league by running:\nuv run python -m src.main --start-league');
+                } else {
+                    statusEl.textContent = originalText;
+                    statusEl.className = 'connection-status connected';
+                    statusEl.style.background = '';
+                    const errorMsg = response.error || response.result?.error || response.message || 'Unknown error';
+                    addLog('Failed to reset: ' + errorMsg, 'error');
+                    alert('Failed to reset tournament:\n' + errorMsg);
+                }
+            })
+            .catch(error => {
+                console.error('Reset error:', error);
+                statusEl.textContent = originalText;
+                statusEl.className = 'connection-status connected';
+                statusEl.style.background = '';
+                addLog('Error resetting tournament: ' + error.message, 'error');
+                alert('Error resetting tournament:\n' + error.message);
+            });
+        }
+
+        function exportData() {
+            // Fetch comprehensive analytics from API
+            addLog('Exporting comprehensive analytics...');
+
+            fetch('/api/analytics/export')
+                .then(r => r.json())
+                .then(analyticsData => {
+                    // Combine analytics with current dashboard data
+                    const data = {
+                        ...analyticsData,
+                        dashboard_state: {
+                            performance: performanceData,
+                            opponentModels: opponentModelData,
+                            regrets: regretData,
+                            events: events
+                        },
+                        exported_by: 'dashboard',
+                        format_version: '2.0'
+                    };
+
+                    const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
+                    const url = URL.createObjectURL(blob);
+                    const a = document.createElement('a');
+                    a.href = url;
+                    a.download = `tournament-analytics-${Date.now()}.json`;
+                    a.click();
+                    URL.revokeObjectURL(url);
+
+                    addLog('✓ Comprehensive analytics exported (research-ready)');
+                })
+                .catch(error => {
+                    console.error('Export failed:', error);
+
+                    // Fallback to dashboard data only
+                    const data = {
+                        performance: performanceData,
+                        opponentModels: opponentModelData,
+                        regrets: regretData,
+                        events: events,
+                        exported_at: new Date().toISOString(),
+                        note: 'Limited export - analytics API unavailable'
+                    };
+
+                    const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
+                    const url = URL.createObjectURL(blob);
+                    const a = document.createElement('a');
+                    a.href = url;
+                    a.download = `dashboard-data-${Date.now()}.json`;
+                    a.click();
+                    URL.revokeObjectURL(url);
+
+                    addLog('⚠ Partial data exported (analytics unavailable)');
+                });
+        }
+
+        // ===== REGISTRATION MODALS =====
+        function showRegisterPlayerModal() {
+            document.getElementById('register-player-modal').style.display = 'flex';
+        }
+
+        function closeRegisterPlayerModal() {
+            document.getElementById('register-player-modal').style.display = 'none';
+        }
+
+        function showRegisterRefereeModal() {
+            document.getElementById('register-referee-modal').style.display = 'flex';
+        }
+
+        function closeRegisterRefereeModal() {
+            document.getElementById('register-referee-modal').style.display = 'none';
+        }
+
+        function registerPlayer() {
+            const name = document.getElementById('player-name').value;
+            const port = parseInt(document.getElementById('player-port').value);
+            const strategy = document.getElementById('player-strategy').value;
+
+            if (!name || !port) {
+                alert('Please fill in all fields');
+                return;
+            }
+
+            addLog(`👤 Registering player: ${name} with strategy ${strategy}...`, 'info');
+
+            fetch('/api/league/register_player', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ name, port, strategy })
+            })
+            .then(r => r.json())
+            .then(response => {
+                console.log('Register player response:', response);
+                if (response.success) {
+                    addLog(`✅ Player registered: ${name} (${strategy})`, 'success');
+                    closeRegisterPlayerModal();
+
+                    // Clear form
+                    document.getElementById('player-name').value = '';
+                    document.getElementById('player-port').value = '';
+                    document.getElementById('player-strategy').value = 'random';
+
+                    alert(`Player '${name}' registered successfully!\n\nStrategy: ${strategy}\nPort: ${port}\n\nYou can now start the tournament or register more players.`);
+                } else {
+                    addLog(`❌ Failed to register player: ${response.error}`, 'error');
+                    alert(`Failed to register player:\n${response.error}`);
+                }
+            })
+            .catch(error => {
+                console.error('Register player error:', error);
+                addLog(`❌ Error: ${error.message}`, 'error');
+                alert(`Error registering player:\n${error.message}`);
+            });
+        }
+
+        function registerReferee() {
+            const refereeId = document.getElementById('referee-id').value;
+            const port = parseInt(document.getElementById('referee-port').value);
+
+            if (!refereeId || !port) {
+                alert('Please fill in all fields');
+                return;
+            }
+
+            addLog(`🏁 Registering referee: ${refereeId}...`, 'info');
+
+            fetch('/api/league/register_referee', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ referee_id: refereeId, port })
+            })
+            .then(r => r.json())
+            .then(response => {
+                console.log('Register referee response:', response);
+                if (response.success) {
+                    addLog(`✅ Referee registered: ${refereeId}`, 'success');
+                    closeRegisterRefereeModal();
+
+                    // Clear form
+                    document.getElementById('referee-id').value = '';
+                    document.getElementById('referee-port').value = '';
+
+                    alert(`Referee '${refereeId}' registered successfully!\n\nPort: ${port}\n\nYou can now register players and start the tournament.`);
+                } else {
+                    addLog(`❌ Failed to register referee: ${response.error}`, 'error');
+                    alert(`Failed to register referee:\n${response.error}`);
+                }
+            })
+            .catch(error => {
+                console.error('Register referee error:', error);
+                addLog(`❌ Error: ${error.message}`, 'error');
+                alert(`Error registering referee:\n${error.message}`);
+            });
+        }
+
+        // Load initial analytics data
+        async function loadInitialData() {
+            try {
+                console.log('[LoadInitialData] Starting...');
+
+                // Fetch strategy performance data
+                const strategiesResponse = await fetch('/api/analytics/strategies');
+                if (strategiesResponse.ok) {
+                    const strategiesData = await strategiesResponse.json();
+                    console.log('[Strategies] Data received:', strategiesData);
+                    if (strategiesData.strategies && strategiesData.strategies.length > 0) {
+                        strategiesData.strategies.forEach(strategy => {
+                            performanceData[strategy.strategy_name] = strategy;
+                        });
+                        updatePerformanceChart();
+                        updateBeliefsChart();
+                        updateLearningCurve();
+                        addLog('✅ Loaded strategy performance data');
+                    } else {
+                        console.log('[Strategies] No data available');
+                    }
+                }
+
+                // Fetch opponent models (aggregate endpoint)
+                try {
+                    const oppResponse = await fetch('/api/analytics/opponent_models');
+                    if (oppResponse.ok) {
+                        const oppData = await oppResponse.json();
+                        console.log('[OpponentModels] Data received:', oppData);
+                        if (oppData.models && oppData.models.length > 0) {
+                            oppData.models.forEach(model => {
+                                const key = `${model.player_id}_${model.opponent_id}`;
+                                opponentModelData[key] = model;
+                            });
+                            updateOpponentModelChart();
+                            updateConfidenceEvolutionChart();
+                            addLog('✅ Loaded opponent model data');
+                        } else {
+                            console.log('[OpponentModels] No data available');
+                        }
+                    }
+                } catch (e) {
+                    console.log('[OpponentModels] Error:', e);
+                }
+
+                // Fetch counterfactual data (aggregate endpoint)
+                try {
+                    const cfResponse = await fetch('/api/analytics/counterfactuals');
+                    if (cfResponse.ok) {
+                        const cfData = await cfResponse.json();
+                        console.log('[Counterfactuals] Data received:', cfData);
+                        if (cfData.counterfactuals && cfData.counterfactuals.length > 0) {
+                            cfData.counterfactuals.forEach(cf => {
+                                if (cf.rounds && cf.rounds.length > 0) {
+                                    regretData[cf.player_id] = cf;
+                                }
+                            });
+                            if (Object.keys(regretData).length > 0) {
+                                updateRegretChart();
+                                updateRegretEvolutionChart();
+                                addLog('✅ Loaded counterfactual data');
+                            } else {
+                                console.log('[Counterfactuals] No data with rounds available');
+                            }
+                        } else {
+                            console.log('[Counterfactuals] No data available');
+                        }
+                    }
+                } catch (e) {
+                    console.log('[Counterfactuals] Error:', e);
+                }
+
+                console.log('[LoadInitialData] Complete');
+            } catch (error) {
+                console.error('[LoadInitialData] Error:', error);
+                addLog('⚠️ Some analytics data could not be loaded', 'warning');
+            }
+        }
+
+        // Manual refresh function for debugging
+        async function manualRefreshCharts() {
+            console.log('=== MANUAL REFRESH TRIGGERED ===');
+            addLog('🔄 Manually refreshing charts...');
+
+            try {
+                await loadInitialData();
+                addLog('✅ Charts refreshed!');
+            } catch (error) {
+                console.error('Refresh error:', error);
+                addLog('❌ Refresh failed: ' + error.message, 'error');
+            }
+        }
+
+        // Test data injection for diagnostics
+        async function testInjectAnalytics() {
+            console.log('=== TEST DATA INJECTION ===');
+            addLog('🧪 Injecting test analytics data...');
+
+            try {
+                const response = await fetch('/api/analytics/test_inject', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'}
+                });
+                const result = await response.json();
+
+                if (result.success) {
+                    addLog('✅ Test data injected!');
+                    // Refresh charts to display test data
+                    await manualRefreshCharts();
+                } else {
+                    addLog('❌ Test injection failed', 'error');
+                }
+            } catch (error) {
+                console.error('Test injection error:', error);
+                addLog('❌ Test injection failed: ' + error.message, 'error');
+            }
+        }
+
+        // Make functions globally accessible
+        window.manualRefreshCharts = manualRefreshCharts;
+        window.testInjectAnalytics = testInjectAnalytics;
+
+        // Auto-connect on load
+        window.onload = () => {
+            connectWebSocket();
+            loadInitialData();
+        };
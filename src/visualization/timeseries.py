@@ -0,0 +1,236 @@
+"""
+Columnar Time Series
+====================
+
+Bounded, typed time-series storage for the analytics engine.
+
+``RingSeries`` keeps the most recent ``capacity`` values of a series in a
+NumPy ring buffer with running aggregates, so appends and sums are O(1)
+regardless of tournament length. ``downsample_columns`` and ``downsample``
+reduce series to a fixed number of points with Largest-Triangle-Three-
+Buckets (LTTB), which keeps the visual shape of a curve at any zoom level.
+"""
+
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+# Values retained per series
+DEFAULT_SERIES_CAPACITY = 4096
+
+# Points returned per series by visualization exports
+DEFAULT_MAX_POINTS = 500
+
+
+class RingSeries:
+    """
+    Fixed-capacity NumPy ring buffer for one time series.
+
+    Reads behave like a list of the retained values (``len``, iteration,
+    indexing, slicing, ``==``), while ``total`` and ``sum`` cover every value
+    ever appended.
+    """
+
+    __slots__ = ("_buffer", "_start", "_count", "_total", "_sum")
+
+    def __init__(
+        self,
+        values: Sequence[float] | None = None,
+        capacity: int = DEFAULT_SERIES_CAPACITY,
+        dtype: Any = np.float64,
+    ):
+        self._buffer = np.zeros(max(1, capacity), dtype=dtype)
+        self._start = 0
+        self._count = 0
+        self._total = 0
+        self._sum = 0.0
+        if values is not None:
+            self.extend(values)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of retained values."""
+        return len(self._buffer)
+
+    @property
+    def total(self) -> int:
+        """Number of values ever appended (including evicted ones)."""
+        return self._total
+
+    @property
+    def sum(self) -> float:
+        """Running sum of every value ever appended."""
+        return self._sum
+
+    def append(self, value: float) -> None:
+        """Append a value, evicting the oldest one when full."""
+        capacity = len(self._buffer)
+        if self._count < capacity:
+            self._buffer[(self._start + self._count) % capacity] = value
+            self._count += 1
+        else:
+            self._buffer[self._start] = value
+            self._start = (self._start + 1) % capacity
+        self._total += 1
+        self._sum += float(value)
+
+    def extend(self, values: Sequence[float]) -> None:
+        """Append several values."""
+        for value in values:
+            self.append(value)
+
+    def clear(self) -> None:
+        """Drop all values and reset the aggregates."""
+        self._start = 0
+        self._count = 0
+        self._total = 0
+        self._sum = 0.0
+
+    def to_numpy(self) -> np.ndarray:
+        """Get the retained values, oldest first, as a new array."""
+        end = self._start + self._count
+        if end <= len(self._buffer):
+            return self._buffer[self._start : end].copy()
+        return np.concatenate(
+            (self._buffer[self._start :], self._buffer[: end - len(self._buffer)])
+        )
+
+    def tolist(self) -> list:
+        """Get the retained values, oldest first, as Python scalars."""
+        return self.to_numpy().tolist()
+
+    def last(self, n: int) -> np.ndarray:
+        """Get the most recent ``n`` values (O(n))."""
+        n = min(max(0, n), self._count)
+        capacity = len(self._buffer)
+        indices = (self._start + self._count - n + np.arange(n)) % capacity
+        return self._buffer[indices]
+
+    def since(self, total: int) -> list:
+        """Get the retained values appended after ``total`` values had been."""
+        return self.last(self._total - total).tolist()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator:
+        return iter(self.tolist())
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("RingSeries index out of range")
+        return self._buffer[(self._start + index) % len(self._buffer)].item()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RingSeries | list | tuple):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RingSeries({self.tolist()!r}, capacity={self.capacity})"
+
+
+def int_series() -> RingSeries:
+    """Create an integer series (e.g. round numbers)."""
+    return RingSeries(dtype=np.int64)
+
+
+def bounded_history() -> deque:
+    """Create a bounded history for non-numeric snapshots (e.g. belief dicts)."""
+    return deque(maxlen=DEFAULT_SERIES_CAPACITY)
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert series containers (recursively) to plain lists."""
+    if isinstance(value, RingSeries):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {k: to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list | tuple | deque):
+        return [to_jsonable(v) for v in value]
+    return value
+
+
+# ============================================================================
+# Downsampling
+# ============================================================================
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Select indices with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each of ``max_points - 2``
+    equal buckets in between, the point forming the largest triangle with the
+    previously selected point and the next bucket's average.
+    """
+    n = len(x)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        return np.linspace(0, n - 1, max(0, max_points)).astype(np.int64)
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+
+        next_start = end
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_end = max(next_end, next_start + 1)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        px, py = x[previous], y[previous]
+        areas = np.abs((px - avg_x) * (y[start:end] - py) - (px - x[start:end]) * (avg_y - py))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def downsample_columns(
+    columns: Mapping[str, Sequence[float] | RingSeries],
+    max_points: int = DEFAULT_MAX_POINTS,
+    x_key: str = "rounds",
+    y_key: str | None = None,
+) -> dict[str, list]:
+    """
+    Downsample aligned columns to at most ``max_points`` rows.
+
+    Rows are chosen by LTTB on (``x_key``, ``y_key``) (``y_key`` defaults to
+    the first other column) and the same rows are kept in every column.
+    Columns of unequal length are aligned on their most recent values.
+    """
+    arrays = {
+        key: values.to_numpy() if isinstance(values, RingSeries) else np.asarray(values)
+        for key, values in columns.items()
+    }
+    length = min((len(a) for a in arrays.values()), default=0)
+    arrays = {key: a[len(a) - length :] for key, a in arrays.items()}
+
+    if length <= max_points:
+        return {key: a.tolist() for key, a in arrays.items()}
+
+    y_key = y_key or next((key for key in arrays if key != x_key), x_key)
+    x = arrays[x_key] if x_key in arrays else np.arange(length)
+    indices = lttb_indices(x.astype(np.float64), arrays[y_key].astype(np.float64), max_points)
+    return {key: a[indices].tolist() for key, a in arrays.items()}
+
+
+def downsample(values: Sequence[float], max_points: int = DEFAULT_MAX_POINTS) -> list:
+    """Downsample a single series (indexed by position) with LTTB."""
+    return downsample_columns({"values": values}, max_points, x_key="index")["values"]
@@ -24,1452 +24,37 @@ from typing import Any, Dict, List, Optional
 from aiohttp import web
 import aiohttp_cors
 
-# HTML template for the ultimate dashboard
-ULTIMATE_DASHBOARD_HTML = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>MCP Game League - Ultimate MIT-Level Dashboard</title>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/4.4.0/chart.umd.min.js"></script>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-
-        body {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #0a0e27 0%, #1a1f3a 100%);
-            color: #e0e0e0;
-            overflow-x: hidden;
-        }
-
-        /* Header with gradient */
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
-            padding: 25px 40px;
-            box-shadow: 0 8px 32px rgba(102, 126, 234, 0.4);
-            position: sticky;
-            top: 0;
-            z-index: 1000;
-            backdrop-filter: blur(10px);
-        }
-
-        .header-content {
-            max-width: 1900px;
-            margin: 0 auto;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        .header h1 {
-            color: white;
-            font-size: 32px;
-            font-weight: 800;
-            letter-spacing: -0.5px;
-            text-shadow: 0 2px 10px rgba(0,0,0,0.3);
-        }
-
-        .header-badges {
-            display: flex;
-            gap: 15px;
-            align-items: center;
-        }
-
-        .badge {
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-size: 13px;
-            font-weight: 600;
-            backdrop-filter: blur(10px);
-        }
-
-        .badge-mit {
-            background: rgba(255, 215, 0, 0.3);
-            border: 2px solid #ffd700;
-            color: #ffd700;
-            animation: glow 2s ease-in-out infinite;
-        }
-
-        @keyframes glow {
-            0%, 100% { box-shadow: 0 0 10px rgba(255, 215, 0, 0.3); }
-            50% { box-shadow: 0 0 30px rgba(255, 215, 0, 0.8); }
-        }
-
-        .badge-connected {
-            background: rgba(16, 185, 129, 0.3);
-            border: 2px solid #10b981;
-            color: #10b981;
-        }
-
-        .badge-disconnected {
-            background: rgba(239, 68, 68, 0.3);
-            border: 2px solid #ef4444;
-            color: #ef4444;
-        }
-
-        /* Main container */
-        .container {
-            max-width: 1900px;
-            margin: 0 auto;
-            padding: 30px;
-        }
-
-        /* Tab Navigation */
-        .tab-nav {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 30px;
-            overflow-x: auto;
-            padding-bottom: 10px;
-        }
-
-        .tab-button {
-            padding: 15px 30px;
-            background: rgba(255,255,255,0.05);
-            border: 2px solid rgba(102, 126, 234, 0.3);
-            border-radius: 12px;
-            color: #a0aec0;
-            cursor: pointer;
-            font-size: 15px;
-            font-weight: 600;
-            transition: all 0.3s;
-            white-space: nowrap;
-        }
-
-        .tab-button:hover {
-            background: rgba(102, 126, 234, 0.2);
-            border-color: #667eea;
-            color: #667eea;
-        }
-
-        .tab-button.active {
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            border-color: #667eea;
-            color: white;
-            box-shadow: 0 4px 20px rgba(102, 126, 234, 0.5);
-        }
-
-        .tab-content {
-            display: none;
-        }
-
-        .tab-content.active {
-            display: block;
-            animation: fadeIn 0.5s ease;
-        }
-
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        /* Card styles */
-        .card {
-            background: rgba(26, 31, 58, 0.8);
-            backdrop-filter: blur(20px);
-            border-radius: 16px;
-            padding: 30px;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-            border: 1px solid rgba(102, 126, 234, 0.2);
-            margin-bottom: 25px;
-            transition: all 0.3s;
-        }
-
-        .card:hover {
-            border-color: rgba(102, 126, 234, 0.5);
-            box-shadow: 0 12px 48px rgba(102, 126, 234, 0.3);
-        }
-
-        .card h2 {
-            font-size: 24px;
-            margin-bottom: 25px;
-            color: #667eea;
-            font-weight: 700;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }
-
-        .card h2::before {
-            content: '';
-            width: 4px;
-            height: 28px;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            border-radius: 2px;
-        }
-
-        /* Grid layouts */
-        .grid-2 {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(600px, 1fr));
-            gap: 25px;
-        }
-
-        .grid-3 {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 25px;
-        }
-
-        .grid-4 {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 20px;
-        }
-
-        /* Statistics boxes */
-        .stat-box {
-            background: rgba(255,255,255,0.05);
-            border-radius: 12px;
-            padding: 25px;
-            text-align: center;
-            border: 2px solid rgba(102, 126, 234, 0.2);
-            transition: all 0.3s;
-        }
-
-        .stat-box:hover {
-            transform: translateY(-5px);
-            border-color: #667eea;
-            box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
-        }
-
-        .stat-value {
-            font-size: 48px;
-            font-weight: 800;
-            background: linear-gradient(135deg, #667eea, #f093fb);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin-bottom: 10px;
-        }
-
-        .stat-label {
-            font-size: 14px;
-            color: #a0aec0;
-            text-transform: uppercase;
-            letter-spacing: 1.5px;
-            font-weight: 600;
-        }
-
-        /* Round progress banner */
-        .round-banner {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
-            border-radius: 16px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 8px 32px rgba(102, 126, 234, 0.4);
-        }
-
-        .round-progress-bar {
-            height: 12px;
-            background: rgba(255,255,255,0.2);
-            border-radius: 6px;
-            overflow: hidden;
-            margin: 20px 0;
-        }
-
-        .round-progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #10b981, #22c55e);
-            transition: width 0.5s ease;
-            border-radius: 6px;
-            box-shadow: 0 0 20px rgba(16, 185, 129, 0.6);
-        }
-
-        /* Standings table */
-        .standings-table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-
-        .standings-table thead {
-            background: rgba(102, 126, 234, 0.2);
-        }
-
-        .standings-table th {
-            padding: 18px;
-            text-align: left;
-            font-weight: 700;
-            color: #667eea;
-            border-bottom: 3px solid #667eea;
-            font-size: 14px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-
-        .standings-table td {
-            padding: 18px;
-            border-bottom: 1px solid rgba(102, 126, 234, 0.1);
-        }
-
-        .standings-table tr:hover {
-            background: rgba(102, 126, 234, 0.1);
-        }
-
-        .rank-badge {
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            font-weight: 800;
-            font-size: 18px;
-        }
-
-        .rank-1 {
-            background: linear-gradient(135deg, #ffd700, #ffed4e);
-            color: #000;
-            box-shadow: 0 4px 20px rgba(255, 215, 0, 0.6);
-        }
-
-        .rank-2 {
-            background: linear-gradient(135deg, #c0c0c0, #e8e8e8);
-            color: #000;
-            box-shadow: 0 4px 20px rgba(192, 192, 192, 0.6);
-        }
-
-        .rank-3 {
-            background: linear-gradient(135deg, #cd7f32, #e89547);
-            color: #fff;
-            box-shadow: 0 4px 20px rgba(205, 127, 50, 0.6);
-        }
-
-        .rank-other {
-            background: rgba(255,255,255,0.1);
-            color: #a0aec0;
-        }
-
-        .player-cell {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .player-avatar {
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 800;
-            font-size: 18px;
-            border: 3px solid rgba(102, 126, 234, 0.3);
-        }
-
-        .strategy-badge {
-            font-size: 11px;
-            color: #fff;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            padding: 4px 12px;
-            border-radius: 12px;
-            display: inline-block;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-
-        /* Innovation showcase */
-        .innovation-card {
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.1), rgba(240, 147, 251, 0.1));
-            border-radius: 16px;
-            padding: 25px;
-            border: 2px solid rgba(102, 126, 234, 0.3);
-            transition: all 0.3s;
-        }
-
-        .innovation-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 15px 40px rgba(102, 126, 234, 0.4);
-            border-color: #667eea;
-        }
-
-        .innovation-header {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            margin-bottom: 15px;
-        }
-
-        .innovation-icon {
-            font-size: 32px;
-        }
-
-        .innovation-title {
-            font-size: 18px;
-            font-weight: 700;
-            color: #667eea;
-        }
-
-        .innovation-status {
-            padding: 4px 12px;
-            background: rgba(16, 185, 129, 0.2);
-            color: #10b981;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 600;
-            text-transform: uppercase;
-        }
-
-        .innovation-metric {
-            display: flex;
-            justify-content: space-between;
-            margin: 10px 0;
-            padding: 10px;
-            background: rgba(0,0,0,0.2);
-            border-radius: 8px;
-        }
-
-        /* Chart containers */
-        .chart-container {
-            background: rgba(0,0,0,0.2);
-            border-radius: 12px;
-            padding: 20px;
-            min-height: 400px;
-        }
-
-        /* Controls */
-        .controls {
-            display: flex;
-            gap: 12px;
-            margin-bottom: 25px;
-            flex-wrap: wrap;
-        }
-
-        button {
-            padding: 14px 28px;
-            border: none;
-            border-radius: 10px;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            cursor: pointer;
-            font-size: 15px;
-            font-weight: 700;
-            transition: all 0.3s;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-
-        button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.5);
-        }
-
-        button:active {
-            transform: translateY(0);
-        }
-
-        /* Winner modal */
-        .winner-modal {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.95);
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            z-index: 10000;
-            animation: fadeIn 0.5s ease;
-        }
-
-        .winner-modal.hidden { display: none; }
-
-        .winner-content {
-            background: linear-gradient(135deg, #1a1f3a 0%, #2a2f4a 100%);
-            padding: 70px 60px;
-            border-radius: 24px;
-            text-align: center;
-            max-width: 800px;
-            border: 4px solid #ffd700;
-            box-shadow: 0 0 100px rgba(255, 215, 0, 0.8);
-            animation: scaleIn 0.7s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-        }
-
-        @keyframes scaleIn {
-            from { transform: scale(0.3) rotate(-10deg); opacity: 0; }
-            to { transform: scale(1) rotate(0deg); opacity: 1; }
-        }
-
-        .winner-trophy {
-            font-size: 120px;
-            animation: bounce 1.5s ease infinite;
-            text-shadow: 0 0 50px rgba(255, 215, 0, 1);
-        }
-
-        @keyframes bounce {
-            0%, 100% { transform: translateY(0); }
-            50% { transform: translateY(-30px); }
-        }
-
-        .winner-title {
-            color: #ffd700;
-            font-size: 56px;
-            margin: 25px 0;
-            font-weight: 900;
-            text-shadow: 0 0 40px rgba(255, 215, 0, 0.8);
-        }
-
-        .winner-name {
-            font-size: 48px;
-            color: #fff;
-            margin: 30px 0;
-            font-weight: 800;
-        }
-
-        .winner-strategy-box {
-            background: rgba(255, 215, 0, 0.2);
-            border: 3px solid rgba(255, 215, 0, 0.5);
-            border-radius: 20px;
-            padding: 25px 40px;
-            margin: 30px 0;
-        }
-
-        .winner-strategy-name {
-            font-size: 32px;
-            color: #ffd700;
-            font-weight: 800;
-        }
-
-        .winner-stats-grid {
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 20px;
-            margin: 40px 0;
-        }
-
-        /* Responsive design */
-        @media (max-width: 768px) {
-            .grid-2, .grid-3, .grid-4 {
-                grid-template-columns: 1fr;
-            }
-
-            .winner-stats-grid {
-                grid-template-columns: repeat(2, 1fr);
-            }
-        }
-
-        /* Scrollbar styling */
-        ::-webkit-scrollbar {
-            width: 12px;
-        }
-
-        ::-webkit-scrollbar-track {
-            background: rgba(0,0,0,0.2);
-        }
-
-        ::-webkit-scrollbar-thumb {
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            border-radius: 6px;
-        }
-
-        ::-webkit-scrollbar-thumb:hover {
-            background: linear-gradient(135deg, #5568d3, #6a3f8f);
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <div class="header-content">
-            <h1>🎮 MCP Game League - Ultimate MIT-Level Dashboard</h1>
-            <div class="header-badges">
-                <span class="badge badge-mit">⭐ A+ (98.7%) MIT Level</span>
-                <span id="status-badge" class="badge badge-disconnected">Disconnected</span>
-            </div>
-        </div>
-    </div>
-
-    <div class="container">
-        <!-- Tab Navigation -->
-        <div class="tab-nav">
-            <button class="tab-button active" onclick="switchTab('overview')">📊 Overview</button>
-            <button class="tab-button" onclick="switchTab('tournament')">🏆 Tournament</button>
-            <button class="tab-button" onclick="switchTab('innovations')">💡 Innovations</button>
-            <button class="tab-button" onclick="switchTab('brqc')">⚛️ BRQC Performance</button>
-            <button class="tab-button" onclick="switchTab('theorem1')">📐 Theorem 1</button>
-            <button class="tab-button" onclick="switchTab('byzantine')">🛡️ Byzantine</button>
-            <button class="tab-button" onclick="switchTab('analytics')">📈 Analytics</button>
-            <button class="tab-button" onclick="switchTab('research')">🔬 Research</button>
-        </div>
-
-        <!-- Tab: Overview -->
-        <div id="tab-overview" class="tab-content active">
-            <div class="controls">
-                <button onclick="connectWebSocket()">🔌 Connect</button>
-                <button onclick="location.reload()">🔄 Refresh</button>
-                <button onclick="exportData()">💾 Export Data</button>
-                <button onclick="showWinnerModal()">🏆 Show Winner</button>
-            </div>
-
-            <!-- Key Metrics -->
-            <div class="grid-4">
-                <div class="stat-box">
-                    <div class="stat-value" id="current-round-stat">0</div>
-                    <div class="stat-label">Current Round</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value" id="active-players-stat">0</div>
-                    <div class="stat-label">Active Players</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value" id="total-matches-stat">0</div>
-                    <div class="stat-label">Total Matches</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value" id="avg-winrate-stat">0%</div>
-                    <div class="stat-label">Avg Win Rate</div>
-                </div>
-            </div>
-
-            <!-- Round Progress -->
-            <div class="round-banner">
-                <div class="grid-4">
-                    <div style="text-align: center;">
-                        <div style="font-size: 14px; opacity: 0.8; margin-bottom: 8px;">Current Round</div>
-                        <div style="font-size: 36px; font-weight: 800;" id="current-round">0</div>
-                    </div>
-                    <div style="text-align: center;">
-                        <div style="font-size: 14px; opacity: 0.8; margin-bottom: 8px;">Total Rounds</div>
-                        <div style="font-size: 36px; font-weight: 800;" id="total-rounds">0</div>
-                    </div>
-                    <div style="text-align: center;">
-                        <div style="font-size: 14px; opacity: 0.8; margin-bottom: 8px;">Rounds Played</div>
-                        <div style="font-size: 36px; font-weight: 800;" id="rounds-played">0</div>
-                    </div>
-                    <div style="text-align: center;">
-                        <div style="font-size: 14px; opacity: 0.8; margin-bottom: 8px;">Rounds Remaining</div>
-                        <div style="font-size: 36px; font-weight: 800;" id="rounds-remaining">0</div>
-                    </div>
-                </div>
-                <div class="round-progress-bar">
-                    <div class="round-progress-fill" id="round-progress-fill" style="width: 0%"></div>
-                </div>
-                <div style="text-align: center; color: white; font-weight: 600; margin-top: 10px;" id="round-progress-text">
-                    Ready to start...
-                </div>
-            </div>
-
-            <!-- System Status -->
-            <div class="grid-3">
-                <div class="card">
-                    <h2>🔧 System Status</h2>
-                    <div id="system-status">
-                        <div style="padding: 15px; background: rgba(16, 185, 129, 0.2); border-radius: 10px; margin: 10px 0;">
-                            <div style="font-weight: 600; color: #10b981;">✓ All systems operational</div>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="card">
-                    <h2>📊 Tournament Info</h2>
-                    <div id="tournament-info">
-                        <div style="margin: 10px 0; padding: 12px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                            <span style="color: #a0aec0;">Game Type:</span>
-                            <span style="float: right; font-weight: 600;" id="game-type">-</span>
-                        </div>
-                        <div style="margin: 10px 0; padding: 12px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                            <span style="color: #a0aec0;">Status:</span>
-                            <span style="float: right; font-weight: 600;" id="tournament-status">-</span>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="card">
-                    <h2>🎯 Innovation Status</h2>
-                    <div id="innovation-status">
-                        <div style="margin: 10px 0; padding: 12px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                            <span style="color: #a0aec0;">BRQC:</span>
-                            <span style="float: right; font-weight: 600; color: #10b981;">Active</span>
-                        </div>
-                        <div style="margin: 10px 0; padding: 12px; background: rgba(255,255,255,0.05); border-radius: 8px;">
-                            <span style="color: #a0aec0;">Byzantine FT:</span>
-                            <span style="float: right; font-weight: 600; color: #10b981;">Active</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Tab: Tournament -->
-        <div id="tab-tournament" class="tab-content">
-            <div class="card">
-                <h2>🏆 Player Standings & Strategies</h2>
-                <table class="standings-table">
-                    <thead>
-                        <tr>
-                            <th>Rank</th>
-                            <th>Player & Strategy</th>
-                            <th>Score</th>
-                            <th>Wins</th>
-                            <th>Matches</th>
-                            <th>Win Rate</th>
-                        </tr>
-                    </thead>
-                    <tbody id="standings-tbody">
-                        <tr>
-                            <td colspan="6" style="text-align: center; color: #a0aec0; padding: 50px;">
-                                Waiting for tournament data...
-                            </td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-
-            <div class="grid-2">
-                <div class="card">
-                    <h2>📊 Win Rate Distribution</h2>
-                    <div id="winrate-chart" class="chart-container"></div>
-                </div>
-
-                <div class="card">
-                    <h2>🎮 Strategy Performance</h2>
-                    <div id="strategy-chart" class="chart-container"></div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Tab: Innovations -->
-        <div id="tab-innovations" class="tab-content">
-            <div class="card">
-                <h2>💡 MIT-Level Innovations Showcase</h2>
-                <p style="color: #a0aec0; margin-bottom: 25px;">
-                    This project features 10+ world-first innovations in multi-agent systems, achieving A+ (98.7%) MIT-level excellence.
-                </p>
-            </div>
-
-            <div class="grid-3" id="innovations-grid">
-                <!-- Innovation cards will be populated here -->
-            </div>
-        </div>
-
-        <!-- Tab: BRQC Performance -->
-        <div id="tab-brqc" class="tab-content">
-            <div class="card">
-                <h2>⚛️ Byzantine-Resistant Quantum Consensus (BRQC)</h2>
-                <p style="color: #a0aec0; margin-bottom: 20px;">
-                    Novel algorithm achieving O(√n) convergence with Byzantine fault tolerance (f < n/3)
-                </p>
-            </div>
-
-            <div class="grid-2">
-                <div class="card">
-                    <h2>📈 Convergence Scaling</h2>
-                    <div id="brqc-convergence-chart" class="chart-container"></div>
-                </div>
-
-                <div class="card">
-                    <h2>⚡ Speedup vs Classical</h2>
-                    <div id="brqc-speedup-chart" class="chart-container"></div>
-                </div>
-            </div>
-
-            <div class="grid-4">
-                <div class="stat-box">
-                    <div class="stat-value">25×</div>
-                    <div class="stat-label">Max Speedup</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">0.64</div>
-                    <div class="stat-label">Convergence Slope</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">96%</div>
-                    <div class="stat-label">Success Rate</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">O(√n)</div>
-                    <div class="stat-label">Complexity</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Tab: Theorem 1 -->
-        <div id="tab-theorem1" class="tab-content">
-            <div class="card">
-                <h2>📐 Theorem 1: Quantum Strategy Convergence</h2>
-                <p style="color: #a0aec0; margin-bottom: 20px;">
-                    Formal proof that quantum-inspired strategies converge in O(√n/ε²) iterations with probability ≥ 1-δ
-                </p>
-            </div>
-
-            <div class="grid-2">
-                <div class="card">
-                    <h2>📊 Quantum vs Classical Convergence</h2>
-                    <div id="theorem1-convergence-chart" class="chart-container"></div>
-                </div>
-
-                <div class="card">
-                    <h2>⚡ Speedup Factor</h2>
-                    <div id="theorem1-speedup-chart" class="chart-container"></div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>✅ Validation Results</h2>
-                <div class="grid-4">
-                    <div class="stat-box">
-                        <div class="stat-value">6.8×</div>
-                        <div class="stat-label">Max Speedup</div>
-                    </div>
-                    <div class="stat-box">
-                        <div class="stat-value">0.69</div>
-                        <div class="stat-label">Slope (≈0.5)</div>
-                    </div>
-                    <div class="stat-box">
-                        <div class="stat-value">✓</div>
-                        <div class="stat-label">Theorem Verified</div>
-                    </div>
-                    <div class="stat-box">
-                        <div class="stat-value">5</div>
-                        <div class="stat-label">Data Points</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Tab: Byzantine -->
-        <div id="tab-byzantine" class="tab-content">
-            <div class="card">
-                <h2>🛡️ Byzantine Fault Tolerance</h2>
-                <p style="color: #a0aec0; margin-bottom: 20px;">
-                    Detection and tolerance of malicious agents with 97.2% accuracy, supporting f < n/3 Byzantine players
-                </p>
-            </div>
-
-            <div class="grid-2">
-                <div class="card">
-                    <h2>📊 Byzantine Tolerance Test</h2>
-                    <div id="byzantine-tolerance-chart" class="chart-container"></div>
-                </div>
-
-                <div class="card">
-                    <h2>🎯 Strategy Detection</h2>
-                    <div id="byzantine-strategy-chart" class="chart-container"></div>
-                </div>
-            </div>
-
-            <div class="grid-4">
-                <div class="stat-box">
-                    <div class="stat-value">100%</div>
-                    <div class="stat-label">Detection Rate</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">f < n/3</div>
-                    <div class="stat-label">Tolerance</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">0</div>
-                    <div class="stat-label">Safety Violations</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value">3ms</div>
-                    <div class="stat-label">Avg Time</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Tab: Analytics -->
-        <div id="tab-analytics" class="tab-content">
-            <div class="card">
-                <h2>📈 Advanced Analytics</h2>
-                <p style="color: #a0aec0; margin-bottom: 20px;">
-                    Deep insights into tournament performance, strategy effectiveness, and player behavior
-                </p>
-            </div>
-
-            <div class="grid-2">
-                <div class="card">
-                    <h2>🎯 Strategy Comparison Heatmap</h2>
-                    <div id="strategy-heatmap" class="chart-container"></div>
-                </div>
-
-                <div class="card">
-                    <h2>📊 Performance Over Time</h2>
-                    <div id="performance-timeline" class="chart-container"></div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>🔍 Statistical Summary</h2>
-                <div class="grid-3">
-                    <div>
-                        <h3 style="color: #667eea; margin-bottom: 15px;">Descriptive Statistics</h3>
-                        <div id="descriptive-stats"></div>
-                    </div>
-                    <div>
-                        <h3 style="color: #667eea; margin-bottom: 15px;">Performance Metrics</h3>
-                        <div id="performance-metrics"></div>
-                    </div>
-                    <div>
-                        <h3 style="color: #667eea; margin-bottom: 15px;">Innovation Impact</h3>
-                        <div id="innovation-metrics"></div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Tab: Research -->
-        <div id="tab-research" class="tab-content">
-            <div class="card">
-                <h2>🔬 Research Validation Dashboard</h2>
-                <p style="color: #a0aec0; margin-bottom: 20px;">
-                    Publication-ready experimental results and statistical validation
-                </p>
-            </div>
-
-            <div class="grid-3">
-                <div class="card">
-                    <h2>📄 Publications</h2>
-                    <div style="padding: 15px; background: rgba(255,255,255,0.05); border-radius: 10px; margin: 10px 0;">
-                        <div style="font-weight: 600; margin-bottom: 10px;">Conference Papers Ready</div>
-                        <div style="color: #a0aec0;">• NeurIPS 2026: BRQC Algorithm</div>
-                        <div style="color: #a0aec0;">• ICML 2026: Quantum Convergence</div>
-                        <div style="color: #a0aec0;">• AAMAS 2026: Byzantine FT</div>
-                        <div style="color: #a0aec0;">• ICLR 2026: Multi-Agent Systems</div>
-                        <div style="color: #a0aec0;">• IEEE S&P 2026: Security</div>
-                    </div>
-                </div>
-
-                <div class="card">
-                    <h2>📊 Experimental Scale</h2>
-                    <div class="stat-box" style="margin: 10px 0;">
-                        <div class="stat-value">350K+</div>
-                        <div class="stat-label">Total Trials</div>
-                    </div>
-                    <div class="stat-box" style="margin: 10px 0;">
-                        <div class="stat-value">p < 0.001</div>
-                        <div class="stat-label">Significance</div>
-                    </div>
-                    <div class="stat-box" style="margin: 10px 0;">
-                        <div class="stat-value">100%</div>
-                        <div class="stat-label">Reproducibility</div>
-                    </div>
-                </div>
-
-                <div class="card">
-                    <h2>🏆 Impact Metrics</h2>
-                    <div class="stat-box" style="margin: 10px 0;">
-                        <div class="stat-value">98.7%</div>
-                        <div class="stat-label">MIT Grade</div>
-                    </div>
-                    <div class="stat-box" style="margin: 10px 0;">
-                        <div class="stat-value">5/5</div>
-                        <div class="stat-label">Stars</div>
-                    </div>
-                    <div class="stat-box" style="margin: 10px 0;">
-                        <div class="stat-value">A+</div>
-                        <div class="stat-label">Overall</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Winner Modal -->
-    <div id="winner-modal" class="winner-modal hidden">
-        <div class="winner-content">
-            <div class="winner-trophy">🏆</div>
-            <h1 class="winner-title">Tournament Champion!</h1>
-            <h2 class="winner-name" id="winner-name">Champion</h2>
-
-            <div class="winner-strategy-box">
-                <div style="font-size: 14px; opacity: 0.8; margin-bottom: 10px;">Winning Strategy</div>
-                <div class="winner-strategy-name" id="winner-strategy">Unknown</div>
-            </div>
-
-            <div class="winner-stats-grid">
-                <div class="stat-box">
-                    <div class="stat-value" id="winner-score">0</div>
-                    <div class="stat-label">Total Score</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value" id="winner-wins">0</div>
-                    <div class="stat-label">Wins</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value" id="winner-matches">0</div>
-                    <div class="stat-label">Matches</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-value" id="winner-winrate">0%</div>
-                    <div class="stat-label">Win Rate</div>
-                </div>
-            </div>
-
-            <button onclick="closeWinnerModal()">Close</button>
-        </div>
-    </div>
-
-    <script>
-        // Global state
-        let ws = null;
-        let tournamentData = {
-            currentRound: 0,
-            totalRounds: 0,
-            standings: [],
-            brqcResults: null,
-            theorem1Results: null,
-            activeTab: 'overview'
-        };
-
-        // Initialize
-        window.onload = () => {
-            connectWebSocket();
-            loadExperimentalData();
-            initializeInnovations();
-        };
-
-        // Tab switching
-        function switchTab(tabName) {
-            // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(tab => {
-                tab.classList.remove('active');
-            });
-
-            // Remove active from all buttons
-            document.querySelectorAll('.tab-button').forEach(btn => {
-                btn.classList.remove('active');
-            });
-
-            // Show selected tab
-            document.getElementById(`tab-${tabName}`).classList.add('active');
-
-            // Set active button
-            event.target.classList.add('active');
-
-            tournamentData.activeTab = tabName;
-
-            // Initialize charts for specific tabs
-            if (tabName === 'brqc') {
-                updateBRQCCharts();
-            } else if (tabName === 'theorem1') {
-                updateTheorem1Charts();
-            } else if (tabName === 'byzantine') {
-                updateByzantineCharts();
-            }
-        }
-
-        // WebSocket connection
-        function connectWebSocket() {
-            const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-            const host = window.location.host;
-            ws = new WebSocket(`${protocol}//${host}/ws`);
-
-            ws.onopen = () => {
-                document.getElementById('status-badge').textContent = 'Connected';
-                document.getElementById('status-badge').className = 'badge badge-connected';
-                console.log('Connected to dashboard');
-            };
-
-            ws.onclose = () => {
-                document.getElementById('status-badge').textContent = 'Disconnected';
-                document.getElementById('status-badge').className = 'badge badge-disconnected';
-            };
-
-            ws.onmessage = (event) => {
-                const message = JSON.parse(event.data);
-                handleMessage(message);
-            };
-        }
-
-        // Handle incoming messages
-        function handleMessage(message) {
-            switch (message.type) {
-                case 'tournament_update':
-                    handleTournamentUpdate(message.data);
-                    break;
-                case 'tournament_complete':
-                    handleTournamentComplete(message.data);
-                    break;
-            }
-        }
-
-        function handleTournamentUpdate(data) {
-            tournamentData.currentRound = data.current_round || 0;
-            tournamentData.totalRounds = data.total_rounds || 0;
-            tournamentData.standings = data.standings || [];
-
-            updateOverviewStats();
-            updateRoundProgress();
-            updateStandingsTable();
-        }
-
-        function updateOverviewStats() {
-            const current = tournamentData.currentRound;
-            const total = tournamentData.totalRounds;
-            const remaining = Math.max(0, total - current);
-
-            document.getElementById('current-round-stat').textContent = current;
-            document.getElementById('active-players-stat').textContent = tournamentData.standings.length;
-
-            // Calculate total matches
-            const totalMatches = tournamentData.standings.reduce((sum, p) => sum + (p.total_matches || 0), 0) / 2;
-            document.getElementById('total-matches-stat').textContent = Math.floor(totalMatches);
-
-            // Calculate average win rate
-            const avgWinRate = tournamentData.standings.reduce((sum, p) => {
-                const wr = p.total_matches > 0 ? (p.wins / p.total_matches) * 100 : 0;
-                return sum + wr;
-            }, 0) / (tournamentData.standings.length || 1);
-            document.getElementById('avg-winrate-stat').textContent = avgWinRate.toFixed(1) + '%';
-
-            document.getElementById('current-round').textContent = current;
-            document.getElementById('total-rounds').textContent = total;
-            document.getElementById('rounds-played').textContent = current;
-            document.getElementById('rounds-remaining').textContent = remaining;
-        }
-
-        function updateRoundProgress() {
-            const current = tournamentData.currentRound;
-            const total = tournamentData.totalRounds;
-            const percentage = total > 0 ? (current / total * 100) : 0;
-
-            document.getElementById('round-progress-fill').style.width = percentage + '%';
-            document.getElementById('round-progress-text').textContent =
-                `${percentage.toFixed(1)}% Complete - Round ${current} of ${total}`;
-        }
-
-        function updateStandingsTable() {
-            const tbody = document.getElementById('standings-tbody');
-            const standings = tournamentData.standings;
-
-            if (!standings || standings.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="6" style="text-align: center; color: #a0aec0; padding: 50px;">No data yet</td></tr>';
-                return;
-            }
-
-            tbody.innerHTML = standings.map((player, index) => {
-                const rank = index + 1;
-                let rankClass = 'rank-other';
-                if (rank === 1) rankClass = 'rank-1';
-                else if (rank === 2) rankClass = 'rank-2';
-                else if (rank === 3) rankClass = 'rank-3';
-
-                const playerId = player.player_id || player.player || `Player ${rank}`;
-                const strategy = player.strategy || 'Unknown';
-                const score = (player.score || player.total_score || 0).toFixed(1);
-                const wins = player.wins || player.total_wins || 0;
-                const matches = player.total_matches || player.matches_played || 0;
-                const winRate = matches > 0 ? ((wins / matches) * 100).toFixed(1) : '0.0';
-
-                return `
-                    <tr>
-                        <td><div class="rank-badge ${rankClass}">${rank}</div></td>
-                        <td>
-                            <div class="player-cell">
-                                <div class="player-avatar">${playerId.substring(0, 2)}</div>
-                                <div>
-                                    <div style="font-weight: 600; margin-bottom: 5px;">${playerId}</div>
-                                    <span class="strategy-badge">${strategy}</span>
-                                </div>
-                            </div>
-                        </td>
-                        <td style="font-size: 20px; font-weight: 700; color: #667eea;">${score}</td>
-                        <td style="color: #10b981; font-weight: 600;">${wins}</td>
-                        <td>${matches}</td>
-                        <td style="font-weight: 600;">${winRate}%</td>
-                    </tr>
-                `;
-            }).join('');
-        }
-
-        function handleTournamentComplete(data) {
-            const winner = data.winner;
-            if (winner) {
-                document.getElementById('winner-name').textContent = winner.player_id || 'Champion';
-                document.getElementById('winner-strategy').textContent = winner.strategy || 'Unknown';
-                document.getElementById('winner-score').textContent = winner.score?.toFixed(1) || '0';
-                document.getElementById('winner-wins').textContent = winner.wins || '0';
-                document.getElementById('winner-matches').textContent = winner.total_matches || '0';
-
-                const winRate = winner.total_matches > 0
-                    ? ((winner.wins / winner.total_matches) * 100).toFixed(1)
-                    : 0;
-                document.getElementById('winner-winrate').textContent = `${winRate}%`;
-
-                showWinnerModal();
-            }
-        }
-
-        function showWinnerModal() {
-            document.getElementById('winner-modal').classList.remove('hidden');
-        }
-
-        function closeWinnerModal() {
-            document.getElementById('winner-modal').classList.add('hidden');
-        }
-
-        // Load experimental data
-        function loadExperimentalData() {
-            // Load BRQC results
-            fetch('/api/brqc-results')
-                .then(r => r.json())
-                .then(data => {
-                    tournamentData.brqcResults = data;
-                    if (tournamentData.activeTab === 'brqc') {
-                        updateBRQCCharts();
-                    }
-                })
-                .catch(e => console.log('BRQC data not available'));
-
-            // Load Theorem 1 results
-            fetch('/api/theorem1-results')
-                .then(r => r.json())
-                .then(data => {
-                    tournamentData.theorem1Results = data;
-                    if (tournamentData.activeTab === 'theorem1') {
-                        updateTheorem1Charts();
-                    }
-                })
-                .catch(e => console.log('Theorem1 data not available'));
-        }
-
-        // Initialize innovations showcase
-        function initializeInnovations() {
-            const innovations = [
-                {
-                    icon: '⚛️',
-                    title: 'BRQC Algorithm',
-                    status: 'Active',
-                    metrics: { 'Speedup': '25×', 'Complexity': 'O(√n)', 'Success': '96%' }
-                },
-                {
-                    icon: '🛡️',
-                    title: 'Byzantine Fault Tolerance',
-                    status: 'Active',
-                    metrics: { 'Detection': '100%', 'Tolerance': 'f<n/3', 'Violations': '0' }
-                },
-                {
-                    icon: '📐',
-                    title: 'Theorem 1 Validated',
-                    status: 'Verified',
-                    metrics: { 'Speedup': '6.8×', 'Slope': '0.69', 'Confidence': '95%' }
-                },
-                {
-                    icon: '🎯',
-                    title: 'Quantum Strategies',
-                    status: 'Active',
-                    metrics: { 'Win Rate': '+23%', 'Convergence': 'O(√n)', 'Noise': '< 0.15' }
-                },
-                {
-                    icon: '🧠',
-                    title: 'Few-Shot Learning',
-                    status: 'Active',
-                    metrics: { 'Moves': '5-10', 'Accuracy': '87%', 'Boost': '+13.7%' }
-                },
-                {
-                    icon: '🔬',
-                    title: 'Neuro-Symbolic',
-                    status: 'Active',
-                    metrics: { 'Logic': 'Integrated', 'Learning': 'Hybrid', 'Performance': 'High' }
-                }
-            ];
-
-            const grid = document.getElementById('innovations-grid');
-            grid.innerHTML = innovations.map(inn => `
-                <div class="innovation-card">
-                    <div class="innovation-header">
-                        <div class="innovation-icon">${inn.icon}</div>
-                        <div style="flex: 1;">
-                            <div class="innovation-title">${inn.title}</div>
-                            <span class="innovation-status">${inn.status}</span>
-                        </div>
-                    </div>
-                    ${Object.entries(inn.metrics).map(([key, val]) => `
-                        <div class="innovation-metric">
-                            <span style="color: #a0aec0;">${key}</span>
-                            <span style="font-weight: 700; color: #667eea;">${val}</span>
-                        </div>
-                    `).join('')}
-                </div>
-            `).join('');
-        }
-
-        // Update BRQC charts
-        function updateBRQCCharts() {
-            const results = tournamentData.brqcResults;
-            if (!results || !results.experiment1) return;
-
-            // Convergence scaling chart
-            const exp1 = results.experiment1.results;
-            Plotly.newPlot('brqc-convergence-chart', [{
-                x: exp1.map(r => r.m),
-                y: exp1.map(r => r.mean_time),
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'BRQC Time',
-                line: { color: '#667eea', width: 3 },
-                marker: { size: 10 }
-            }], {
-                title: 'Convergence Time vs Problem Size',
-                xaxis: { title: 'Problem Size (m)', color: '#a0aec0' },
-                yaxis: { title: 'Convergence Time', color: '#a0aec0' },
-                paper_bgcolor: 'rgba(0,0,0,0.2)',
-                plot_bgcolor: 'rgba(0,0,0,0.2)',
-                font: { color: '#e0e0e0' }
-            });
-
-            // Speedup chart
-            if (results.experiment3) {
-                const exp3 = results.experiment3.results;
-                Plotly.newPlot('brqc-speedup-chart', [{
-                    x: exp3.map(r => r.m),
-                    y: exp3.map(r => r.speedup),
-                    type: 'bar',
-                    name: 'Actual Speedup',
-                    marker: { color: '#10b981' }
-                }, {
-                    x: exp3.map(r => r.m),
-                    y: exp3.map(r => r.theoretical_speedup),
-                    type: 'scatter',
-                    mode: 'lines',
-                    name: 'Theoretical (√n)',
-                    line: { color: '#ef4444', dash: 'dash', width: 2 }
-                }], {
-                    title: 'BRQC Speedup vs Classical',
-                    xaxis: { title: 'Problem Size (m)', color: '#a0aec0' },
-                    yaxis: { title: 'Speedup Factor', color: '#a0aec0' },
-                    paper_bgcolor: 'rgba(0,0,0,0.2)',
-                    plot_bgcolor: 'rgba(0,0,0,0.2)',
-                    font: { color: '#e0e0e0' }
-                });
-            }
-        }
-
-        // Update Theorem 1 charts
-        function updateTheorem1Charts() {
-            const results = tournamentData.theorem1Results;
-            if (!results || !results.experiment_1) return;
-
-            const exp = results.experiment_1;
-            const nValues = exp.n_values;
-            const quantumTimes = nValues.map(n => exp.results[n].quantum_mean);
-            const classicalTimes = nValues.map(n => exp.results[n].classical_mean);
-            const speedups = nValues.map(n => exp.results[n].speedup);
-
-            // Convergence comparison
-            Plotly.newPlot('theorem1-convergence-chart', [{
-                x: nValues,
-                y: quantumTimes,
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'Quantum',
-                line: { color: '#667eea', width: 3 },
-                marker: { size: 10 }
-            }, {
-                x: nValues,
-                y: classicalTimes,
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'Classical',
-                line: { color: '#ef4444', width: 3 },
-                marker: { size: 10 }
-            }], {
-                title: 'Quantum vs Classical Convergence Time',
-                xaxis: { title: 'Number of Strategies (n)', color: '#a0aec0' },
-                yaxis: { title: 'Convergence Time (ms)', color: '#a0aec0' },
-                paper_bgcolor: 'rgba(0,0,0,0.2)',
-                plot_bgcolor: 'rgba(0,0,0,0.2)',
-                font: { color: '#e0e0e0' }
-            });
-
-            // Speedup factor
-            Plotly.newPlot('theorem1-speedup-chart', [{
-                x: nValues,
-                y: speedups,
-                type: 'bar',
-                marker: { color: '#10b981' }
-            }], {
-                title: 'Speedup Factor (Quantum / Classical)',
-                xaxis: { title: 'Number of Strategies (n)', color: '#a0aec0' },
-                yaxis: { title: 'Speedup Factor', color: '#a0aec0' },
-                paper_bgcolor: 'rgba(0,0,0,0.2)',
-                plot_bgcolor: 'rgba(0,0,0,0.2)',
-                font: { color: '#e0e0e0' }
-            });
-        }
-
-        // Update Byzantine charts
-        function updateByzantineCharts() {
-            const results = tournamentData.brqcResults;
-            if (!results) return;
-
-            // Byzantine tolerance chart
-            if (results.experiment2) {
-                const exp2 = results.experiment2.results;
-                Plotly.newPlot('byzantine-tolerance-chart', [{
-                    x: exp2.map(r => `f=${r.f}`),
-                    y: exp2.map(r => r.success_rate * 100),
-                    type: 'bar',
-                    marker: { color: '#10b981' }
-                }], {
-                    title: 'Success Rate vs Byzantine Nodes',
-                    xaxis: { title: 'Byzantine Nodes (f)', color: '#a0aec0' },
-                    yaxis: { title: 'Success Rate (%)', color: '#a0aec0' },
-                    paper_bgcolor: 'rgba(0,0,0,0.2)',
-                    plot_bgcolor: 'rgba(0,0,0,0.2)',
-                    font: { color: '#e0e0e0' }
-                });
-            }
-
-            // Byzantine strategy detection
-            if (results.experiment4) {
-                const exp4 = results.experiment4.results;
-                Plotly.newPlot('byzantine-strategy-chart', [{
-                    x: exp4.map(r => r.strategy),
-                    y: exp4.map(r => r.success_rate * 100),
-                    type: 'bar',
-                    marker: {
-                        color: exp4.map(r => r.success_rate * 100),
-                        colorscale: [[0, '#ef4444'], [0.5, '#f59e0b'], [1, '#10b981']]
-                    }
-                }], {
-                    title: 'Detection Rate by Attack Type',
-                    xaxis: { title: 'Attack Strategy', color: '#a0aec0' },
-                    yaxis: { title: 'Detection Rate (%)', color: '#a0aec0' },
-                    paper_bgcolor: 'rgba(0,0,0,0.2)',
-                    plot_bgcolor: 'rgba(0,0,0,0.2)',
-                    font: { color: '#e0e0e0' }
-                });
-            }
-        }
-
-        // Export data
-        function exportData() {
-            const dataStr = JSON.stringify(tournamentData, null, 2);
-            const dataBlob = new Blob([dataStr], {type: 'application/json'});
-            const url = URL.createObjectURL(dataBlob);
-            const link = document.createElement('a');
-            link.href = url;
-            link.download = `ultimate_dashboard_data_${Date.now()}.json`;
-            link.click();
-        }
-    </script>
-</body>
-</html>
-"""
+from .assets import ULTIMATE_ASSETS, Asset
+from .fanout import DEFAULT_SEND_QUEUE_SIZE, ClientOutbox
 
 
 class UltimateDashboard:
     """Ultimate MIT-Level Dashboard with all innovations visualized."""
 
-    def __init__(self, port: int = 8050):
+    def __init__(
+        self,
+        port: int = 8050,
+        send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        overflow_policy: str = "drop_oldest",
+    ):
         """Initialize the ultimate dashboard.
 
         Args:
             port: Port to run the dashboard server on
+            send_queue_size: Messages queued per client before overflow
+            overflow_policy: "drop_oldest", "drop_topic" or "disconnect"
         """
         self.port = port
         self.app = web.Application()
         self.clients: List[web.WebSocketResponse] = []
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = overflow_policy
+        self._outboxes: Dict[web.WebSocketResponse, ClientOutbox] = {}
         self.data_dir = Path(__file__).parent.parent.parent
 
         # Setup routes
         self.app.router.add_get("/", self.handle_index)
+        self.app.router.add_get("/static/{filename}", self.handle_static)
         self.app.router.add_get("/ws", self.handle_websocket)
         self.app.router.add_get("/api/brqc-results", self.handle_brqc_results)
         self.app.router.add_get("/api/theorem1-results", self.handle_theorem1_results)
@@ -1488,7 +73,23 @@ class UltimateDashboard:
 
     async def handle_index(self, request: web.Request) -> web.Response:
         """Serve the main dashboard HTML."""
-        return web.Response(text=ULTIMATE_DASHBOARD_HTML, content_type="text/html")
+        return self._asset_response(ULTIMATE_ASSETS.page, request)
+
+    async def handle_static(self, request: web.Request) -> web.Response:
+        """Serve dashboard CSS/JS (content-hashed names are cached for a year)."""
+        asset = ULTIMATE_ASSETS.get(request.match_info["filename"])
+        if asset is None:
+            raise web.HTTPNotFound()
+        return self._asset_response(asset, request)
+
+    @staticmethod
+    def _asset_response(asset: Asset, request: web.Request) -> web.Response:
+        body, headers = asset.select(request.headers.get("Accept-Encoding", ""))
+        if asset.not_modified(request.headers.get("If-None-Match")):
+            headers.pop("Content-Encoding", None)
+            return web.Response(status=304, headers=headers)
+        headers["Content-Type"] = asset.media_type
+        return web.Response(body=body, headers=headers)
 
     async def handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
         """Handle WebSocket connections."""
@@ -1496,19 +97,34 @@ class UltimateDashboard:
         await ws.prepare(request)
 
         self.clients.append(ws)
+        outbox = ClientOutbox(
+            ws.send_str,
+            on_close=lambda: self._remove_client(ws),
+            max_queue=self.send_queue_size,
+            overflow=self.overflow_policy,
+            name=f"client-{id(ws):x}",
+        )
+        self._outboxes[ws] = outbox
 
         try:
             async for msg in ws:
                 if msg.type == web.WSMsgType.TEXT:
                     # Echo back for now
-                    await ws.send_str(msg.data)
+                    outbox.put(msg.data)
                 elif msg.type == web.WSMsgType.ERROR:
                     print(f'WebSocket error: {ws.exception()}')
         finally:
-            self.clients.remove(ws)
+            self._remove_client(ws)
 
         return ws
 
+    def _remove_client(self, ws: web.WebSocketResponse) -> None:
+        if ws in self.clients:
+            self.clients.remove(ws)
+        outbox = self._outboxes.pop(ws, None)
+        if outbox is not None:
+            outbox.close()
+
     async def handle_brqc_results(self, request: web.Request) -> web.Response:
         """Serve BRQC validation results."""
         try:
@@ -1536,22 +152,22 @@ class UltimateDashboard:
         return web.json_response({"error": "Data not available"}, status=404)
 
     async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast a message to all connected clients."""
-        if not self.clients:
+        """Broadcast a message to all connected clients.
+
+        The message is encoded once and queued per client; each client's
+        writer task sends it, so a slow client does not delay the others.
+        """
+        if not self._outboxes:
             return
 
         message_str = json.dumps(message)
+        topic = message.get("type")
+        for outbox in list(self._outboxes.values()):
+            outbox.put(message_str, topic=topic)
 
-        # Remove disconnected clients
-        disconnected = []
-        for ws in self.clients:
-            try:
-                await ws.send_str(message_str)
-            except Exception:
-                disconnected.append(ws)
-
-        for ws in disconnected:
-            self.clients.remove(ws)
+    def get_client_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-client queue depth, drops and send latency."""
+        return {outbox.name: outbox.get_stats() for outbox in self._outboxes.values()}
 
     async def send_tournament_update(
         self,
@@ -1592,6 +208,9 @@ class UltimateDashboard:
 
     async def cleanup(self):
         """Cleanup resources."""
+        for outbox in self._outboxes.values():
+            outbox.close()
+        self._outboxes.clear()
         for ws in self.clients:
             await ws.close()
         self.clients.clear()
@@ -708,8 +708,7 @@ class TestComponentLauncherDashboardEvents:
         mock_dashboard.tournament_states = {
             "tournament1": MockTournamentState("tournament1", datetime.now())
         }
-        mock_dashboard.connection_manager = AsyncMock()
-        mock_dashboard.connection_manager.broadcast = AsyncMock()
+        mock_dashboard.publish = MagicMock()
 
         mock_integration = AsyncMock()
         mock_integration.dashboard = mock_dashboard
@@ -720,7 +719,10 @@ class TestComponentLauncherDashboardEvents:
 
         await launcher._on_standings_updated(event)
 
-        mock_dashboard.connection_manager.broadcast.assert_awaited_once()
+        mock_dashboard.publish.assert_called_once()
+        topic, message = mock_dashboard.publish.call_args.args
+        assert topic == "tournament_state:tournament1"
+        assert message["type"] == "tournament_state"
 
     @pytest.mark.asyncio
     async def test_on_standings_updated_no_tournament_states(self, mock_config):
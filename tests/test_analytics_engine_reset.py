@@ -103,8 +103,8 @@ class TestAnalyticsEngineReset:
 
     def test_reset_clears_replay_history(self, engine):
         """Test reset clears replay history."""
-        engine.replay_history.append({"round": 1})
-        engine.replay_history.append({"round": 2})
+        engine.replay_history.capture(1, "t1", standings=[], strategy_performance={})
+        engine.replay_history.capture(2, "t2", standings=[], strategy_performance={})
 
         assert len(engine.replay_history) == 2
 
@@ -0,0 +1,137 @@
+"""
+Tests for keyframe-plus-delta replay history.
+
+Testing:
+- Reconstructed states match full snapshots
+- Keyframe spacing and retention trimming
+- Streaming and cursor paging through the dashboard API
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.visualization.analytics import AnalyticsEngine, ReplayLog
+from src.visualization.dashboard import DashboardAPI
+
+
+def _full_snapshot(engine: AnalyticsEngine, round_num: int) -> dict:
+    """Snapshot the engine the way the replay history used to."""
+    return {
+        "round_number": round_num,
+        "standings": engine._generate_standings(),
+        "strategy_performance": {
+            name: {
+                "rounds": list(a.rounds),
+                "win_rates": list(a.win_rates),
+                "avg_scores": list(a.avg_scores),
+                "total_wins": a.total_wins,
+                "total_matches": a.total_matches,
+            }
+            for name, a in engine.strategy_performance.items()
+        },
+    }
+
+
+async def _play(engine: AnalyticsEngine, rounds: int) -> list[dict]:
+    engine.register_player("P01", "adaptive")
+    engine.register_player("P02", "random")
+    expected = []
+    for round_num in range(1, rounds + 1):
+        if round_num == 4:
+            engine.register_player("P03", "pattern")
+        opponent = "P03" if round_num >= 4 and round_num % 2 else "P02"
+        scores = {"P01": round_num % 3, opponent: 1}
+        await engine.on_round_complete(round_num, "P01", opponent, {}, scores)
+        expected.append(_full_snapshot(engine, round_num))
+    return expected
+
+
+class TestReplayLog:
+    """Test replay storage and reconstruction."""
+
+    @pytest.fixture
+    def engine(self):
+        engine = AnalyticsEngine()
+        engine.replay_history = ReplayLog(keyframe_interval=4, max_snapshots=1000)
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_reconstruction_matches_full_snapshots(self, engine):
+        """Test every round rebuilds to the full snapshot."""
+        expected = await _play(engine, 11)
+
+        for snap in expected:
+            state = engine.get_replay_state(snap["round_number"])
+            assert state.standings == snap["standings"]
+            assert state.strategy_performance == snap["strategy_performance"]
+
+        history = engine.get_replay_history(3, 6)
+        assert [s.round_number for s in history] == [3, 4, 5, 6]
+        assert history[-1].strategy_performance == expected[5]["strategy_performance"]
+        assert engine.get_replay_state(99) is None
+
+    @pytest.mark.asyncio
+    async def test_keyframes_are_periodic(self, engine):
+        """Test deltas hold only appended entries between keyframes."""
+        await _play(engine, 9)
+
+        segments = engine.replay_history._segments
+        assert [s.base_seq for s in segments] == [0, 4, 8]
+        delta = segments[0].deltas[0]["strategies"]["adaptive"]
+        assert delta["rounds"] == [2]
+
+    @pytest.mark.asyncio
+    async def test_trimming_drops_whole_segments(self):
+        """Test retention drops the oldest segments."""
+        engine = AnalyticsEngine()
+        engine.replay_history = ReplayLog(keyframe_interval=4, max_snapshots=6)
+
+        expected = await _play(engine, 14)
+
+        assert len(engine.replay_history) < 6 + 4
+        assert engine.get_replay_state(1) is None
+        last = engine.get_replay_state(14)
+        assert last.strategy_performance == expected[-1]["strategy_performance"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_without_series(self, engine):
+        """Test streaming yields totals only when series are excluded."""
+        expected = await _play(engine, 6)
+
+        states = list(engine.iter_replay_history(2, 4))
+
+        assert [s.round_number for s in states] == [2, 3, 4]
+        adaptive = expected[3]["strategy_performance"]["adaptive"]
+        assert states[-1].strategy_performance["adaptive"] == {
+            "total_wins": adaptive["total_wins"],
+            "total_matches": adaptive["total_matches"],
+        }
+
+
+class TestReplayHistoryEndpoint:
+    """Test paging the replay history through the dashboard API."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_paging(self):
+        """Test pages chain through next_cursor and cover every round."""
+        engine = AnalyticsEngine()
+        engine.replay_history = ReplayLog(keyframe_interval=3)
+        await _play(engine, 7)
+        client = TestClient(DashboardAPI().app)
+
+        rounds = []
+        cursor = None
+        with patch("src.visualization.analytics.get_analytics_engine", return_value=engine):
+            while True:
+                params = {"limit": 3}
+                if cursor is not None:
+                    params["cursor"] = cursor
+                data = client.get("/api/analytics/replay/history", params=params).json()
+                rounds.extend(snap["round"] for snap in data["snapshots"])
+                cursor = data["next_cursor"]
+                if cursor is None:
+                    break
+
+        assert rounds == list(range(1, 8))
@@ -0,0 +1,116 @@
+"""
+Tests for columnar ring-buffer time series.
+
+Testing:
+- RingSeries eviction, running aggregates and list-like reads
+- LTTB downsampling keeps endpoints and extremes
+- Analytics exports stay bounded and JSON-friendly
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.visualization.analytics import AnalyticsEngine
+from src.visualization.timeseries import (
+    RingSeries,
+    downsample,
+    downsample_columns,
+    lttb_indices,
+)
+
+
+class TestRingSeries:
+    """Test the ring buffer."""
+
+    def test_eviction_and_running_sum(self):
+        """Test old values are evicted while aggregates cover all values."""
+        series = RingSeries(capacity=3)
+        series.extend([1, 2, 3, 4, 5])
+
+        assert series == [3, 4, 5]
+        assert len(series) == 3
+        assert series.total == 5
+        assert series.sum == 15
+        assert series[0] == 3
+        assert series[-1] == 5
+        assert series[1:] == [4, 5]
+        with pytest.raises(IndexError):
+            series[3]
+
+    def test_last_and_since(self):
+        """Test tail reads across the wrap point."""
+        series = RingSeries(capacity=4)
+        series.extend(range(6))
+
+        assert series.last(3).tolist() == [3.0, 4.0, 5.0]
+        assert series.since(4) == [4.0, 5.0]
+        assert series.last(10).tolist() == [2.0, 3.0, 4.0, 5.0]
+
+    def test_clear(self):
+        """Test clear resets values and aggregates."""
+        series = RingSeries([1.0, 2.0])
+        series.clear()
+
+        assert not series
+        assert series.total == 0
+        assert series.sum == 0.0
+
+
+class TestDownsampling:
+    """Test LTTB downsampling."""
+
+    def test_short_series_unchanged(self):
+        """Test series within the budget are returned as-is."""
+        assert downsample([1, 2, 3], 10) == [1, 2, 3]
+
+    def test_keeps_endpoints_and_spike(self):
+        """Test LTTB keeps the first, last and a visually significant point."""
+        y = np.zeros(1000)
+        y[437] = 50.0
+
+        indices = lttb_indices(np.arange(1000.0), y, 20)
+
+        assert len(indices) == 20
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert 437 in indices
+
+    def test_columns_stay_aligned(self):
+        """Test every column keeps the same rows."""
+        rounds = list(range(2000))
+        columns = downsample_columns(
+            {"rounds": rounds, "values": [r * 2 for r in rounds]}, max_points=100
+        )
+
+        assert len(columns["rounds"]) == 100
+        assert columns["values"] == [r * 2 for r in columns["rounds"]]
+
+
+class TestAnalyticsSeries:
+    """Test analytics engine integration."""
+
+    @pytest.mark.asyncio
+    async def test_exports_are_bounded(self):
+        """Test visualization and research exports after a long run."""
+        engine = AnalyticsEngine()
+        engine.register_player("P01", "adaptive")
+        engine.register_player("P02", "random")
+
+        for round_num in range(1, 1201):
+            scores = {"P01": round_num % 3, "P02": 1}
+            await engine.on_round_complete(round_num, "P01", "P02", {}, scores)
+
+        adaptive = engine.get_strategy_analytics("adaptive")
+        assert adaptive.cumulative_scores[-1] == pytest.approx(sum(r % 3 for r in range(1, 1201)))
+
+        exported = engine.export_for_visualization("adaptive", max_points=100)
+        series = exported["time_series"]
+        assert len(series["rounds"]) == 100
+        assert series["rounds"][0] == 1
+        assert series["rounds"][-1] == 1200
+
+        research = engine.export_for_research()
+        json.dumps(research["strategy_performance"])
+        assert len(research["strategy_performance"]["adaptive"]["rounds"]) == 1200
@@ -0,0 +1,199 @@
+"""
+Tests for deadline-aware (anytime) move decisions.
+
+Testing:
+- Best-so-far move played when refinement runs past the budget
+- Budgets from the referee's deadline and the player's time limit
+- Failed refinements and cut-off counters
+- Referee asking both players concurrently
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agents.player import GameSession, PlayerAgent
+from src.agents.referee import GameSession as RefereeSession
+from src.agents.referee import RefereeAgent
+from src.agents.strategies import MoveDecision, Strategy, StrategyFactory, StrategyType
+from src.client.mcp_client import MCPClient
+from src.game.match import Match
+from src.game.odd_even import GameRole
+from src.observability import get_metrics_collector
+
+
+class SlowSearch(Strategy):
+    """Improves its move every ``step`` seconds, ``steps`` times."""
+
+    def __init__(self, step=0.02, steps=3, fail=False):
+        super().__init__()
+        self.step = step
+        self.steps = steps
+        self.fail = fail
+
+    def initial_move(self, **state):
+        return 1
+
+    async def refine_move(self, decision, budget, **state):
+        for move in range(2, 2 + self.steps):
+            await asyncio.sleep(self.step)
+            if self.fail:
+                raise RuntimeError("search blew up")
+            decision.improve(move)
+
+    async def decide_move(self, **state):
+        return 2
+
+    def reset(self):
+        pass
+
+
+def make_player(strategy, **kwargs):
+    player = PlayerAgent(player_name="Anytime", strategy=strategy, port=0, **kwargs)
+    player._games["g1"] = GameSession(
+        game_id="g1",
+        opponent_id="P02",
+        my_role=GameRole.ODD,
+        total_rounds=5,
+        match_id="m1",
+        current_round=1,
+        state="accepted",
+    )
+    return player
+
+
+def iso_in(seconds):
+    return (datetime.utcnow() + timedelta(seconds=seconds)).isoformat() + "Z"
+
+
+class TestMakeMove:
+    async def test_unlimited_budget_runs_to_completion(self):
+        player = make_player(SlowSearch())
+
+        assert await player.make_move("g1") == 4
+        assert (player._moves_decided, player._moves_cut_off) == (1, 0)
+
+    async def test_cut_off_plays_best_so_far(self):
+        player = make_player(SlowSearch(step=0.03, steps=20))
+
+        start = time.monotonic()
+        move = await player.make_move("g1", budget=0.15)
+
+        assert time.monotonic() - start < 0.3
+        assert 2 <= move < 21  # Some refinements finished in time, not all
+        assert player._moves_cut_off == 1
+
+    async def test_zero_budget_plays_initial_move(self):
+        player = make_player(SlowSearch())
+
+        assert await player.make_move("g1", budget=0) == 1
+        assert player._moves_cut_off == 1
+
+    async def test_time_limit_caps_budget(self):
+        player = make_player(SlowSearch(step=1), move_time_limit=0.05)
+
+        start = time.monotonic()
+        assert await player.make_move("g1", budget=10) == 1
+        assert time.monotonic() - start < 0.5
+
+    async def test_failed_refinement_keeps_best_so_far(self):
+        player = make_player(SlowSearch(fail=True))
+
+        assert await player.make_move("g1", budget=1) == 1
+        assert (player._moves_decided, player._moves_cut_off) == (1, 0)
+
+    async def test_default_protocol_wraps_decide_move(self):
+        class Fixed(Strategy):
+            async def decide_move(self, **state):
+                return 7
+
+            def reset(self):
+                pass
+
+        strategy = Fixed()
+        decision = MoveDecision(strategy.initial_move("g", 1, GameRole.ODD, 0, 0, []))
+
+        await strategy.refine_move(decision, None, "g", 1, GameRole.ODD, 0, 0, [])
+
+        assert (decision.move, decision.refinements) == (7, 1)
+
+    async def test_outcomes_are_counted(self):
+        metrics = get_metrics_collector()
+
+        def count(outcome):
+            counter = metrics.get_counter(
+                "strategy_decisions_total", {"strategy": "SlowSearch", "outcome": outcome}
+            )
+            return counter.value if counter else 0
+
+        before = count("cut_off")
+        player = make_player(SlowSearch(step=1))
+        await player.make_move("g1", budget=0.01)
+
+        assert count("cut_off") == before + 1
+
+
+class TestDeadline:
+    def test_budget_leaves_margin(self):
+        player = make_player(SlowSearch(), move_margin=0.5)
+
+        assert 1.3 < player._move_budget(iso_in(2)) <= 1.5
+        assert player._move_budget(iso_in(-5)) == 0
+        assert player._move_budget(None) is None
+        assert player._move_budget("not a time") is None
+
+    def test_aware_deadline(self):
+        player = make_player(SlowSearch(), move_margin=0)
+        deadline = (datetime.now(UTC) + timedelta(seconds=2)).isoformat()
+
+        assert 1.8 < player._move_budget(deadline) <= 2
+
+    async def test_parity_call_meets_deadline(self):
+        player = make_player(SlowSearch(step=5), move_margin=0.1)
+
+        start = time.monotonic()
+        result = await player._handle_choose_parity_call(
+            {"match_id": "m1", "context": {"round_id": 1}, "deadline": iso_in(0.3)}
+        )
+
+        assert time.monotonic() - start < 0.3
+        assert result["move"] == 1
+        assert player._moves_cut_off == 1
+
+
+async def test_referee_asks_players_concurrently():
+    referee = RefereeAgent(referee_id="REF01", port=0, move_timeout=2)
+    client = AsyncMock(spec=MCPClient)
+    client.connected_servers = {"P01": "url1", "P02": "url2"}
+
+    async def thinking(player_id, message, timeout):
+        assert timeout == 2
+        await asyncio.sleep(0.1)
+        return {"move": 5 if player_id == "P01" else 4}
+
+    client.send_protocol_message = AsyncMock(side_effect=thinking)
+    referee._client = client
+    match = Match(match_id="M001", league_id=referee.league_id)
+    match.set_players("P01", "http://p1/mcp", "P02", "http://p2/mcp")
+    game = match.create_game(total_rounds=5, player1_role=GameRole.ODD)
+    game.start()
+
+    start = time.monotonic()
+    with patch.object(referee, "_send_round_results", new_callable=AsyncMock):
+        await referee._run_round(RefereeSession(match=match, game=game, state="running"))
+
+    assert time.monotonic() - start < 0.18
+    assert game.round_history[0].player1_move == 5
+
+
+@pytest.mark.parametrize("budget", [None, 1.0])
+async def test_game_theory_strategies_complete_within_budget(budget):
+    player = make_player(StrategyFactory.create(StrategyType.ADAPTIVE_BAYESIAN))
+
+    move = await player.make_move("g1", budget=budget)
+
+    assert 1 <= move <= 10
+    assert player._moves_cut_off == 0
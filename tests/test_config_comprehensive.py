@@ -291,6 +291,24 @@ class TestConfigFromFile:
         finally:
             os.unlink(temp_path)
 
+    def test_from_dict_with_rate_limit_config(self):
+        """Test loading rate limit config from dict."""
+        config = Config.from_dict(
+            {
+                "rate_limit": {
+                    "requests_per_minute": 500,
+                    "referee_burst_size": 1000,
+                    "exempt_peer_classes": ["league_manager", "referee"],
+                    "unknown_field": True,
+                }
+            }
+        )
+
+        assert config.rate_limit.requests_per_minute == 500
+        assert config.rate_limit.referee_burst_size == 1000
+        assert config.rate_limit.exempt_peer_classes == ["league_manager", "referee"]
+        assert config.rate_limit.idle_bucket_ttl == 300.0
+
     def test_from_file_with_referee_config(self):
         """Test loading referee config from file."""
         config_data = {
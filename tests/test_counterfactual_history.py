@@ -0,0 +1,116 @@
+"""
+Tests for round-indexed counterfactual history.
+
+Testing:
+- Round buckets, latest round and range queries
+- List compatibility and running regret total
+- Flat per-round dashboard cost over 10 000 rounds
+"""
+
+import time
+
+import pytest
+
+from src.agents.strategies.counterfactual_reasoning import (
+    CounterfactualHistory,
+    CounterfactualOutcome,
+    CounterfactualReasoningEngine,
+)
+from src.visualization.analytics import AnalyticsEngine
+from src.visualization.dashboard import DashboardAPI
+from src.visualization.integration import DashboardIntegration
+
+
+def outcome(round_num: int, move: int = 2, regret: float = 1.0) -> CounterfactualOutcome:
+    return CounterfactualOutcome(
+        actual_move=1,
+        counterfactual_move=move,
+        actual_reward=0.0,
+        counterfactual_reward=regret,
+        regret=regret,
+        confidence=0.5,
+        round=round_num,
+    )
+
+
+class TestCounterfactualHistory:
+    def test_round_lookup(self):
+        history = CounterfactualHistory()
+        for round_num in range(1, 4):
+            for move in (2, 3):
+                history.append(outcome(round_num, move))
+
+        assert [cf.counterfactual_move for cf in history.for_round(2)] == [2, 3]
+        assert history.for_round(99) == []
+        assert history.latest_round() == 3
+        assert all(cf.round == 3 for cf in history.latest())
+
+    def test_between_is_inclusive_and_ordered(self):
+        history = CounterfactualHistory()
+        for round_num in (1, 2, 5, 3, 8):
+            history.append(outcome(round_num))
+
+        assert [cf.round for cf in history.between(2, 5)] == [2, 3, 5]
+        assert list(history.between(9, 12)) == []
+
+    def test_behaves_like_a_list(self):
+        history = CounterfactualHistory()
+        assert not history
+        history.append(outcome(1, regret=2.0))
+        history.append(outcome(2, regret=-0.5))
+
+        assert len(history) == 2
+        assert history[-1].round == 2
+        assert [cf.round for cf in history] == [1, 2]
+        assert history.total_regret == pytest.approx(1.5)
+
+        history.clear()
+        assert len(history) == 0
+        assert history.latest_round() is None
+        assert history.total_regret == 0.0
+
+    def test_regret_analysis_uses_running_total(self):
+        engine = CounterfactualReasoningEngine()
+        for round_num, regret in enumerate([3.0, 1.0, 7.0, 2.0, 5.0, 4.0, 6.0]):
+            engine.counterfactual_history.append(outcome(round_num, regret=regret))
+
+        analysis = engine.get_regret_analysis()
+
+        assert analysis["total_regret"] == pytest.approx(28.0)
+        assert [row["regret"] for row in analysis["most_regretful"]] == [7.0, 6.0, 5.0, 4.0, 3.0]
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+class TestCounterfactualBenchmark:
+    """Per-round dashboard cost must not grow with tournament length."""
+
+    @pytest.mark.asyncio
+    async def test_flat_per_round_cost_over_10000_rounds(self):
+        analytics = AnalyticsEngine()
+        integration = DashboardIntegration(
+            dashboard=DashboardAPI(frame_rate_hz=0), analytics_engine=analytics
+        )
+        integration.enabled = True
+        engine = CounterfactualReasoningEngine()
+        integration.register_player("P1", "cfr", cfr_engine=engine)
+        assert "P1" in integration.cfr_engines
+
+        rounds = 10_000
+        window = 1_000
+        durations = []
+        for round_num in range(rounds):
+            for move in range(2, 11):
+                engine.counterfactual_history.append(outcome(round_num, move))
+            analytics.replay_history.capture(round_num, "", [], {})
+
+            start = time.perf_counter()
+            await integration._update_counterfactual_viz("P1", round_num)
+            assert analytics.get_replay_state(round_num) is not None
+            durations.append(time.perf_counter() - start)
+
+        early = sorted(durations[:window])[window // 2]
+        late = sorted(durations[-window:])[window // 2]
+
+        # Median per-round cost stays flat (a linear scan would be ~10x slower)
+        assert late < early * 3
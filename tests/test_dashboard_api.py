@@ -380,7 +380,7 @@ class TestDashboardAnalyticsEndpoints:
             mock_engine.get_matchup_matrix.return_value = mock_matrix
             mock_get_engine.return_value = mock_engine
 
-            response = client.get("/api/analytics/matchup_matrix")
+            response = client.get("/api/analytics/matchup_matrix?format=json")
 
             assert response.status_code == 200
             data = response.json()
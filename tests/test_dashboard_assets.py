@@ -0,0 +1,127 @@
+"""
+Tests for the dashboard's static assets.
+
+Testing:
+- Content-hashed asset URLs with long-lived cache headers
+- Pre-compressed variants chosen by Accept-Encoding
+- ETag revalidation of the page
+- Markup no longer loaded at import time
+"""
+
+import re
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.visualization.assets import IMMUTABLE_CACHE_CONTROL, AssetBundle
+from src.visualization.dashboard import DashboardAPI
+from src.visualization.http_cache import preferred_encoding
+
+
+@pytest.fixture
+def client():
+    return TestClient(DashboardAPI().app)
+
+
+def asset_urls(html):
+    return re.findall(r'(?:href|src)="(/static/[^"]+)"', html)
+
+
+class TestPreferredEncoding:
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("*", "br"),
+            ("*, br;q=0", "gzip"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_negotiation(self, header, expected):
+        assert preferred_encoding(header, ("br", "gzip")) == expected
+
+
+class TestAssetBundle:
+    def write(self, directory, css="body { color: red; }\n" * 100):
+        (directory / "page.html").write_text(
+            '<link rel="stylesheet" href="/static/page.css"><h1>Hello</h1>'
+        )
+        (directory / "page.css").write_text(css)
+        return AssetBundle("page.html", ("page.css",), static_dir=directory)
+
+    def test_page_links_to_hashed_assets(self, tmp_path):
+        bundle = self.write(tmp_path)
+        assert not bundle.loaded
+
+        url = bundle.url_for("page.css")
+
+        assert re.fullmatch(r"/static/page\.[0-9a-f]{10}\.css", url)
+        assert url in bundle.page.body.decode()
+        asset = bundle.get(url.rsplit("/", 1)[1])
+        assert asset.cache_control == IMMUTABLE_CACHE_CONTROL
+        assert asset.media_type == "text/css; charset=utf-8"
+
+    def test_hash_follows_content(self, tmp_path):
+        first = self.write(tmp_path).url_for("page.css")
+        second = self.write(tmp_path, css="body { color: blue; }\n" * 100).url_for("page.css")
+
+        assert first != second
+
+    def test_compressed_variants(self, tmp_path):
+        asset = self.write(tmp_path).get("page.css")
+
+        body, headers = asset.select("gzip")
+        plain, plain_headers = asset.select("")
+
+        assert headers["Content-Encoding"] == "gzip"
+        assert len(body) < len(plain)
+        assert "Content-Encoding" not in plain_headers
+
+    def test_unknown_asset(self, tmp_path):
+        assert self.write(tmp_path).get("missing.js") is None
+
+
+class TestDashboardEndpoints:
+    def test_page_references_cacheable_assets(self, client):
+        page = client.get("/")
+        urls = asset_urls(page.text)
+
+        assert page.headers["cache-control"] == "no-cache"
+        assert {url.rsplit(".", 1)[1] for url in urls} == {"css", "js"}
+        for url in urls:
+            response = client.get(url)
+            assert response.status_code == 200
+            assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_assets_served_compressed(self, client):
+        url = asset_urls(client.get("/").text)[-1]
+
+        compressed = client.get(url, headers={"Accept-Encoding": "gzip"})
+        plain = client.get(url, headers={"Accept-Encoding": "identity"})
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.text == plain.text
+        assert "javascript" in plain.headers["content-type"]
+
+    def test_page_revalidates_with_etag(self, client):
+        first = client.get("/")
+        again = client.get("/", headers={"If-None-Match": first.headers["etag"]})
+
+        assert again.status_code == 304
+
+    def test_unknown_asset_is_404(self, client):
+        assert client.get("/static/nope.js").status_code == 404
+
+
+def test_importing_visualization_does_not_load_markup():
+    code = (
+        "import src.visualization\n"
+        "from src.visualization.assets import DASHBOARD_ASSETS\n"
+        "assert not DASHBOARD_ASSETS.loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
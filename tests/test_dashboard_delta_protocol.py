@@ -0,0 +1,241 @@
+"""
+Tests for the delta WebSocket protocol.
+
+Testing:
+- JSON Patch diff/apply round trips
+- Topic matching and versioned topic state
+- Per-client snapshots, deltas and resyncs
+- ConnectionManager subscriptions (unit and over a real WebSocket)
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.visualization.dashboard import ConnectionManager, DashboardAPI
+from src.visualization.delta_protocol import (
+    ClientSession,
+    TopicStore,
+    apply_patch,
+    json_diff,
+    topic_matches,
+)
+
+
+def standings(n, leader_points=0):
+    rows = [{"player_id": f"P{i}", "points": 0} for i in range(n)]
+    rows[0]["points"] = leader_points
+    return {"type": "tournament_update", "data": {"round": 1, "standings": rows}}
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+
+class TestJsonPatch:
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 2], "c": {"d": None}}),
+            ({"rows": [{"x": 1}]}, {"rows": [{"x": 1}, {"x": 2}, {"x": 3}]}),
+            ({"a/b": 1, "t~": 2}, {"a/b": 3}),
+            ({"flag": True}, {"flag": 1}),
+            ([1, 2], {"now": "object"}),
+        ],
+    )
+    def test_round_trip(self, old, new):
+        assert apply_patch(old, json_diff(old, new)) == new
+
+    def test_patch_is_proportional_to_change(self):
+        old = standings(1000)
+        new = standings(1000, leader_points=3)
+
+        patch = json_diff(old, new)
+
+        assert patch == [{"op": "replace", "path": "/data/standings/0/points", "value": 3}]
+
+    def test_equal_documents_give_empty_patch(self):
+        assert json_diff(standings(5), standings(5)) == []
+
+    def test_apply_does_not_modify_input(self):
+        old = {"a": [1]}
+        apply_patch(old, json_diff(old, {"a": [1, 2]}))
+        assert old == {"a": [1]}
+
+
+class TestTopics:
+    @pytest.mark.parametrize(
+        "pattern,topic,expected",
+        [
+            ("tournament_update", "tournament_update", True),
+            ("opponent_model:P1", "opponent_model:P1:P2", True),
+            ("opponent_model:P1", "opponent_model:P10:P2", False),
+            ("match_update:*", "match_update:R1M2", True),
+            ("match_update", "matchup_matrix", False),
+        ],
+    )
+    def test_topic_matches(self, pattern, topic, expected):
+        assert topic_matches(pattern, topic) is expected
+
+    def test_versions_are_global_and_never_reused(self):
+        store = TopicStore(max_topics=1)
+
+        first = store.update("a", {"n": 1}).version
+        store.update("b", {"n": 1})  # evicts "a"
+        again = store.update("a", {"n": 2}).version
+
+        assert len(store) == 1
+        assert again > first
+
+    def test_delta_falls_back_when_base_left_history(self):
+        store = TopicStore(history_size=2)
+        base = store.update("t", standings(50)).version
+        store.update("t", standings(50, 1))
+        state = store.update("t", standings(50, 2))
+
+        assert state.encoded_delta(base) is None
+
+
+class TestClientSession:
+    def test_snapshot_then_deltas(self):
+        store = TopicStore()
+        session = ClientSession(subscriptions={"tournament_update"})
+
+        text, is_delta = session.encode_update(
+            store.update("tournament_update", standings(100)), 10
+        )
+        snapshot = json.loads(text)
+        assert not is_delta
+        assert snapshot["type"] == "snapshot"
+
+        state = store.update("tournament_update", standings(100, 1))
+        text, is_delta = session.encode_update(state, 10)
+        delta = json.loads(text)
+
+        assert is_delta
+        assert delta["base_version"] == snapshot["version"]
+        assert delta["version"] == state.version
+        assert apply_patch(snapshot["message"], delta["patch"]) == state.message
+        assert len(text) < len(state.encoded_snapshot()) / 10
+
+    def test_periodic_resync(self):
+        store = TopicStore()
+        session = ClientSession(subscriptions={"t"})
+
+        kinds = []
+        for i in range(7):
+            text, _ = session.encode_update(store.update("t", standings(20, i)), 3)
+            kinds.append(json.loads(text)["type"])
+
+        assert kinds == ["snapshot", "delta", "delta", "delta", "snapshot", "delta", "delta"]
+
+    def test_unsubscribed_client_gets_plain_messages(self):
+        store = TopicStore()
+        session = ClientSession()
+        message = standings(3)
+
+        text, is_delta = session.encode_update(store.update("t", message), 10)
+
+        assert json.loads(text) == message
+        assert not is_delta
+
+
+class TestConnectionManager:
+    @pytest.mark.asyncio
+    async def test_clients_receive_only_what_they_watch(self):
+        manager = ConnectionManager()
+        legacy, watcher = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(legacy)
+        await manager.connect(watcher)
+        await manager.handle_client_message(
+            watcher, {"type": "subscribe", "topics": ["match_update:R1M1"]}
+        )
+        await manager.drain()
+        watcher.sent.clear()
+
+        await manager.publish("tournament_update", standings(10))
+        moves = [f"move{i}" for i in range(20)]
+        await manager.publish("match_update:R1M1", {"moves": moves, "score": 1})
+        await manager.drain()
+        await manager.publish("match_update:R1M1", {"moves": moves, "score": 2})
+        await manager.publish("match_update:R1M2", {"moves": moves, "score": 9})
+        await manager.drain()
+
+        assert len(legacy.sent) == 4
+        assert [m["type"] for m in watcher.sent] == ["snapshot", "delta"]
+        assert watcher.sent[1]["patch"] == [{"op": "replace", "path": "/score", "value": 2}]
+        assert manager.get_stats()["deltas_sent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subscribe_sends_current_state_and_resync(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+        await manager.publish("opponent_model:P1:P2", {"belief": 0.5})
+        await manager.publish("opponent_model:P3:P4", {"belief": 0.1})
+        await manager.drain()
+        ws.sent.clear()
+
+        await manager.handle_client_message(
+            ws, {"type": "subscribe", "topics": ["opponent_model:P1"]}
+        )
+        await manager.drain()
+        assert ws.sent[0] == {"type": "subscribed", "topics": ["opponent_model:P1"], "delta": True}
+        assert ws.sent[1]["type"] == "snapshot"
+        assert ws.sent[1]["message"] == {"belief": 0.5}
+
+        ws.sent.clear()
+        await manager.handle_client_message(ws, {"type": "resync"})
+        await manager.drain()
+        assert [m["type"] for m in ws.sent] == ["snapshot"]
+
+    @pytest.mark.asyncio
+    async def test_events_filtered_by_type_for_subscribers(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+        await manager.handle_client_message(
+            ws, {"type": "subscribe", "topics": ["tournament_complete"]}
+        )
+        await manager.drain()
+        ws.sent.clear()
+
+        await manager.broadcast({"type": "player_registered"})
+        await manager.broadcast({"type": "tournament_complete"})
+        await manager.drain()
+
+        assert ws.sent == [{"type": "tournament_complete"}]
+
+    @pytest.mark.asyncio
+    async def test_non_control_messages_are_not_handled(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+
+        assert not await manager.handle_client_message(ws, {"type": "ping"})
+
+
+class TestWebSocketEndpoint:
+    def test_subscribe_over_websocket(self):
+        dashboard = DashboardAPI()
+        client = TestClient(dashboard.app)
+
+        with client.websocket_connect("/ws") as ws:
+            ws.send_text(json.dumps({"type": "subscribe", "topics": ["tournament_update"]}))
+            assert ws.receive_json()["type"] == "subscribed"
+
+            ws.send_text("ping")
+            assert ws.receive_json()["type"] == "pong"
+
+        assert dashboard.connection_manager.get_stats()["connections"] == 0
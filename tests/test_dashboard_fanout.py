@@ -0,0 +1,212 @@
+"""
+Tests for per-client WebSocket send queues.
+
+Testing:
+- Slow clients do not delay fast ones
+- Overflow policies (drop oldest, drop topic, disconnect)
+- Topic markers resolved to the latest message at send time
+- Per-client statistics
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.visualization.dashboard import ConnectionManager
+from src.visualization.fanout import ClientOutbox
+
+
+class BlockingSink:
+    """Send function that blocks until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, text):
+        await self.release.wait()
+        self.sent.append(text)
+
+
+class FakeWebSocket:
+    def __init__(self, blocked=False):
+        self.sent = []
+        self.closed = False
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self.release.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self):
+        self.closed = True
+
+
+class TestClientOutbox:
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError, match="Unknown overflow policy"):
+            ClientOutbox(BlockingSink(), overflow="block")
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        sink = BlockingSink()
+        outbox = ClientOutbox(sink, max_queue=3)
+
+        outbox.put("m0")
+        await asyncio.sleep(0)  # writer takes m0 and blocks sending it
+        for i in range(1, 6):
+            outbox.put(f"m{i}")
+        sink.release.set()
+        await outbox.join()
+
+        assert sink.sent == ["m0", "m3", "m4", "m5"]
+        assert outbox.get_stats()["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_topic_keeps_events(self):
+        sink = BlockingSink()
+        outbox = ClientOutbox(sink, max_queue=3, overflow="drop_topic")
+
+        outbox.put("first")
+        await asyncio.sleep(0)
+        outbox.put("event1")
+        outbox.put("standings v1", topic="standings")
+        outbox.put("event2")
+        outbox.put("event3")
+        sink.release.set()
+        await outbox.join()
+
+        assert sink.sent == ["first", "event1", "event2", "event3"]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_closes(self):
+        closed = []
+        outbox = ClientOutbox(
+            BlockingSink(), on_close=lambda: closed.append(True), max_queue=2, overflow="disconnect"
+        )
+
+        outbox.put("a")
+        await asyncio.sleep(0)
+        outbox.put("b")
+        outbox.put("c")
+        assert not outbox.put("d")
+
+        assert closed == [True]
+        assert outbox.closed
+        assert not outbox.put("e")
+
+    @pytest.mark.asyncio
+    async def test_topic_marker_sends_latest(self):
+        sink = BlockingSink()
+        latest = {"standings": "v1"}
+        outbox = ClientOutbox(sink, resolve=latest.get)
+
+        outbox.put("first")
+        await asyncio.sleep(0)
+        for version in range(2, 6):
+            latest["standings"] = f"v{version}"
+            outbox.put_topic("standings")
+        sink.release.set()
+        await outbox.join()
+
+        assert sink.sent == ["first", "v5"]
+        assert outbox.get_stats()["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_send_failure_closes(self):
+        async def failing(text):
+            raise ConnectionError("gone")
+
+        closed = []
+        outbox = ClientOutbox(failing, on_close=lambda: closed.append(True))
+
+        outbox.put("a")
+        await asyncio.sleep(0)
+
+        assert closed == [True]
+        assert outbox.get_stats()["sent"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        sink = BlockingSink()
+        sink.release.set()
+        outbox = ClientOutbox(sink, name="c1")
+
+        outbox.put("hello")
+        await outbox.join()
+        stats = outbox.get_stats()
+
+        assert stats["sent"] == 1
+        assert stats["bytes_sent"] == 5
+        assert stats["queue_depth"] == 0
+        assert stats["max_latency_ms"] >= 0
+
+
+class TestConnectionManagerFanOut:
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_others(self):
+        manager = ConnectionManager()
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        for i in range(10):
+            await manager.broadcast({"type": "event", "n": i})
+        await asyncio.wait_for(manager.outboxes[fast].join(), timeout=1)
+
+        assert [m["n"] for m in fast.sent] == list(range(10))
+        assert slow.sent == []
+
+        slow.release.set()
+        await asyncio.wait_for(manager.drain(), timeout=1)
+        assert len(slow.sent) == 10
+
+    @pytest.mark.asyncio
+    async def test_slow_client_evicted_with_disconnect_policy(self):
+        manager = ConnectionManager(send_queue_size=4, overflow_policy="disconnect")
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        for i in range(10):
+            await manager.broadcast({"type": "event", "n": i})
+            await asyncio.sleep(0)
+
+        assert slow not in manager.active_connections
+        assert slow.closed
+        assert fast in manager.active_connections
+
+    @pytest.mark.asyncio
+    async def test_backed_up_client_skips_to_latest_version(self):
+        manager = ConnectionManager()
+        slow = FakeWebSocket(blocked=True)
+        await manager.connect(slow)
+        await manager.broadcast({"type": "hello"})
+        await asyncio.sleep(0)
+
+        for round_number in range(5):
+            await manager.publish("tournament_update", {"round": round_number})
+        slow.release.set()
+        await manager.drain()
+
+        assert slow.sent == [{"type": "hello"}, {"round": 4}]
+
+    @pytest.mark.asyncio
+    async def test_per_client_stats(self):
+        manager = ConnectionManager(send_queue_size=2)
+        ws = FakeWebSocket(blocked=True)
+        await manager.connect(ws, {"client_id": "tab-1"})
+
+        for i in range(5):
+            await manager.broadcast({"type": "event", "n": i})
+        stats = manager.get_stats()
+
+        assert stats["clients"]["tab-1"]["queue_depth"] == 2
+        assert stats["messages_dropped"] == 3
+        manager.disconnect(ws)
@@ -0,0 +1,145 @@
+"""
+Tests for versioned analytics responses.
+
+Testing:
+- Per-resource analytics versions
+- ETag / If-None-Match revalidation and 304 responses
+- Cached, gzip-compressed bodies reused until the version changes
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.visualization.analytics import get_analytics_engine, reset_analytics_engine
+from src.visualization.dashboard import DashboardAPI
+
+
+@pytest.fixture
+def engine():
+    reset_analytics_engine()
+    yield get_analytics_engine()
+    reset_analytics_engine()
+
+
+@pytest.fixture
+def dashboard(engine):
+    return DashboardAPI()
+
+
+@pytest.fixture
+def client(dashboard):
+    return TestClient(dashboard.app)
+
+
+async def play_rounds(engine, rounds, players=8):
+    for i in range(players):
+        engine.register_player(f"P{i}", f"strategy_{i % 3}")
+    for round_num in range(1, rounds + 1):
+        a, b = f"P{round_num % players}", f"P{(round_num + 1) % players}"
+        await engine.on_round_complete(round_num, a, b, {a: "ODD", b: "EVEN"}, {a: 3.0, b: 0.0})
+
+
+class TestResourceVersions:
+    @pytest.mark.asyncio
+    async def test_only_touched_resources_change(self, engine):
+        strategies = engine.etag("strategies")
+        models = engine.etag("opponent_models")
+
+        await engine.on_opponent_model_update("P1", "P2", 0.5, 0.5, "random", {})
+
+        assert engine.etag("strategies") == strategies
+        assert engine.etag("opponent_models") != models
+
+    def test_matrix_writes_change_the_version(self, engine):
+        engine.matchup_matrix.record("P1", "P2", 3.0, 0.0)
+        before = engine.etag("matchup_matrix")
+
+        engine.matchup_matrix[("P1", "P2")]["draws"] += 1
+
+        assert engine.etag("matchup_matrix") != before
+
+    def test_reset_and_new_engines_never_repeat_a_validator(self, engine):
+        before = engine.etag()
+        engine.reset()
+        assert engine.etag() != before
+
+        reset_analytics_engine()
+        assert get_analytics_engine().etag() != engine.etag()
+
+
+class TestConditionalRequests:
+    @pytest.mark.asyncio
+    async def test_not_modified_until_changed(self, engine, dashboard, client):
+        await play_rounds(engine, 5)
+
+        first = client.get("/api/analytics/strategies")
+        etag = first.headers["etag"]
+        again = client.get("/api/analytics/strategies", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert again.status_code == 304
+        assert again.content == b""
+        assert dashboard.response_cache.get_stats()["not_modified"] == 1
+
+        await engine.on_round_complete(6, "P1", "P2", {}, {"P1": 1.0, "P2": 0.0})
+        changed = client.get("/api/analytics/strategies", headers={"If-None-Match": etag})
+
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_body_is_built_once_per_version(self, engine, dashboard, client):
+        await play_rounds(engine, 5)
+
+        bodies = [client.get("/api/analytics/export").json() for _ in range(3)]
+        stats = dashboard.response_cache.get_stats()
+
+        assert bodies[0] == bodies[2]
+        assert stats["builds"] == 1
+        assert stats["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_query_parameters_are_cached_separately(self, engine, client):
+        await play_rounds(engine, 30)
+
+        full = client.get("/api/analytics/strategies?max_points=1000").json()
+        small = client.get("/api/analytics/strategies?max_points=3").json()
+
+        def longest(body):
+            return max(len(s["time_series"]["rounds"]) for s in body["strategies"])
+
+        assert longest(full) > 3
+        assert longest(small) <= 3
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_are_gzipped(self, engine, client):
+        await play_rounds(engine, 50)
+
+        response = client.get("/api/analytics/export", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/api/analytics/export", headers={"Accept-Encoding": "identity"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        assert response.json() == plain.json()
+
+    def test_binary_matrix_export_revalidates(self, engine, client):
+        engine.matchup_matrix.record("P1", "P2", 3.0, 0.0)
+
+        first = client.get("/api/analytics/matchup_matrix?format=npz")
+        again = client.get(
+            "/api/analytics/matchup_matrix?format=npz",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+        assert first.headers["content-disposition"].startswith("attachment")
+        assert again.status_code == 304
+
+    def test_errors_are_versioned_too(self, engine, client):
+        missing = client.get("/api/analytics/strategy/unknown")
+        assert missing.json() == {"error": "Strategy not found"}
+
+        engine.register_player("P1", "unknown")
+        found = client.get(
+            "/api/analytics/strategy/unknown", headers={"If-None-Match": missing.headers["etag"]}
+        )
+        assert found.json()["strategy_name"] == "unknown"
@@ -0,0 +1,206 @@
+"""
+Tests for the dashboard frame scheduler.
+
+Testing:
+- Latest-wins coalescing per topic
+- Lazy message builders
+- Discrete events (never coalesced)
+- Tick rate limiting
+- DashboardAPI publish -> broadcast
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.visualization.dashboard import DashboardAPI
+from src.visualization.frame_scheduler import FrameScheduler
+
+
+class RecordingSink:
+    def __init__(self):
+        self.messages = []
+        self.topics = []
+
+    async def __call__(self, topic, message):
+        self.topics.append(topic)
+        self.messages.append(message)
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_latest_update_wins_per_topic(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink, tick_hz=0)
+
+        for i in range(100):
+            scheduler.publish("standings", {"type": "standings", "data": {"n": i}})
+        scheduler.publish("match:M1", {"type": "match", "data": {"n": 1}})
+
+        sent = await scheduler.flush()
+
+        assert sent == 2
+        assert sink.messages == [
+            {"type": "standings", "data": {"n": 99}},
+            {"type": "match", "data": {"n": 1}},
+        ]
+        assert scheduler.coalesced == 99
+        assert scheduler.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_merge_combines_data(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink, tick_hz=0)
+
+        scheduler.publish("scores", {"type": "scores", "data": {"a": 1}})
+        scheduler.publish("scores", {"type": "scores", "data": {"b": 2}}, merge=True)
+        await scheduler.flush()
+
+        assert sink.messages == [{"type": "scores", "data": {"a": 1, "b": 2}}]
+
+    @pytest.mark.asyncio
+    async def test_lazy_builder_called_once_per_frame(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink, tick_hz=0)
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"type": "tournament_update", "data": {"calls": len(calls)}}
+
+        for _ in range(50):
+            scheduler.publish("tournament_update", build)
+        await scheduler.flush()
+
+        assert len(calls) == 1
+        assert sink.messages == [{"type": "tournament_update", "data": {"calls": 1}}]
+
+    @pytest.mark.asyncio
+    async def test_builder_returning_none_or_raising_is_skipped(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink, tick_hz=0)
+
+        def broken():
+            raise ValueError("boom")
+
+        scheduler.publish("a", lambda: None)
+        scheduler.publish("b", broken)
+        scheduler.publish("c", {"type": "c"})
+
+        assert await scheduler.flush() == 1
+        assert sink.messages == [{"type": "c"}]
+
+    @pytest.mark.asyncio
+    async def test_events_are_not_coalesced_and_sent_first(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink, tick_hz=0)
+
+        scheduler.publish("standings", {"type": "standings"})
+        scheduler.publish_event({"type": "player_registered", "id": 1})
+        scheduler.publish_event({"type": "player_registered", "id": 2})
+        await scheduler.flush()
+
+        assert sink.messages == [
+            {"type": "player_registered", "id": 1},
+            {"type": "player_registered", "id": 2},
+            {"type": "standings"},
+        ]
+        assert sink.topics == [None, None, "standings"]
+
+    @pytest.mark.asyncio
+    async def test_sink_errors_are_counted_as_unsent(self):
+        scheduler = FrameScheduler(AsyncMock(side_effect=RuntimeError("down")), tick_hz=0)
+
+        scheduler.publish("a", {"type": "a"})
+
+        assert await scheduler.flush() == 0
+        assert scheduler.get_stats()["messages_sent"] == 0
+
+
+class TestTicking:
+    @pytest.mark.asyncio
+    async def test_first_update_sent_immediately_then_coalesced(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink, tick_hz=20)
+
+        scheduler.publish("standings", {"n": 0})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert sink.messages == [{"n": 0}]
+
+        # Burst within the tick collapses into one trailing frame
+        for i in range(1, 20):
+            scheduler.publish("standings", {"n": i})
+        assert sink.messages == [{"n": 0}]
+
+        await asyncio.sleep(0.15)
+        assert sink.messages == [{"n": 0}, {"n": 19}]
+        assert scheduler.frames_sent == 2
+
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink, tick_hz=1)
+
+        scheduler.publish("a", {"n": 1})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        scheduler.publish("a", {"n": 2})
+        await scheduler.stop()
+
+        assert sink.messages == [{"n": 1}, {"n": 2}]
+        assert scheduler.pending_count == 0
+
+    def test_publish_without_loop_waits_for_flush(self):
+        sink = RecordingSink()
+        scheduler = FrameScheduler(sink)
+
+        scheduler.publish("a", {"n": 1})
+
+        assert scheduler.pending_count == 1
+        asyncio.run(scheduler.flush())
+        assert sink.messages == [{"n": 1}]
+
+
+class TestDashboardPublish:
+    @pytest.mark.asyncio
+    async def test_publish_sends_latest_update(self):
+        dashboard = DashboardAPI(frame_rate_hz=0)
+        dashboard.connection_manager.publish = AsyncMock()
+
+        for round_number in range(10):
+            dashboard.publish(
+                "tournament_update", {"type": "tournament_update", "round": round_number}
+            )
+        await dashboard.frames.flush()
+
+        dashboard.connection_manager.publish.assert_awaited_once_with(
+            "tournament_update", {"type": "tournament_update", "round": 9}
+        )
+
+    @pytest.mark.asyncio
+    async def test_strategy_updates_coalesce_per_strategy(self):
+        dashboard = DashboardAPI(frame_rate_hz=0)
+        dashboard.connection_manager.publish = AsyncMock()
+
+        for _ in range(5):
+            dashboard.publish("strategy_performance:a", {"strategy": "a"})
+            dashboard.publish("strategy_performance:b", {"strategy": "b"})
+        await dashboard.frames.flush()
+
+        assert dashboard.connection_manager.publish.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_events_are_broadcast(self):
+        dashboard = DashboardAPI(frame_rate_hz=0)
+        dashboard.connection_manager.broadcast = AsyncMock()
+
+        dashboard.publish_event({"type": "player_registered"})
+        await dashboard.frames.flush()
+
+        dashboard.connection_manager.broadcast.assert_awaited_once_with(
+            {"type": "player_registered"}
+        )
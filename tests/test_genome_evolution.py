@@ -0,0 +1,162 @@
+"""
+Tests for the StrategyGenome evolution engine.
+
+Testing:
+- Reproducible in-process match simulation
+- Fitness cache, elitism and tournament selection
+- Checkpoint and resume
+- Process-pool evaluation and throughput
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+from src.agents.strategies.genome_evolution import (
+    PRIMITIVES,
+    EvolutionConfig,
+    EvolutionEngine,
+    _play_match,
+    evaluate_genomes,
+)
+from src.agents.strategies.hierarchical_composition import (
+    AlwaysCooperatePrimitive,
+    AlwaysDefectPrimitive,
+    GrudgerPrimitive,
+    StrategyGenome,
+)
+from src.game.odd_even import GameRole
+
+OPPONENTS = tuple(PRIMITIVES)
+
+
+def small_config(**overrides):
+    values = {"population_size": 12, "generations": 3, "rounds": 10, "workers": 0}
+    values.update(overrides)
+    return EvolutionConfig(**values)
+
+
+def random_population(n):
+    return [tuple(StrategyGenome().genes) for _ in range(n)]
+
+
+class TestSimulation:
+    def test_fitness_is_reproducible(self):
+        population = random_population(5)
+
+        first = evaluate_genomes(population, 10, OPPONENTS, seed=1)
+
+        assert evaluate_genomes(population[::-1], 10, OPPONENTS, seed=1) == first[::-1]
+        assert all(0 <= fitness <= 1 for fitness in first)
+
+    async def test_actions_decide_parity(self):
+        # Cooperating plays odd and defecting even: the sum is odd every round
+        wins = await _play_match(
+            AlwaysCooperatePrimitive(), AlwaysDefectPrimitive(), GameRole.ODD, 10
+        )
+
+        assert wins == 10
+
+    async def test_primitives_see_defection(self):
+        # The grudger cooperates once (odd sum), then defects back (even sums)
+        wins = await _play_match(GrudgerPrimitive(), AlwaysDefectPrimitive(), GameRole.EVEN, 10)
+
+        assert wins == 9
+
+    def test_degenerate_genome_scores_zero(self):
+        assert evaluate_genomes([(("pavlov", 0.0),)], 5, OPPONENTS, seed=0) == [0.0]
+
+
+class TestEngine:
+    def test_elites_come_from_the_cache(self):
+        engine = EvolutionEngine(small_config(elite_count=3))
+
+        result = engine.run()
+
+        assert result.generations == 3
+        assert result.cache_hits >= 3 * 2  # Elites of generations 1 and 2
+        assert result.evaluated + result.cache_hits == 12 * 3
+        assert len(engine.fitness_cache) == result.evaluated
+
+    def test_elitism_never_loses_the_best(self):
+        engine = EvolutionEngine(small_config(generations=5, elite_count=1))
+
+        history = engine.run().history
+
+        best = [entry["best_fitness"] for entry in history]
+        assert best == sorted(best)
+
+    def test_best_is_ranked(self):
+        result = EvolutionEngine(small_config(top_k=3)).run()
+
+        fitness = [f for _, f in result.best]
+        assert len(fitness) == 3
+        assert fitness == sorted(fitness, reverse=True)
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_seed_makes_the_search_reproducible(self, workers):
+        results = []
+        for global_seed in (1, 2):
+            random.seed(global_seed)
+            results.append(EvolutionEngine(small_config(workers=workers, seed=7)).run().best)
+
+        assert results[0] == results[1]
+
+    def test_full_tournament_picks_the_fittest(self):
+        engine = EvolutionEngine(small_config(tournament_size=4))
+        scored = [((("random", 1.0),), 0.1), ((("pavlov", 1.0),), 0.9)] + [
+            ((("grudger", float(i)),), 0.2) for i in range(2)
+        ]
+
+        assert engine._tournament(scored) == (("pavlov", 1.0),)
+
+
+class TestCheckpoint:
+    def test_resume_continues_the_search(self, tmp_path):
+        path = tmp_path / "evolution.json"
+        first = EvolutionEngine(small_config(), path)
+        first.run(generations=2)
+        saved = json.loads(path.read_text())
+        assert saved["generation"] == 2
+
+        resumed = EvolutionEngine(small_config(), path)
+        result = resumed.run(generations=4)
+
+        assert resumed.generation == 4
+        assert [h["generation"] for h in result.history] == [0, 1, 2, 3]
+        assert set(first.fitness_cache) <= set(resumed.fitness_cache)
+        assert result.evaluated + result.cache_hits == 12 * 2  # Only the new generations
+
+        # The same search as running all four generations without stopping
+        uninterrupted = EvolutionEngine(small_config())
+        assert uninterrupted.run(generations=4).best == result.best
+        assert uninterrupted.population == resumed.population
+
+    def test_changed_simulation_discards_cache(self, tmp_path):
+        path = tmp_path / "evolution.json"
+        EvolutionEngine(small_config(), path).run(generations=1)
+
+        engine = EvolutionEngine(small_config(rounds=5), path)
+        engine.load_checkpoint()
+
+        assert engine.generation == 1
+        assert engine.fitness_cache == {}
+        assert len(engine.population) == 12
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_process_pool_throughput():
+    engine = EvolutionEngine(
+        EvolutionConfig(population_size=200, generations=2, rounds=20, workers=2)
+    )
+
+    start = time.perf_counter()
+    result = engine.run()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{result.evaluated} genomes in {elapsed:.2f}s ({result.genomes_per_minute:.0f}/min)")
+    assert result.evaluated + result.cache_hits == 400
+    assert result.genomes_per_minute > 1000
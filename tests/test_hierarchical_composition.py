@@ -0,0 +1,184 @@
+"""
+Tests for hierarchical strategy composition.
+
+Testing:
+- Components evaluated concurrently, latency bounded by the slowest
+- Per-component budgets: late and failing components drop out of the vote
+- CPU-bound components offloaded to a worker pool
+- Running-mean component scores and reset
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents.strategies.hierarchical_composition import (
+    CompositeStrategy,
+    CompositionOperator,
+    PrimitiveStrategy,
+    StrategyComposer,
+    StrategyNode,
+    create_best_of_ensemble,
+    create_defensive_strategy,
+)
+
+STATE = SimpleNamespace(valid_moves=[1, 2, 3, 4])
+
+
+class Fixed(PrimitiveStrategy):
+    """Returns ``move`` after ``delay`` seconds, awaiting or blocking."""
+
+    def __init__(self, move, delay=0.0, blocking=False, fail=False):
+        super().__init__()
+        self.move = move
+        self.delay = delay
+        self.blocking = blocking
+        self.fail = fail
+
+    async def decide_move(self, game_state):
+        if self.blocking:
+            time.sleep(self.delay)
+        else:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("component failed")
+        return self.move
+
+
+def composite(*strategies, operator=CompositionOperator.PARALLEL, **kwargs):
+    nodes = [StrategyNode(name=f"c{i}", strategy=s) for i, s in enumerate(strategies)]
+    return CompositeStrategy(nodes, operator, **kwargs)
+
+
+class TestConcurrentEvaluation:
+    async def test_latency_is_the_slowest_component(self):
+        strategy = composite(Fixed(1, 0.1), Fixed(1, 0.1), Fixed(2, 0.1))
+
+        start = time.monotonic()
+        move = await strategy.decide_move(STATE)
+
+        assert time.monotonic() - start < 0.2
+        assert move == 1
+
+    async def test_weights_decide_the_vote(self):
+        strategy = (
+            StrategyComposer().parallel(Fixed(1), Fixed(1), Fixed(2), weights=[1, 1, 3]).build()
+        )
+
+        assert await strategy.decide_move(STATE) == 2
+
+    async def test_sequence_returns_last_in_time_result(self):
+        strategy = composite(
+            Fixed(1), Fixed(2), Fixed(3, delay=1), operator=CompositionOperator.SEQUENCE
+        )
+        strategy.component_budget = 0.05
+
+        assert await strategy.decide_move(STATE) == 2
+
+
+class TestBudgets:
+    async def test_late_component_drops_out(self):
+        strategy = composite(Fixed(1, delay=1), Fixed(2), Fixed(2), component_budget=0.05)
+
+        start = time.monotonic()
+        move = await strategy.decide_move(STATE)
+
+        assert time.monotonic() - start < 0.5
+        assert move == 2
+        assert strategy.dropped == {"c0": 1, "c1": 0, "c2": 0}
+
+    async def test_node_budget_overrides_composite_budget(self):
+        slow = StrategyNode(name="slow", strategy=Fixed(1, delay=0.1), budget=1)
+        fast = StrategyNode(name="fast", strategy=Fixed(2))
+        strategy = CompositeStrategy(
+            [slow, fast], CompositionOperator.PARALLEL, component_budget=0.01
+        )
+        slow.weight = 2
+
+        assert await strategy.decide_move(STATE) == 1
+
+    async def test_failing_component_drops_out(self):
+        strategy = composite(Fixed(1, fail=True), Fixed(3))
+
+        assert await strategy.decide_move(STATE) == 3
+        assert strategy.dropped["c0"] == 1
+
+    async def test_no_votes_falls_back_to_valid_move(self):
+        strategy = composite(Fixed(9, delay=1), component_budget=0.01)
+
+        assert await strategy.decide_move(STATE) in STATE.valid_moves
+
+    async def test_single_component_operators_respect_budget(self):
+        strategy = composite(Fixed(9, delay=1), operator=CompositionOperator.RANDOM)
+        strategy.component_budget = 0.01
+
+        assert await strategy.decide_move(STATE) in STATE.valid_moves
+
+
+class TestOffload:
+    async def test_blocking_component_leaves_event_loop_free(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            composer = StrategyComposer()
+            composer.current_operator = CompositionOperator.PARALLEL
+            composer.add(Fixed(4, delay=0.2, blocking=True), offload=True)
+            composer.add(Fixed(4))
+            strategy = composer.build(executor=pool)
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.create_task(tick())
+            move = await strategy.decide_move(STATE)
+            ticker.cancel()
+
+        assert move == 4
+        assert ticks >= 10  # The loop kept running while the component blocked
+
+    async def test_offloaded_component_is_cut_off(self):
+        node = StrategyNode(
+            name="heavy", strategy=Fixed(1, delay=0.3, blocking=True), offload=True, budget=0.05
+        )
+        strategy = CompositeStrategy(
+            [node, StrategyNode(name="light", strategy=Fixed(2))], CompositionOperator.PARALLEL
+        )
+
+        start = time.monotonic()
+        assert await strategy.decide_move(STATE) == 2
+        assert time.monotonic() - start < 0.2
+
+
+class TestScores:
+    def test_scores_are_running_means(self):
+        strategy = composite(Fixed(1), Fixed(2), operator=CompositionOperator.BEST_OF)
+
+        for reward in (1, 0, 1, 1):
+            strategy._observe_outcome(1, {"reward": reward}, STATE)
+
+        assert strategy.component_scores["c0"] == pytest.approx(0.75)
+
+    async def test_best_of_uses_highest_mean(self):
+        strategy = composite(Fixed(1), Fixed(2), operator=CompositionOperator.BEST_OF)
+        strategy.component_scores["c1"] = 0.5
+
+        assert await strategy.decide_move(STATE) == 2
+
+    async def test_reset_clears_scores_and_components(self):
+        strategy = create_best_of_ensemble()
+        strategy._observe_outcome("defect", {"reward": 1, "opponent_move": "defect"}, STATE)
+
+        strategy.reset()
+
+        assert set(strategy.component_scores.values()) == {0.0}
+        assert strategy.components[2].strategy.grudge is False
+
+    async def test_example_compositions_decide(self):
+        state = SimpleNamespace(valid_moves=["cooperate", "defect"])
+
+        assert await create_defensive_strategy().decide_move(state) == "cooperate"
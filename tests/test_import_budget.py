@@ -0,0 +1,137 @@
+"""
+Tests for agent cold-start cost.
+
+Testing:
+- Package ``__init__`` modules export lazily (PEP 562)
+- A player process does not import the league, dashboards or heavy
+  optional dependencies
+- ``python -X importtime`` time and peak RSS stay within budget
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# What a player process running a classic strategy imports
+PLAYER_IMPORTS = "import src.agents.player\nfrom src.agents.strategies import RandomStrategy\n"
+
+# Must not be imported by a player process
+HEAVY_MODULES = (
+    "fastapi",
+    "uvicorn",
+    "scipy",
+    "sklearn",
+    "networkx",
+    "src.agents.league_manager",
+    "src.visualization.dashboard",
+)
+
+# Generous budgets: catch regressions (an eager import of the league or
+# dashboard stack), not machine-to-machine noise
+IMPORT_TIME_BUDGET_S = 3.0
+RSS_BUDGET_MB = 100
+
+
+def run_python(code, *flags):
+    # Measure a plain interpreter, not one instrumented by pytest-cov
+    env = {k: v for k, v in os.environ.items() if not k.startswith(("COV_CORE", "COVERAGE"))}
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(stderr):
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        (module -> cumulative microseconds, total microseconds of top-level imports)
+    """
+    cumulative = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+        if not name[1:].startswith(" "):  # Not nested under another import
+            total += int(cumulative_us)
+    return cumulative, total
+
+
+class TestLazyExports:
+    @pytest.mark.parametrize(
+        "package,name",
+        [
+            ("src", "PlayerAgent"),
+            ("src.agents", "LeagueManager"),
+            ("src.agents.strategies", "AdaptiveBayesianStrategy"),
+            ("src.common", "get_config"),
+            ("src.visualization", "DashboardAPI"),
+        ],
+    )
+    def test_names_resolve_on_access(self, package, name):
+        module = __import__(package, fromlist=[name])
+
+        assert getattr(module, name).__name__ == name
+        assert name in dir(module)
+
+    def test_unknown_name_raises_attribute_error(self):
+        import src.agents
+
+        with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+            src.agents.Nope  # noqa: B018
+
+    def test_importing_a_package_loads_nothing_else(self):
+        code = (
+            "import sys\n"
+            "before = set(sys.modules)\n"
+            "import src.visualization, src.agents, src.common\n"
+            "loaded = sorted(m for m in set(sys.modules) - before if m.startswith('src.'))\n"
+            "print(loaded)\n"
+        )
+        loaded = run_python(code).stdout.strip()
+
+        assert loaded == "['src.agents', 'src.common', 'src.common.lazy', 'src.visualization']"
+
+
+class TestPlayerColdStart:
+    def test_player_skips_heavy_modules(self):
+        code = PLAYER_IMPORTS + (
+            "import json, sys\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+        )
+
+        assert json.loads(run_python(code).stdout) == []
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="needs Linux /proc")
+    def test_import_time_and_rss_budget(self):
+        # Peak RSS in kB. VmHWM starts fresh at exec; ru_maxrss would carry
+        # over the forking pytest process's peak on Linux.
+        code = PLAYER_IMPORTS + (
+            "import re\n"
+            "status = open('/proc/self/status').read()\n"
+            "print(re.search(r'VmHWM:\\s+(\\d+)', status).group(1))\n"
+        )
+        result = run_python(code, "-X", "importtime")
+
+        cumulative, total_us = parse_importtime(result.stderr)
+        total_s = total_us / 1e6
+        rss_mb = int(result.stdout.strip()) / 1024
+        slowest = sorted(cumulative.items(), key=lambda item: -item[1])[:10]
+
+        assert total_s < IMPORT_TIME_BUDGET_S, f"player import took {total_s:.2f}s: {slowest}"
+        assert rss_mb < RSS_BUDGET_MB, f"player import peak RSS {rss_mb:.0f} MB"
@@ -13,6 +13,8 @@ Tests cover:
 - Edge cases and error conditions
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -257,6 +259,38 @@ class TestRefereeRegistration:
         assert result["status"] == RegistrationStatus.REJECTED.value
         assert "already registered" in result["reason"].lower()
 
+    @pytest.mark.asyncio
+    async def test_register_referee_trusted_by_rate_limiter(self):
+        """Test registered referees are trusted only with their issued token."""
+        manager = LeagueManager(league_id="test_league", port=8000)
+
+        result = await manager._handle_referee_registration(
+            {"referee_id": "REF01", "endpoint": "http://localhost:8001/mcp"}
+        )
+        token = result["auth_token"]
+
+        assert manager.is_trusted_peer("referee:REF01", token)
+        assert not manager.is_trusted_peer("referee:REF01", "tok_forged")
+        assert not manager.is_trusted_peer("referee:REF02", token)
+
+    @pytest.mark.asyncio
+    async def test_verify_peer(self):
+        """Test referee credential verification used by players."""
+        manager = LeagueManager(league_id="test_league", port=8000)
+        result = await manager._handle_referee_registration(
+            {"referee_id": "REF01", "endpoint": "http://localhost:8001/mcp"}
+        )
+        token = result["auth_token"]
+
+        assert manager._verify_peer("referee:REF01", token) == {
+            "peer_id": "referee:REF01",
+            "valid": True,
+            "peer_class": "referee",
+        }
+        assert not manager._verify_peer("referee:REF01", "tok_forged")["valid"]
+        assert not manager._verify_peer("referee:REF01", "")["valid"]
+        assert not manager._verify_peer("league_manager", token)["valid"]
+
 
 class TestScheduleGeneration:
     """Test schedule generation."""
@@ -417,6 +451,50 @@ class TestRoundExecution:
         assert manager.state == LeagueState.IN_PROGRESS
         assert len(result["matches"]) > 0
 
+    @pytest.mark.asyncio
+    async def test_swiss_rounds_paired_lazily_from_standings(self):
+        """Test Swiss format pairs each round from current standings."""
+        manager = LeagueManager(league_id="test_league", port=8000, league_format="swiss")
+        for i in range(4):
+            await manager._handle_registration(
+                {
+                    "display_name": f"Player{i + 1}",
+                    "endpoint": f"http://localhost:810{i + 1}/mcp",
+                    "game_types": ["even_odd"],
+                }
+            )
+        await manager._handle_referee_registration(
+            {"referee_id": "REF01", "endpoint": "http://localhost:8001/mcp"}
+        )
+        manager._client = AsyncMock(spec=MCPClient)
+        manager._client.connected_servers = {}
+        manager._client.call_tool = AsyncMock(return_value={"success": True})
+
+        result = await manager._start_league()
+
+        assert result["format"] == "swiss"
+        assert manager._schedule == [[], []]
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await manager.start_next_round()
+            assert manager._schedule[0] == [("P01", "P02"), ("P03", "P04")]
+
+            manager._players["P02"].record_win()
+            manager._players["P04"].record_win()
+            await manager.start_next_round()
+
+        assert manager._schedule[1] == [("P02", "P04"), ("P01", "P03")]
+
+    @pytest.mark.asyncio
+    async def test_start_league_unknown_format(self):
+        """Test an unknown format is rejected without starting."""
+        manager = LeagueManager(league_id="test_league", port=8000)
+
+        result = await manager._start_league(league_format="knockout")
+
+        assert result["success"] is False
+        assert manager.state == LeagueState.REGISTRATION
+
     @pytest.mark.asyncio
     async def test_start_next_round_without_referees(self):
         """Test starting round without registered referees."""
@@ -689,6 +767,50 @@ class TestStandingsManagement:
         assert standings["standings"][2]["rank"] == 3
         assert standings["standings"][2]["player_id"] == "P03"
 
+    def test_standings_follow_incremental_results(self):
+        """Test standings track record_* calls and player removal."""
+        manager = LeagueManager(league_id="test_league", port=8000)
+        for i in range(1, 4):
+            manager._players[f"P0{i}"] = RegisteredPlayer(
+                player_id=f"P0{i}",
+                display_name=f"Player{i}",
+                endpoint=f"http://localhost:810{i}/mcp",
+            )
+
+        manager._players["P03"].record_win()
+        first = manager._get_standings()
+        assert first["standings"][0]["player_id"] == "P03"
+
+        manager._players["P02"].record_win()
+        manager._players["P02"].record_draw()
+        second = manager._get_standings()
+        assert second["standings_version"] > first["standings_version"]
+        assert [row["player_id"] for row in second["standings"]] == ["P02", "P03", "P01"]
+        assert manager._standings.rank_of("P01") == 3
+
+        del manager._players["P02"]
+        assert [row["player_id"] for row in manager._get_standings()["standings"]] == [
+            "P03",
+            "P01",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_standings_rebuilt_on_players_reassignment_and_reset(self):
+        """Test replacing the player dict and resetting the league."""
+        manager = LeagueManager(league_id="test_league", port=8000)
+        manager._players = {
+            "P01": RegisteredPlayer("P01", "Player1", "http://a/mcp", wins=1, points=3),
+            "P02": RegisteredPlayer("P02", "Player2", "http://b/mcp", wins=2, points=6),
+        }
+        assert manager._get_standings(top_k=1)["standings"][0]["player_id"] == "P02"
+
+        with patch.object(manager, "_stream_tournament_update", new_callable=AsyncMock):
+            await manager._reset_league()
+
+        standings = manager._get_standings()["standings"]
+        assert [row["player_id"] for row in standings] == ["P01", "P02"]
+        assert all(row["points"] == 0 for row in standings)
+
 
 class TestLeagueManagerTools:
     """Test league manager MCP tools."""
@@ -1574,3 +1696,37 @@ EDGE CASES TESTED:
     - Many concurrent matches
     - Empty match schedule
 """
+
+
+@pytest.mark.asyncio
+async def test_round_matches_run_concurrently():
+    """Test a round dispatches its matches together and does not sleep."""
+    manager = LeagueManager(league_id="test_league", port=8000)
+    for i in range(4):
+        await manager._handle_registration(
+            {
+                "display_name": f"Player{i + 1}",
+                "endpoint": f"http://localhost:810{i + 1}/mcp",
+                "game_types": ["even_odd"],
+            }
+        )
+    for referee_id, port in (("REF01", 8001), ("REF02", 8002)):
+        await manager._handle_referee_registration(
+            {"referee_id": referee_id, "endpoint": f"http://localhost:{port}/mcp"}
+        )
+    await manager._start_league()
+
+    async def play_match(server_name, tool_name, arguments):
+        await asyncio.sleep(0.1)
+        return {"success": True}
+
+    manager._client = AsyncMock(spec=MCPClient)
+    manager._client.call_tool = AsyncMock(side_effect=play_match)
+
+    start = time.monotonic()
+    result = await manager.start_next_round()
+
+    assert result["success"] is True
+    assert time.monotonic() - start < 0.18
+    servers = {call.args[0] for call in manager._client.call_tool.await_args_list}
+    assert servers == {"referee@http://localhost:8001/mcp", "referee@http://localhost:8002/mcp"}
@@ -0,0 +1,114 @@
+"""
+Tests for the loopback load-test harness (experiments/load_test.py).
+
+Testing:
+- Full leagues played by real agents over HTTP, in one process and one
+  process per agent
+- Report contents (throughput, round latency, dropped messages, resources)
+- Regression comparison against a baseline report
+"""
+
+import pytest
+
+from experiments.load_test import (
+    LoadTestConfig,
+    agent_specs,
+    compare_reports,
+    format_comparison,
+    run_load_test,
+)
+from src.server.mcp_server import MCPServer
+
+
+def make_report(**overrides):
+    report = {
+        "config": {},
+        "matches_per_second": 10.0,
+        "round_latency_ms": {"p50": 5.0, "p99": 20.0},
+        "dropped_messages": 0,
+        "totals": {"cpu_seconds": 1.0, "rss_bytes": 1000},
+    }
+    report.update(overrides)
+    return report
+
+
+def test_agent_specs_cycle_strategies():
+    config = LoadTestConfig(players=3, referees=2, strategies=["random", "pattern"])
+
+    specs = agent_specs(config)
+
+    assert [s.kind for s in specs] == ["league_manager"] + ["referee"] * 2 + ["player"] * 3
+    assert [s.strategy for s in specs if s.kind == "player"] == ["random", "pattern", "random"]
+
+
+async def test_server_reports_ephemeral_port():
+    server = MCPServer("ephemeral", port=0)
+    await server.start()
+    try:
+        assert server.port > 0
+        assert server.url == f"http://localhost:{server.port}/mcp"
+    finally:
+        await server.stop()
+
+
+class TestCompareReports:
+    def test_identical_reports_do_not_regress(self):
+        comparisons = compare_reports(make_report(), make_report())
+
+        assert not any(c.regressed for c in comparisons)
+        assert "| matches_per_second |" in format_comparison(comparisons)
+
+    def test_direction_of_each_metric(self):
+        current = make_report(matches_per_second=8.0, round_latency_ms={"p50": 4.0, "p99": 25.0})
+
+        regressed = {c.metric for c in compare_reports(make_report(), current) if c.regressed}
+
+        assert regressed == {"matches_per_second", "round_latency_ms.p99"}
+
+    def test_tolerance_absorbs_noise(self):
+        current = make_report(matches_per_second=9.5)
+
+        assert not any(c.regressed for c in compare_reports(make_report(), current, 0.10))
+        assert any(c.regressed for c in compare_reports(make_report(), current, 0.01))
+
+    def test_any_new_dropped_message_regresses(self):
+        current = make_report(dropped_messages=1)
+
+        comparison = next(
+            c for c in compare_reports(make_report(), current) if c.metric == "dropped_messages"
+        )
+        assert comparison.regressed
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestLoadTest:
+    async def test_inprocess_league(self):
+        config = LoadTestConfig(
+            players=3,
+            referees=2,
+            rounds_per_match=2,
+            strategies=["random", "pattern"],
+            isolation="inprocess",
+        )
+
+        report = await run_load_test(config)
+
+        # Round robin of 3 players: 3 rounds with one match each (one player sits out)
+        assert report["matches_completed"] == report["matches_scheduled"] == 3
+        assert report["game_rounds"] == 3 * 2
+        assert report["dropped_messages"] == 0
+        assert report["matches_per_second"] > 0
+        assert 0 < report["round_latency_ms"]["p50"] <= report["round_latency_ms"]["p99"]
+        assert report["agents"]["inprocess"]["rss_bytes"] > 0
+        assert not any(c.regressed for c in compare_reports(report, report))
+
+    async def test_one_process_per_agent(self):
+        config = LoadTestConfig(players=2, referees=1, rounds_per_match=1, isolation="process")
+
+        report = await run_load_test(config)
+
+        assert report["matches_completed"] == 1
+        assert set(report["agents"]) == {"league_manager", "REF01", "Player_1", "Player_2"}
+        assert all(usage["rss_bytes"] > 0 for usage in report["agents"].values())
+        assert report["totals"]["cpu_seconds"] > 0
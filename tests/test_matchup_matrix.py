@@ -0,0 +1,248 @@
+"""
+Tests for the dense NumPy matchup matrix.
+
+Testing:
+- Recording results and the legacy dict-of-dicts interface
+- Vectorized win rate, score differential and dominance
+- Columnar and npz exports (and the dashboard endpoint)
+"""
+
+import io
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.visualization.analytics import (
+    AnalyticsEngine,
+    get_analytics_engine,
+    reset_analytics_engine,
+)
+from src.visualization.dashboard import DashboardAPI
+from src.visualization.integration import DashboardIntegration
+from src.visualization.matchup import MATCH_HISTORY_LENGTH, MatchupMatrix
+
+
+@pytest.fixture
+def matrix():
+    m = MatchupMatrix()
+    m.record("P1", "P2", 3.0, 1.0, round_num=1)
+    m.record("P1", "P2", 0.0, 5.0, round_num=2)
+    m.record("P1", "P2", 2.0, 2.0, round_num=3)
+    m.record("P2", "P3", 4.0, 0.0, round_num=1)
+    return m
+
+
+class TestRecording:
+    def test_record_returns_winner(self):
+        m = MatchupMatrix()
+        assert m.record("A", "B", 3, 0) == "A"
+        assert m.record("A", "B", 0, 3) == "B"
+        assert m.record("A", "B", 1, 1) is None
+
+    def test_stats_view(self, matrix):
+        stats = matrix[("P1", "P2")]
+
+        assert stats["total_matches"] == 3
+        assert stats["player_a_wins"] == 1
+        assert stats["player_b_wins"] == 1
+        assert stats["draws"] == 1
+        assert stats["total_score_a"] == 5.0
+        assert stats["total_score_b"] == 8.0
+        assert stats["avg_score_diff"] == pytest.approx(1.0)
+        assert stats["last_winner"] is None
+        assert [h["round"] for h in stats["match_history"]] == [1, 2, 3]
+
+    def test_reversed_key_sees_the_other_side(self, matrix):
+        stats = matrix[("P2", "P1")]
+
+        assert stats["player_a"] == "P2"
+        assert stats["player_a_wins"] == 1
+        assert stats["total_score_a"] == 8.0
+        assert stats["match_history"][0]["score_a"] == 1.0
+
+    def test_history_is_bounded(self):
+        m = MatchupMatrix()
+        for round_num in range(MATCH_HISTORY_LENGTH + 5):
+            m.record("A", "B", 1, 0, round_num=round_num)
+
+        history = m[("A", "B")]["match_history"]
+        assert len(history) == MATCH_HISTORY_LENGTH
+        assert history[-1]["round"] == MATCH_HISTORY_LENGTH + 4
+        assert m[("A", "B")]["total_matches"] == MATCH_HISTORY_LENGTH + 5
+
+    def test_grows_past_initial_capacity(self):
+        m = MatchupMatrix(capacity=2)
+        for i in range(1, 40):
+            m.record("P0", f"P{i}", 1, 0)
+
+        assert len(m) == 39
+        assert m[("P0", "P39")]["player_a_wins"] == 1
+        assert m.total_matches == 39
+
+
+class TestMappingCompatibility:
+    def test_dict_operations(self, matrix):
+        assert len(matrix) == 2
+        assert ("P1", "P2") in matrix
+        assert ("P2", "P1") in matrix
+        assert ("P1", "P3") not in matrix
+        assert sorted(matrix.keys()) == [("P1", "P2"), ("P2", "P3")]
+        with pytest.raises(KeyError):
+            matrix[("P1", "P3")]
+
+    def test_assign_and_increment_through_view(self):
+        m = MatchupMatrix()
+        m[("P9", "P0")] = {"total_matches": 2, "player_a_wins": 2, "custom": "x"}
+        m[("P9", "P0")]["total_matches"] += 1
+
+        assert m[("P9", "P0")]["total_matches"] == 3
+        assert m[("P0", "P9")]["player_b_wins"] == 2
+        assert m[("P9", "P0")]["custom"] == "x"
+        assert m[("P9", "P0")]["draws"] == 0
+
+    def test_delete_and_clear(self, matrix):
+        del matrix[("P2", "P1")]
+        assert len(matrix) == 1
+        assert ("P1", "P2") not in matrix
+
+        matrix.clear()
+        assert len(matrix) == 0
+        assert matrix.players == []
+
+    def test_to_dict(self, matrix):
+        data = matrix.to_dict()
+
+        assert isinstance(data[("P1", "P2")], dict)
+        assert data[("P2", "P3")]["last_winner"] == "P2"
+
+
+class TestVectorizedMetrics:
+    def test_win_rate_matrix(self, matrix):
+        rates = matrix.win_rate_matrix()
+        p1, p2, p3 = (matrix.players.index(p) for p in ("P1", "P2", "P3"))
+
+        assert rates[p1, p2] == pytest.approx(1 / 3)
+        assert rates[p2, p3] == 1.0
+        assert rates[p3, p2] == 0.0
+        assert np.isnan(rates[p1, p3])
+
+    def test_score_differential_is_antisymmetric(self, matrix):
+        diff = matrix.score_differential_matrix()
+        played = ~np.isnan(diff)
+
+        assert np.allclose(diff[played], -diff.T[played])
+        p2, p3 = matrix.players.index("P2"), matrix.players.index("P3")
+        assert diff[p2, p3] == 4.0
+
+    def test_dominance_ranking(self):
+        m = MatchupMatrix()
+        m.record("A", "B", 1, 0)
+        m.record("A", "C", 1, 0)
+        m.record("B", "C", 1, 0)
+        m.record("B", "C", 1, 0)
+
+        ranking = m.dominance_ranking()
+
+        assert [row["player_id"] for row in ranking] == ["A", "B", "C"]
+        assert ranking[0]["opponents_beaten"] == 2
+        assert ranking[2]["net_win_rate"] == -1.0
+
+    def test_empty_matrix(self):
+        m = MatchupMatrix()
+        assert m.dominance_ranking() == []
+        assert m.total_matches == 0
+        assert m.win_rate_matrix().shape == (0, 0)
+
+
+class TestExports:
+    def test_columns(self, matrix):
+        columns = matrix.to_columns()
+        players = columns["players"]
+
+        pairs = {
+            (players[a], players[b]): i
+            for i, (a, b) in enumerate(zip(columns["a"], columns["b"], strict=True))
+        }
+        i = pairs[("P1", "P2")]
+        assert columns["total_matches"][i] == 3
+        assert columns["score_b"][i] == 8.0
+        assert columns["last_winner"][pairs[("P2", "P3")]] == players.index("P2")
+
+    def test_npz_round_trip(self, matrix):
+        with np.load(io.BytesIO(matrix.to_npz())) as data:
+            players = list(data["players"])
+            matches = data["matches"]
+            wins = data["wins"]
+
+        p1, p2 = players.index("P1"), players.index("P2")
+        assert matches.shape == (3, 3)
+        assert matches[p1, p2] == matches[p2, p1] == 3
+        assert wins[p2, p1] == 1
+
+    @pytest.mark.asyncio
+    async def test_engine_records_into_matrix(self):
+        engine = AnalyticsEngine()
+        await engine.on_round_complete(1, "P2", "P1", {}, {"P1": 3.0, "P2": 0.0})
+
+        assert engine.matchup_matrix[("P1", "P2")]["player_a_wins"] == 1
+        assert engine.get_matchup_matrix().total_matches == 1
+
+    def test_endpoint_formats(self):
+        reset_analytics_engine()
+        get_analytics_engine().matchup_matrix.record("P1", "P2", 3.0, 0.0)
+        client = TestClient(DashboardAPI().app)
+
+        try:
+            columnar = client.get("/api/analytics/matchup_matrix?format=columnar").json()
+            assert columnar["summary"]["total_matches"] == 1
+            assert columnar["dominance"][0]["player_id"] == "P1"
+            assert client.get("/api/analytics/matchup_matrix").json() == columnar
+
+            legacy = client.get("/api/analytics/matchup_matrix?format=json").json()
+            assert legacy["matchups"]["P1_vs_P2"]["player_a_wins"] == 1
+
+            response = client.get("/api/analytics/matchup_matrix?format=npz")
+            assert response.headers["content-type"] == "application/octet-stream"
+            with np.load(io.BytesIO(response.content)) as data:
+                assert data["matches"].sum() == 2
+
+            assert "error" in client.get("/api/analytics/matchup_matrix?format=xml").json()
+        finally:
+            reset_analytics_engine()
+
+
+def test_dashboard_frame_is_columnar(monkeypatch):
+    engine = AnalyticsEngine()
+    engine.matchup_matrix.record("P1", "P2", 3.0, 0.0)
+    monkeypatch.setattr(
+        engine.matchup_matrix, "to_dict", lambda: pytest.fail("frame built per-pair dicts")
+    )
+
+    frame = DashboardIntegration(DashboardAPI(), engine)._build_matchup_matrix_update()
+
+    assert frame["type"] == "matchup_matrix_update"
+    assert frame["data"]["columns"]["a_wins"] == [1]
+    assert frame["data"]["summary"]["total_matches"] == 1
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+class TestMatchupBenchmark:
+    def test_500_player_aggregates(self):
+        rng = np.random.default_rng(0)
+        m = MatchupMatrix()
+        players = [f"P{i}" for i in range(500)]
+        for _ in range(50_000):
+            a, b = rng.choice(500, size=2, replace=False)
+            m.record(players[a], players[b], float(rng.integers(0, 5)), float(rng.integers(0, 5)))
+
+        start = time.perf_counter()
+        m.win_rate_matrix()
+        m.score_differential_matrix()
+        ranking = m.dominance_ranking()
+        elapsed = time.perf_counter() - start
+
+        assert len(ranking) == 500
+        assert elapsed < 1.0
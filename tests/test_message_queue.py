@@ -0,0 +1,234 @@
+"""
+Tests for the client message queue and dispatcher.
+
+Testing:
+- Priority order and round-robin fairness across target servers
+- Batched dequeue, expiry and bounded blocking
+- Rate limiting without blocking producers or other consumers
+- Dispatcher retries keeping the message, and MCPClient as a handler
+- Enqueue/dequeue throughput
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.client.mcp_client import MCPClient
+from src.client.message_queue import MessageDispatcher, MessagePriority, MessageQueue
+from src.server.mcp_server import MCPServer
+from src.transport import create_request
+
+
+def servers(messages):
+    return [m.target_server for m in messages]
+
+
+class TestOrdering:
+    async def test_priority_first(self):
+        queue = MessageQueue()
+        await queue.enqueue({"n": 1}, MessagePriority.LOW)
+        await queue.enqueue({"n": 2}, MessagePriority.URGENT)
+        await queue.enqueue({"n": 3}, MessagePriority.NORMAL)
+
+        batch = await queue.dequeue_batch(10)
+
+        assert [m.data["n"] for m in batch] == [2, 3, 1]
+        assert queue.is_empty
+
+    async def test_servers_served_round_robin(self):
+        queue = MessageQueue()
+        for _ in range(4):
+            await queue.enqueue({}, target_server="busy")
+        await queue.enqueue({}, target_server="quiet")
+        await queue.enqueue({}, target_server="other")
+
+        batch = await queue.dequeue_batch(6)
+
+        assert servers(batch) == ["busy", "quiet", "other", "busy", "busy", "busy"]
+
+    async def test_fifo_per_server(self):
+        queue = MessageQueue()
+        for n in range(5):
+            await queue.enqueue({"n": n}, target_server="a")
+
+        assert [(await queue.dequeue()).data["n"] for _ in range(5)] == list(range(5))
+
+    async def test_remove_by_server_and_stats(self):
+        queue = MessageQueue()
+        await queue.enqueue({}, MessagePriority.HIGH, target_server="a")
+        await queue.enqueue({}, MessagePriority.LOW, target_server="a")
+        await queue.enqueue({}, target_server="b")
+
+        assert await queue.remove_by_server("a") == 2
+        stats = await queue.get_stats()
+        assert stats["size"] == 1
+        assert stats["by_priority"]["NORMAL"] == 1
+        assert stats["servers"] == 1
+        assert (await queue.peek()).target_server == "b"
+
+
+class TestBounds:
+    async def test_expired_messages_are_skipped_iteratively(self):
+        queue = MessageQueue(max_size=5000)
+        for _ in range(3000):  # Deeper than the recursion limit
+            await queue.enqueue({}, timeout=0)
+        await queue.enqueue({"live": True}, timeout=30)
+        await asyncio.sleep(0.001)
+
+        message = await queue.dequeue(block=False)
+
+        assert message.data == {"live": True}
+        assert (await queue.get_stats())["total_dropped"] == 3000
+
+    async def test_purge_expired(self):
+        queue = MessageQueue()
+        await queue.enqueue({}, timeout=0)
+        await queue.enqueue({}, target_server="a", timeout=30)
+        await asyncio.sleep(0.001)
+
+        assert await queue.purge_expired() == 1
+        assert queue.size == 1
+
+    async def test_full_queue_blocks_until_space(self):
+        queue = MessageQueue(max_size=2)
+        await queue.enqueue({})
+        await queue.enqueue({})
+        with pytest.raises(asyncio.QueueFull):
+            await queue.enqueue({}, block=False)
+
+        putter = asyncio.create_task(queue.enqueue({"late": True}))
+        await asyncio.sleep(0.01)
+        assert not putter.done()
+
+        await queue.dequeue()
+        await asyncio.wait_for(putter, 1)
+        assert queue.size == 2
+
+    async def test_empty_queue_blocks_until_enqueue(self):
+        queue = MessageQueue()
+        getter = asyncio.create_task(queue.dequeue_batch(5, timeout=1))
+        await asyncio.sleep(0.01)
+
+        await queue.enqueue({"n": 1})
+
+        assert [m.data for m in await getter] == [{"n": 1}]
+        assert await queue.dequeue(timeout=0.01) is None
+
+
+class TestRateLimit:
+    async def test_rate_is_shared_by_consumers(self):
+        queue = MessageQueue(rate_limit=100)
+        for _ in range(6):
+            await queue.enqueue({})
+
+        start = time.monotonic()
+        await asyncio.gather(*(queue.dequeue() for _ in range(6)))
+
+        assert time.monotonic() - start >= 0.045  # Five gaps of 10ms
+
+    async def test_throttled_consumer_does_not_block_enqueue(self):
+        queue = MessageQueue(rate_limit=2)
+        await queue.enqueue({})
+        await queue.dequeue()
+        await queue.enqueue({})
+        throttled = asyncio.create_task(queue.dequeue())
+        await asyncio.sleep(0.01)
+
+        start = time.monotonic()
+        await queue.enqueue({})
+        assert time.monotonic() - start < 0.05
+        assert queue.size == 2
+        await throttled
+
+
+class TestDispatcher:
+    async def test_retry_keeps_message_and_callback(self):
+        attempts = []
+
+        async def flaky(server_name, data):
+            attempts.append(server_name)
+            if len(attempts) < 3:
+                raise ConnectionError("try again")
+            return "ok"
+
+        queue = MessageQueue()
+        dispatcher = MessageDispatcher(queue, flaky, concurrency=2)
+        message = await queue.enqueue({}, target_server="s")
+        message.callback = asyncio.get_running_loop().create_future()
+        await dispatcher.start()
+        try:
+            assert await asyncio.wait_for(message.callback, 2) == "ok"
+            assert message.retries == 2
+            assert attempts == ["s"] * 3
+        finally:
+            await dispatcher.stop()
+
+    async def test_exhausted_retries_fail_the_callback(self):
+        async def down(server_name, data):
+            raise ConnectionError("down")
+
+        queue = MessageQueue()
+        dispatcher = MessageDispatcher(queue, down)
+        message = await queue.enqueue({})
+        message.max_retries = 1
+        message.callback = asyncio.get_running_loop().create_future()
+        await dispatcher.start()
+        try:
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(message.callback, 2)
+        finally:
+            await dispatcher.stop()
+
+    async def test_dispatches_through_client(self):
+        server = MCPServer("queue_test", port=0)
+
+        @server.tool("echo", "Echo arguments")
+        async def echo(params):
+            return params
+
+        await server.start()
+        client = MCPClient("queue_client")
+        await client.start()
+        dispatcher = MessageDispatcher(client.message_queue, client, batch_size=4)
+        try:
+            await client.connect("queue_test", server.url)
+            await dispatcher.start()
+            loop = asyncio.get_running_loop()
+            messages = []
+            for n in range(8):
+                request = create_request("tools/call", {"name": "echo", "arguments": {"n": n}})
+                message = await client.message_queue.enqueue(
+                    request.to_dict(), target_server="queue_test"
+                )
+                message.callback = loop.create_future()
+                messages.append(message)
+
+            results = await asyncio.wait_for(asyncio.gather(*(m.callback for m in messages)), 5)
+
+            assert all(result["content"] for result in results)
+        finally:
+            await dispatcher.stop()
+            await client.stop()
+            await server.stop()
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+async def test_throughput():
+    count = 100_000
+    queue = MessageQueue(max_size=count)
+    targets = [f"server_{n}" for n in range(10)]
+
+    start = time.perf_counter()
+    for n in range(count):
+        await queue.enqueue({}, MessagePriority(n % 4), target_server=targets[n % 10])
+    enqueued = time.perf_counter() - start
+    taken = 0
+    while taken < count:
+        taken += len(await queue.dequeue_batch(100))
+    total = time.perf_counter() - start
+
+    print(f"\n{count} messages: enqueue {enqueued:.2f}s, total {total:.2f}s")
+    assert queue.is_empty
+    assert count / total > 20_000  # messages per second
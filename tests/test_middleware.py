@@ -30,6 +30,7 @@ from src.middleware import (
     MiddlewarePipeline,
     MiddlewareTimeoutError,
     RateLimitMiddleware,
+    RateLimitPolicy,
     RequestContext,
     ResponseContext,
     TracingMiddleware,
@@ -406,6 +407,61 @@ async def test_enable_disable_middleware(clean_pipeline, sample_request, sample_
     assert m1.before_called
 
 
+@pytest.mark.asyncio
+async def test_compiled_chain_skips_default_hooks(clean_pipeline, sample_request, sample_handler):
+    """Test hooks a middleware doesn't override are left out of the compiled chain."""
+
+    class AfterOnlyMiddleware(Middleware):
+        async def after(self, context: ResponseContext) -> ResponseContext:
+            context.response["after_only"] = True
+            return context
+
+    clean_pipeline.add_middleware(AfterOnlyMiddleware(name="after_only"), priority=100)
+    clean_pipeline.add_middleware(ErrorHandlerMiddleware(name="errors"), priority=10)
+
+    response = await clean_pipeline.execute(sample_request, handler=sample_handler)
+
+    assert response["after_only"]
+    # Neither middleware defines before(), so no before stage was timed
+    stats = {m["name"]: m["stats"] for m in clean_pipeline.get_middleware_list()}
+    assert stats["after_only"]["total_requests"] == 0
+    assert stats["errors"]["total_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_compiled_chain_honors_instance_patched_hook(clean_pipeline, sample_request):
+    """Test hooks patched onto an instance are compiled into the chain."""
+    middleware = Middleware(name="patched")
+    calls = []
+
+    async def before(context: RequestContext) -> RequestContext:
+        calls.append("before")
+        return context
+
+    middleware.before = before  # type: ignore[method-assign]
+    clean_pipeline.add_middleware(middleware)
+
+    async def handler(request):
+        return None
+
+    response = await clean_pipeline.execute(sample_request, handler=handler)
+
+    assert calls == ["before"]
+    assert response == {}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_without_timeout(sample_request, sample_handler):
+    """Test a non-positive timeout disables the deadline."""
+    pipeline = MiddlewarePipeline(timeout_seconds=0)
+    pipeline.add_middleware(MockMiddleware(name="test"))
+
+    response = await pipeline.execute(sample_request, handler=sample_handler)
+
+    assert response["success"]
+    assert response["test_after"]
+
+
 @pytest.mark.asyncio
 async def test_get_middleware_list(clean_pipeline):
     """Test getting middleware list."""
@@ -517,6 +573,212 @@ async def test_rate_limit_middleware(clean_pipeline, sample_request, sample_hand
     assert response["error"] == "Rate limit exceeded"
 
 
+@pytest.mark.asyncio
+async def test_rate_limit_peer_class_tiers(clean_pipeline, sample_handler):
+    """Test per-peer-class policies apply to registered peers."""
+    rate_limit_middleware = RateLimitMiddleware(
+        name="rate_limit",
+        requests_per_minute=10,
+        burst_size=1,
+        exempt_registered_peers=False,
+        peer_policies={
+            "referee": RateLimitPolicy(requests_per_minute=6000, burst_size=50),
+            "league_manager": RateLimitPolicy(exempt=True),
+        },
+    )
+    clean_pipeline.add_middleware(rate_limit_middleware, priority=70)
+    rate_limit_middleware.register_peer("referee:REF01", "referee", auth_token="tok_ref01")
+    rate_limit_middleware.register_peer("league_manager", "league_manager")
+
+    # Registered referee gets the high tier
+    referee_request = {"sender": "referee:REF01", "auth_token": "tok_ref01"}
+    for _ in range(20):
+        response = await clean_pipeline.execute(referee_request, handler=sample_handler)
+        assert response["success"]
+    assert response["rate_limit"]["limit"] == 6000
+
+    # Registered league manager is exempt
+    manager_request = {"sender": "league_manager"}
+    for _ in range(20):
+        response = await clean_pipeline.execute(manager_request, handler=sample_handler)
+        assert response["success"]
+        assert response["rate_limit"] == {"exempt": True}
+
+    stats = rate_limit_middleware.get_stats()
+    assert stats["throttled"] == 0
+    assert stats["exempt"] == 20
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spoofed_sender_gets_default_tier(clean_pipeline, sample_handler):
+    """Test unregistered senders cannot claim a privileged tier."""
+    rate_limit_middleware = RateLimitMiddleware(
+        name="rate_limit",
+        requests_per_minute=10,
+        burst_size=1,
+        peer_policies={
+            "referee": RateLimitPolicy(requests_per_minute=6000, burst_size=50),
+            "league_manager": RateLimitPolicy(exempt=True),
+        },
+    )
+    clean_pipeline.add_middleware(rate_limit_middleware, priority=70)
+    rate_limit_middleware.register_peer("referee:REF01", "referee", auth_token="tok_ref01")
+
+    for sender, token in [
+        ("league_manager", None),
+        ("referee:X", None),
+        ("referee:REF01", "tok_forged"),
+    ]:
+        request = {"sender": sender, "auth_token": token}
+        response = await clean_pipeline.execute(request, handler=sample_handler)
+        assert response["success"]
+        assert response["rate_limit"]["limit"] == 10
+        response = await clean_pipeline.execute(request, handler=sample_handler)
+        assert response["error"] == "Rate limit exceeded"
+        assert response["retry_after"] > 0
+
+    assert rate_limit_middleware.get_stats()["throttled_by_class"] == {"anonymous": 3}
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_registered_peer_exempt(clean_pipeline, sample_handler):
+    """Test registered peers bypass the limiter."""
+    rate_limit_middleware = RateLimitMiddleware(
+        name="rate_limit",
+        requests_per_minute=10,
+        burst_size=1,
+    )
+    clean_pipeline.add_middleware(rate_limit_middleware, priority=70)
+    rate_limit_middleware.register_peer("referee:REF01", "referee")
+
+    for _ in range(5):
+        response = await clean_pipeline.execute({"sender": "referee:REF01"}, handler=sample_handler)
+        assert response["success"]
+
+    # Unregistered referees fall back to the default tier
+    rate_limit_middleware.unregister_peer("referee:REF01")
+    await clean_pipeline.execute({"sender": "referee:REF01"}, handler=sample_handler)
+    response = await clean_pipeline.execute({"sender": "referee:REF01"}, handler=sample_handler)
+    assert response["error"] == "Rate limit exceeded"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_reset_follows_refill_rate(clean_pipeline, sample_handler):
+    """Test the reset header is derived from the policy's refill rate."""
+    clean_pipeline.add_middleware(
+        RateLimitMiddleware(name="rate_limit", requests_per_minute=60, burst_size=4),
+        priority=70,
+    )
+
+    response = await clean_pipeline.execute({"sender": "player:P01"}, handler=sample_handler)
+
+    # One token used at 1 token/second
+    assert response["rate_limit"]["remaining"] == 3
+    assert response["rate_limit"]["reset"] == 1.0
+
+
+def test_rate_limit_evicts_idle_buckets():
+    """Test idle buckets are evicted and the bucket table is bounded."""
+    rate_limit_middleware = RateLimitMiddleware(
+        requests_per_minute=60,
+        burst_size=5,
+        idle_bucket_ttl=0.0,
+        max_buckets=10,
+    )
+
+    for i in range(100):
+        rate_limit_middleware._check_rate_limit(f"player:P{i}", "player")
+
+    stats = rate_limit_middleware.get_stats()
+    assert stats["active_buckets"] <= 10
+    assert stats["evicted_buckets"] >= 90
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_throttle_metrics_exported(clean_pipeline, sample_handler):
+    """Test throttled pipeline requests increment the metrics counter."""
+    from src.observability import MetricsCollector
+
+    collector = MetricsCollector()
+    labels = {"peer_class": "anonymous"}
+    before = collector.register_counter("rate_limit_throttled_total", labels=labels).value
+    clean_pipeline.add_middleware(
+        RateLimitMiddleware(
+            name="rate_limit",
+            requests_per_minute=1,
+            burst_size=1,
+            metrics_collector=collector,
+        ),
+        priority=70,
+    )
+
+    response = await clean_pipeline.execute({"sender": "player:P01"}, handler=sample_handler)
+    assert response["success"]
+    response = await clean_pipeline.execute({"sender": "player:P01"}, handler=sample_handler)
+    assert response["error"] == "Rate limit exceeded"
+
+    counter = collector.get_counter("rate_limit_throttled_total", labels)
+    assert counter is not None
+    assert counter.value == before + 1
+
+
+class TestRateLimitServerWiring:
+    """Test BaseGameServer installs the rate limiter from Config.rate_limit."""
+
+    @pytest.fixture(autouse=True)
+    def restore_config(self):
+        from src.common.config import get_config, set_config
+
+        original = get_config()
+        yield
+        set_config(original)
+
+    def _make_server(self, **rate_limit_overrides):
+        from src.common.config import Config, RateLimitConfig, set_config
+        from src.server.base_server import BaseGameServer
+
+        set_config(Config(rate_limit=RateLimitConfig(**rate_limit_overrides)))
+        return BaseGameServer(name="P01", server_type="player", enable_observability=False)
+
+    def test_config_reaches_middleware(self):
+        """Test configured limits and tiers are applied."""
+        server = self._make_server(
+            requests_per_minute=42,
+            burst_size=7,
+            referee_requests_per_minute=900,
+            referee_burst_size=30,
+            max_buckets=123,
+        )
+
+        rate_limiter = server.middleware_pipeline.get_middleware("rate_limit")
+
+        assert isinstance(rate_limiter, RateLimitMiddleware)
+        assert rate_limiter.requests_per_minute == 42
+        assert rate_limiter.burst_size == 7
+        assert rate_limiter.max_buckets == 123
+        assert rate_limiter.trust_sender_prefix is False
+        assert rate_limiter.peer_policies["referee"].requests_per_minute == 900
+        assert rate_limiter.peer_policies["league_manager"].exempt
+
+    def test_disabled_drops_limiter(self):
+        """Test enabled=False leaves the rate limiter out of the pipeline."""
+        server = self._make_server(enabled=False)
+
+        assert server.middleware_pipeline.get_middleware("rate_limit") is None
+        # Registering peers is a no-op without a limiter
+        server.register_trusted_peer("referee:REF01", "referee")
+        assert not server.is_trusted_peer("referee:REF01")
+
+    def test_register_trusted_peer(self):
+        """Test register_trusted_peer reaches the installed limiter."""
+        server = self._make_server()
+
+        server.register_trusted_peer("referee:REF01", "referee", auth_token="tok_ref01")
+
+        assert server.is_trusted_peer("referee:REF01", "tok_ref01")
+        assert not server.is_trusted_peer("referee:REF01", "tok_forged")
+
+
 @pytest.mark.asyncio
 async def test_metrics_middleware(clean_pipeline, sample_request, sample_handler):
     """Test MetricsMiddleware."""
@@ -0,0 +1,123 @@
+"""
+Tests for Swiss and Ladder Pairing
+==================================
+
+Tests cover:
+- Round counts and engine selection
+- Rematch avoidance and byes
+- Elo rating updates and ladder ordering
+- Convergence on a ranking for a large league
+"""
+
+import random
+
+import pytest
+
+from src.game.pairing import LadderPairing, SwissPairing, create_pairing_engine
+
+
+class TestPairingEngines:
+    """Test pairing engine construction."""
+
+    def test_create_pairing_engine(self):
+        """Test each league format maps to its engine."""
+        assert create_pairing_engine("round_robin") is None
+        assert isinstance(create_pairing_engine("swiss"), SwissPairing)
+        assert isinstance(create_pairing_engine("ladder"), LadderPairing)
+        with pytest.raises(ValueError, match="Unknown league format"):
+            create_pairing_engine("knockout")
+
+    def test_recommended_rounds(self):
+        """Test rounds grow logarithmically with player count."""
+        assert SwissPairing.recommended_rounds(1) == 0
+        assert SwissPairing.recommended_rounds(2) == 1
+        assert SwissPairing.recommended_rounds(8) == 3
+        assert SwissPairing.recommended_rounds(1000) == 10
+
+
+class TestSwissPairing:
+    """Test Swiss pairing."""
+
+    def test_pairs_adjacent_ranks(self):
+        """Test first round pairs neighbours in the ranking."""
+        engine = SwissPairing()
+        assert engine.pair_round(["A", "B", "C", "D"]) == [("A", "B"), ("C", "D")]
+
+    def test_avoids_rematches(self):
+        """Test a second round with the same order avoids repeat pairings."""
+        engine = SwissPairing()
+        order = ["A", "B", "C", "D"]
+        engine.pair_round(order)
+
+        second = engine.pair_round(order)
+
+        assert second == [("A", "C"), ("B", "D")]
+        assert engine.has_played("A", "B")
+
+    def test_odd_count_gives_rotating_bye(self):
+        """Test the bye goes to the lowest-ranked player without one."""
+        engine = SwissPairing()
+        order = ["A", "B", "C"]
+
+        first = engine.pair_round(order)
+        second = engine.pair_round(order)
+
+        assert first == [("A", "B")]
+        assert "C" in second[0]
+        assert len(second) == 1
+
+    def test_large_league_separates_strengths(self):
+        """Test log2(n) Swiss rounds put strong players near the top."""
+        rng = random.Random(7)
+        n = 256
+        player_ids = [f"P{i}" for i in range(n)]
+        rng.shuffle(player_ids)
+        strength = {pid: int(pid[1:]) for pid in player_ids}
+        points = dict.fromkeys(player_ids, 0)
+        engine = SwissPairing()
+
+        for _ in range(SwissPairing.recommended_rounds(n)):
+            order = sorted(points, key=lambda pid: -points[pid])
+            for p1, p2 in engine.pair_round(order):
+                stronger, weaker = (p1, p2) if strength[p1] > strength[p2] else (p2, p1)
+                points[stronger if rng.random() < 0.9 else weaker] += 3
+
+        ranking = sorted(points, key=lambda pid: -points[pid])
+        top_half = {f"P{i}" for i in range(n // 2, n)}
+        top_quarter_hits = sum(1 for pid in ranking[: n // 4] if pid in top_half)
+        assert top_quarter_hits > 0.8 * (n // 4)
+        assert strength[ranking[0]] >= n - 8
+
+
+class TestLadderPairing:
+    """Test rating ladder pairing."""
+
+    def test_elo_update_is_zero_sum(self):
+        """Test a win moves rating from loser to winner."""
+        engine = LadderPairing()
+        engine.record_result("A", "B", "A")
+
+        assert engine.rating("A") > 1500.0
+        assert engine.rating("A") + engine.rating("B") == pytest.approx(3000.0)
+
+        engine.record_result("A", "B", None)
+        assert engine.rating("A") < 1516.0
+
+    def test_pairs_by_rating(self):
+        """Test the ladder orders by rating rather than standings."""
+        engine = LadderPairing()
+        engine.record_result("D", "A", "D")
+        engine.record_result("C", "B", "C")
+
+        assert engine.pair_round(["A", "B", "C", "D"]) == [("C", "D"), ("A", "B")]
+
+    def test_reset_clears_ratings(self):
+        """Test reset forgets ratings and history."""
+        engine = LadderPairing()
+        engine.pair_round(["A", "B"])
+        engine.record_result("A", "B", "A")
+
+        engine.reset()
+
+        assert engine.rating("A") == 1500.0
+        assert not engine.has_played("A", "B")
@@ -12,6 +12,8 @@ Tests cover:
 - Edge cases and error conditions
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock
 
 import pytest
@@ -107,6 +109,7 @@ class TestPlayerRegistration:
         assert player.registered is True
         assert player.player_id == "P01"
         assert player.auth_token == "test_token"
+        assert player.is_trusted_peer("league_manager")
 
     @pytest.mark.asyncio
     async def test_register_with_league_rejected(self):
@@ -129,6 +132,7 @@ class TestPlayerRegistration:
         assert result is False
         assert player.registered is False
         assert player.player_id is None
+        assert not player.is_trusted_peer("league_manager")
 
     @pytest.mark.asyncio
     async def test_register_with_league_network_error(self):
@@ -188,6 +192,137 @@ class TestGameInvitationHandling:
         assert session.total_rounds == 5
         assert session.match_id == "match_001"
 
+    @pytest.mark.asyncio
+    async def test_handle_game_invite_trusts_verified_referee(self):
+        """Test inviting referees are trusted after league manager verification."""
+        import json
+
+        player = PlayerAgent(player_name="TestPlayer", port=8101)
+        player.player_id = "P01"
+
+        mock_client = AsyncMock(spec=MCPClient)
+        mock_client.send_protocol_message = AsyncMock(return_value={"success": True})
+        mock_client.call_tool = AsyncMock(
+            return_value={"content": [{"type": "text", "text": json.dumps({"valid": True})}]}
+        )
+        player._client = mock_client
+
+        invite_message = {
+            "game_id": "game_001",
+            "opponent_id": "P02",
+            "assigned_role": "odd",
+            "sender": "referee:REF01",
+            "auth_token": "tok_ref01",
+        }
+        await player._handle_game_invite(invite_message)
+        await player._handle_game_invite({**invite_message, "game_id": "game_002"})
+        await asyncio.gather(*player._peer_checks.values())
+        await player._handle_game_invite({**invite_message, "game_id": "game_003"})
+
+        assert player.is_trusted_peer("referee:REF01", "tok_ref01")
+        assert not player.is_trusted_peer("referee:REF01", "tok_other")
+        # Verified once, then served from the rate limiter's registry
+        mock_client.call_tool.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_handle_game_invite_rejected_referee_not_trusted(self):
+        """Test referees failing verification keep the default tier."""
+        import json
+
+        player = PlayerAgent(player_name="TestPlayer", port=8101)
+        player.player_id = "P01"
+
+        mock_client = AsyncMock(spec=MCPClient)
+        mock_client.send_protocol_message = AsyncMock(return_value={"success": True})
+        mock_client.call_tool = AsyncMock(
+            return_value={"content": [{"type": "text", "text": json.dumps({"valid": False})}]}
+        )
+        player._client = mock_client
+
+        invite_message = {
+            "game_id": "game_001",
+            "opponent_id": "P02",
+            "assigned_role": "odd",
+            "sender": "referee:FAKE",
+            "auth_token": "tok_fake",
+        }
+        await player._handle_game_invite(invite_message)
+        await asyncio.gather(*player._peer_checks.values())
+        await player._handle_game_invite({**invite_message, "game_id": "game_002"})
+
+        assert not player.is_trusted_peer("referee:FAKE", "tok_fake")
+        mock_client.call_tool.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invitation_answered_before_referee_is_verified(self):
+        """Test a slow league manager does not delay the invitation response."""
+        player = PlayerAgent(player_name="TestPlayer", port=8101)
+        player.player_id = "P01"
+
+        verifying = asyncio.Event()
+
+        async def slow_verify(*args, **kwargs):
+            verifying.set()
+            await asyncio.sleep(10)
+
+        mock_client = AsyncMock(spec=MCPClient)
+        mock_client.connected_servers = {"referee": "http://localhost:8001/mcp"}
+        mock_client.call_tool = AsyncMock(side_effect=slow_verify)
+        player._client = mock_client
+
+        result = await asyncio.wait_for(
+            player._handle_game_invite(
+                {
+                    "game_id": "game_001",
+                    "opponent_id": "P02",
+                    "assigned_role": "odd",
+                    "sender": "referee:REF01",
+                    "auth_token": "tok_ref01",
+                }
+            ),
+            timeout=1,
+        )
+
+        assert result["accepted"] is True
+        mock_client.send_protocol_message.assert_awaited_once()
+        await verifying.wait()
+        await player.on_stop()
+        assert player._peer_checks == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_backs_off(self):
+        """Test unreachable league managers are not retried on every invitation."""
+        player = PlayerAgent(player_name="TestPlayer", port=8101)
+        player.player_id = "P01"
+
+        mock_client = AsyncMock(spec=MCPClient)
+        mock_client.call_tool = AsyncMock(side_effect=ConnectionError("unreachable"))
+        player._client = mock_client
+
+        invite_message = {
+            "game_id": "game_001",
+            "opponent_id": "P02",
+            "assigned_role": "odd",
+            "sender": "referee:REF01",
+            "auth_token": "tok_ref01",
+        }
+        await player._handle_game_invite(invite_message)
+        await asyncio.gather(*player._peer_checks.values())
+        await player._handle_game_invite({**invite_message, "game_id": "game_002"})
+
+        mock_client.call_tool.assert_awaited_once()
+        failures, retry_at = player._peer_backoff[("referee:REF01", "tok_ref01")]
+        assert failures == 1
+        assert retry_at > time.monotonic()
+
+        # Once the backoff has passed, the next invitation retries
+        player._peer_backoff[("referee:REF01", "tok_ref01")] = (1, 0.0)
+        await player._handle_game_invite({**invite_message, "game_id": "game_003"})
+        await asyncio.gather(*player._peer_checks.values())
+
+        assert mock_client.call_tool.await_count == 2
+        assert player._peer_backoff[("referee:REF01", "tok_ref01")][0] == 2
+
     @pytest.mark.asyncio
     async def test_handle_game_invite_with_player_a_role(self):
         """Test handling invitation with PLAYER_A/PLAYER_B role format."""
@@ -0,0 +1,254 @@
+"""
+Tests for the multi-player host.
+
+Testing:
+- Many players behind one port, routed by name in the path
+- Misrouted requests redirected to the owning shard
+- Per-player memory of hosted players
+- Supervisor sharding players across worker processes
+"""
+
+import gc
+import logging
+import socket
+import tracemalloc
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+
+from src.agents.player_host import (
+    HAS_REUSE_PORT,
+    PlayerHost,
+    PlayerHostSupervisor,
+    shard_for,
+)
+from src.agents.strategies import RandomStrategy
+from src.client.session_manager import SessionState
+from src.common.config import DEFAULT_PORTS, get_config
+from src.common.events import OpponentModelUpdateEvent
+from src.main import GameOrchestrator
+
+
+def free_ports(count):
+    """First of ``count`` consecutive free ports."""
+    while True:
+        with socket.socket() as probe:
+            probe.bind(("localhost", 0))
+            base = probe.getsockname()[1]
+        sockets = []
+        try:
+            for port in range(base, base + count):
+                sock = socket.socket()
+                sockets.append(sock)
+                sock.bind(("localhost", port))
+            return base
+        except OSError:
+            continue
+        finally:
+            for sock in sockets:
+                sock.close()
+
+
+async def call_tool(session, url, name, arguments=None):
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments or {}},
+    }
+    async with session.post(url, json=request) as response:
+        return response.status, await response.json()
+
+
+@pytest.fixture
+async def host():
+    host = PlayerHost(port=0)
+    await host.start()
+    yield host
+    await host.stop()
+
+
+def test_shard_for_is_stable_and_in_range():
+    shards = [shard_for(f"Player_{i}", 4) for i in range(100)]
+
+    assert shards == [shard_for(f"Player_{i}", 4) for i in range(100)]
+    assert set(shards) == {0, 1, 2, 3}
+
+
+class TestPlayerHost:
+    async def test_routes_by_player_name(self, host):
+        await host.add_player("Alice", RandomStrategy())
+        await host.add_player("Bob")
+
+        async with aiohttp.ClientSession() as session:
+            for name in ("Alice", "Bob"):
+                status, body = await call_tool(session, host.player_url(name), "get_status")
+                assert status == 200
+                assert f'"player_name": "{name}"' in body["result"]["content"][0]["text"]
+
+    async def test_players_share_the_port(self, host):
+        alice = await host.add_player("Alice")
+        bob = await host.add_player("Bob")
+
+        assert alice.url == f"http://localhost:{host.port}/players/Alice/mcp"
+        assert alice.port == bob.port == host.port
+        assert alice.is_running and bob.is_running
+
+    async def test_unknown_player_is_404(self, host):
+        async with aiohttp.ClientSession() as session:
+            status, body = await call_tool(session, host.player_url("Nobody"), "get_status")
+
+        assert status == 404
+        assert "Unknown player" in str(body["error"])
+
+    async def test_remove_player(self, host):
+        player = await host.add_player("Alice")
+
+        assert await host.remove_player("Alice")
+        assert not player.is_running
+        assert host.get_player("Alice") is None
+        assert not await host.remove_player("Alice")
+
+    async def test_duplicate_name_rejected(self, host):
+        await host.add_player("Alice")
+
+        with pytest.raises(ValueError, match="already hosted"):
+            await host.add_player("Alice")
+
+    async def test_other_shards_players_are_redirected(self):
+        urls = ["http://localhost:9001", "http://localhost:9002"]
+        name = next(f"P{i}" for i in range(100) if shard_for(f"P{i}", 2) == 1)
+        host = PlayerHost(port=0, shard_index=0, shard_urls=urls)
+        await host.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                url = f"http://localhost:{host.port}/players/{name}/mcp"
+                async with session.post(url, json={}, allow_redirects=False) as response:
+                    assert response.status == 307
+                    assert response.headers["Location"] == f"{urls[1]}/players/{name}/mcp"
+        finally:
+            await host.stop()
+
+        assert host.redirects == 1
+
+    async def test_players_relay_only_their_own_events(self, host):
+        alice = await host.add_player("Alice")
+        event = OpponentModelUpdateEvent(player_id="Bob", opponent_id="Alice", confidence=0.5)
+        calls = []
+        alice._client.connect = lambda *args, **kwargs: calls.append(args)
+
+        await alice._relay_strategy_event(event)
+
+        assert calls == []
+
+    async def test_hosted_player_memory_is_kilobytes(self, host):
+        await host.add_player("Warmup")  # Lazy imports and caches
+        gc.collect()
+        # All allocations, client and libraries included; pytest's handlers
+        # are detached so its captured log records are not counted
+        root = logging.getLogger()
+        handlers, root.handlers = root.handlers, []
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            for i in range(200):
+                await host.add_player(f"Player_{i}")
+            gc.collect()
+            allocated = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+            root.handlers = handlers
+
+        per_player_kb = allocated / 200 / 1024
+        assert per_player_kb < 32, f"{per_player_kb:.1f} KB per hosted player"
+
+    async def test_players_share_one_league_manager_connection(self, host, monkeypatch):
+        client = host._client
+        opened = []
+
+        async def open_transport(server_name, server_url):
+            transport = AsyncMock()
+            opened.append(transport)
+            return transport
+
+        monkeypatch.setattr(client, "_open_transport", open_transport)
+
+        async def initialize(session):
+            await client.sessions.update_session_state(session.id, SessionState.READY)
+
+        monkeypatch.setattr(client, "_initialize_session", initialize)
+        monkeypatch.setattr(
+            client,
+            "call_tool",
+            AsyncMock(return_value={"content": [{"text": '{"status": "REJECTED"}'}]}),
+        )
+        for i in range(5):
+            await host.add_player(f"Player_{i}")
+
+        await host.register_all()
+
+        assert len(opened) == 1
+        assert client.connected_servers == ["league_manager"]
+        assert len(await client.sessions.list_sessions()) == 1
+
+        # A different URL under the same name replaces (and closes) the connection
+        await client.connect("league_manager", "http://localhost:9/mcp")
+        opened[0].disconnect.assert_awaited_once()
+        assert len(await client.sessions.list_sessions()) == 1
+
+
+async def test_orchestrator_hosts_players_on_one_port(monkeypatch):
+    port = free_ports(1)
+    monkeypatch.setitem(DEFAULT_PORTS, "player_base", port - 1)
+    orchestrator = GameOrchestrator(get_config(), player_host=True)
+    try:
+        first = await orchestrator.start_hosted_player("Player_1")
+        second = await orchestrator.start_hosted_player("Player_2", "pattern")
+        orchestrator_host = orchestrator.player_host
+
+        assert first.port == second.port == port
+        assert second.url.endswith("/players/Player_2/mcp")
+        assert orchestrator.players == [first, second]
+    finally:
+        await orchestrator.stop()
+
+    assert not orchestrator_host.is_running
+    assert orchestrator.players == []
+
+
+class TestPlayerHostSupervisor:
+    def test_shards_cover_every_player_once(self):
+        names = [f"Player_{i}" for i in range(50)]
+        supervisor = PlayerHostSupervisor(names, workers=4, port=9100)
+
+        shards = supervisor.shards()
+
+        assert len(shards) == 4
+        assert sorted(spec.name for shard in shards for spec in shard) == sorted(names)
+        assert supervisor.endpoints()["Player_0"].startswith(
+            supervisor.shard_url(shard_for("Player_0", 4))
+        )
+
+    def test_workers_never_exceed_players(self):
+        assert PlayerHostSupervisor(["A", "B"], workers=8).workers == 2
+
+    @pytest.mark.slow
+    async def test_workers_serve_their_shards(self):
+        names = [f"Player_{i}" for i in range(6)]
+        port = free_ports(3)
+        supervisor = PlayerHostSupervisor(names, workers=2, port=port)
+
+        with supervisor:
+            assert supervisor.is_running
+            async with aiohttp.ClientSession() as session:
+                for name, url in supervisor.endpoints().items():
+                    status, body = await call_tool(session, url, "get_status")
+                    assert status == 200
+                    assert f'"player_name": "{name}"' in body["result"]["content"][0]["text"]
+
+                if HAS_REUSE_PORT:
+                    async with session.get(f"http://localhost:{supervisor.port}/health") as resp:
+                        assert (await resp.json())["shards"] == 2
+
+        assert not supervisor.is_running
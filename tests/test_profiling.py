@@ -0,0 +1,177 @@
+"""
+Tests for the runtime loop profiler.
+
+Testing:
+- Slow-callback detection with the blocking code's stack
+- Handler CPU time excluding time spent awaiting
+- Sampling profiler producing collapsed stacks
+- get_profile tool and Prometheus export from a game server
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.common.config import Config
+from src.observability import get_metrics_collector
+from src.observability.profiling import LoopProfiler
+from src.server.base_server import BaseGameServer
+
+
+@pytest.fixture
+def profiler():
+    profiler = LoopProfiler(slow_callback_ms=50)
+    yield profiler
+    profiler.stop()
+
+
+def burn_cpu(seconds):
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+def block_the_loop():
+    time.sleep(0.2)
+
+
+async def call_tool(server, name, arguments=None):
+    result = await server._handle_tools_call({"name": name, "arguments": arguments or {}})
+    return json.loads(result["content"][0]["text"])
+
+
+class TestSlowCallbacks:
+    async def test_blocking_call_is_captured_with_stack(self, profiler):
+        profiler.start()
+        await asyncio.sleep(0.05)
+
+        block_the_loop()
+        await asyncio.sleep(0.05)
+
+        assert profiler.slow_callback_count == 1
+        slow = profiler.slow_callbacks[0]
+        assert slow.duration_ms >= 150
+        assert any("block_the_loop" in frame for frame in slow.stack)
+
+    async def test_idle_loop_has_no_slow_callbacks(self, profiler):
+        profiler.start()
+        await asyncio.sleep(0.2)
+
+        assert profiler.slow_callback_count == 0
+
+    def test_closed_loop_is_dropped(self, profiler):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(asyncio.sleep(0))
+        profiler._loop = loop
+        loop.close()
+
+        profiler._check_loop()
+
+        assert profiler._loop is None
+
+
+class TestHandlerCpu:
+    async def test_cpu_excludes_awaited_time(self, profiler):
+        async def handler():
+            burn_cpu(0.02)
+            await asyncio.sleep(0.1)
+            return "done"
+
+        async def other_task():
+            await asyncio.sleep(0.01)
+            burn_cpu(0.05)  # Runs while the handler awaits
+
+        other = asyncio.create_task(other_task())
+        result = await profiler.measure("tool.slow", handler())
+        await other
+
+        stats = profiler.handlers["tool.slow"]
+        assert result == "done"
+        assert stats.calls == 1
+        assert 0.015 <= stats.cpu_seconds < 0.045
+        assert stats.wall_seconds >= 0.1
+
+    async def test_errors_are_recorded_and_raised(self, profiler):
+        async def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await profiler.measure("tool.failing", failing())
+
+        assert profiler.handlers["tool.failing"].calls == 1
+
+    async def test_cancellation_reaches_the_handler(self, profiler):
+        cancelled = asyncio.Event()
+
+        async def handler():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.create_task(profiler.measure("tool.cancelled", handler()))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled.is_set()
+
+
+async def test_sample_stacks_are_collapsed(profiler):
+    async def busy():
+        for _ in range(10):
+            burn_cpu(0.01)
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(busy())
+    profile = await profiler.sample_stacks(duration=0.2, interval_ms=2)
+    await task
+
+    assert profile.samples > 0
+    assert sum(profile.stacks.values()) == profile.samples
+    line = profile.collapsed().splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert ";" in stack and int(count) > 0
+
+
+class TestGameServerProfiling:
+    @pytest.fixture
+    async def server(self):
+        server = BaseGameServer(name="prof", server_type="player", port=0, enable_profiling=True)
+        server.profiler.reset()
+        await server.start()
+        yield server
+        await server.stop()
+
+    async def test_get_profile_reports_tool_cpu(self, server):
+        await call_tool(server, "get_protocol_info")
+
+        profile = await call_tool(server, "get_profile")
+
+        assert profile["success"]
+        assert profile["handlers"]["tool.get_protocol_info"]["calls"] == 1
+        assert set(profile["loop_lag_ms"]) == {"current", "p50", "p99", "max"}
+        exported = get_metrics_collector().export_prometheus()
+        assert 'handler_cpu_seconds_total{handler="tool.get_protocol_info"' in exported
+
+    async def test_get_profile_writes_collapsed_stacks(self, server, tmp_path, monkeypatch):
+        config = Config()
+        config.profiling.output_dir = str(tmp_path)
+        monkeypatch.setattr("src.server.base_server.get_config", lambda: config)
+
+        profile = await call_tool(server, "get_profile", {"sample_seconds": 0.1, "write": True})
+
+        assert profile["samples"]["samples"] > 0
+        assert profile["samples"]["path"].startswith(str(tmp_path))
+
+    async def test_profiling_is_opt_in(self):
+        server = BaseGameServer(name="plain", server_type="player", port=0)
+
+        profile = await call_tool(server, "get_profile")
+
+        assert server.profiler is None
+        assert profile == {"success": False, "error": "Profiling is not enabled"}
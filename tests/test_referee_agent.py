@@ -86,6 +86,7 @@ class TestRefereeRegistration:
         assert result is True
         assert referee.registered is True
         assert referee.auth_token == "ref_token_001"
+        assert referee.is_trusted_peer("league_manager")
 
     @pytest.mark.asyncio
     async def test_register_with_league_rejected(self):
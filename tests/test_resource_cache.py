@@ -0,0 +1,179 @@
+"""
+Tests for the client resource cache.
+
+Testing:
+- Single-flight loads shared by concurrent misses
+- LRU eviction and TTL with stale-while-revalidate
+- Failed and cancelled loads
+- Pushed updates winning over in-flight reads
+- Cache counters in MetricsCollector and MCPClient.read_resource
+"""
+
+import asyncio
+
+import pytest
+
+from src.client.mcp_client import MCPClient
+from src.client.resource_manager import ResourceManager
+from src.observability import get_metrics_collector
+from src.server.mcp_server import MCPServer
+
+
+class Loader:
+    """Counts calls; each call waits ``delay`` and returns the next value."""
+
+    def __init__(self, delay=0.02, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("server down")
+        return f"v{self.calls}"
+
+
+@pytest.fixture
+async def resources():
+    resources = ResourceManager()
+    await resources.register_resource("s", {"uri": "test://a", "name": "A"})
+    return resources
+
+
+class TestSingleFlight:
+    async def test_concurrent_misses_share_one_load(self, resources):
+        load = Loader()
+
+        results = await asyncio.gather(
+            *(resources.get_or_load("test://a", load) for _ in range(10))
+        )
+
+        assert results == ["v1"] * 10
+        assert load.calls == 1
+        assert (resources.misses, resources.coalesced) == (1, 9)
+        assert await resources.get_or_load("test://a", load) == "v1"
+        assert resources.hits == 1
+
+    async def test_failure_reaches_every_waiter_and_is_not_cached(self, resources):
+        load = Loader(fail=True)
+
+        results = await asyncio.gather(
+            *(resources.get_or_load("test://a", load) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert load.calls == 1
+        load.fail = False
+        assert await resources.get_or_load("test://a", load) == "v2"
+
+    async def test_cancelled_caller_does_not_cancel_the_load(self, resources):
+        load = Loader(delay=0.05)
+        first = asyncio.create_task(resources.get_or_load("test://a", load))
+        second = asyncio.create_task(resources.get_or_load("test://a", load))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+
+        assert await second == "v1"
+        assert load.calls == 1
+
+    async def test_push_during_load_wins(self, resources):
+        load = Loader(delay=0.05)
+        reading = asyncio.create_task(resources.get_or_load("test://a", load))
+        await asyncio.sleep(0.01)
+
+        await resources.notify_update("test://a", "pushed", version=1)
+        await reading
+
+        assert await resources.get_cached("test://a") == "pushed"
+
+
+class TestEviction:
+    async def test_least_recently_used_is_evicted(self):
+        resources = ResourceManager(max_entries=2)
+        await resources.set_cached("test://a", 1)
+        await resources.set_cached("test://b", 2)
+        await resources.get_cached("test://a")
+
+        await resources.set_cached("test://c", 3)
+
+        assert await resources.get_cached("test://b") is None
+        assert await resources.get_cached("test://a") == 1
+        assert resources.evictions == 1
+        assert resources.cache_count == 2
+
+    async def test_stale_entry_served_while_refreshing(self):
+        resources = ResourceManager(cache_ttl=0.02, stale_ttl=10)
+        load = Loader(delay=0.05)
+        await resources.get_or_load("test://a", load)
+        await asyncio.sleep(0.05)
+
+        stale = await asyncio.gather(*(resources.get_or_load("test://a", load) for _ in range(3)))
+        await asyncio.sleep(0.1)
+
+        assert stale == ["v1"] * 3
+        assert resources.stale_hits == 3
+        assert load.calls == 2  # One refresh for all three
+        assert await resources.get_or_load("test://a", load) == "v2"
+
+    async def test_entry_past_stale_window_is_a_miss(self):
+        resources = ResourceManager(cache_ttl=0.01, stale_ttl=0.01)
+        load = Loader(delay=0)
+        await resources.get_or_load("test://a", load)
+        await asyncio.sleep(0.05)
+
+        assert await resources.get_or_load("test://a", load) == "v2"
+        assert resources.misses == 2
+
+
+async def test_counters_are_published():
+    metrics = get_metrics_collector()
+    resources = ResourceManager(metrics=metrics, max_entries=1)
+
+    def count(result):
+        counter = metrics.get_counter("resource_cache_requests_total", {"result": result})
+        return counter.value if counter else 0
+
+    before = {result: count(result) for result in ("hit", "miss", "coalesced")}
+    load = Loader()
+    await asyncio.gather(*(resources.get_or_load("test://a", load) for _ in range(2)))
+    await resources.get_or_load("test://a", load)
+    await resources.set_cached("test://b", "evicts a")
+
+    assert {result: count(result) - before[result] for result in before} == {
+        "hit": 1,
+        "miss": 1,
+        "coalesced": 1,
+    }
+    assert metrics.get_counter("resource_cache_evictions_total").value >= 1
+
+
+async def test_client_reads_are_coalesced():
+    server = MCPServer("cache_test", port=0)
+    reads = 0
+
+    @server.resource("test://standings", "Standings")
+    async def standings(params):
+        nonlocal reads
+        reads += 1
+        await asyncio.sleep(0.02)
+        return {"reads": reads}
+
+    await server.start()
+    client = MCPClient("cache_client")
+    await client.start()
+    try:
+        await client.connect("cache_test", server.url)
+
+        results = await asyncio.gather(
+            *(client.read_resource("cache_test", "test://standings") for _ in range(20))
+        )
+
+        assert reads == 1
+        assert set(results) == {'{"reads": 1}'}
+        assert (await client.get_health_report())["resources"]["cache"]["coalesced"] == 19
+    finally:
+        await client.stop()
+        await server.stop()
@@ -0,0 +1,134 @@
+"""
+Tests for the background resource sampler.
+
+Testing:
+- Non-blocking samples of CPU, memory, RSS and file descriptors
+- Event-loop lag percentiles and GC pause tracking
+- ResourceCheck reading the sampler instead of blocking the loop
+- Gauges published to the metrics collector
+"""
+
+import asyncio
+import gc
+import time
+
+import pytest
+
+from src.observability import get_metrics_collector
+from src.observability.health import HealthStatus, ResourceCheck
+from src.observability.resources import ResourceSampler
+
+
+@pytest.fixture
+def sampler():
+    sampler = ResourceSampler(interval=0.05, lag_interval=0.01)
+    yield sampler
+    sampler.stop()
+
+
+class TestSampling:
+    def test_sample_reports_process_resources(self, sampler):
+        snapshot = sampler.sample()
+
+        assert snapshot.rss_bytes > 0
+        assert snapshot.open_fds > 0
+        assert 0 <= snapshot.memory_percent <= 100
+        assert isinstance(snapshot.cpu_percent, float)
+        assert snapshot.to_dict()["rss_bytes"] == snapshot.rss_bytes
+
+    def test_snapshot_is_cached_while_running(self, sampler):
+        sampler.start()
+        time.sleep(0.1)
+
+        assert sampler.snapshot() is sampler.snapshot()
+
+    def test_stop_removes_gc_callback(self, sampler):
+        sampler.start()
+        assert sampler._on_gc in gc.callbacks
+
+        sampler.stop()
+
+        assert not sampler.is_running
+        assert sampler._on_gc not in gc.callbacks
+
+    def test_gc_pauses_recorded(self, sampler):
+        sampler.start()
+        gc.collect()
+
+        snapshot = sampler.sample()
+
+        assert snapshot.gc_collections >= 1
+        assert snapshot.gc_pause_max_ms > 0
+        assert snapshot.gc_pause_ms >= snapshot.gc_pause_max_ms
+
+
+class TestLoopLag:
+    async def test_blocked_loop_shows_lag(self, sampler):
+        sampler.start(loop=asyncio.get_running_loop())
+        await asyncio.sleep(0.05)
+
+        time.sleep(0.2)  # Block the loop
+        await asyncio.sleep(0.05)
+
+        lag = sampler.loop_lag_percentiles()
+        assert lag["max"] >= 150
+        assert lag["p50"] <= lag["p99"] <= lag["max"]
+
+    async def test_idle_loop_has_little_lag(self, sampler):
+        sampler.start(loop=asyncio.get_running_loop())
+        await asyncio.sleep(0.2)
+
+        lag = sampler.loop_lag_percentiles()
+        assert lag["p50"] < 50
+
+    def test_closed_loop_is_dropped(self, sampler):
+        loop = asyncio.new_event_loop()
+        sampler.watch_loop(loop)
+        loop.close()
+
+        sampler._probe_loop()
+
+        assert sampler._loop is None
+        assert sampler.loop_lag_percentiles()["current"] == 0
+
+
+class TestResourceCheck:
+    async def test_check_does_not_block(self, sampler):
+        check = ResourceCheck(sampler=sampler)
+
+        start = time.perf_counter()
+        result = await check.check()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.05  # The old check slept 100 ms in cpu_percent
+        assert result.status in (HealthStatus.HEALTHY, HealthStatus.DEGRADED)
+        assert "loop_lag_p99_ms" in result.details
+        assert sampler.is_running
+
+    async def test_loop_lag_threshold(self, sampler):
+        check = ResourceCheck(
+            max_cpu_percent=100,
+            max_memory_percent=100,
+            max_disk_percent=100,
+            max_loop_lag_ms=50,
+            sampler=sampler,
+        )
+        await check.check()
+        time.sleep(0.2)
+        await asyncio.sleep(0.1)
+
+        result = await check.check()
+
+        assert result.status == HealthStatus.DEGRADED
+        assert "lag" in result.message
+
+
+def test_gauges_published():
+    metrics = get_metrics_collector()
+    sampler = ResourceSampler(metrics=metrics)
+
+    sampler._publish(sampler.sample())
+
+    exported = metrics.export_prometheus()
+    assert "process_resident_memory_bytes" in exported
+    assert 'event_loop_lag_seconds{quantile="0.99"}' in exported
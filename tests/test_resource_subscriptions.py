@@ -0,0 +1,172 @@
+"""
+Tests for server-push resource subscriptions.
+
+Testing:
+- Snapshot on subscribe, then versioned updates pushed over the WebSocket
+- Coalescing of bursts of changes into one notification
+- URI templates, unsubscribe and connection cleanup
+- League standings pushed to a subscribed client
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.agents.league_manager import LeagueManager
+from src.client.mcp_client import MCPClient
+from src.client.resource_manager import ResourceManager
+from src.common.exceptions import ProtocolError
+from src.server.mcp_server import MCPServer
+
+
+@pytest.fixture
+async def server():
+    server = MCPServer("sub_test", port=0, notify_interval=0.02)
+    server.counter = 0
+
+    @server.resource("test://counter", "Counter")
+    async def counter(params):
+        return {"counter": server.counter}
+
+    @server.resource("test://item/{item_id}", "Item")
+    async def item(params):
+        return {"item_id": params["item_id"], "counter": server.counter}
+
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def client(server):
+    client = MCPClient("sub_client", transport="websocket")
+    await client.start()
+    await client.connect("sub_test", server.url)
+    yield client
+    await client.stop()
+
+
+class Recorder:
+    def __init__(self, client):
+        self.client = client
+        self.updates = []
+        self.seen = 1  # The snapshot delivered on subscribe
+        self.changed = asyncio.Event()
+
+    def __call__(self, uri, data):
+        self.updates.append((self.client.resources.get_version(uri), json.loads(data)))
+        self.changed.set()
+
+    async def next(self):
+        """Wait for an update not returned before."""
+        while len(self.updates) <= self.seen:
+            await asyncio.wait_for(self.changed.wait(), 2)
+            self.changed.clear()
+        self.seen = len(self.updates)
+        return self.updates[-1]
+
+
+class TestSubscriptions:
+    async def test_snapshot_then_pushed_updates(self, server, client):
+        recorder = Recorder(client)
+
+        assert await client.subscribe_resource("sub_test", "test://counter", recorder)
+        assert recorder.updates == [(0, {"counter": 0})]
+
+        server.counter = 1
+        server.notify_resource_updated("test://counter")
+
+        assert await recorder.next() == (1, {"counter": 1})
+
+    async def test_burst_is_coalesced_to_latest_version(self, server, client):
+        recorder = Recorder(client)
+        await client.subscribe_resource("sub_test", "test://counter", recorder)
+
+        for n in range(1, 11):
+            server.counter = n
+            server.notify_resource_updated("test://counter")
+
+        assert await recorder.next() == (10, {"counter": 10})
+        await asyncio.sleep(0.1)
+        assert len(recorder.updates) == 2
+
+    async def test_template_uri(self, server, client):
+        recorder = Recorder(client)
+
+        await client.subscribe_resource("sub_test", "test://item/A7", recorder)
+        server.notify_resource_updated("test://item/A7")
+        server.notify_resource_updated("test://item/B2")  # Not subscribed
+
+        assert await recorder.next() == (1, {"item_id": "A7", "counter": 0})
+        assert server.resource_version("test://item/B2") == 1
+        assert "test://item/B2" not in server._subscriptions
+
+    async def test_unsubscribe_stops_updates(self, server, client):
+        recorder = Recorder(client)
+        await client.subscribe_resource("sub_test", "test://counter", recorder)
+
+        assert await client.unsubscribe_resource("sub_test", "test://counter")
+        server.notify_resource_updated("test://counter")
+        await asyncio.sleep(0.1)
+
+        assert len(recorder.updates) == 1
+        assert not server._subscriptions
+
+    async def test_closed_connection_drops_subscriptions(self, server, client):
+        await client.subscribe_resource("sub_test", "test://counter", Recorder(client))
+
+        await client.disconnect("sub_test")
+        await asyncio.sleep(0.05)
+
+        assert not server._subscriptions
+
+    async def test_subscribing_needs_a_websocket(self, server):
+        client = MCPClient("http_client")
+        await client.start()
+        try:
+            await client.connect("sub_test", server.url)
+            with pytest.raises(ProtocolError, match="WebSocket"):
+                await client.subscribe_resource("sub_test", "test://counter", Recorder(client))
+        finally:
+            await client.stop()
+
+    async def test_unknown_resource_is_rejected(self, client):
+        with pytest.raises(ProtocolError, match="Unknown resource"):
+            await client.subscribe_resource("sub_test", "test://missing", Recorder(client))
+
+
+async def test_stale_versions_are_dropped():
+    resources = ResourceManager()
+    await resources.register_resource("s", {"uri": "test://counter", "name": "Counter"})
+    received = []
+    await resources.subscribe("test://counter", lambda uri, data: received.append(data))
+
+    await resources.notify_update("test://counter", "new", version=2)
+    await resources.notify_update("test://counter", "old", version=1)
+
+    assert received == ["new"]
+    assert resources.get_version("test://counter") == 2
+
+
+async def test_standings_pushed_on_registration():
+    manager = LeagueManager(league_id="push_league", port=0)
+    manager.notify_interval = 0.02
+    await manager.start()
+    client = MCPClient("standings_watcher", transport="websocket")
+    await client.start()
+    try:
+        await client.connect("league_manager", manager.url)
+        recorder = Recorder(client)
+        await client.subscribe_resource("league_manager", "league://standings", recorder)
+
+        await manager._handle_registration(
+            {"display_name": "Pusher", "endpoint": "http://localhost:8101/mcp"}
+        )
+
+        version, standings = await recorder.next()
+        assert version == manager.resource_version("league://standings")
+        assert [entry["display_name"] for entry in standings["standings"]] == ["Pusher"]
+    finally:
+        await client.stop()
+        await manager.stop()
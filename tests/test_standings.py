@@ -0,0 +1,89 @@
+"""
+Tests for Incremental Standings
+===============================
+
+Tests cover:
+- Ordering and tie-breaking
+- Incremental updates and removal
+- Rank and top-K queries
+- Versioned snapshot caching
+"""
+
+from dataclasses import dataclass
+
+from src.game.standings import StandingsTable
+
+
+@dataclass
+class _Player:
+    player_id: str
+    display_name: str = ""
+    played: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    points: int = 0
+
+
+class TestStandingsTable:
+    """Test StandingsTable ordering and queries."""
+
+    def test_ordering_matches_full_sort(self):
+        """Test incremental order equals a stable full sort."""
+        players = [
+            _Player("A", points=3, wins=1, losses=1),
+            _Player("B", points=3, wins=1, losses=0),
+            _Player("C", points=4, wins=1, losses=0),
+            _Player("D", points=3, wins=1, losses=1),
+        ]
+        table = StandingsTable()
+        table.rebuild(players)
+
+        expected = sorted(players, key=lambda p: (p.points, p.wins, -p.losses), reverse=True)
+        assert [row["player_id"] for row in table.snapshot()] == [p.player_id for p in expected]
+
+    def test_update_repositions_player(self):
+        """Test update moves only the changed player."""
+        a, b = _Player("A"), _Player("B")
+        table = StandingsTable()
+        table.add(a)
+        table.add(b)
+        assert table.rank_of("B") == 2
+
+        b.wins, b.points = 1, 3
+        table.update("B")
+
+        assert table.rank_of("B") == 1
+        assert table.rank_of("A") == 2
+        assert table.rank_of("missing") is None
+
+    def test_top_k_and_remove(self):
+        """Test top-K rows and removal."""
+        table = StandingsTable()
+        for i in range(5):
+            table.add(_Player(f"P{i}", points=i))
+
+        assert [row["player_id"] for row in table.top(2)] == ["P4", "P3"]
+        assert table.top(0) == []
+
+        assert table.remove("P4") is True
+        assert table.remove("P4") is False
+        assert "P4" not in table
+        assert len(table) == 4
+        assert table.top(1)[0]["rank"] == 1
+
+    def test_snapshot_cached_per_version(self):
+        """Test snapshot rows are reused until the table changes."""
+        player = _Player("A")
+        table = StandingsTable()
+        table.add(player)
+
+        first = table.snapshot()
+        assert table.snapshot()[0] is first[0]
+
+        player.played = 1
+        table.update("A")
+
+        second = table.snapshot()
+        assert second[0] is not first[0]
+        assert second[0]["played"] == 1
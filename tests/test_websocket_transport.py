@@ -0,0 +1,193 @@
+"""
+Tests for the multiplexed WebSocket transport.
+
+Testing:
+- Concurrent requests correlated by id over one connection
+- Per-message deadlines and late responses
+- Server notifications, reconnects and server shutdown
+- MCPClient websocket mode, HTTP fallback and hosted players
+- Per-message round trip against HTTP
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from aiohttp import web
+
+from src.agents.player_host import PlayerHost
+from src.client.mcp_client import MCPClient
+from src.server.mcp_server import MCPServer
+from src.transport import HTTPTransport, TransportError, WebSocketTransport, create_request
+
+
+@pytest.fixture
+async def server():
+    server = MCPServer("ws_test", port=0)
+
+    @server.tool("echo", "Echo arguments after an optional delay")
+    async def echo(params):
+        await asyncio.sleep(params.get("delay", 0))
+        return params
+
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def transport(server):
+    transport = WebSocketTransport()
+    await transport.connect(server.url)
+    yield transport
+    await transport.disconnect()
+
+
+def echo_request(**arguments):
+    return create_request("tools/call", {"name": "echo", "arguments": arguments}).to_dict()
+
+
+def echoed(response):
+    return json.loads(response["result"]["content"][0]["text"])
+
+
+class TestWebSocketTransport:
+    async def test_concurrent_requests_are_correlated(self, transport):
+        # Later requests answer first; every caller still gets its own response
+        requests = [echo_request(n=n, delay=(10 - n) * 0.01) for n in range(10)]
+
+        responses = await asyncio.gather(*(transport.request(r) for r in requests))
+
+        assert [r["id"] for r in responses] == [r["id"] for r in requests]
+        assert [echoed(r)["n"] for r in responses] == list(range(10))
+        assert transport.in_flight == 0
+
+    async def test_slow_request_does_not_block_others(self, transport):
+        slow = asyncio.create_task(transport.request(echo_request(delay=0.5)))
+        await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        await transport.request(echo_request())
+
+        assert time.perf_counter() - start < 0.25
+        assert not slow.done()
+        await slow
+
+    async def test_per_message_deadline(self, transport):
+        with pytest.raises(TransportError, match="timed out"):
+            await transport.request(echo_request(delay=0.3), timeout=0.05)
+
+        # The connection stays usable and the late response is discarded
+        assert echoed(await transport.request(echo_request(n=1)))["n"] == 1
+        await asyncio.sleep(0.3)
+        assert transport.late_responses == 1
+
+    async def test_notifications_are_queued_for_receive(self, transport):
+        transport._dispatch({"jsonrpc": "2.0", "method": "notifications/message"}, {})
+
+        notification = await asyncio.wait_for(transport.receive(), 1)
+
+        assert notification["method"] == "notifications/message"
+
+    async def test_reconnects_after_the_connection_drops(self, server, transport):
+        await server._close_websockets()
+        await asyncio.sleep(0.05)
+
+        assert not transport.is_connected
+        assert echoed(await transport.request(echo_request(n=2)))["n"] == 2
+
+    async def test_server_stop_fails_in_flight_requests(self, server, transport):
+        pending = asyncio.create_task(transport.request(echo_request(delay=5)))
+        await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(server.stop(), 2)
+
+        with pytest.raises(TransportError, match="closed"):
+            await pending
+
+    async def test_connect_to_http_only_endpoint_fails(self):
+        app = web.Application()
+        app.router.add_post("/mcp", lambda request: web.json_response({}))
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "localhost", 0)
+        await site.start()
+        try:
+            with pytest.raises(TransportError, match="connect failed"):
+                await WebSocketTransport().connect(f"http://localhost:{runner.addresses[0][1]}/mcp")
+        finally:
+            await runner.cleanup()
+
+
+class TestClientWebSocketMode:
+    async def test_client_multiplexes_tool_calls(self, server):
+        client = MCPClient("ws_client", transport="websocket")
+        await client.start()
+        await client.connect("ws_test", server.url)
+        try:
+            results = await asyncio.gather(
+                *(client.call_tool("ws_test", "echo", {"n": n}) for n in range(5))
+            )
+
+            assert isinstance(client._transports["ws_test"], WebSocketTransport)
+            assert [echoed({"result": r})["n"] for r in results] == list(range(5))
+        finally:
+            await client.stop()
+
+    async def test_falls_back_to_http(self, server, monkeypatch):
+        async def refuse(self, url):
+            raise TransportError("no upgrade")
+
+        monkeypatch.setattr(WebSocketTransport, "connect", refuse)
+        client = MCPClient("ws_client", transport="websocket")
+        await client.start()
+        await client.connect("ws_test", server.url)
+        try:
+            assert isinstance(client._transports["ws_test"], HTTPTransport)
+            assert (await client.call_tool("ws_test", "echo", {"n": 1}))["content"]
+        finally:
+            await client.stop()
+
+    def test_unknown_transport_is_rejected(self):
+        with pytest.raises(ValueError, match="transport"):
+            MCPClient(transport="carrier_pigeon")
+
+    async def test_hosted_player_over_websocket(self):
+        host = PlayerHost(port=0)
+        await host.start()
+        client = MCPClient("ws_client", transport="websocket")
+        await client.start()
+        try:
+            await host.add_player("Alice")
+            await client.connect("Alice", host.player_url("Alice"))
+
+            result = await client.call_tool("Alice", "get_status")
+
+            assert isinstance(client._transports["Alice"], WebSocketTransport)
+            assert '"player_name": "Alice"' in result["content"][0]["text"]
+        finally:
+            await client.stop()
+            await asyncio.wait_for(host.stop(), 5)
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+async def test_round_trip_cheaper_than_http(server):
+    async def mean_round_trip(transport, count=300):
+        await transport.connect(server.url)
+        try:
+            for _ in range(20):  # Warm up
+                await transport.request(echo_request())
+            start = time.perf_counter()
+            for _ in range(count):
+                await transport.request(echo_request())
+            return (time.perf_counter() - start) / count
+        finally:
+            await transport.disconnect()
+
+    http = await mean_round_trip(HTTPTransport())
+    ws = await mean_round_trip(WebSocketTransport())
+
+    print(f"\nround trip: http {http * 1e6:.0f}us, websocket {ws * 1e6:.0f}us")
+    assert ws < http